@@ -1,9 +1,12 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
 from apps.buying.backends import BACKENDS
 from apps.material.models import CourseModel
 from apps.service.models import ServiceModel
+from apps.user.entitlements import CourseEntitlements
 from apps.user.models import UserModel
 from utils.abstract_models.base_model import BaseModel
 
@@ -76,9 +79,48 @@ class ContractModel(BaseModel):
         on_delete=models.CASCADE,
     )
 
+    version_scope_fields = ("user__service_id",)
+
     class Meta:
         verbose_name = _("Contract")
         verbose_name_plural = _("Contracts")
 
     def __str__(self):
         return f"Contract for {self.user.first_name} {self.user.last_name}"
+
+
+def invalidate_entitlements(*user_ids):
+    """
+    Drops the cached entitlements now and again after the commit, so a
+    request that read the old contracts meanwhile doesn't keep them cached.
+    """
+    CourseEntitlements.invalidate(*user_ids)
+    transaction.on_commit(lambda: CourseEntitlements.invalidate(*user_ids))
+
+
+@receiver(post_save, sender=ContractModel)
+@receiver(post_delete, sender=ContractModel)
+def invalidate_contract_entitlements(sender, instance, **_kwargs):
+    invalidate_entitlements(instance.user_id)
+
+
+@receiver(m2m_changed, sender=PackageModel.courses.through)
+def invalidate_package_entitlements(
+    sender, instance, action, reverse, pk_set, **_kwargs
+):
+    if action not in {"post_add", "post_remove", "pre_clear"}:
+        return
+
+    if not reverse:
+        package_ids = [instance.pk]
+    elif action == "pre_clear":
+        package_ids = list(instance.packages.values_list("pk", flat=True))
+    else:
+        package_ids = list(pk_set)
+
+    user_ids = (
+        ContractModel.objects.filter(package__in=package_ids, is_active=True)
+        .values_list("user_id", flat=True)
+        .distinct()
+    )
+    invalidate_entitlements(*user_ids)
@@ -0,0 +1,65 @@
+import math
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from utils.cache_version import bump_version, get_version
+
+
+class LiveCalendarCache:
+    """
+    Caches the serialized live calendar per service and date range. An entry
+    lasts until the next live in it starts or the day turns, and every change
+    to the service's lives bumps its version, so stale calendars are never
+    read again.
+    """
+
+    timeout = 60 * 60
+
+    def __init__(self, service_id, date_from, date_to):
+        self.service_id = service_id
+        self.date_from = date_from
+        self.date_to = date_to
+
+    @staticmethod
+    def get_version_key(service_id):
+        return f"material:lives:{service_id}:version"
+
+    def get_version(self):
+        return get_version(self.get_version_key(self.service_id))
+
+    @cached_property
+    def key(self):
+        version = self.get_version()
+
+        return (
+            f"material:lives:{self.service_id}:{version}:"
+            f"{self.date_from.isoformat()}:{self.date_to.isoformat()}"
+        )
+
+    def get_timeout(self, lives):
+        now = timezone.now()
+        today = timezone.localtime(now).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        expires_at = min(
+            [
+                today + timedelta(days=1),
+                *[live.starts_at for live in lives if live.starts_at > now],
+            ]
+        )
+        seconds = math.ceil((expires_at - now).total_seconds())
+
+        return min(max(seconds, 1), self.timeout)
+
+    def get(self):
+        return cache.get(self.key)
+
+    def set(self, data, lives):
+        cache.set(self.key, data, self.get_timeout(lives))
+
+    @classmethod
+    def invalidate(cls, service_id):
+        bump_version(cls.get_version_key(service_id))
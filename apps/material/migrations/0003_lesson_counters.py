@@ -0,0 +1,53 @@
+# Generated by Django 3.2.25 on 2026-10-17 21:36
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_subquery(queryset, field):
+    counts = (
+        queryset.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+
+    return Coalesce(Subquery(counts[:1]), 0)
+
+
+def fill_counters(apps, _schema_editor):
+    LessonModel = apps.get_model("material", "LessonModel")
+    CommentModel = apps.get_model("material", "CommentModel")
+
+    LessonModel.objects.update(
+        likes_count=count_subquery(
+            LessonModel.likes.through.objects.all(), "lessonmodel"
+        ),
+        comments_count=count_subquery(CommentModel.objects.all(), "lesson"),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("material", "0002_livemodel"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lessonmodel",
+            name="comments_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Comments Count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="lessonmodel",
+            name="likes_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Likes Count"
+            ),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
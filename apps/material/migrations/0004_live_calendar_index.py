@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-17 21:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("material", "0003_lesson_counters"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="livemodel",
+            index=models.Index(
+                fields=["service", "is_active", "starts_at"],
+                name="live_calendar_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 3.2.25 on 2026-10-17 22:00
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("material", "0004_live_calendar_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseProgressModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("is_active", models.BooleanField(default=True)),
+                (
+                    "date_joined",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="date joined"
+                    ),
+                ),
+                (
+                    "date_modified",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="date modified"
+                    ),
+                ),
+                (
+                    "completed_lesson_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.PositiveBigIntegerField(),
+                        default=list,
+                        editable=False,
+                        size=None,
+                        verbose_name="Completed Lessons",
+                    ),
+                ),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="progress",
+                        to="material.coursemodel",
+                        verbose_name="Course",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="courses_progress",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Course Progress",
+                "verbose_name_plural": "Courses Progress",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="courseprogressmodel",
+            constraint=models.UniqueConstraint(
+                fields=("user", "course"), name="unique_user_course_progress"
+            ),
+        ),
+    ]
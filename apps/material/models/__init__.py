@@ -3,6 +3,7 @@ __all__ = [
     "CourseModel",
     "LessonModel",
     "CommentModel",
+    "CourseProgressModel",
     "LiveModel",
 ]
 
@@ -13,3 +14,4 @@ from apps.material.models.courses import (
     LessonModel,
 )
 from apps.material.models.lives import LiveModel
+from apps.material.models.progress import CourseProgressModel
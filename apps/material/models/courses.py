@@ -1,10 +1,15 @@
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
 from apps.service.models import ServiceModel
 from apps.user.models import UserModel
 from apps.visual_structure.models import ColorModel, ColorPaletteModel
 from utils.abstract_models.base_model import BaseModel
+from utils.mixins.counter import CounterMixin, counter_updated
 
 from .utils.file import material_file_directory_path
 
@@ -82,6 +87,8 @@ class CourseModel(BaseModel):
         ),
     )
 
+    version_scope_fields = ("service_id",)
+
     class Meta:
         verbose_name = _("Course")
         verbose_name_plural = _("Courses")
@@ -90,7 +97,29 @@ class CourseModel(BaseModel):
         return self.title
 
 
-class LessonModel(BaseModel):
+TOGGLE_LIKE_SQL = """
+WITH removed AS (
+    DELETE FROM {through_table}
+    WHERE {through_lesson} = %(lesson_id)s AND {through_user} = %(user_id)s
+    RETURNING 1
+), added AS (
+    INSERT INTO {through_table} ({through_lesson}, {through_user})
+    SELECT %(lesson_id)s, %(user_id)s WHERE NOT EXISTS (SELECT 1 FROM removed)
+    ON CONFLICT DO NOTHING
+    RETURNING 1
+)
+UPDATE {lesson_table} SET likes_count = GREATEST(
+    likes_count
+        + (SELECT COUNT(*) FROM added)
+        - (SELECT COUNT(*) FROM removed),
+    0
+)
+WHERE id = %(lesson_id)s
+RETURNING likes_count, EXISTS (SELECT 1 FROM added)
+"""
+
+
+class LessonModel(CounterMixin, BaseModel):
     LESSON_TYPE_CHOICES = (
         ("video", _("Video")),
         ("text", _("Text")),
@@ -154,6 +183,14 @@ class LessonModel(BaseModel):
         null=True,
         blank=True,
     )
+    likes_count = models.PositiveIntegerField(
+        verbose_name=_("Likes Count"), default=0, editable=False
+    )
+    comments_count = models.PositiveIntegerField(
+        verbose_name=_("Comments Count"), default=0, editable=False
+    )
+
+    version_scope_fields = ("course__service_id",)
 
     class Meta:
         verbose_name = _("Lesson")
@@ -164,7 +201,71 @@ class LessonModel(BaseModel):
 
     @property
     def likes_amount(self):
-        return self.likes.only("id").count()
+        return self.likes_count
+
+    @classmethod
+    def get_toggle_like_sql(cls):
+        likes_field = cls._meta.get_field("likes")
+
+        return TOGGLE_LIKE_SQL.format(
+            through_table=likes_field.remote_field.through._meta.db_table,
+            through_lesson=likes_field.m2m_column_name(),
+            through_user=likes_field.m2m_reverse_name(),
+            lesson_table=cls._meta.db_table,
+        )
+
+    def toggle_like(self, user: UserModel):
+        """
+        Likes the lesson, or removes the user's like when there is one, and
+        updates `likes_count` in the same statement. Returns whether the
+        lesson is liked after the toggle.
+
+        The lesson row is locked first, so concurrent toggles run one after
+        the other and each one sees the like left by the previous.
+        """
+        with transaction.atomic(), connection.cursor() as cursor:
+            type(self).objects.select_for_update().filter(pk=self.pk).exists()
+            cursor.execute(
+                self.get_toggle_like_sql(),
+                {"lesson_id": self.pk, "user_id": user.pk},
+            )
+            self.likes_count, liked = cursor.fetchone()
+
+        counter_updated.send(
+            sender=type(self), fields=("likes_count",), filters={"pk": self.pk}
+        )
+
+        return liked
+
+    @classmethod
+    def refresh_likes_count(cls, **filters):
+        """
+        Recounts the likes of the filtered lessons, for changes made through
+        the `likes` relation instead of `toggle_like`.
+        """
+        likes = (
+            cls.likes.through.objects.filter(lessonmodel=OuterRef("pk"))
+            .order_by()
+            .values("lessonmodel")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+
+        return cls._update_counter(
+            "likes_count", Coalesce(Subquery(likes[:1]), 0), **filters
+        )
+
+    @classmethod
+    def get_liked_ids(cls, lessons, user: UserModel):
+        """
+        Ids of the given lessons (or lesson ids) liked by the user, loaded in
+        a single query.
+        """
+        return set(
+            cls.likes.through.objects.filter(
+                lessonmodel__in=lessons, usermodel=user
+            ).values_list("lessonmodel_id", flat=True)
+        )
 
 
 class CommentModel(BaseModel):
@@ -182,9 +283,41 @@ class CommentModel(BaseModel):
         on_delete=models.CASCADE,
     )
 
+    version_scope_fields = ("lesson__course__service_id",)
+
     class Meta:
         verbose_name = _("Comment")
         verbose_name_plural = _("Comments")
 
     def __str__(self):
         return f"{self.author.username}'s comment in {self.lesson.title} lesson"
+
+
+@receiver(post_save, sender=CommentModel)
+def increment_lesson_comments_count(sender, instance, created, **_kwargs):
+    if created:
+        LessonModel.update_counter("comments_count", 1, pk=instance.lesson_id)
+
+
+@receiver(post_delete, sender=CommentModel)
+def decrement_lesson_comments_count(sender, instance, **_kwargs):
+    LessonModel.update_counter("comments_count", -1, pk=instance.lesson_id)
+
+
+@receiver(m2m_changed, sender=LessonModel.likes.through)
+def refresh_lesson_likes_count(sender, instance, action, reverse, pk_set, **_kwargs):
+    if action == "pre_clear" and reverse:
+        instance._cleared_liked_lesson_ids = set(
+            instance.lessons_likes.values_list("id", flat=True)
+        )
+
+    if action not in ["post_add", "post_remove", "post_clear"]:
+        return
+
+    if not reverse:
+        LessonModel.refresh_likes_count(pk=instance.pk)
+        instance.refresh_from_db(fields=["likes_count"])
+    elif action == "post_clear":
+        LessonModel.refresh_likes_count(pk__in=instance._cleared_liked_lesson_ids)
+    elif pk_set:
+        LessonModel.refresh_likes_count(pk__in=pk_set)
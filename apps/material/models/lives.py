@@ -1,6 +1,9 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
+from apps.material.live_cache import LiveCalendarCache
 from apps.service.models import ServiceModel
 from utils.abstract_models.base_model import BaseModel
 
@@ -51,6 +54,18 @@ class LiveModel(BaseModel):
     class Meta:
         verbose_name = _("Live")
         verbose_name_plural = _("Lives")
+        indexes = [
+            models.Index(
+                fields=["service", "is_active", "starts_at"],
+                name="live_calendar_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
+
+
+@receiver(post_save, sender=LiveModel)
+@receiver(post_delete, sender=LiveModel)
+def invalidate_calendar_on_live_change(sender, instance, **_kwargs):
+    LiveCalendarCache.invalidate(instance.service_id)
@@ -0,0 +1,160 @@
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.db.models import F, Func, OuterRef, Q, Subquery, Value
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.material.models.courses import CourseModel, LessonModel
+from apps.user.models import UserModel
+from utils.abstract_models.base_model import BaseModel
+
+
+class CourseProgressModel(BaseModel):
+    user = models.ForeignKey(
+        UserModel,
+        verbose_name=_("User"),
+        related_name="courses_progress",
+        on_delete=models.CASCADE,
+    )
+    course = models.ForeignKey(
+        CourseModel,
+        verbose_name=_("Course"),
+        related_name="progress",
+        on_delete=models.CASCADE,
+    )
+    completed_lesson_ids = ArrayField(
+        models.PositiveBigIntegerField(),
+        verbose_name=_("Completed Lessons"),
+        default=list,
+        editable=False,
+    )
+
+    class Meta:
+        verbose_name = _("Course Progress")
+        verbose_name_plural = _("Courses Progress")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "course"], name="unique_user_course_progress"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.first_name}'s progress in {self.course.title}"
+
+    @staticmethod
+    def get_lessons_order():
+        return [F("order").asc(nulls_last=True), "pk"]
+
+    @classmethod
+    def with_lesson_ids(cls, queryset):
+        """
+        Annotates `lesson_ids` with the ids of the course lessons in the
+        order they are taken, so the progress is computed without another
+        query.
+        """
+        lesson_ids = (
+            LessonModel.objects.filter(course=OuterRef("course"))
+            .order_by()
+            .values("course")
+            .annotate(ids=ArrayAgg("pk", ordering=cls.get_lessons_order()))
+            .values("ids")
+        )
+
+        return queryset.annotate(lesson_ids=Subquery(lesson_ids[:1]))
+
+    @classmethod
+    def get_for_user(cls, user: UserModel, **filters):
+        """
+        Progress of the user in the active courses of their service, with
+        the lessons of each course, loaded in a single query.
+        """
+        queryset = cls.objects.select_related("course").filter(
+            user=user,
+            course__service_id=user.service_id,
+            course__is_active=True,
+            **filters,
+        )
+
+        return cls.with_lesson_ids(queryset).order_by("-date_modified")
+
+    @classmethod
+    def get_course_progress(cls, user: UserModel, course: CourseModel):
+        """
+        Progress of the user in the course, or an empty (unsaved) progress
+        when they haven't completed any of its lessons yet.
+        """
+        progress = cls.get_for_user(user, course=course).first()
+
+        if progress is None:
+            progress = cls(user=user, course=course)
+            progress.lesson_ids = list(
+                course.lessons.order_by(*cls.get_lessons_order()).values_list(
+                    "pk", flat=True
+                )
+            )
+
+        return progress
+
+    @classmethod
+    def complete_lesson(cls, user: UserModel, lesson: LessonModel):
+        """
+        Adds the lesson to the user's progress in its course. The lesson id is
+        appended in the database, so concurrent requests don't drop each
+        other's lessons, and completing a lesson twice changes nothing.
+        """
+        progress, _created = cls.objects.get_or_create(
+            user=user, course_id=lesson.course_id
+        )
+        cls.objects.filter(pk=progress.pk).filter(
+            ~Q(completed_lesson_ids__contains=[lesson.pk])
+        ).update(
+            completed_lesson_ids=Func(
+                F("completed_lesson_ids"), Value(lesson.pk), function="array_append"
+            ),
+            date_modified=timezone.now(),
+        )
+
+    @property
+    def completed_lessons(self):
+        """
+        Completed lessons that are still in the course, in order.
+        """
+        completed_lesson_ids = set(self.completed_lesson_ids)
+
+        return [pk for pk in self.lesson_ids or [] if pk in completed_lesson_ids]
+
+    @property
+    def completed_lessons_count(self):
+        return len(self.completed_lessons)
+
+    @property
+    def lessons_count(self):
+        return len(self.lesson_ids or [])
+
+    @property
+    def percent_complete(self):
+        if not self.lessons_count:
+            return 0
+
+        return round(self.completed_lessons_count * 100 / self.lessons_count)
+
+    @property
+    def next_lesson_id(self):
+        """
+        First lesson, in order, the user hasn't completed yet. In progressive
+        courses it's the last unlocked lesson.
+        """
+        completed_lesson_ids = set(self.completed_lesson_ids)
+
+        return next(
+            (pk for pk in self.lesson_ids or [] if pk not in completed_lesson_ids),
+            None,
+        )
+
+    def is_unlocked(self, lesson: LessonModel):
+        return (
+            self.course.course_mode != "progressive"
+            or lesson.pk in self.completed_lesson_ids
+            or lesson.pk == self.next_lesson_id
+        )
@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination
+
+
+class LessonCommentCursorPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-date_joined", "-id")
+
+
+class LessonLikeCursorPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-id",)
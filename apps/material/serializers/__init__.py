@@ -2,8 +2,12 @@ __all__ = [
     "AuthorSerializer",
     "CommentSerializer",
     "LessonSerializer",
+    "LessonLikeSerializer",
     "CourseCategorySerializer",
     "CourseSerializer",
+    "CourseSummarySerializer",
+    "CourseProgressSerializer",
+    "LiveCalendarQuerySerializer",
     "LiveSerializer",
 ]
 
@@ -12,6 +16,9 @@ from apps.material.serializers.courses import (
     CommentSerializer,
     CourseCategorySerializer,
     CourseSerializer,
+    CourseSummarySerializer,
+    LessonLikeSerializer,
     LessonSerializer,
 )
-from apps.material.serializers.lives import LiveSerializer
+from apps.material.serializers.lives import LiveCalendarQuerySerializer, LiveSerializer
+from apps.material.serializers.progress import CourseProgressSerializer
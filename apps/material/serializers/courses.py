@@ -33,8 +33,7 @@ class CommentSerializer(serializers.ModelSerializer):
 
 
 class LessonSerializer(serializers.ModelSerializer):
-    likes = AuthorSerializer(many=True)
-    comments = CommentSerializer(many=True)
+    is_liked = serializers.SerializerMethodField()
 
     class Meta:
         model = LessonModel
@@ -44,7 +43,8 @@ class LessonSerializer(serializers.ModelSerializer):
             "title",
             "description",
             "thumbnail",
-            "likes",
+            "likes_count",
+            "is_liked",
             "order",
             "lesson_type",
             "text",
@@ -53,9 +53,17 @@ class LessonSerializer(serializers.ModelSerializer):
             "video_transcript",
             "audio",
             "audio_transcript",
-            "comments",
+            "comments_count",
         ]
 
+    def get_is_liked(self, obj: LessonModel):
+        return obj.pk in self.context.get("liked_lesson_ids", set())
+
+
+class LessonLikeSerializer(serializers.Serializer):
+    liked = serializers.BooleanField()
+    likes_count = serializers.IntegerField()
+
 
 class CourseCategorySerializer(serializers.ModelSerializer):
     color = ColorSerializer()
@@ -93,3 +101,41 @@ class CourseSerializer(serializers.ModelSerializer):
             "lessons",
         ]
         depth = 2
+
+
+class CourseSummarySerializer(serializers.ModelSerializer):
+    categories = CourseCategorySerializer(many=True)
+    color_palette = ColorPaletteSerializer()
+    lessons_count = serializers.IntegerField(read_only=True)
+    duration = serializers.IntegerField(
+        read_only=True, help_text="Sum of the lessons reading time, in minutes."
+    )
+    likes_count = serializers.IntegerField(read_only=True)
+    is_locked = serializers.SerializerMethodField(
+        help_text="Whether the course is paid and the user has no contract for it."
+    )
+
+    class Meta:
+        model = CourseModel
+        fields = [
+            "id",
+            "is_active",
+            "title",
+            "description",
+            "image",
+            "trailer",
+            "is_paid",
+            "slug",
+            "categories",
+            "color_palette",
+            "course_mode",
+            "lessons_count",
+            "duration",
+            "likes_count",
+            "is_locked",
+        ]
+
+    def get_is_locked(self, obj: CourseModel):
+        return obj.is_paid and obj.pk not in self.context.get(
+            "entitled_course_ids", set()
+        )
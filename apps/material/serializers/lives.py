@@ -1,3 +1,6 @@
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
 
 from apps.material.models import LiveModel
@@ -17,3 +20,37 @@ class LiveSerializer(serializers.ModelSerializer):
             "live_type",
             "image",
         ]
+
+
+class LiveCalendarQuerySerializer(serializers.Serializer):
+    default_days = 30
+    max_days = 92
+
+    def get_fields(self):
+        # "from" is a keyword, so the fields can't be declared as attributes.
+        return {
+            "from": serializers.DateField(
+                required=False, help_text="First day of the calendar, today if empty."
+            ),
+            "to": serializers.DateField(
+                required=False,
+                help_text=f"Last day of the calendar, {self.default_days} days "
+                "after the first if empty.",
+            ),
+        }
+
+    def validate(self, attrs):
+        date_from = attrs.get("from") or timezone.localdate()
+        date_to = attrs.get("to") or date_from + timedelta(days=self.default_days)
+
+        if date_to < date_from:
+            raise serializers.ValidationError(
+                {"to": "The last day must not be before the first one."}
+            )
+
+        if (date_to - date_from).days > self.max_days:
+            raise serializers.ValidationError(
+                {"to": f"The calendar must not span more than {self.max_days} days."}
+            )
+
+        return {"from": date_from, "to": date_to}
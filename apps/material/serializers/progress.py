@@ -0,0 +1,31 @@
+from rest_framework import serializers
+
+from apps.material.models import CourseProgressModel
+
+
+class CourseProgressSerializer(serializers.ModelSerializer):
+    course = serializers.SlugRelatedField(slug_field="slug", read_only=True)
+    completed_lessons = serializers.ListField(
+        child=serializers.IntegerField(), read_only=True
+    )
+    completed_lessons_count = serializers.IntegerField(read_only=True)
+    lessons_count = serializers.IntegerField(read_only=True)
+    percent_complete = serializers.IntegerField(read_only=True)
+    next_lesson = serializers.IntegerField(
+        source="next_lesson_id",
+        read_only=True,
+        allow_null=True,
+        help_text="First lesson not completed yet, the last unlocked one in "
+        "progressive courses.",
+    )
+
+    class Meta:
+        model = CourseProgressModel
+        fields = [
+            "course",
+            "completed_lessons",
+            "completed_lessons_count",
+            "lessons_count",
+            "percent_complete",
+            "next_lesson",
+        ]
@@ -1,22 +1,95 @@
+from django.db.models import Count, OuterRef, Prefetch, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 from drf_yasg.utils import swagger_auto_schema
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
-from apps.material.models import CourseModel
-from apps.material.serializers import CourseSerializer
+from apps.buying.models import ContractModel
+from apps.material.models import (
+    CommentModel,
+    CourseCategoryModel,
+    CourseModel,
+    CourseProgressModel,
+    LessonModel,
+)
+from apps.material.pagination import (
+    LessonCommentCursorPagination,
+    LessonLikeCursorPagination,
+)
+from apps.material.serializers import (
+    AuthorSerializer,
+    CommentSerializer,
+    CourseProgressSerializer,
+    CourseSerializer,
+    CourseSummarySerializer,
+    LessonLikeSerializer,
+)
+from apps.visual_structure.models import ColorModel, ColorPaletteModel
 from utils.auth import BearerTokenAuthentication
 from utils.exceptions.http import HttpPaymentRequired
+from utils.mixins.conditional_get import ConditionalGetMixin
+from utils.mixins.multiserializer import MultiSerializerMixin
 from utils.mixins.service_context import ReadWithServiceContextMixin
 
 
-class CourseViewSet(ReadWithServiceContextMixin, ReadOnlyModelViewSet):
+def lesson_subquery(queryset, field, aggregate):
+    """
+    Subquery que agrega as linhas de `queryset` ligadas ao curso externo,
+    sem multiplicar as linhas do curso com JOINs.
+    """
+    totals = (
+        queryset.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(total=aggregate)
+        .values("total")
+    )
+
+    return Coalesce(Subquery(totals[:1]), 0)
+
+
+def get_course_summary_annotations():
+    lessons = LessonModel.objects.all()
+    likes = LessonModel.likes.through.objects.all()
+
+    return {
+        "lessons_count": lesson_subquery(lessons, "course", Count("pk")),
+        "duration": lesson_subquery(lessons, "course", Sum("reading_time")),
+        "likes_count": lesson_subquery(likes, "lessonmodel__course", Count("pk")),
+    }
+
+
+class CourseViewSet(
+    ConditionalGetMixin,
+    ReadWithServiceContextMixin,
+    MultiSerializerMixin,
+    ReadOnlyModelViewSet,
+):
     authentication_classes = [BearerTokenAuthentication]
     permission_classes = [IsAuthenticated]
-    serializer_class = CourseSerializer
+    serializers = {
+        "list": CourseSummarySerializer,
+        "retrieve": CourseSerializer,
+        "lesson_comments": CommentSerializer,
+        "lesson_likes": AuthorSerializer,
+        "toggle_lesson_like": LessonLikeSerializer,
+        "progress": CourseProgressSerializer,
+        "complete_lesson": CourseProgressSerializer,
+    }
     queryset = (
         CourseModel.objects.select_related("color_palette", "service")
-        .prefetch_related("lessons", "categories")
+        .prefetch_related(
+            Prefetch(
+                "categories",
+                queryset=CourseCategoryModel.objects.select_related("color"),
+            ),
+            "color_palette__colors",
+        )
         .only(
             "id",
             "is_active",
@@ -33,15 +106,135 @@ class CourseViewSet(ReadWithServiceContextMixin, ReadOnlyModelViewSet):
         .filter(is_active=True)
     )
     lookup_field = "slug"
+    etag_models = [
+        CourseModel,
+        LessonModel,
+        CommentModel,
+        CourseCategoryModel,
+        ColorPaletteModel,
+        ColorModel,
+        ContractModel,
+    ]
+
+    def get_etag_scope(self, request):
+        return (request.user.service_id,)
 
     @swagger_auto_schema(operation_summary=_("Course Detail"))
     def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
+        course = self.get_object()
+        liked_lesson_ids = LessonModel.get_liked_ids(course.lessons.all(), request.user)
+        context = {
+            **self.get_serializer_context(),
+            "liked_lesson_ids": liked_lesson_ids,
+        }
+        serializer = self.get_serializer(course, context=context)
+
+        return Response(serializer.data)
 
     @swagger_auto_schema(operation_summary=_("Courses"))
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+
+        if self.action == "list" and self.request.user.is_authenticated:
+            context["entitled_course_ids"] = self.request.user.get_course_ids()
+
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        if self.action == "list":
+            return queryset.annotate(**get_course_summary_annotations())
+
+        if self.action == "retrieve":
+            return queryset.prefetch_related("lessons")
+
+        return queryset
+
+    def get_lesson(self, lesson_id):
+        course = self.get_object()
+
+        return get_object_or_404(course.lessons.all(), pk=lesson_id)
+
+    @swagger_auto_schema(operation_summary=_("Lesson Comments"))
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"lessons/(?P<lesson_id>\d+)/comments",
+    )
+    def lesson_comments(self, request, lesson_id, *args, **kwargs):
+        lesson = self.get_lesson(lesson_id)
+        paginator = LessonCommentCursorPagination()
+        comments = paginator.paginate_queryset(
+            CommentModel.objects.filter(lesson=lesson).select_related("author"),
+            request,
+            view=self,
+        )
+        serializer = self.get_serializer(comments, many=True)
+
+        return paginator.get_paginated_response(serializer.data)
+
+    @swagger_auto_schema(operation_summary=_("Lesson Likes"))
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"lessons/(?P<lesson_id>\d+)/likes",
+    )
+    def lesson_likes(self, request, lesson_id, *args, **kwargs):
+        lesson = self.get_lesson(lesson_id)
+        paginator = LessonLikeCursorPagination()
+        likes = paginator.paginate_queryset(
+            LessonModel.likes.through.objects.filter(lessonmodel=lesson).select_related(
+                "usermodel"
+            ),
+            request,
+            view=self,
+        )
+        serializer = self.get_serializer([like.usermodel for like in likes], many=True)
+
+        return paginator.get_paginated_response(serializer.data)
+
+    @swagger_auto_schema(operation_summary=_("Like or Unlike Lesson"))
+    @lesson_likes.mapping.post
+    def toggle_lesson_like(self, request, lesson_id, *args, **kwargs):
+        lesson = self.get_lesson(lesson_id)
+        liked = lesson.toggle_like(request.user)
+        serializer = self.get_serializer(
+            {"liked": liked, "likes_count": lesson.likes_count}
+        )
+
+        return Response(serializer.data)
+
+    @swagger_auto_schema(operation_summary=_("My Courses Progress"))
+    @action(detail=False, methods=["get"])
+    def progress(self, request):
+        progress = CourseProgressModel.get_for_user(request.user)
+        serializer = self.get_serializer(progress, many=True)
+
+        return Response(serializer.data)
+
+    @swagger_auto_schema(operation_summary=_("Complete Lesson"))
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path=r"lessons/(?P<lesson_id>\d+)/complete",
+    )
+    def complete_lesson(self, request, lesson_id, *args, **kwargs):
+        lesson = self.get_lesson(lesson_id)
+        progress = CourseProgressModel.get_course_progress(request.user, lesson.course)
+
+        if not progress.is_unlocked(lesson):
+            raise PermissionDenied(_("Complete the previous lessons first."))
+
+        CourseProgressModel.complete_lesson(request.user, lesson)
+        progress = CourseProgressModel.get_course_progress(request.user, lesson.course)
+        serializer = self.get_serializer(progress)
+
+        return Response(serializer.data)
+
     def get_object(self):
         obj = super().get_object()
         user = self.request.user
@@ -1,16 +1,24 @@
+from datetime import datetime, time, timedelta
+
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.mixins import ListModelMixin
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from apps.material.live_cache import LiveCalendarCache
 from apps.material.models import LiveModel
-from apps.material.serializers import LiveSerializer
+from apps.material.serializers import LiveCalendarQuerySerializer, LiveSerializer
 from utils.auth import BearerTokenAuthentication
 from utils.mixins.service_context import ListObjectServiceContextMixin
 
 
+def get_start_of_day(date):
+    return timezone.make_aware(datetime.combine(date, time.min))
+
+
 class LiveViewSet(ListObjectServiceContextMixin, GenericViewSet, ListModelMixin):
     authentication_classes = [BearerTokenAuthentication]
     permission_classes = [IsAuthenticated]
@@ -29,10 +37,31 @@ class LiveViewSet(ListObjectServiceContextMixin, GenericViewSet, ListModelMixin)
             "image",
             "service",
         )
-        .filter(is_active=True, starts_at__date__gte=timezone.now().date())
+        .filter(is_active=True)
         .order_by("starts_at")
     )
 
-    @swagger_auto_schema(operation_summary=_("Live Calendar"))
+    def get_calendar(self, date_from, date_to):
+        return self.filter_queryset(self.get_queryset()).filter(
+            starts_at__gte=get_start_of_day(date_from),
+            starts_at__lt=get_start_of_day(date_to + timedelta(days=1)),
+        )
+
+    @swagger_auto_schema(
+        operation_summary=_("Live Calendar"),
+        query_serializer=LiveCalendarQuerySerializer,
+    )
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        query = LiveCalendarQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        date_from = query.validated_data["from"]
+        date_to = query.validated_data["to"]
+        calendar_cache = LiveCalendarCache(request.user.service_id, date_from, date_to)
+        data = calendar_cache.get()
+
+        if data is None:
+            lives = list(self.get_calendar(date_from, date_to))
+            data = self.get_serializer(lives, many=True).data
+            calendar_cache.set(data, lives)
+
+        return Response(data)
@@ -305,6 +305,16 @@ class ServiceEmailConfigModel(BaseModel):
         )
         client.send()
 
+    def send_personalized_email(self, from_email, personalizations):
+        client = self.email_sender_client(
+            from_email=from_email,
+            to_emails=list(personalizations),
+            subject=self.email_subject,
+            html_body=self.email_html_template,
+            personalizations=personalizations,
+        )
+        client.send()
+
 
 class ServiceCredentialConfigModel(BaseModel):
     CREDENTIAL_CONFIG_TYPES_CHOICES = (
@@ -6,6 +6,8 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from apps.visual_structure.models import ColorModel, ColorPaletteModel
+from utils.mixins.conditional_get import ConditionalGetMixin
 from utils.mixins.multiserializer import MultiSerializerMixin
 
 from .models import ServiceModel
@@ -16,7 +18,12 @@ from .serializers import (
 )
 
 
-class ServiceViewSet(MultiSerializerMixin, GenericViewSet, mixins.RetrieveModelMixin):
+class ServiceViewSet(
+    ConditionalGetMixin,
+    MultiSerializerMixin,
+    GenericViewSet,
+    mixins.RetrieveModelMixin,
+):
     queryset = (
         ServiceModel.objects.prefetch_related("colors_palettes")
         .only(
@@ -37,6 +44,7 @@ class ServiceViewSet(MultiSerializerMixin, GenericViewSet, mixins.RetrieveModelM
         "credential_fields": ServiceCredentialConfigSerializer,
     }
     lookup_field = "slug"
+    etag_models = [ServiceModel, ColorPaletteModel, ColorModel]
 
     @swagger_auto_schema(operation_summary=_("Service Detail"))
     def retrieve(self, request, *args, **kwargs):
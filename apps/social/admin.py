@@ -1,4 +1,7 @@
+from functools import partial
+
 from django.contrib import admin
+from django.db import transaction
 from django.utils.html import mark_safe
 from django.utils.translation import gettext_lazy as _
 
@@ -6,6 +9,8 @@ from apps.service.admin import ServiceEmailConfigInline
 from apps.social.models import (
     AITextReportModel,
     EventModel,
+    GuestImportModel,
+    GuestImportRowModel,
     LoginAnswer,
     LoginQuestionOption,
     LoginQuestions,
@@ -14,8 +19,14 @@ from apps.social.models import (
     MissionTypeModel,
     PostCommentModel,
     PostModel,
+    PostNotificationJobModel,
     ReactionModel,
 )
+from apps.social.tasks import (
+    generate_ai_text_reports,
+    run_guest_import,
+    run_post_notification_job,
+)
 from utils.admin import admin_method_attributes
 from utils.admin.mixins import (
     AttachmentPreviewMixin,
@@ -106,8 +117,7 @@ class PostAdmin(
     actions = ["generate_ai_report", "notify_new_post"]
 
     def generate_ai_report(self, _, queryset):
-        for post in queryset:
-            post.generate_ai_text_report()
+        generate_ai_text_reports(list(queryset.values_list("pk", flat=True)))
 
     def notify_new_post(self, _, queryset):
         for post in queryset:
@@ -126,6 +136,45 @@ class PostAdmin(
         return mark_safe(html)
 
 
+@admin.register(PostNotificationJobModel)
+class PostNotificationJobAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "post",
+        "status",
+        "notified_count",
+        "guests_count",
+        "progress",
+        "date_modified",
+    ]
+    readonly_fields = [
+        "id",
+        "post",
+        "status",
+        "last_guest_id",
+        "notified_count",
+        "guests_count",
+        "progress",
+        "error",
+        "date_joined",
+        "date_modified",
+    ]
+    list_filter = ["status"]
+    actions = ["resume"]
+
+    def has_add_permission(self, *_args, **_kwargs):
+        return False
+
+    @staticmethod
+    @admin_method_attributes(short_description=_("Progress"))
+    def progress(obj):
+        return f"{obj.progress}%"
+
+    def resume(self, _, queryset):
+        for job in queryset.exclude(status=PostNotificationJobModel.STATUS_DONE):
+            run_post_notification_job(job.pk)
+
+
 @admin.register(PostCommentModel)
 class PostCommentAdmin(UpdateDateModifiedOrSetAuthorMixin, admin.ModelAdmin):
     list_display = ["id", "author", "post", "reactions_amount", "is_deleted"]
@@ -203,9 +252,78 @@ class EventAdmin(UpdateDateModifiedMixin, AttachmentPreviewMixin, admin.ModelAdm
     )
     actions = ["send_invite_to_guests"]
 
-    def send_invite_to_guests(self, _, events):
+    def send_invite_to_guests(self, request, events):
         for event in events:
-            event.create_guests()
+            report = event.create_guests()
+            self.message_user(
+                request,
+                _(
+                    "%(event)s: %(created)s guests created and %(existing)s "
+                    "already existing in %(elapsed).1fs (%(throughput).0f guests/s)."
+                )
+                % {"event": event, **report},
+            )
+
+
+@admin.register(GuestImportModel)
+class GuestImportAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "event",
+        "status",
+        "rows_count",
+        "created_count",
+        "date_joined",
+    ]
+    readonly_fields = [
+        "id",
+        "status",
+        "rows_count",
+        "created_count",
+        "summary",
+        "error",
+        "date_joined",
+        "date_modified",
+    ]
+    list_filter = ["status"]
+    actions = ["retry"]
+
+    def get_readonly_fields(self, request, obj=None):
+        if obj:
+            return ["event", "file", *self.readonly_fields]
+
+        return self.readonly_fields
+
+    @staticmethod
+    @admin_method_attributes(short_description=_("Summary"))
+    def summary(obj):
+        return ", ".join(
+            f"{status}: {count}" for status, count in obj.get_summary().items()
+        )
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+
+        if not change:
+            transaction.on_commit(partial(run_guest_import, obj.pk))
+
+    def retry(self, _, queryset):
+        for guest_import in queryset.filter(status=GuestImportModel.STATUS_FAILED):
+            run_guest_import(guest_import.pk)
+
+
+@admin.register(GuestImportRowModel)
+class GuestImportRowAdmin(admin.ModelAdmin):
+    list_display = ["id", "guest_import", "line", "name", "email", "status", "error"]
+    list_filter = ["status"]
+    search_fields = ["email", "name"]
+    raw_id_fields = ["guest_import"]
+
+    def has_add_permission(self, *_args, **_kwargs):
+        return False
+
+    def has_change_permission(self, *_args, **_kwargs):
+        return False
 
 
 class MissionInteractionInline(AttachmentPreviewMixin, admin.TabularInline):
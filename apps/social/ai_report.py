@@ -0,0 +1,66 @@
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+
+AI_REPORT_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+AI_REPORT_MAX_WORKERS = 4
+
+logger = logging.getLogger(__name__)
+
+
+def get_ai_report_hash(text_ai: str, pre_set: str, message: str):
+    content = "\0".join([text_ai, pre_set, message])
+
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def get_ai_report_cache_key(digest: str):
+    return f"social:ai-report:{digest}"
+
+
+def request_ai_report(text_ai_client, pre_set: str, message: str):
+    return text_ai_client(pre_set, message).get_response()
+
+
+def get_ai_reports(prompts: dict, max_workers: int = AI_REPORT_MAX_WORKERS):
+    """
+    Returns the response to each prompt, keyed by the prompt hash. The prompts
+    map a hash to the text AI client, pre set and message. Cached responses are
+    reused and the missing ones are requested concurrently, at most max_workers
+    at a time. Prompts whose request fails are left out of the result.
+    """
+    keys = {get_ai_report_cache_key(digest): digest for digest in prompts}
+    reports = {keys[key]: report for key, report in cache.get_many(keys).items()}
+    missing = [digest for digest in prompts if digest not in reports]
+
+    if not missing:
+        return reports
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            digest: executor.submit(request_ai_report, *prompts[digest])
+            for digest in missing
+        }
+
+    new_reports = {}
+
+    for digest, future in futures.items():
+        error = future.exception()
+
+        if error is None:
+            new_reports[digest] = future.result()
+        else:
+            logger.warning("AI report request %s failed: %s", digest, error)
+
+    cache.set_many(
+        {
+            get_ai_report_cache_key(digest): report
+            for digest, report in new_reports.items()
+        },
+        timeout=AI_REPORT_CACHE_TIMEOUT,
+    )
+    reports.update(new_reports)
+
+    return reports
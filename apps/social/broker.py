@@ -0,0 +1,109 @@
+import asyncio
+import json
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+import redis
+import redis.asyncio
+from django.conf import settings
+
+STREAM_CHANNEL_PREFIX = "social:stream"
+
+
+def get_stream_channel(service_id, event_id=None):
+    return f"{STREAM_CHANNEL_PREFIX}:{service_id}:{event_id}"
+
+
+class Subscription:
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+
+    async def get(self, timeout: float):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class InMemoryBroker:
+    """
+    Delivers messages to the subscribers of the same process. Publishing is
+    thread safe, so the sync Django code can publish to the async streams.
+    """
+
+    def __init__(self):
+        self.subscribers = defaultdict(set)
+
+    def publish(self, channel: str, message: dict):
+        for queue, loop in list(self.subscribers[channel]):
+            loop.call_soon_threadsafe(queue.put_nowait, message)
+
+    @asynccontextmanager
+    async def subscribe(self, *channels):
+        subscriber = (asyncio.Queue(), asyncio.get_running_loop())
+
+        for channel in channels:
+            self.subscribers[channel].add(subscriber)
+
+        try:
+            yield Subscription(subscriber[0])
+        finally:
+            for channel in channels:
+                self.subscribers[channel].discard(subscriber)
+
+
+class RedisBroker(InMemoryBroker):
+    """
+    Fans the messages out through Redis pub/sub, so every server process
+    receives what any of them publishes. Each process keeps a single Redis
+    subscription and delivers the messages to its own subscribers.
+    """
+
+    reconnect_delay = 1
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+        self.client = redis.Redis.from_url(url)
+        self.listener = None
+
+    def publish(self, channel: str, message: dict):
+        try:
+            self.client.publish(channel, json.dumps(message))
+        except redis.RedisError:
+            pass
+
+    async def listen(self):
+        while True:
+            client = redis.asyncio.Redis.from_url(self.url)
+            pubsub = client.pubsub()
+
+            try:
+                await pubsub.psubscribe(f"{STREAM_CHANNEL_PREFIX}:*")
+
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        super().publish(
+                            message["channel"].decode(), json.loads(message["data"])
+                        )
+            except redis.RedisError:
+                await asyncio.sleep(self.reconnect_delay)
+            finally:
+                await pubsub.close()
+                await client.close()
+
+    @asynccontextmanager
+    async def subscribe(self, *channels):
+        if self.listener is None or self.listener.done():
+            self.listener = asyncio.ensure_future(self.listen())
+
+        async with super().subscribe(*channels) as subscription:
+            yield subscription
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    redis_url = getattr(settings, "REDIS_URL", None)
+
+    return RedisBroker(redis_url) if redis_url else InMemoryBroker()
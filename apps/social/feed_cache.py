@@ -0,0 +1,44 @@
+import hashlib
+
+from django.core.cache import cache
+
+from utils.cache_version import bump_version, get_version
+
+
+class PostFeedCache:
+    """
+    Caches the shared (user independent) part of the serialized post feed per
+    service and event. Every change to the feed bumps the scope version, so
+    stale pages are never read again and simply expire.
+    """
+
+    timeout = 60 * 5
+
+    def __init__(self, service_id, event_id=None):
+        self.service_id = service_id
+        self.event_id = event_id
+
+    @staticmethod
+    def get_version_key(service_id, event_id=None):
+        return f"social:feed:{service_id}:{event_id}:version"
+
+    def get_version(self):
+        return get_version(self.get_version_key(self.service_id, self.event_id))
+
+    def get_page_key(self, page: str):
+        digest = hashlib.md5(page.encode()).hexdigest()
+        version = self.get_version()
+
+        return f"social:feed:{self.service_id}:{self.event_id}:{version}:{digest}"
+
+    def get_or_set(self, page: str, default):
+        return cache.get_or_set(self.get_page_key(page), default, self.timeout)
+
+    @classmethod
+    def invalidate(cls, service_id, event_id=None):
+        """
+        Bumps the version of the event feed and of the whole service feed,
+        which is the one seen by users that aren't guests of an event.
+        """
+        for scope_event_id in {event_id, None}:
+            bump_version(cls.get_version_key(service_id, scope_event_id))
@@ -0,0 +1,68 @@
+import csv
+import io
+import re
+
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+from openpyxl import load_workbook
+
+GUEST_EMAIL_REGEX = re.compile(
+    r"^([a-z0-9]+)[a-z0-9.-][^\.]*([a-z0-9!@#$%^&*()_+]+)"
+    r"@([a-z0-9]+)[a-z0-9.-]*\.[a-z0-9]*([a-z0-9]+){2,}$"
+)
+GUEST_FILE_EXTENSIONS = ["csv", "xlsx"]
+
+
+def read_csv_rows(file):
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+
+    try:
+        yield from csv.reader(text)
+    finally:
+        if not text.closed:
+            text.detach()
+
+
+def read_xlsx_rows(file):
+    workbook = load_workbook(file, read_only=True, data_only=True)
+
+    try:
+        for row in workbook.active.iter_rows(values_only=True):
+            yield ["" if value is None else str(value) for value in row]
+    finally:
+        workbook.close()
+
+
+def get_column(row: list, index):
+    if index is None or index >= len(row):
+        return ""
+
+    return row[index].strip()
+
+
+def read_guest_rows(file, file_name: str):
+    """
+    Yields the line, name and email of each guest of a CSV or XLSX file,
+    reading one row at a time. The first row is the header, which must have
+    an "email" column and may have a "name" column.
+    """
+    reader = read_xlsx_rows if file_name.lower().endswith(".xlsx") else read_csv_rows
+    rows = reader(file)
+    header = [column.strip().lower() for column in next(rows, [])]
+
+    if "email" not in header:
+        raise ValidationError(_('The guests file must have an "email" column.'))
+
+    email_index = header.index("email")
+    name_index = header.index("name") if "name" in header else None
+
+    for line, row in enumerate(rows, start=2):
+        email = get_column(row, email_index).lower()
+        name = get_column(row, name_index)
+
+        if email or name:
+            yield line, name, email
+
+
+def is_valid_guest_email(email: str):
+    return len(email) <= 254 and GUEST_EMAIL_REGEX.match(email) is not None
@@ -0,0 +1,142 @@
+from collections import defaultdict
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+from django.db import transaction
+
+LEADERBOARD_KEY_PREFIX = "social:leaderboard"
+
+
+def get_leaderboard_key(service_id, event_id=None):
+    return f"{LEADERBOARD_KEY_PREFIX}:{service_id}:{event_id}"
+
+
+class InMemoryLeaderboard:
+    """
+    Keeps the scores in the process memory, ordered like the Redis sorted
+    sets: by score and then by user id, both descending. Meant for tests and
+    local development.
+    """
+
+    def __init__(self):
+        self.boards = defaultdict(dict)
+
+    def get_ranking(self, key: str):
+        return sorted(
+            self.boards[key].items(),
+            key=lambda item: (item[1], str(item[0])),
+            reverse=True,
+        )
+
+    def increment(self, key: str, user_id: int, amount: int = 1):
+        board = self.boards[key]
+        board[user_id] = board.get(user_id, 0) + amount
+
+        if board[user_id] <= 0:
+            del board[user_id]
+
+    def get_top(self, key: str, limit: int):
+        return self.get_ranking(key)[:limit]
+
+    def get_rank(self, key: str, user_id: int):
+        if user_id not in self.boards[key]:
+            return None
+
+        position = [member for member, _ in self.get_ranking(key)].index(user_id)
+
+        return position + 1, self.boards[key][user_id]
+
+    def rebuild(self, boards: dict):
+        self.boards = defaultdict(dict)
+
+        for key, board in boards.items():
+            self.boards[key].update(board)
+
+
+class RedisLeaderboard:
+    """
+    Keeps each leaderboard in a Redis sorted set, so incrementing a score and
+    finding a user's position are O(log n) and the top N is O(log n + N).
+    """
+
+    chunk_size = 1000
+
+    def __init__(self, url: str):
+        self.url = url
+        self.client = redis.Redis.from_url(url)
+
+    def increment(self, key: str, user_id: int, amount: int = 1):
+        """
+        Adds `amount` (negative to subtract) to the user's score. Users left
+        without score leave the board, as they do when it's rebuilt.
+        """
+        try:
+            self.client.zincrby(key, amount, user_id)
+
+            if amount < 0:
+                self.client.zremrangebyscore(key, "-inf", 0)
+        except redis.RedisError:
+            pass
+
+    def get_top(self, key: str, limit: int):
+        members = self.client.zrevrange(key, 0, limit - 1, withscores=True)
+
+        return [(int(member), int(score)) for member, score in members]
+
+    def get_rank(self, key: str, user_id: int):
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.zrevrank(key, user_id)
+        pipeline.zscore(key, user_id)
+        position, score = pipeline.execute()
+
+        if position is None:
+            return None
+
+        return position + 1, int(score)
+
+    def rebuild(self, boards: dict):
+        """
+        Writes every board to a temporary key and renames it over the current
+        one, so readers never see a partial board. Boards left without scores
+        are deleted.
+        """
+        stale_keys = set(self.client.scan_iter(match=f"{LEADERBOARD_KEY_PREFIX}:*"))
+
+        for key, board in boards.items():
+            temporary_key = f"{key}:rebuild"
+            items = list(board.items())
+
+            if not items:
+                continue
+
+            self.client.delete(temporary_key)
+
+            for start in range(0, len(items), self.chunk_size):
+                end = start + self.chunk_size
+                self.client.zadd(temporary_key, dict(items[start:end]))
+
+            self.client.rename(temporary_key, key)
+            stale_keys.discard(key.encode())
+
+        if stale_keys:
+            self.client.delete(*stale_keys)
+
+
+@lru_cache(maxsize=None)
+def get_leaderboard():
+    if settings.REDIS_URL:
+        return RedisLeaderboard(settings.REDIS_URL)
+
+    return InMemoryLeaderboard()
+
+
+def score_mission_completion(mission, user_id: int, amount: int = 1):
+    """
+    Adds the completed mission to the user's score (or removes it, with a
+    negative `amount`) once the transaction is committed, so a rolled back
+    change never counts.
+    """
+    key = get_leaderboard_key(mission.service_id, mission.event_id)
+
+    transaction.on_commit(lambda: get_leaderboard().increment(key, user_id, amount))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework import serializers
+
+from utils.direct_upload import abort_stale_multipart_uploads
+
+
+class Command(BaseCommand):
+    help = (
+        "Aborts the multipart uploads whose token has expired, deleting the "
+        "parts left in the bucket by clients that never completed them."
+    )
+
+    def handle(self, *args, **options):
+        try:
+            aborted = abort_stale_multipart_uploads()
+        except serializers.ValidationError as error:
+            raise CommandError(error.detail[0])
+
+        self.stdout.write(self.style.SUCCESS(f"Aborted {aborted} uploads"))
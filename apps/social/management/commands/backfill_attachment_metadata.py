@@ -0,0 +1,69 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from utils.mixins.attachment_type import GetAttachmentTypeMixin
+
+
+class Command(BaseCommand):
+    help = (
+        "Reads the MIME type, size, dimensions and duration of the attachments "
+        "uploaded before these values were stored, opening each file once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=100)
+
+    def backfill_instance(self, instance):
+        try:
+            instance.set_attachment_metadata()
+        except Exception as error:
+            instance.set_attachment_metadata(read_file=False)
+            self.stderr.write(f"{instance._meta.label} {instance.pk}: {error}")
+
+            return False
+        finally:
+            instance.attachment.close()
+
+        return True
+
+    def backfill_model(self, model, chunk_size: int):
+        instances = (
+            model.objects.exclude(attachment="")
+            .exclude(attachment__isnull=True)
+            .filter(attachment_size__isnull=True)
+            .only("id", "attachment")
+            .order_by("pk")
+        )
+        updated = failed = 0
+        last_id = 0
+
+        while True:
+            chunk = list(instances.filter(pk__gt=last_id)[:chunk_size])
+
+            if not chunk:
+                break
+
+            for instance in chunk:
+                if self.backfill_instance(instance):
+                    updated += 1
+                else:
+                    failed += 1
+
+            model.objects.bulk_update(
+                chunk, GetAttachmentTypeMixin.ATTACHMENT_METADATA_FIELDS
+            )
+            last_id = chunk[-1].pk
+
+        return updated, failed
+
+    def handle(self, *args, **options):
+        for model in apps.get_models():
+            if not issubclass(model, GetAttachmentTypeMixin):
+                continue
+
+            updated, failed = self.backfill_model(model, options["chunk_size"])
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{model._meta.label}: {updated} updated, {failed} failed"
+                )
+            )
@@ -0,0 +1,106 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+
+from apps.social.models import PostModel, ReactionModel, ReactionTypeModel
+from apps.user.models import UserModel
+
+
+def react_many_times(post_id, user_id, reaction_type_ids, amount):
+    """
+    Reacts `amount` times as the same user, cycling the reaction types.
+    """
+    try:
+        post = PostModel.objects.get(pk=post_id)
+        user = UserModel.objects.get(pk=user_id)
+        reaction_types = cycle(reaction_type_ids)
+
+        for _ in range(amount):
+            post.react(user, next(reaction_types))
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the throughput of concurrent reactions to a single post and "
+        "checks that no duplicated reactions were created. Meant to be run "
+        "against a development database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("post_id", type=int)
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument("--reactions-per-worker", type=int, default=50)
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        amount = options["reactions_per_worker"]
+
+        try:
+            post = PostModel.objects.get(pk=options["post_id"])
+        except PostModel.DoesNotExist:
+            raise CommandError("Post not found.")
+
+        user_ids = list(
+            UserModel.objects.filter(service_id=post.service_id)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:workers]
+        )
+        reaction_type_ids = list(
+            ReactionTypeModel.objects.filter(service_id=post.service_id).values_list(
+                "pk", flat=True
+            )
+        )
+
+        if len(user_ids) < workers:
+            raise CommandError(f"The post's service needs at least {workers} users.")
+
+        if not reaction_type_ids:
+            raise CommandError("The post's service has no reaction types.")
+
+        started_at = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    react_many_times, post.pk, user_id, reaction_type_ids, amount
+                )
+                for user_id in user_ids
+            ]
+
+            for future in futures:
+                future.result()
+
+        elapsed = time.perf_counter() - started_at
+        total = workers * amount
+        post.refresh_from_db()
+        duplicated = (
+            ReactionModel.objects.filter(post=post)
+            .values("user")
+            .annotate(total=Count("pk"))
+            .filter(total__gt=1)
+            .count()
+        )
+        linked = post.reactions.count()
+
+        self.stdout.write(
+            f"{total} reactions in {elapsed:.2f}s ({total / elapsed:.0f} reactions/s)"
+        )
+        by_type = sum(post.reactions_by_type.values())
+
+        self.stdout.write(
+            f"reactions_count={post.reactions_count} linked={linked} "
+            f"by_type={by_type} duplicated={duplicated}"
+        )
+
+        if duplicated or not post.reactions_count == linked == by_type:
+            raise CommandError("The reactions of the post are inconsistent.")
+
+        self.stdout.write(
+            self.style.SUCCESS("The reactions of the post are consistent")
+        )
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.social.models import EventModel
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates the guests listed in the event's guests field, reporting the "
+        "result of each guest and the throughput. Meant for events too large "
+        "to be imported from the admin."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("event_id", type=int)
+
+    def handle(self, *args, **options):
+        try:
+            event = EventModel.objects.select_related("service").get(
+                pk=options["event_id"]
+            )
+        except EventModel.DoesNotExist:
+            raise CommandError("Event not found.")
+
+        report = event.create_guests()
+
+        for result in report["results"]:
+            self.stdout.write(f"{result['email']}: {result['status']}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{report['created']} guests created and {report['existing']} "
+                f"already existing in {report['elapsed']:.2f}s "
+                f"({report['throughput']:.0f} guests/s)"
+            )
+        )
@@ -0,0 +1,37 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from apps.social.leaderboard import get_leaderboard, get_leaderboard_key
+from apps.social.models import MissionInteractionModel
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the mission leaderboards from the completed missions, fixing "
+        "scores lost while Redis was unavailable."
+    )
+
+    def handle(self, *args, **options):
+        completions = (
+            MissionInteractionModel.objects.order_by()
+            .values("mission__service_id", "mission__event_id", "user_id")
+            .annotate(score=Count("mission", distinct=True))
+        )
+        boards = defaultdict(dict)
+
+        for completion in completions.iterator():
+            key = get_leaderboard_key(
+                completion["mission__service_id"], completion["mission__event_id"]
+            )
+            boards[key][completion["user_id"]] = completion["score"]
+
+        get_leaderboard().rebuild(boards)
+
+        users_count = sum(len(board) for board in boards.values())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {len(boards)} leaderboards with {users_count} users"
+            )
+        )
@@ -0,0 +1,83 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.social.models import PostCommentModel, PostModel, ReactionTypeModel
+
+REBUILD_REACTIONS_BY_TYPE_SQL = """
+UPDATE {target_table} AS target SET reactions_by_type = COALESCE((
+    SELECT jsonb_object_agg(counts.name, counts.total)
+    FROM (
+        SELECT reaction_type.name, COUNT(*) AS total
+        FROM {through_table} AS through
+        JOIN {reaction_table} AS reaction
+            ON reaction.id = through.{through_reaction}
+        JOIN {reaction_type_table} AS reaction_type
+            ON reaction_type.id = reaction.reaction_type_id
+        WHERE through.{through_target} = target.id
+        GROUP BY reaction_type.name
+    ) AS counts
+), '{{}}'::jsonb)
+"""
+
+
+def count_subquery(queryset, field):
+    """
+    Subquery que conta as linhas de `queryset` relacionadas ao registro externo.
+    """
+    counts = (
+        queryset.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+
+    return Coalesce(Subquery(counts[:1]), 0)
+
+
+def rebuild_reactions_by_type(model):
+    """
+    Recalcula a coluna `reactions_by_type` de todos os registros do model.
+    """
+    reactions_field = model._meta.get_field("reactions")
+    sql = REBUILD_REACTIONS_BY_TYPE_SQL.format(
+        target_table=model._meta.db_table,
+        through_table=reactions_field.remote_field.through._meta.db_table,
+        through_target=reactions_field.m2m_column_name(),
+        through_reaction=reactions_field.m2m_reverse_name(),
+        reaction_table=reactions_field.related_model._meta.db_table,
+        reaction_type_table=ReactionTypeModel._meta.db_table,
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the reactions and comments counters of posts and comments."
+
+    def handle(self, *args, **options):
+        active_comments = PostCommentModel.objects.filter(is_deleted=False)
+
+        posts = PostModel.objects.update(
+            reactions_count=count_subquery(
+                PostModel.reactions.through.objects.all(), "postmodel"
+            ),
+            comments_count=count_subquery(active_comments, "post"),
+        )
+        comments = PostCommentModel.objects.update(
+            reactions_count=count_subquery(
+                PostCommentModel.reactions.through.objects.all(), "postcommentmodel"
+            ),
+            comments_count=count_subquery(active_comments, "answer"),
+        )
+        rebuild_reactions_by_type(PostModel)
+        rebuild_reactions_by_type(PostCommentModel)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt counters of {posts} posts and {comments} comments"
+            )
+        )
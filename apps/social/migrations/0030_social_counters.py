@@ -0,0 +1,74 @@
+# Generated by Django 3.2.25 on 2026-10-17 19:06
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_subquery(queryset, field):
+    counts = (
+        queryset.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+
+    return Coalesce(Subquery(counts[:1]), 0)
+
+
+def fill_counters(apps, _schema_editor):
+    PostModel = apps.get_model("social", "PostModel")
+    PostCommentModel = apps.get_model("social", "PostCommentModel")
+    active_comments = PostCommentModel.objects.filter(is_deleted=False)
+
+    PostModel.objects.update(
+        reactions_count=count_subquery(
+            PostModel.reactions.through.objects.all(), "postmodel"
+        ),
+        comments_count=count_subquery(active_comments, "post"),
+    )
+    PostCommentModel.objects.update(
+        reactions_count=count_subquery(
+            PostCommentModel.reactions.through.objects.all(), "postcommentmodel"
+        ),
+        comments_count=count_subquery(active_comments, "answer"),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social", "0029_postcommentmodel_mentions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="postcommentmodel",
+            name="comments_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Answers Count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="postcommentmodel",
+            name="reactions_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Reactions Count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="postmodel",
+            name="comments_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Comments Count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="postmodel",
+            name="reactions_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Reactions Count"
+            ),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-17 19:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social", "0030_social_counters"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="postmodel",
+            index=models.Index(
+                fields=["service", "event", "is_active", "date_joined"],
+                name="post_feed_idx",
+            ),
+        ),
+    ]
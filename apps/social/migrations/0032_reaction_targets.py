@@ -0,0 +1,39 @@
+# Generated by Django 3.2.25 on 2026-10-17 19:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social", "0031_postmodel_feed_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reactionmodel",
+            name="comment",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="social.postcommentmodel",
+                verbose_name="Comment",
+            ),
+        ),
+        migrations.AddField(
+            model_name="reactionmodel",
+            name="post",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="social.postmodel",
+                verbose_name="Post",
+            ),
+        ),
+    ]
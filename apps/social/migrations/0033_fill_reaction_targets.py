@@ -0,0 +1,62 @@
+# Generated by Django 3.2.25 on 2026-10-17 19:33
+
+from django.db import migrations
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+REACTION_TARGETS = [
+    ("PostModel", "post", "postmodel"),
+    ("PostCommentModel", "comment", "postcommentmodel"),
+]
+
+
+def count_subquery(queryset, field):
+    counts = (
+        queryset.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+
+    return Coalesce(Subquery(counts[:1]), 0)
+
+
+def fill_reaction_targets(apps, _schema_editor):
+    ReactionModel = apps.get_model("social", "ReactionModel")
+
+    for model_name, field, through_field in REACTION_TARGETS:
+        model = apps.get_model("social", model_name)
+        through = model.reactions.through
+        targets = through.objects.filter(reactionmodel=OuterRef("pk")).values(
+            through_field
+        )
+
+        ReactionModel.objects.update(**{field: Subquery(targets[:1])})
+
+        duplicates = (
+            ReactionModel.objects.filter(**{f"{field}__isnull": False})
+            .order_by()
+            .values("user", field)
+            .annotate(latest=Max("pk"), total=Count("pk"))
+            .filter(total__gt=1)
+        )
+
+        for duplicate in duplicates:
+            ReactionModel.objects.filter(
+                user=duplicate["user"], **{field: duplicate[field]}
+            ).exclude(pk=duplicate["latest"]).delete()
+
+        model.objects.update(
+            reactions_count=count_subquery(through.objects.all(), through_field)
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social", "0032_reaction_targets"),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_reaction_targets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.25 on 2026-10-17 19:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social", "0033_fill_reaction_targets"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="reactionmodel",
+            constraint=models.UniqueConstraint(
+                fields=("user", "post"), name="unique_user_post_reaction"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="reactionmodel",
+            constraint=models.UniqueConstraint(
+                fields=("user", "comment"), name="unique_user_comment_reaction"
+            ),
+        ),
+    ]
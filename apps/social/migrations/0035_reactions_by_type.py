@@ -0,0 +1,50 @@
+# Generated by Django 3.2.25 on 2026-10-17 19:39
+
+from django.db import migrations, models
+
+FILL_REACTIONS_BY_TYPE_SQL = """
+UPDATE social_{target} AS target SET reactions_by_type = COALESCE((
+    SELECT jsonb_object_agg(counts.name, counts.total)
+    FROM (
+        SELECT reaction_type.name, COUNT(*) AS total
+        FROM social_{target}_reactions AS through
+        JOIN social_reactionmodel AS reaction
+            ON reaction.id = through.reactionmodel_id
+        JOIN social_reactiontypemodel AS reaction_type
+            ON reaction_type.id = reaction.reaction_type_id
+        WHERE through.{target}_id = target.id
+        GROUP BY reaction_type.name
+    ) AS counts
+), '{{}}'::jsonb)
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social", "0034_reactionmodel_unique_targets"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="postcommentmodel",
+            name="reactions_by_type",
+            field=models.JSONField(
+                default=dict, editable=False, verbose_name="Reactions By Type"
+            ),
+        ),
+        migrations.AddField(
+            model_name="postmodel",
+            name="reactions_by_type",
+            field=models.JSONField(
+                default=dict, editable=False, verbose_name="Reactions By Type"
+            ),
+        ),
+        migrations.RunSQL(
+            FILL_REACTIONS_BY_TYPE_SQL.format(target="postmodel"),
+            migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            FILL_REACTIONS_BY_TYPE_SQL.format(target="postcommentmodel"),
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 3.2.25 on 2026-10-17 20:01
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social", "0035_reactions_by_type"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostNotificationJobModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("is_active", models.BooleanField(default=True)),
+                (
+                    "date_joined",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="date joined"
+                    ),
+                ),
+                (
+                    "date_modified",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="date modified"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "last_guest_id",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Last Guest ID"
+                    ),
+                ),
+                (
+                    "guests_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Guests Count"),
+                ),
+                (
+                    "notified_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Notified Count"
+                    ),
+                ),
+                (
+                    "error",
+                    models.TextField(blank=True, null=True, verbose_name="Error"),
+                ),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notification_jobs",
+                        to="social.postmodel",
+                        verbose_name="Post",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Post Notification Job",
+                "verbose_name_plural": "Post Notification Jobs",
+            },
+        ),
+    ]
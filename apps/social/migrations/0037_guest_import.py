@@ -0,0 +1,195 @@
+# Generated by Django 3.2.25 on 2026-10-17 20:17
+
+import django.core.validators
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+import apps.social.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social", "0036_post_notification_job"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GuestImportModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("is_active", models.BooleanField(default=True)),
+                (
+                    "date_joined",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="date joined"
+                    ),
+                ),
+                (
+                    "date_modified",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="date modified"
+                    ),
+                ),
+                (
+                    "file",
+                    models.FileField(
+                        help_text=(
+                            "A CSV or XLSX file whose first row has the "
+                            '"name" and "email" columns.'
+                        ),
+                        upload_to=apps.social.models.guest_import_directory_path,
+                        validators=[
+                            django.core.validators.FileExtensionValidator(
+                                ["csv", "xlsx"]
+                            )
+                        ],
+                        verbose_name="File",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "rows_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Rows Count"),
+                ),
+                (
+                    "created_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Created Count"
+                    ),
+                ),
+                (
+                    "error",
+                    models.TextField(blank=True, null=True, verbose_name="Error"),
+                ),
+            ],
+            options={
+                "verbose_name": "Guest Import",
+                "verbose_name_plural": "Guest Imports",
+            },
+        ),
+        migrations.AlterField(
+            model_name="eventmodel",
+            name="guests",
+            field=models.TextField(
+                blank=True,
+                help_text=(
+                    "\n            Enter guests in the following format:"
+                    "\n            <br>"
+                    "\n            name;email,name;email,name;email,name;email,..."
+                    "\n            <br>"
+                    "\n            Like:"
+                    "\n            <br>"
+                    "\n            John Doe;john@mail.com,Elisa Jax;elisa@mail.com,"
+                    "Edward,edward.us@mail.com,..."
+                    "\n            <br>"
+                    "\n            For large lists, upload a CSV or XLSX file in Guest "
+                    "Imports instead."
+                    "\n        "
+                ),
+                null=True,
+                verbose_name="Guests",
+            ),
+        ),
+        migrations.CreateModel(
+            name="GuestImportRowModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("is_active", models.BooleanField(default=True)),
+                (
+                    "date_joined",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="date joined"
+                    ),
+                ),
+                (
+                    "date_modified",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="date modified"
+                    ),
+                ),
+                ("line", models.PositiveIntegerField(verbose_name="Line")),
+                ("name", models.TextField(blank=True, verbose_name="Name")),
+                ("email", models.TextField(verbose_name="Email")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("invalid", "Invalid"),
+                            ("duplicated", "Duplicated"),
+                            ("exists", "Exists"),
+                            ("created", "Created"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "error",
+                    models.CharField(
+                        blank=True, max_length=255, null=True, verbose_name="Error"
+                    ),
+                ),
+                (
+                    "guest_import",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rows",
+                        to="social.guestimportmodel",
+                        verbose_name="Guest Import",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Guest Import Row",
+                "verbose_name_plural": "Guest Import Rows",
+            },
+        ),
+        migrations.AddField(
+            model_name="guestimportmodel",
+            name="event",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="guest_imports",
+                to="social.eventmodel",
+                verbose_name="Event",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="guestimportrowmodel",
+            index=models.Index(
+                fields=["guest_import", "email"], name="guest_import_row_email_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.25 on 2026-10-17 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social", "0037_guest_import"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="postmodel",
+            name="ai_report_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Hash of the AI settings and message used by the AI report.",
+                max_length=64,
+                verbose_name="AI Report Hash",
+            ),
+        ),
+    ]
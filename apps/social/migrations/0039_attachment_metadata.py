@@ -0,0 +1,464 @@
+# Generated by Django 3.2.25 on 2026-10-17 21:02
+
+import os
+
+from django.db import migrations, models
+
+CHUNK_SIZE = 1000
+ATTACHMENT_MODELS = [
+    "EventModel",
+    "MissionInteractionModel",
+    "MissionModel",
+    "PostCommentModel",
+    "PostModel",
+    "ReactionTypeModel",
+]
+VIDEO_EXTENSIONS = ["mp4", "webm", "ogg", "ogv", "avi", "mov", "wmv", "flv", "mkv"]
+IMAGE_EXTENSIONS = ["jpg", "jpeg", "png", "gif", "bmp", "svg", "webp"]
+AUDIO_EXTENSIONS = [
+    "mp3",
+    "wav",
+    "ogg",
+    "oga",
+    "flac",
+    "aac",
+    "m4a",
+    "wma",
+    "alac",
+    "aiff",
+    "pcm",
+    "dsd",
+]
+
+
+def get_attachment_type(name):
+    extension = os.path.splitext(name)[1][1:].lower()
+
+    if extension in VIDEO_EXTENSIONS:
+        return "video"
+
+    if extension in IMAGE_EXTENSIONS:
+        return "image"
+
+    if extension in AUDIO_EXTENSIONS:
+        return "audio"
+
+    return "file"
+
+
+def fill_attachment_type(apps, _schema_editor):
+    for model_name in ATTACHMENT_MODELS:
+        Model = apps.get_model("social", model_name)
+        instances = (
+            Model.objects.exclude(attachment="")
+            .exclude(attachment__isnull=True)
+            .only("id", "attachment")
+            .order_by("pk")
+        )
+        last_id = 0
+
+        while True:
+            chunk = list(instances.filter(pk__gt=last_id)[:CHUNK_SIZE])
+
+            if not chunk:
+                break
+
+            for instance in chunk:
+                instance.attachment_type = get_attachment_type(instance.attachment.name)
+
+            Model.objects.bulk_update(chunk, ["attachment_type"])
+            last_id = chunk[-1].pk
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social", "0038_post_ai_report_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventmodel",
+            name="attachment_duration",
+            field=models.FloatField(
+                blank=True,
+                editable=False,
+                help_text="In seconds.",
+                null=True,
+                verbose_name="Attachment Duration",
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventmodel",
+            name="attachment_height",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Height"
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventmodel",
+            name="attachment_mime_type",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=255,
+                verbose_name="Attachment MIME Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventmodel",
+            name="attachment_size",
+            field=models.PositiveBigIntegerField(
+                blank=True,
+                editable=False,
+                help_text="In bytes.",
+                null=True,
+                verbose_name="Attachment Size",
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventmodel",
+            name="attachment_type",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("image", "Image"),
+                    ("video", "Video"),
+                    ("audio", "Audio"),
+                    ("file", "File"),
+                ],
+                editable=False,
+                max_length=5,
+                null=True,
+                verbose_name="Attachment Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventmodel",
+            name="attachment_width",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Width"
+            ),
+        ),
+        migrations.AddField(
+            model_name="missioninteractionmodel",
+            name="attachment_duration",
+            field=models.FloatField(
+                blank=True,
+                editable=False,
+                help_text="In seconds.",
+                null=True,
+                verbose_name="Attachment Duration",
+            ),
+        ),
+        migrations.AddField(
+            model_name="missioninteractionmodel",
+            name="attachment_height",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Height"
+            ),
+        ),
+        migrations.AddField(
+            model_name="missioninteractionmodel",
+            name="attachment_mime_type",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=255,
+                verbose_name="Attachment MIME Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="missioninteractionmodel",
+            name="attachment_size",
+            field=models.PositiveBigIntegerField(
+                blank=True,
+                editable=False,
+                help_text="In bytes.",
+                null=True,
+                verbose_name="Attachment Size",
+            ),
+        ),
+        migrations.AddField(
+            model_name="missioninteractionmodel",
+            name="attachment_type",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("image", "Image"),
+                    ("video", "Video"),
+                    ("audio", "Audio"),
+                    ("file", "File"),
+                ],
+                editable=False,
+                max_length=5,
+                null=True,
+                verbose_name="Attachment Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="missioninteractionmodel",
+            name="attachment_width",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Width"
+            ),
+        ),
+        migrations.AddField(
+            model_name="missionmodel",
+            name="attachment_duration",
+            field=models.FloatField(
+                blank=True,
+                editable=False,
+                help_text="In seconds.",
+                null=True,
+                verbose_name="Attachment Duration",
+            ),
+        ),
+        migrations.AddField(
+            model_name="missionmodel",
+            name="attachment_height",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Height"
+            ),
+        ),
+        migrations.AddField(
+            model_name="missionmodel",
+            name="attachment_mime_type",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=255,
+                verbose_name="Attachment MIME Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="missionmodel",
+            name="attachment_size",
+            field=models.PositiveBigIntegerField(
+                blank=True,
+                editable=False,
+                help_text="In bytes.",
+                null=True,
+                verbose_name="Attachment Size",
+            ),
+        ),
+        migrations.AddField(
+            model_name="missionmodel",
+            name="attachment_type",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("image", "Image"),
+                    ("video", "Video"),
+                    ("audio", "Audio"),
+                    ("file", "File"),
+                ],
+                editable=False,
+                max_length=5,
+                null=True,
+                verbose_name="Attachment Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="missionmodel",
+            name="attachment_width",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Width"
+            ),
+        ),
+        migrations.AddField(
+            model_name="postcommentmodel",
+            name="attachment_duration",
+            field=models.FloatField(
+                blank=True,
+                editable=False,
+                help_text="In seconds.",
+                null=True,
+                verbose_name="Attachment Duration",
+            ),
+        ),
+        migrations.AddField(
+            model_name="postcommentmodel",
+            name="attachment_height",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Height"
+            ),
+        ),
+        migrations.AddField(
+            model_name="postcommentmodel",
+            name="attachment_mime_type",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=255,
+                verbose_name="Attachment MIME Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="postcommentmodel",
+            name="attachment_size",
+            field=models.PositiveBigIntegerField(
+                blank=True,
+                editable=False,
+                help_text="In bytes.",
+                null=True,
+                verbose_name="Attachment Size",
+            ),
+        ),
+        migrations.AddField(
+            model_name="postcommentmodel",
+            name="attachment_type",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("image", "Image"),
+                    ("video", "Video"),
+                    ("audio", "Audio"),
+                    ("file", "File"),
+                ],
+                editable=False,
+                max_length=5,
+                null=True,
+                verbose_name="Attachment Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="postcommentmodel",
+            name="attachment_width",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Width"
+            ),
+        ),
+        migrations.AddField(
+            model_name="postmodel",
+            name="attachment_duration",
+            field=models.FloatField(
+                blank=True,
+                editable=False,
+                help_text="In seconds.",
+                null=True,
+                verbose_name="Attachment Duration",
+            ),
+        ),
+        migrations.AddField(
+            model_name="postmodel",
+            name="attachment_height",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Height"
+            ),
+        ),
+        migrations.AddField(
+            model_name="postmodel",
+            name="attachment_mime_type",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=255,
+                verbose_name="Attachment MIME Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="postmodel",
+            name="attachment_size",
+            field=models.PositiveBigIntegerField(
+                blank=True,
+                editable=False,
+                help_text="In bytes.",
+                null=True,
+                verbose_name="Attachment Size",
+            ),
+        ),
+        migrations.AddField(
+            model_name="postmodel",
+            name="attachment_type",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("image", "Image"),
+                    ("video", "Video"),
+                    ("audio", "Audio"),
+                    ("file", "File"),
+                ],
+                editable=False,
+                max_length=5,
+                null=True,
+                verbose_name="Attachment Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="postmodel",
+            name="attachment_width",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Width"
+            ),
+        ),
+        migrations.AddField(
+            model_name="reactiontypemodel",
+            name="attachment_duration",
+            field=models.FloatField(
+                blank=True,
+                editable=False,
+                help_text="In seconds.",
+                null=True,
+                verbose_name="Attachment Duration",
+            ),
+        ),
+        migrations.AddField(
+            model_name="reactiontypemodel",
+            name="attachment_height",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Height"
+            ),
+        ),
+        migrations.AddField(
+            model_name="reactiontypemodel",
+            name="attachment_mime_type",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=255,
+                verbose_name="Attachment MIME Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="reactiontypemodel",
+            name="attachment_size",
+            field=models.PositiveBigIntegerField(
+                blank=True,
+                editable=False,
+                help_text="In bytes.",
+                null=True,
+                verbose_name="Attachment Size",
+            ),
+        ),
+        migrations.AddField(
+            model_name="reactiontypemodel",
+            name="attachment_type",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("image", "Image"),
+                    ("video", "Video"),
+                    ("audio", "Audio"),
+                    ("file", "File"),
+                ],
+                editable=False,
+                max_length=5,
+                null=True,
+                verbose_name="Attachment Type",
+            ),
+        ),
+        migrations.AddField(
+            model_name="reactiontypemodel",
+            name="attachment_width",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Attachment Width"
+            ),
+        ),
+        migrations.RunPython(fill_attachment_type, migrations.RunPython.noop),
+    ]
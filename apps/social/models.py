@@ -1,16 +1,34 @@
-import re
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import islice
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.core.validators import FileExtensionValidator
+from django.db import connection, models, transaction
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from apps.service.models import ServiceClientModel, ServiceModel
+from apps.social.ai_report import get_ai_report_hash, get_ai_reports
 from apps.social.chat_ai import TEXT_AI
+from apps.social.feed_cache import PostFeedCache
+from apps.social.guest_import import (
+    GUEST_EMAIL_REGEX,
+    GUEST_FILE_EXTENSIONS,
+    is_valid_guest_email,
+    read_guest_rows,
+)
+from apps.social.leaderboard import score_mission_completion
+from apps.social.stream import publish_to_feed
+from apps.social.tasks import run_post_notification_job
 from apps.user.models import UserModel
-from pipelines.pipes import CreateUserPipeline
-from pipelines.pipes.user import NotifyGuestNewPostPipeline
+from pipelines.pipes.user import CreateGuestsPipeline, NotifyGuestNewPostPipeline
 from utils.abstract_models.base_model import AttachmentModel, BaseModel
+from utils.mixins.counter import CounterMixin, JSONCounterIncrement, counter_updated
 
 
 def get_formatted_datetime_now():
@@ -31,6 +49,12 @@ def event_directory_path(instance, filename):
     return f"media/event/{instance.title}_{instance.id}_{date}_{filename}"
 
 
+def guest_import_directory_path(instance, filename):
+    date = get_formatted_datetime_now()
+
+    return f"media/guest_import/{instance.event_id}_{date}_{filename}"
+
+
 def mission_interaction_directory_path(instance, filename):
     date = get_formatted_datetime_now()
 
@@ -45,22 +69,189 @@ def mission_directory_path(instance, filename):
     return f"media/mission/{instance.title}_{instance.id}_{date}_{filename}"
 
 
-class ReactionsMixin:
+REACT_SQL = """
+WITH old AS (
+    SELECT reaction.reaction_type_id, reaction_type.name
+    FROM {reaction_table} AS reaction
+    JOIN {reaction_type_table} AS reaction_type
+        ON reaction_type.id = reaction.reaction_type_id
+    WHERE reaction.user_id = %(user_id)s AND reaction.{target} = %(target_id)s
+    FOR UPDATE OF reaction
+), upsert AS (
+    INSERT INTO {reaction_table}
+        (is_active, date_joined, date_modified, reaction_type_id, user_id, {target})
+    VALUES (true, %(now)s, %(now)s, %(reaction_type_id)s, %(user_id)s, %(target_id)s)
+    ON CONFLICT (user_id, {target}) DO UPDATE
+        SET reaction_type_id = EXCLUDED.reaction_type_id,
+            date_modified = EXCLUDED.date_modified
+        WHERE EXISTS (SELECT 1 FROM old)
+    RETURNING id, date_joined, (xmax = 0) AS inserted
+), link AS (
+    INSERT INTO {through_table} ({through_target}, {through_reaction})
+    SELECT %(target_id)s, id FROM upsert WHERE inserted
+    ON CONFLICT DO NOTHING
+), counter AS (
+    UPDATE {target_table} AS target SET
+        reactions_count = target.reactions_count
+            + CASE WHEN upsert.inserted THEN 1 ELSE 0 END,
+        reactions_by_type = jsonb_strip_nulls(
+            target.reactions_by_type
+            || jsonb_build_object(
+                new_type.name,
+                COALESCE((target.reactions_by_type ->> new_type.name)::int, 0) + 1
+            )
+            || CASE WHEN old.name IS NULL THEN '{{}}'::jsonb ELSE jsonb_build_object(
+                old.name,
+                NULLIF(
+                    GREATEST(
+                        COALESCE((target.reactions_by_type ->> old.name)::int, 0) - 1,
+                        0
+                    ),
+                    0
+                )
+            ) END
+        )
+    FROM upsert
+    JOIN {reaction_type_table} AS new_type ON new_type.id = %(reaction_type_id)s
+    LEFT JOIN old ON true
+    WHERE target.id = %(target_id)s
+        AND (upsert.inserted OR old.reaction_type_id <> %(reaction_type_id)s)
+    RETURNING target.reactions_count, target.reactions_by_type
+)
+SELECT upsert.id, upsert.date_joined, upsert.inserted,
+    counter.reactions_count, counter.reactions_by_type
+FROM upsert LEFT JOIN counter ON true
+"""
+
+
+class ReactionsMixin(CounterMixin):
+    reaction_target_field = None
+
     @property
     def reactions_amount(self):
         return self.reactions.count()
 
+    @classmethod
+    def get_react_sql(cls):
+        reactions_field = cls._meta.get_field("reactions")
+        through = reactions_field.remote_field.through
+
+        return REACT_SQL.format(
+            reaction_table=ReactionModel._meta.db_table,
+            reaction_type_table=ReactionTypeModel._meta.db_table,
+            target=ReactionModel._meta.get_field(cls.reaction_target_field).column,
+            through_table=through._meta.db_table,
+            through_target=reactions_field.m2m_column_name(),
+            through_reaction=reactions_field.m2m_reverse_name(),
+            target_table=cls._meta.db_table,
+        )
+
     def react(self, user: UserModel, reaction_type_id: int):
-        user_reaction = self.reactions.filter(user=user).first()
-        if user_reaction:
-            user_reaction.reaction_type_id = reaction_type_id
-            user_reaction.save()
-            return user_reaction
-        return self.reactions.create(reaction_type_id=reaction_type_id, user=user)
+        """
+        Creates the user's reaction or changes its type with a single
+        `INSERT ... ON CONFLICT DO UPDATE`, linking it and updating the
+        counters in the same statement.
+
+        The previous type is read from the locked reaction row, and the
+        counters only change when the reaction is created or its type really
+        changes. When a concurrent request creates the reaction after the
+        statement started, the update is skipped (it can't tell the previous
+        type) and the statement runs again, now seeing that reaction.
+        """
+        now = timezone.now()
+        row = None
+
+        with connection.cursor() as cursor:
+            while row is None:
+                cursor.execute(
+                    self.get_react_sql(),
+                    {
+                        "now": now,
+                        "reaction_type_id": reaction_type_id,
+                        "user_id": user.pk,
+                        "target_id": self.pk,
+                    },
+                )
+                row = cursor.fetchone()
+
+        (reaction_id, date_joined, inserted, reactions_count, reactions_by_type) = row
+
+        reaction = ReactionModel(
+            id=reaction_id,
+            date_joined=date_joined,
+            date_modified=now,
+            reaction_type_id=reaction_type_id,
+            user=user,
+            **{self.reaction_target_field: self},
+        )
+        reaction._state.adding = False
+        post_save.send(
+            sender=ReactionModel,
+            instance=reaction,
+            created=inserted,
+            update_fields=None,
+            raw=False,
+            using=connection.alias,
+        )
+
+        if reactions_count is not None:
+            self.reactions_count = reactions_count
+            self.reactions_by_type = self._meta.get_field(
+                "reactions_by_type"
+            ).from_db_value(reactions_by_type, None, connection)
+            counter_updated.send(
+                sender=type(self),
+                fields=(
+                    ("reactions_count", "reactions_by_type")
+                    if inserted
+                    else ("reactions_by_type",)
+                ),
+                filters={"pk": self.pk},
+            )
+
+        return reaction
 
     def get_reaction_by_user(self, user: UserModel):
+        reactions_by_user = getattr(self, "_reactions_by_user", {})
+
+        if user.pk in reactions_by_user:
+            return reactions_by_user[user.pk]
+
         return self.reactions.filter(user=user).first()
 
+    @classmethod
+    def get_reactions_by_user(cls, instances, user: UserModel):
+        """
+        Loads the user's reactions for all the instances (or ids) in a single
+        query, returning them by instance id.
+        """
+        related_name = cls._meta.get_field("reactions").related_query_name()
+        reactions = (
+            ReactionModel.objects.filter(
+                user=user, **{f"{related_name}__in": instances}
+            )
+            .select_related("reaction_type", "user__service")
+            .annotate(target_id=models.F(f"{related_name}__id"))
+            .order_by("-pk")
+        )
+
+        return {reaction.target_id: reaction for reaction in reactions}
+
+    @classmethod
+    def attach_reactions_by_user(cls, instances, user: UserModel):
+        """
+        Attaches the user's reactions to the instances, so
+        `get_reaction_by_user` doesn't need to hit the database for each one.
+        """
+        reactions_by_target = cls.get_reactions_by_user(instances, user)
+
+        for instance in instances:
+            instance._reactions_by_user = {
+                user.pk: reactions_by_target.get(instance.pk)
+            }
+
+        return instances
+
 
 class ReactionTypeModel(
     BaseModel, AttachmentModel(upload_to=post_attachment_directory_path).mixin
@@ -112,14 +303,77 @@ class ReactionModel(BaseModel):
         related_name="reactions",
         on_delete=models.CASCADE,
     )
+    post = models.ForeignKey(
+        "PostModel",
+        verbose_name=_("Post"),
+        related_name="+",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    comment = models.ForeignKey(
+        "PostCommentModel",
+        verbose_name=_("Comment"),
+        related_name="+",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        editable=False,
+    )
+
+    version_scope_fields = (
+        "user__service_id",
+        Coalesce(
+            "post__event_id",
+            "comment__post__event_id",
+            "comment__answer__post__event_id",
+            "user__event_id",
+        ),
+    )
 
     class Meta:
         verbose_name = _("Reaction")
         verbose_name_plural = _("Reactions")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "post"], name="unique_user_post_reaction"
+            ),
+            models.UniqueConstraint(
+                fields=["user", "comment"], name="unique_user_comment_reaction"
+            ),
+        ]
 
     def __str__(self):
         return self.reaction_type.name
 
+    def delete(self, *args, **kwargs):
+        """
+        Locks the reaction before updating the counters, so concurrent deletes
+        of the same reaction (a double tap on "unreact") count only once. The
+        ones that find the reaction already deleted change nothing.
+        """
+        reaction_type_name = self.reaction_type.name
+
+        with transaction.atomic():
+            if not ReactionModel.objects.select_for_update().filter(pk=self.pk):
+                return 0, {}
+
+            model = PostModel if self.post_id else PostCommentModel
+            model.update_counters(
+                {
+                    "reactions_count": model.get_counter_increment(
+                        "reactions_count", -1
+                    ),
+                    "reactions_by_type": JSONCounterIncrement(
+                        "reactions_by_type", reaction_type_name, -1
+                    ),
+                },
+                reactions=self,
+            )
+
+            return super().delete(*args, **kwargs)
+
 
 class PostCommentModel(
     BaseModel,
@@ -162,6 +416,21 @@ class PostCommentModel(
         related_name="post_comments_mentions",
         blank=True,
     )
+    reactions_count = models.PositiveIntegerField(
+        verbose_name=_("Reactions Count"), default=0, editable=False
+    )
+    comments_count = models.PositiveIntegerField(
+        verbose_name=_("Answers Count"), default=0, editable=False
+    )
+    reactions_by_type = models.JSONField(
+        verbose_name=_("Reactions By Type"), default=dict, editable=False
+    )
+
+    reaction_target_field = "comment"
+    version_scope_fields = (
+        "author__service_id",
+        Coalesce("post__event_id", "answer__post__event_id", "author__event_id"),
+    )
 
     @property
     def is_answer(self):
@@ -174,9 +443,27 @@ class PostCommentModel(
     def __str__(self):
         return f"{self.author.first_name}'s comment"
 
+    def _update_thread_counters(self, amount: int):
+        if self.post_id:
+            PostModel.update_counter("comments_count", amount, pk=self.post_id)
+
+        if self.answer_id:
+            PostCommentModel.update_counter("comments_count", amount, pk=self.answer_id)
+
+    def save(self, *args, **kwargs):
+        is_new = self._state.adding
+        super().save(*args, **kwargs)
+
+        if is_new and not self.is_deleted:
+            self._update_thread_counters(1)
+
     def delete(self, *args, **kwargs):
+        if self.is_deleted:
+            return
+
         self.is_deleted = True
         self.save()
+        self._update_thread_counters(-1)
 
 
 class EventModel(BaseModel, AttachmentModel(upload_to=event_directory_path).mixin):
@@ -227,6 +514,8 @@ class EventModel(BaseModel, AttachmentModel(upload_to=event_directory_path).mixi
             Like:
             <br>
             John Doe;john@mail.com,Elisa Jax;elisa@mail.com,Edward,edward.us@mail.com,...
+            <br>
+            For large lists, upload a CSV or XLSX file in Guest Imports instead.
         """,  # noqa: E501
     )
     send_email_to_guests = models.BooleanField(
@@ -266,12 +555,7 @@ class EventModel(BaseModel, AttachmentModel(upload_to=event_directory_path).mixi
 
     @staticmethod
     def _verify_errors(errors: list, email: str):
-        email_regex = (
-            r"^([a-z0-9]+)[a-z0-9.-][^\.]*([a-z0-9!@#$%^&*()_+]+)"
-            r"@([a-z0-9]+)[a-z0-9.-]*\.[a-z0-9]*([a-z0-9]+){2,}$"
-        )
-
-        if not re.match(email_regex, email):
+        if not GUEST_EMAIL_REGEX.match(email):
             errors.append(f"Wrong email format: {email}")
 
     @staticmethod
@@ -310,35 +594,20 @@ class EventModel(BaseModel, AttachmentModel(upload_to=event_directory_path).mixi
     def create_guests(self):
         self.validate_guests_format()
 
-        guests = self.get_guests()
+        guests = []
 
-        if guests:
-            for guest in guests:
-                name, email = self._get_guest_name_and_email(guest)
-                first_name, last_name = self._get_guest_full_name(name.strip())
-                user_exists_in_this_event = UserModel.objects.filter(
-                    email=email, event=self
-                ).exists()
-
-                if not user_exists_in_this_event:
-                    password_length = 6
-                    only_digits = "0123456789"
-                    password = UserModel.objects.make_random_password(
-                        password_length, only_digits
-                    )
-
-                    pipeline = CreateUserPipeline(
-                        email=email,
-                        password=password,
-                        service=self.service,
-                        first_name=first_name,
-                        last_name=last_name,
-                        event=self,
-                        is_verified=True,
-                        send_mail=self.send_email_to_guests,
-                        email_type="guest_invitation",
-                    )
-                    pipeline.run()
+        for guest in self.get_guests():
+            name, email = self._get_guest_name_and_email(guest)
+            first_name, last_name = self._get_guest_full_name(name.strip())
+            guests.append(
+                {"first_name": first_name, "last_name": last_name, "email": email}
+            )
+
+        pipeline = CreateGuestsPipeline(
+            event=self, guests=guests, send_mail=self.send_email_to_guests
+        )
+
+        return pipeline.run()
 
 
 class AITextReportModel(BaseModel):
@@ -417,18 +686,29 @@ class PostModel(
         null=True,
         blank=True,
     )
+    ai_report_hash = models.CharField(
+        verbose_name=_("AI Report Hash"),
+        max_length=64,
+        blank=True,
+        default="",
+        editable=False,
+        help_text=_("Hash of the AI settings and message used by the AI report."),
+    )
+    reactions_count = models.PositiveIntegerField(
+        verbose_name=_("Reactions Count"), default=0, editable=False
+    )
+    comments_count = models.PositiveIntegerField(
+        verbose_name=_("Comments Count"), default=0, editable=False
+    )
+    reactions_by_type = models.JSONField(
+        verbose_name=_("Reactions By Type"), default=dict, editable=False
+    )
 
-    def count_reactions(self):
-        reactions = self.reactions.all()
-
-        reactions_count = {}
-
-        for reaction in reactions:
-            reactions_count[reaction.reaction_type.name] = (
-                reactions_count.get(reaction.reaction_type.name, 0) + 1
-            )
+    reaction_target_field = "post"
+    version_scope_fields = ("service_id", "event_id")
 
-        return reactions_count
+    def count_reactions(self):
+        return self.reactions_by_type
 
     def format_reactions_to_text(self):
         reactions = self.count_reactions()
@@ -468,31 +748,464 @@ class PostModel(
         {comments}
         """
 
-    def generate_ai_text_report(self):
-        if self.ai_text_report:
-            text_ai = self.ai_text_report.text_ai_client
-            message = self.get_message_to_send()
-            client = text_ai(self.ai_text_report.pre_set, message)
+    def get_ai_report_prompt(self):
+        ai_text_report = self.ai_text_report
+        message = self.get_message_to_send()
+        digest = get_ai_report_hash(
+            ai_text_report.text_ai, ai_text_report.pre_set, message
+        )
+
+        return digest, (ai_text_report.text_ai_client, ai_text_report.pre_set, message)
+
+    @classmethod
+    def generate_ai_text_reports(cls, posts):
+        """
+        Generates the AI report of the posts with an AI text report, requesting
+        them concurrently. Posts whose AI settings and message did not change
+        since the last report are skipped.
+        """
+        summary = {"generated": 0, "skipped": 0, "failed": 0}
+        pending = []
+        prompts = {}
 
-            self.ai_report = client.get_response()
-            self.save()
+        for post in posts:
+            if not post.ai_text_report_id:
+                continue
+
+            digest, prompt = post.get_ai_report_prompt()
+
+            if post.ai_report and post.ai_report_hash == digest:
+                summary["skipped"] += 1
+                continue
+
+            pending.append((post, digest))
+            prompts[digest] = prompt
+
+        reports = get_ai_reports(prompts)
+        generated = []
+
+        for post, digest in pending:
+            if digest not in reports:
+                summary["failed"] += 1
+                continue
+
+            post.ai_report = reports[digest]
+            post.ai_report_hash = digest
+            generated.append(post)
+
+        cls.objects.bulk_update(generated, ["ai_report", "ai_report_hash"])
+        summary["generated"] = len(generated)
+
+        return summary
+
+    def generate_ai_text_report(self):
+        return self.generate_ai_text_reports([self])
 
     def notify_new_post(self):
-        if self.event:
-            guests = self.event.users.filter(is_active=True)
+        if not self.event_id:
+            return None
+
+        job = self.notification_jobs.exclude(
+            status=PostNotificationJobModel.STATUS_DONE
+        ).first()
+
+        if job is None:
+            job = self.notification_jobs.create(
+                guests_count=UserModel.objects.filter(
+                    event_id=self.event_id, is_active=True
+                ).count()
+            )
 
-            for guest in guests:
-                pipeline = NotifyGuestNewPostPipeline(user=guest)
-                pipeline.run()
+        transaction.on_commit(partial(run_post_notification_job, job.pk))
+
+        return job
 
     class Meta:
         verbose_name = _("Post")
         verbose_name_plural = _("Posts")
+        indexes = [
+            models.Index(
+                fields=["service", "event", "is_active", "date_joined"],
+                name="post_feed_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.author.first_name}'s post"
 
 
+class PostNotificationJobModel(BaseModel):
+    """
+    Notifies the guests of the post's event about the post in chunks. The
+    last notified guest is saved after every chunk, so a failed or interrupted
+    job resumes from where it stopped.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, _("Pending")),
+        (STATUS_RUNNING, _("Running")),
+        (STATUS_DONE, _("Done")),
+        (STATUS_FAILED, _("Failed")),
+    )
+    EMAIL_TYPE = "new_post_notification"
+
+    post = models.ForeignKey(
+        PostModel,
+        verbose_name=_("Post"),
+        related_name="notification_jobs",
+        on_delete=models.CASCADE,
+    )
+    status = models.CharField(
+        verbose_name=_("Status"),
+        max_length=16,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+    )
+    last_guest_id = models.PositiveIntegerField(
+        verbose_name=_("Last Guest ID"), default=0
+    )
+    guests_count = models.PositiveIntegerField(
+        verbose_name=_("Guests Count"), default=0
+    )
+    notified_count = models.PositiveIntegerField(
+        verbose_name=_("Notified Count"), default=0
+    )
+    error = models.TextField(verbose_name=_("Error"), null=True, blank=True)
+
+    # A SendGrid request takes up to 1000 recipients
+    chunk_size = 1000
+    # Seconds to run before continuing in a new invocation
+    time_budget = 300
+    # Seconds without progress after which a running job is considered dead
+    stale_after = 900
+
+    @property
+    def progress(self):
+        if not self.guests_count:
+            return 100 if self.status == self.STATUS_DONE else 0
+
+        return min(round(self.notified_count * 100 / self.guests_count), 100)
+
+    def get_pending_guests(self):
+        return (
+            UserModel.objects.filter(
+                event_id=self.post.event_id,
+                is_active=True,
+                pk__gt=self.last_guest_id,
+            )
+            .select_related("service", "event")
+            .order_by("pk")
+        )
+
+    def has_email_config(self):
+        return self.post.event.email_configs.filter(
+            email_config_type=self.EMAIL_TYPE
+        ).exists()
+
+    def claim(self):
+        stale_before = timezone.now() - timedelta(seconds=self.stale_after)
+        claimed = (
+            type(self)
+            .objects.filter(pk=self.pk)
+            .filter(
+                models.Q(status__in=[self.STATUS_PENDING, self.STATUS_FAILED])
+                | models.Q(status=self.STATUS_RUNNING, date_modified__lt=stale_before)
+            )
+            .update(
+                status=self.STATUS_RUNNING, error=None, date_modified=timezone.now()
+            )
+        )
+
+        if claimed:
+            self.refresh_from_db()
+
+        return bool(claimed)
+
+    def save_progress(self, **fields):
+        for field, value in fields.items():
+            setattr(self, field, value)
+
+        self.date_modified = timezone.now()
+        self.save(update_fields=[*fields, "date_modified"])
+
+    def run(self):
+        if not self.claim():
+            return
+
+        started_at = time.monotonic()
+
+        if not self.has_email_config():
+            self.save_progress(
+                status=self.STATUS_FAILED,
+                error=f"The event has no {self.EMAIL_TYPE} email config.",
+            )
+            return
+
+        try:
+            while True:
+                guests = list(self.get_pending_guests()[: self.chunk_size])
+
+                if not guests:
+                    self.save_progress(status=self.STATUS_DONE)
+                    return
+
+                NotifyGuestNewPostPipeline(users=guests).run()
+                self.save_progress(
+                    last_guest_id=guests[-1].pk,
+                    notified_count=self.notified_count + len(guests),
+                )
+
+                if time.monotonic() - started_at >= self.time_budget:
+                    self.save_progress(status=self.STATUS_PENDING)
+                    run_post_notification_job(self.pk)
+                    return
+        except Exception as error:
+            self.save_progress(status=self.STATUS_FAILED, error=str(error))
+            raise
+
+    class Meta:
+        verbose_name = _("Post Notification Job")
+        verbose_name_plural = _("Post Notification Jobs")
+
+    def __str__(self):
+        return f"{self.post}'s notification ({self.status})"
+
+
+class GuestImportModel(BaseModel):
+    """
+    Imports the guests of a CSV or XLSX file into the event. The file is read
+    one row at a time into a staging table, where invalid, repeated and
+    already existing guests are marked with set-based queries before the
+    remaining ones are created in chunks.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, _("Pending")),
+        (STATUS_RUNNING, _("Running")),
+        (STATUS_DONE, _("Done")),
+        (STATUS_FAILED, _("Failed")),
+    )
+
+    event = models.ForeignKey(
+        EventModel,
+        verbose_name=_("Event"),
+        related_name="guest_imports",
+        on_delete=models.CASCADE,
+    )
+    file = models.FileField(
+        verbose_name=_("File"),
+        upload_to=guest_import_directory_path,
+        validators=[FileExtensionValidator(GUEST_FILE_EXTENSIONS)],
+        help_text=_(
+            'A CSV or XLSX file whose first row has the "name" and "email" ' "columns."
+        ),
+    )
+    status = models.CharField(
+        verbose_name=_("Status"),
+        max_length=16,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+    )
+    rows_count = models.PositiveIntegerField(verbose_name=_("Rows Count"), default=0)
+    created_count = models.PositiveIntegerField(
+        verbose_name=_("Created Count"), default=0
+    )
+    error = models.TextField(verbose_name=_("Error"), null=True, blank=True)
+
+    chunk_size = 1000
+
+    class Meta:
+        verbose_name = _("Guest Import")
+        verbose_name_plural = _("Guest Imports")
+
+    def __str__(self):
+        return f"{self.event}'s guest import ({self.status})"
+
+    def get_summary(self):
+        return dict(
+            self.rows.order_by()
+            .values_list("status")
+            .annotate(count=models.Count("id"))
+        )
+
+    def claim(self):
+        claimed = (
+            type(self)
+            .objects.filter(
+                pk=self.pk, status__in=[self.STATUS_PENDING, self.STATUS_FAILED]
+            )
+            .update(
+                status=self.STATUS_RUNNING, error=None, date_modified=timezone.now()
+            )
+        )
+
+        if claimed:
+            self.refresh_from_db()
+
+        return bool(claimed)
+
+    def save_progress(self, **fields):
+        for field, value in fields.items():
+            setattr(self, field, value)
+
+        self.date_modified = timezone.now()
+        self.save(update_fields=[*fields, "date_modified"])
+
+    def build_row(self, line: int, name: str, email: str):
+        is_valid = is_valid_guest_email(email)
+
+        return GuestImportRowModel(
+            guest_import=self,
+            line=line,
+            name=name,
+            email=email,
+            status=(
+                GuestImportRowModel.STATUS_PENDING
+                if is_valid
+                else GuestImportRowModel.STATUS_INVALID
+            ),
+            error=None if is_valid else "Wrong email format.",
+        )
+
+    def stage(self):
+        self.rows.all().delete()
+        rows_count = 0
+
+        with self.file.open("rb") as file:
+            rows = (
+                self.build_row(*row) for row in read_guest_rows(file, self.file.name)
+            )
+
+            while True:
+                chunk = list(islice(rows, self.chunk_size))
+
+                if not chunk:
+                    break
+
+                GuestImportRowModel.objects.bulk_create(chunk)
+                rows_count += len(chunk)
+
+        pending_rows = self.rows.filter(status=GuestImportRowModel.STATUS_PENDING)
+        earlier_rows = GuestImportRowModel.objects.filter(
+            guest_import=models.OuterRef("guest_import"),
+            email=models.OuterRef("email"),
+            line__lt=models.OuterRef("line"),
+        )
+        pending_rows.filter(models.Exists(earlier_rows)).update(
+            status=GuestImportRowModel.STATUS_DUPLICATED
+        )
+        pending_rows.filter(
+            email__in=UserModel.objects.filter(event_id=self.event_id).values("email")
+        ).update(status=GuestImportRowModel.STATUS_EXISTS)
+
+        self.save_progress(rows_count=rows_count)
+
+    def get_guest(self, row):
+        name = row.name or f"Guest {row.email}"
+        first_name, last_name = self.event._get_guest_full_name(name)
+
+        return {"first_name": first_name, "last_name": last_name, "email": row.email}
+
+    def create_guests(self):
+        last_row_id = 0
+
+        while True:
+            rows = list(
+                self.rows.filter(
+                    status=GuestImportRowModel.STATUS_PENDING, pk__gt=last_row_id
+                ).order_by("pk")[: self.chunk_size]
+            )
+
+            if not rows:
+                return
+
+            report = CreateGuestsPipeline(
+                event=self.event,
+                guests=[self.get_guest(row) for row in rows],
+                send_mail=self.event.send_email_to_guests,
+            ).run()
+            statuses = {
+                result["email"]: result["status"] for result in report["results"]
+            }
+
+            for status in [
+                GuestImportRowModel.STATUS_CREATED,
+                GuestImportRowModel.STATUS_EXISTS,
+            ]:
+                self.rows.filter(
+                    pk__in=[row.pk for row in rows if statuses.get(row.email) == status]
+                ).update(status=status)
+
+            self.save_progress(created_count=self.created_count + report["created"])
+            last_row_id = rows[-1].pk
+
+    def run(self):
+        if not self.claim():
+            return
+
+        try:
+            self.stage()
+            self.create_guests()
+            self.save_progress(status=self.STATUS_DONE)
+        except Exception as error:
+            self.save_progress(status=self.STATUS_FAILED, error=str(error))
+            raise
+
+
+class GuestImportRowModel(BaseModel):
+    STATUS_PENDING = "pending"
+    STATUS_INVALID = "invalid"
+    STATUS_DUPLICATED = "duplicated"
+    STATUS_EXISTS = "exists"
+    STATUS_CREATED = "created"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, _("Pending")),
+        (STATUS_INVALID, _("Invalid")),
+        (STATUS_DUPLICATED, _("Duplicated")),
+        (STATUS_EXISTS, _("Exists")),
+        (STATUS_CREATED, _("Created")),
+    )
+
+    guest_import = models.ForeignKey(
+        GuestImportModel,
+        verbose_name=_("Guest Import"),
+        related_name="rows",
+        on_delete=models.CASCADE,
+    )
+    line = models.PositiveIntegerField(verbose_name=_("Line"))
+    name = models.TextField(verbose_name=_("Name"), blank=True)
+    email = models.TextField(verbose_name=_("Email"))
+    status = models.CharField(
+        verbose_name=_("Status"),
+        max_length=16,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+    )
+    error = models.CharField(
+        verbose_name=_("Error"), max_length=255, null=True, blank=True
+    )
+
+    class Meta:
+        verbose_name = _("Guest Import Row")
+        verbose_name_plural = _("Guest Import Rows")
+        indexes = [
+            models.Index(
+                fields=["guest_import", "email"], name="guest_import_row_email_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.email} ({self.status})"
+
+
 class MissionTypeModel(BaseModel):
     MISSION_TYPE_CHOICES = (
         ("Video", "Video"),
@@ -557,19 +1270,63 @@ class MissionModel(BaseModel, AttachmentModel(upload_to=mission_directory_path).
     )
     order = models.IntegerField(verbose_name=_("Order"), default=0)
 
+    version_scope_fields = ("service_id", "event_id")
+
     def get_completed_info(self, user: UserModel):
-        return self.interactions.filter(user=user).first()
+        interactions_by_user = getattr(self, "_interactions_by_user", {})
+
+        if user.pk not in interactions_by_user:
+            interactions_by_user[user.pk] = self.interactions.filter(user=user).first()
+            self._interactions_by_user = interactions_by_user
+
+        return interactions_by_user[user.pk]
 
     def is_completed(self, user: UserModel):
-        return self.interactions.filter(user=user).exists()
+        return self.get_completed_info(user) is not None
+
+    @classmethod
+    def attach_interactions_by_user(cls, missions, user: UserModel):
+        """
+        Loads the user's interactions with all the missions in a single query,
+        so `is_completed` and `get_completed_info` don't need to hit the
+        database for each one.
+        """
+        interactions = MissionInteractionModel.objects.filter(
+            user=user, mission__in=missions
+        ).order_by("pk")
+        interactions_by_mission = {}
+
+        for interaction in interactions:
+            interactions_by_mission.setdefault(interaction.mission_id, interaction)
+
+        for mission in missions:
+            mission._interactions_by_user = {
+                user.pk: interactions_by_mission.get(mission.pk)
+            }
+
+        return missions
 
     def complete(self, user: UserModel, attachment=None, content=None):
-        return MissionInteractionModel.objects.create(
-            user=user,
-            mission=self,
-            content=content,
-            attachment=attachment,
-        )
+        """
+        Completes the mission once per user: the user row is locked, so a
+        double submit returns the first interaction instead of scoring twice.
+        """
+        getattr(self, "_interactions_by_user", {}).pop(user.pk, None)
+
+        with transaction.atomic():
+            UserModel.objects.select_for_update().filter(pk=user.pk).exists()
+            interaction = self.interactions.filter(user=user).first()
+
+            if interaction is None:
+                interaction = MissionInteractionModel.objects.create(
+                    user=user,
+                    mission=self,
+                    content=content,
+                    attachment=attachment,
+                )
+                score_mission_completion(self, user.pk)
+
+        return interaction
 
     class Meta:
         verbose_name = _("Mission")
@@ -596,6 +1353,8 @@ class MissionInteractionModel(
     )
     content = models.TextField(verbose_name=_("Content"), null=True, blank=True)
 
+    version_scope_fields = ("mission__service_id", "mission__event_id")
+
     class Meta:
         verbose_name = _("User Mission")
         verbose_name_plural = _("User Missions")
@@ -682,3 +1441,101 @@ class LoginAnswer(BaseModel):
 
     def __str__(self):
         return str(self.option.option)
+
+
+@receiver(post_save, sender=PostModel)
+@receiver(post_delete, sender=PostModel)
+def invalidate_feed_on_post_change(sender, instance, **_kwargs):
+    PostFeedCache.invalidate(instance.service_id, instance.event_id)
+
+
+@receiver(post_delete, sender=MissionInteractionModel)
+def unscore_deleted_mission_completion(sender, instance, **_kwargs):
+    completed = sender.objects.filter(
+        user_id=instance.user_id, mission_id=instance.mission_id
+    ).exists()
+
+    if not completed:
+        score_mission_completion(instance.mission, instance.user_id, -1)
+
+
+@receiver(post_save, sender=UserModel)
+def invalidate_feed_on_author_change(sender, instance, created, **_kwargs):
+    if created:
+        return
+
+    scopes = (
+        PostModel.objects.filter(author=instance)
+        .values_list("service_id", "event_id")
+        .distinct()
+    )
+
+    for service_id, event_id in scopes:
+        PostFeedCache.invalidate(service_id, event_id)
+
+
+@receiver(post_save, sender=PostModel)
+def publish_created_post(sender, instance, created, **_kwargs):
+    if not created:
+        return
+
+    publish_to_feed(
+        instance.service_id,
+        instance.event_id,
+        {
+            "type": "post.created",
+            "data": {
+                "id": instance.id,
+                "author": instance.author_id,
+                "description": instance.description,
+                "attachment_type": instance.attachment_type,
+                "date_joined": instance.date_joined.isoformat(),
+            },
+        },
+    )
+
+
+@receiver(post_save, sender=PostCommentModel)
+def publish_created_comment(sender, instance, created, **_kwargs):
+    post = instance.post if instance.post_id else getattr(instance.answer, "post", None)
+
+    if not created or instance.is_deleted or post is None:
+        return
+
+    publish_to_feed(
+        post.service_id,
+        post.event_id,
+        {
+            "type": "comment.created",
+            "data": {
+                "id": instance.id,
+                "post": post.id,
+                "answer": instance.answer_id,
+                "author": instance.author_id,
+                "content": instance.content,
+                "date_joined": instance.date_joined.isoformat(),
+            },
+        },
+    )
+
+
+@receiver(counter_updated, sender=PostModel)
+def notify_post_counter_change(sender, filters, **_kwargs):
+    posts = sender.objects.filter(**filters).values(
+        "id",
+        "service_id",
+        "event_id",
+        "reactions_count",
+        "reactions_by_type",
+        "comments_count",
+    )
+    scopes = set()
+
+    for post in posts:
+        service_id = post.pop("service_id")
+        event_id = post.pop("event_id")
+        scopes.add((service_id, event_id))
+        publish_to_feed(service_id, event_id, {"type": "post.counters", "data": post})
+
+    for service_id, event_id in scopes:
+        PostFeedCache.invalidate(service_id, event_id)
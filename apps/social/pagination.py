@@ -0,0 +1,30 @@
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+
+
+class PostCursorPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-date_joined", "-id")
+
+
+class CommentThreadPagination(LimitOffsetPagination):
+    default_limit = 20
+    max_limit = 100
+
+
+class GuestSearchPagination(LimitOffsetPagination):
+    """
+    Limit and offset without the COUNT query: the autocomplete asks for the
+    next page until it receives less than the limit.
+    """
+
+    default_limit = 20
+    max_limit = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.limit = self.get_limit(request)
+        self.offset = self.get_offset(request)
+        start, end = self.offset, self.offset + self.limit
+
+        return list(queryset[start:end])
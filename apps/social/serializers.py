@@ -1,7 +1,23 @@
+from django.db import models
+from django.urls import reverse
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
 from pipelines.pipes.user import MentionGuestPipeline
+from utils.direct_upload import (
+    DIRECT_UPLOAD_MAX_SIZE,
+    DIRECT_UPLOAD_TARGETS,
+    DirectUploadField,
+    DirectUploadSerializerMixin,
+    MultipartUploadField,
+    abort_multipart_upload,
+    complete_multipart_upload,
+    create_direct_upload,
+    create_multipart_upload,
+    get_multipart_part_url,
+    get_parts_count,
+    validate_checksum,
+)
 from utils.mixins.attachment_type import GetAttachmentTypeSerializerMixin
 
 from ..user.models import UserModel
@@ -17,6 +33,8 @@ from .models import (
     ReactionModel,
     ReactionTypeModel,
 )
+from .pagination import CommentThreadPagination
+from .threads import CommentThread
 
 
 class ListReactionSerializer(serializers.ModelSerializer):
@@ -24,10 +42,34 @@ class ListReactionSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ReactionModel
-        fields = "__all__"
+        exclude = ["post", "comment"]
         depth = 1
 
 
+class UserReactionsListSerializer(serializers.ListSerializer):
+    """
+    Attaches the request user's reactions to every item of the page before
+    serializing them, so `my_reaction` costs one query for the whole list.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        instances = list(iterable)
+        request = self.context.get("request")
+
+        if request and not self.context.get("skip_user_fields"):
+            pending = [
+                instance
+                for instance in instances
+                if request.user.pk not in getattr(instance, "_reactions_by_user", {})
+            ]
+
+            if pending:
+                self.child.Meta.model.attach_reactions_by_user(pending, request.user)
+
+        return super().to_representation(instances)
+
+
 class ListAllPostSerializer(serializers.ModelSerializer):
     author = UserDataSerializer(read_only=True)
     reactions = serializers.SerializerMethodField()
@@ -51,15 +93,17 @@ class ListAllPostSerializer(serializers.ModelSerializer):
             "description",
         ]
         depth = 1
+        list_serializer_class = UserReactionsListSerializer
 
     def get_comments(self, obj):
         return {
-            "length": obj.comments.filter(is_deleted=False).count(),
+            "length": obj.comments_count,
         }
 
     def get_reactions(self, obj):
         return {
-            "length": obj.reactions.count(),
+            "length": obj.reactions_count,
+            "by_type": obj.reactions_by_type,
         }
 
     def get_event(self, obj):
@@ -71,6 +115,9 @@ class ListAllPostSerializer(serializers.ModelSerializer):
         }
 
     def get_my_reaction(self, obj):
+        if self.context.get("skip_user_fields"):
+            return None
+
         request = self.context["request"]
         reaction = obj.get_reaction_by_user(request.user)
 
@@ -83,17 +130,57 @@ class ListAllPostSerializer(serializers.ModelSerializer):
 
 
 class ListPostSerializer(ListAllPostSerializer):
+    """
+    Post detail with the first page of its top-level comments. The rest are
+    read from `comments_next`, the `/post/{id}/comments/` page that follows.
+    """
+
     comments = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
+    comments_next = serializers.SerializerMethodField()
+
+    class Meta(ListAllPostSerializer.Meta):
+        fields = [*ListAllPostSerializer.Meta.fields, "comments_count", "comments_next"]
+
+    @staticmethod
+    def get_comment_roots(obj):
+        """
+        First page of top-level comments plus one more, which only tells if
+        there is a next page.
+        """
+        if not hasattr(obj, "_comment_roots"):
+            limit = CommentThreadPagination.default_limit
+            roots = CommentThread.get_roots_queryset(obj)
+            obj._comment_roots = list(roots[: limit + 1])
+
+        return obj._comment_roots
 
     def get_comments(self, obj):
-        return ListPostCommentSerializer(
-            obj.comments.filter(is_deleted=False).order_by("-date_joined"),
-            many=True,
-            context=self.context,
-        ).data
+        request = self.context.get("request")
+        roots = self.get_comment_roots(obj)
+        thread = CommentThread(
+            roots[: CommentThreadPagination.default_limit],
+            user=request.user if request else None,
+        ).build()
+
+        return ListPostCommentSerializer(thread, many=True, context=self.context).data
+
+    def get_comments_next(self, obj):
+        limit = CommentThreadPagination.default_limit
+
+        if len(self.get_comment_roots(obj)) <= limit:
+            return None
+
+        url = reverse("post-comments", kwargs={"pk": obj.pk})
+        request = self.context.get("request")
+
+        if request:
+            url = request.build_absolute_uri(url)
 
+        return f"{url}?limit={limit}&offset={limit}"
 
-class CreatePostCommentSerializer(serializers.Serializer):
+
+class CreatePostCommentSerializer(DirectUploadSerializerMixin, serializers.Serializer):
     content = serializers.CharField()
     post = serializers.PrimaryKeyRelatedField(
         queryset=PostModel.objects.all(), required=False
@@ -103,9 +190,26 @@ class CreatePostCommentSerializer(serializers.Serializer):
         required=False,
     )
     attachment = serializers.FileField(required=False)
-    mentions = serializers.PrimaryKeyRelatedField(
-        queryset=UserModel.objects.all(), many=True, required=False
-    )
+    upload = DirectUploadField("post_comment", required=False)
+    mentions = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+    def validate_mentions(self, value):
+        users = list(
+            UserModel.objects.filter(pk__in=set(value)).select_related(
+                "service", "event"
+            )
+        )
+        missing = set(value) - {user.pk for user in users}
+
+        if missing:
+            message = serializers.PrimaryKeyRelatedField.default_error_messages[
+                "does_not_exist"
+            ]
+            raise serializers.ValidationError(
+                message.format(pk_value=min(missing)), code="does_not_exist"
+            )
+
+        return users
 
     def create(self, validated_data):
         request = self.context["request"]
@@ -116,20 +220,16 @@ class CreatePostCommentSerializer(serializers.Serializer):
         )
 
         if mentions:
-            for mention in mentions:
-                pipeline = MentionGuestPipeline(
-                    mention,
-                    comment,
-                )
-
-                pipeline.run()
+            pipeline = MentionGuestPipeline(mentions, comment)
+            pipeline.run()
 
         return comment
 
 
-class UpdatePostCommentSerializer(serializers.Serializer):
+class UpdatePostCommentSerializer(DirectUploadSerializerMixin, serializers.Serializer):
     content = serializers.CharField()
     attachment = serializers.FileField(required=False)
+    upload = DirectUploadField("post_comment", required=False)
 
     def update(self, instance, validated_data):
         instance.content = validated_data.get("content", instance.content)
@@ -145,6 +245,7 @@ class ListPostCommentSerializer(
     author = UserDataSerializer(read_only=True)
     reactions = ListReactionSerializer(many=True)
     answers = serializers.SerializerMethodField()
+    answers_count = serializers.IntegerField(source="comments_count", read_only=True)
     my_reaction = serializers.SerializerMethodField()
     mentions = UserDataSerializer(many=True, read_only=True)
 
@@ -155,6 +256,7 @@ class ListPostCommentSerializer(
             "content",
             "author",
             "answers",
+            "answers_count",
             "reactions",
             "my_reaction",
             "attachment",
@@ -163,11 +265,15 @@ class ListPostCommentSerializer(
             "date_joined",
         ]
         depth = 9
+        list_serializer_class = UserReactionsListSerializer
 
     def get_answers(self, obj):
-        return ListPostCommentSerializer(
-            obj.answers.all(), many=True, context=self.context
-        ).data
+        answers = getattr(obj, "_thread_answers", None)
+
+        if answers is None:
+            answers = obj.answers.filter(is_deleted=False)
+
+        return ListPostCommentSerializer(answers, many=True, context=self.context).data
 
     def get_my_reaction(self, obj):
         request = self.context["request"]
@@ -230,6 +336,24 @@ class MissionTypeSerializer(serializers.ModelSerializer):
         fields = ["name"]
 
 
+class UserInteractionsListSerializer(serializers.ListSerializer):
+    """
+    Attaches the request user's interactions to every mission before
+    serializing them, so `is_completed` and `completed_info` cost one query
+    for the whole list.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        missions = list(iterable)
+        request = self.context.get("request")
+
+        if request and missions:
+            MissionModel.attach_interactions_by_user(missions, request.user)
+
+        return super().to_representation(missions)
+
+
 class ListMissionSerializer(
     serializers.ModelSerializer, GetAttachmentTypeSerializerMixin
 ):
@@ -251,6 +375,7 @@ class ListMissionSerializer(
             "completed_info",
         ]
         depth = 1
+        list_serializer_class = UserInteractionsListSerializer
 
     def get_completed_info(self, obj: MissionModel):
         request = self.context["request"]
@@ -275,11 +400,47 @@ class ListMissionSerializer(
         return obj.is_completed(user)
 
 
-class CompleteMissionSerializer(serializers.Serializer):
+class CreateDirectUploadSerializer(serializers.Serializer):
+    target = serializers.ChoiceField(choices=list(DIRECT_UPLOAD_TARGETS))
+    file_name = serializers.CharField(max_length=100)
+    content_type = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1, max_value=DIRECT_UPLOAD_MAX_SIZE)
+
+    def create(self, validated_data):
+        request = self.context["request"]
+
+        return create_direct_upload(request.user, **validated_data)
+
+
+class DirectUploadSerializer(serializers.Serializer):
+    key = serializers.CharField()
+    token = serializers.CharField()
+    url = serializers.URLField()
+    fields = serializers.DictField(child=serializers.CharField())
+    expires_in = serializers.IntegerField()
+
+
+class LeaderboardQuerySerializer(serializers.Serializer):
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
+
+
+class LeaderboardEntrySerializer(serializers.Serializer):
+    position = serializers.IntegerField()
+    score = serializers.IntegerField()
+    user = UserDataSerializer()
+
+
+class LeaderboardRankSerializer(serializers.Serializer):
+    position = serializers.IntegerField(allow_null=True)
+    score = serializers.IntegerField()
+
+
+class CompleteMissionSerializer(DirectUploadSerializerMixin, serializers.Serializer):
     mission = serializers.PrimaryKeyRelatedField(
         queryset=MissionModel.objects.all(),
     )
     attachment = serializers.FileField(required=False)
+    upload = DirectUploadField("mission_interaction", required=False)
     content = serializers.CharField(required=False)
 
     def create(self, validated_data):
@@ -295,6 +456,101 @@ class CompleteMissionSerializer(serializers.Serializer):
         return mission.complete(user, attachment, content)
 
 
+class CreateMissionUploadSerializer(serializers.Serializer):
+    mission = serializers.PrimaryKeyRelatedField(
+        queryset=MissionModel.objects.all(),
+    )
+    file_name = serializers.CharField(max_length=100)
+    content_type = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1, max_value=DIRECT_UPLOAD_MAX_SIZE)
+
+    def validate_mission(self, mission):
+        request = self.context["request"]
+
+        if mission.is_completed(request.user):
+            raise ValidationError("Mission already completed")
+
+        return mission
+
+    def create(self, validated_data):
+        request = self.context["request"]
+        mission = validated_data.pop("mission")
+
+        return create_multipart_upload(
+            request.user, "mission_interaction", mission=mission.pk, **validated_data
+        )
+
+
+class MultipartUploadSerializer(serializers.Serializer):
+    key = serializers.CharField()
+    token = serializers.CharField()
+    part_size = serializers.IntegerField()
+    parts_count = serializers.IntegerField()
+
+
+class MissionUploadPartSerializer(serializers.Serializer):
+    upload = MultipartUploadField("mission_interaction")
+    part_number = serializers.IntegerField(min_value=1)
+    checksum = serializers.CharField(validators=[validate_checksum])
+
+    def validate(self, attrs):
+        if attrs["part_number"] > get_parts_count(attrs["upload"]["size"]):
+            raise ValidationError({"part_number": "This part is out of range."})
+
+        return attrs
+
+    def create(self, validated_data):
+        return get_multipart_part_url(**validated_data)
+
+
+class MultipartUploadPartUrlSerializer(serializers.Serializer):
+    url = serializers.URLField()
+    headers = serializers.DictField(child=serializers.CharField())
+    expires_in = serializers.IntegerField()
+
+
+class MissionUploadStatusSerializer(serializers.Serializer):
+    upload = MultipartUploadField("mission_interaction")
+
+
+class MultipartUploadPartSerializer(serializers.Serializer):
+    part_number = serializers.IntegerField(min_value=1)
+    checksum = serializers.CharField(validators=[validate_checksum])
+    size = serializers.IntegerField(read_only=True)
+
+
+class MultipartUploadStatusSerializer(serializers.Serializer):
+    offset = serializers.IntegerField()
+    parts = MultipartUploadPartSerializer(many=True)
+
+
+class CompleteMissionUploadSerializer(serializers.Serializer):
+    upload = MultipartUploadField("mission_interaction")
+    parts = MultipartUploadPartSerializer(many=True)
+    content = serializers.CharField(required=False)
+
+    def create(self, validated_data):
+        request = self.context["request"]
+        user = request.user
+        upload = validated_data["upload"]
+        mission = MissionModel.objects.filter(pk=upload["mission"]).first()
+
+        if mission is None:
+            abort_multipart_upload(upload)
+            raise ValidationError({"error": "Mission not found"})
+
+        if mission.is_completed(user):
+            abort_multipart_upload(upload)
+            raise ValidationError({"error": "Mission already completed"})
+
+        checksums = {
+            part["part_number"]: part["checksum"] for part in validated_data["parts"]
+        }
+        attachment = complete_multipart_upload(upload, checksums)
+
+        return mission.complete(user, attachment, validated_data.get("content"))
+
+
 class LoginQuestionOptionSerializer(serializers.ModelSerializer):
     class Meta:
         model = LoginQuestionOption
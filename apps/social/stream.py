@@ -0,0 +1,152 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, transaction
+from rest_framework.exceptions import AuthenticationFailed
+
+from apps.social.broker import get_broker, get_stream_channel
+from utils.auth import BearerTokenAuthentication
+
+
+def publish_to_feed(service_id, event_id, message: dict):
+    """
+    Publishes the message, once the transaction is committed, to the streams
+    of the event and of the whole service.
+    """
+    broker = get_broker()
+    channels = {get_stream_channel(service_id, event_id)}
+    channels.add(get_stream_channel(service_id))
+
+    def publish():
+        for channel in channels:
+            broker.publish(channel, message)
+
+    transaction.on_commit(publish)
+
+
+def get_stream_user(authorization: str):
+    close_old_connections()
+    keyword, _, key = authorization.partition(" ")
+
+    if keyword != BearerTokenAuthentication.keyword or not key:
+        return None
+
+    try:
+        user, _token = BearerTokenAuthentication().authenticate_credentials(key)
+    except AuthenticationFailed:
+        return None
+    finally:
+        close_old_connections()
+
+    return user
+
+
+class PostStreamApplication:
+    """
+    ASGI application that streams the feed changes of the user's service, or
+    of the user's event for guests, as Server-Sent Events. Every connection
+    is a coroutine waiting on the broker, so idle clients hold no thread.
+    """
+
+    path = "/api/v1/post/stream/"
+    heartbeat_interval = 15
+
+    def __init__(self, broker=None):
+        self.broker = broker
+
+    @staticmethod
+    def get_header(scope, name: bytes):
+        for header, value in scope["headers"]:
+            if header.lower() == name:
+                return value.decode("latin-1")
+
+        return ""
+
+    @staticmethod
+    def format_event(message: dict):
+        data = json.dumps(message["data"])
+
+        return f"event: {message['type']}\ndata: {data}\n\n".encode()
+
+    @staticmethod
+    async def send_error(send, status: int, detail: str):
+        body = json.dumps({"detail": detail}).encode()
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["method"] != "GET":
+            return await self.send_error(
+                send, 405, f'Method "{scope["method"]}" not allowed.'
+            )
+
+        authorization = self.get_header(scope, b"authorization")
+        user = await sync_to_async(get_stream_user)(authorization)
+
+        if user is None:
+            return await self.send_error(
+                send, 401, "Authentication credentials were not provided."
+            )
+
+        channel = get_stream_channel(user.service_id, user.event_id)
+        broker = self.broker or get_broker()
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/event-stream"),
+                    (b"cache-control", b"no-cache"),
+                    (b"x-accel-buffering", b"no"),
+                ],
+            }
+        )
+
+        async with broker.subscribe(channel) as subscription:
+            disconnected = asyncio.ensure_future(self.wait_disconnect(receive))
+
+            try:
+                await self.stream(subscription, send, disconnected)
+            finally:
+                disconnected.cancel()
+
+    @staticmethod
+    async def wait_disconnect(receive):
+        while True:
+            message = await receive()
+
+            if message["type"] == "http.disconnect":
+                return
+
+    async def stream(self, subscription, send, disconnected):
+        await send(
+            {
+                "type": "http.response.body",
+                "body": b": connected\n\n",
+                "more_body": True,
+            }
+        )
+
+        while True:
+            getter = asyncio.ensure_future(subscription.get(self.heartbeat_interval))
+            await asyncio.wait(
+                {getter, disconnected}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if disconnected.done():
+                getter.cancel()
+                return
+
+            message = getter.result()
+            body = self.format_event(message) if message else b": ping\n\n"
+
+            await send({"type": "http.response.body", "body": body, "more_body": True})
@@ -0,0 +1,38 @@
+from zappa.asynchronous import task
+
+
+@task
+def run_post_notification_job(job_id: int):
+    """
+    Runs the job in its own Lambda invocation when deployed with Zappa, or
+    synchronously anywhere else.
+    """
+    from apps.social.models import PostNotificationJobModel
+
+    job = PostNotificationJobModel.objects.filter(pk=job_id).first()
+
+    if job is not None:
+        job.run()
+
+
+@task
+def run_guest_import(guest_import_id: int):
+    from apps.social.models import GuestImportModel
+
+    guest_import = (
+        GuestImportModel.objects.select_related("event__service")
+        .filter(pk=guest_import_id)
+        .first()
+    )
+
+    if guest_import is not None:
+        guest_import.run()
+
+
+@task
+def generate_ai_text_reports(post_ids: list):
+    from apps.social.models import PostModel
+
+    posts = PostModel.objects.select_related("ai_text_report").filter(pk__in=post_ids)
+
+    return PostModel.generate_ai_text_reports(posts)
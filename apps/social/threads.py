@@ -0,0 +1,88 @@
+from django.db.models import Prefetch, prefetch_related_objects
+
+from apps.social.models import PostCommentModel, ReactionModel
+from apps.user.models import UserModel
+
+
+class CommentThread:
+    """
+    Assembles a comment tree in memory. Answers are loaded one level at a time,
+    so the number of queries depends on the thread depth (bounded by
+    `max_depth`) and not on the number of comments.
+    """
+
+    max_depth = 9
+
+    def __init__(self, roots, user: UserModel = None, max_depth: int = None):
+        self.roots = roots
+        self.user = user
+        self.max_depth = max_depth or self.max_depth
+
+    @staticmethod
+    def get_comments_queryset():
+        return PostCommentModel.objects.filter(is_deleted=False).select_related(
+            "author__service"
+        )
+
+    @classmethod
+    def get_roots_queryset(cls, post):
+        return (
+            cls.get_comments_queryset()
+            .filter(post=post, answer__isnull=True)
+            .order_by("-date_joined", "-id")
+        )
+
+    def _load_answers(self, comments):
+        comments_by_id = {comment.pk: comment for comment in comments}
+        answers = list(
+            self.get_comments_queryset()
+            .filter(answer_id__in=comments_by_id)
+            .order_by("date_joined", "id")
+        )
+
+        for answer in answers:
+            comments_by_id[answer.answer_id]._thread_answers.append(answer)
+
+        return answers
+
+    def _attach_user_reactions(self, comments):
+        for comment in comments:
+            user_reactions = [
+                reaction
+                for reaction in comment.reactions.all()
+                if reaction.user_id == self.user.pk
+            ]
+            comment._reactions_by_user = {
+                self.user.pk: min(user_reactions, key=lambda r: r.pk, default=None)
+            }
+
+    def build(self):
+        roots = list(self.roots)
+        comments = list(roots)
+        level = roots
+
+        for depth in range(1, self.max_depth + 1):
+            for comment in level:
+                comment._thread_answers = []
+
+            if not level or depth == self.max_depth:
+                break
+
+            level = self._load_answers(level)
+            comments.extend(level)
+
+        prefetch_related_objects(
+            comments,
+            Prefetch("mentions", queryset=UserModel.objects.select_related("service")),
+            Prefetch(
+                "reactions",
+                queryset=ReactionModel.objects.select_related(
+                    "reaction_type", "user__service"
+                ),
+            ),
+        )
+
+        if self.user is not None:
+            self._attach_user_reactions(comments)
+
+        return roots
@@ -1,6 +1,12 @@
 from utils import router
 
-from .views import GuestViewSet, LoginQuestionViewSet, MissionViewSet, PostViewSet
+from .views import (
+    DirectUploadViewSet,
+    GuestViewSet,
+    LoginQuestionViewSet,
+    MissionViewSet,
+    PostViewSet,
+)
 
 app_name = "apps.social"
 
@@ -8,3 +14,4 @@ router.register(r"post", PostViewSet, basename="post")
 router.register(r"mission", MissionViewSet, basename="mission")
 router.register(r"login-question", LoginQuestionViewSet, basename="login-question")
 router.register(r"event", GuestViewSet, basename="event")
+router.register(r"upload", DirectUploadViewSet, basename="upload")
@@ -1,3 +1,4 @@
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, status
@@ -9,22 +10,41 @@ from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from utils.auth import BearerTokenAuthentication
+from utils.direct_upload import list_multipart_parts
+from utils.mixins.conditional_get import ConditionalGetMixin
 from utils.mixins.multiserializer import MultiSerializerMixin
 
 from ..user.models import UserModel
+from .feed_cache import PostFeedCache
+from .leaderboard import get_leaderboard, get_leaderboard_key
 from .models import (
     LoginQuestions,
+    MissionInteractionModel,
     MissionModel,
+    MissionTypeModel,
     PostCommentModel,
     PostModel,
+    ReactionModel,
     ReactionTypeModel,
 )
+from .pagination import (
+    CommentThreadPagination,
+    GuestSearchPagination,
+    PostCursorPagination,
+)
 from .serializers import (
     AnswerLoginQuestionSerializer,
     CompleteMissionSerializer,
+    CompleteMissionUploadSerializer,
+    CreateDirectUploadSerializer,
+    CreateMissionUploadSerializer,
     CreatePostCommentSerializer,
     CreateReactionSerializer,
+    DirectUploadSerializer,
     GuestEventSerializer,
+    LeaderboardEntrySerializer,
+    LeaderboardQuerySerializer,
+    LeaderboardRankSerializer,
     ListAllPostSerializer,
     ListMissionSerializer,
     ListPostCommentSerializer,
@@ -32,9 +52,15 @@ from .serializers import (
     ListReactionSerializer,
     ListReactTypesSerializer,
     LoginQuestionSerializer,
+    MissionUploadPartSerializer,
+    MissionUploadStatusSerializer,
+    MultipartUploadPartUrlSerializer,
+    MultipartUploadSerializer,
+    MultipartUploadStatusSerializer,
     UnreactSerializer,
     UpdatePostCommentSerializer,
 )
+from .threads import CommentThread
 
 
 class ServiceAndEventContextMixin:
@@ -51,6 +77,7 @@ class ServiceAndEventContextMixin:
 
 
 class PostViewSet(
+    ConditionalGetMixin,
     ServiceAndEventContextMixin,
     MultiSerializerMixin,
     GenericViewSet,
@@ -60,23 +87,28 @@ class PostViewSet(
     authentication_classes = [BearerTokenAuthentication]
     permission_classes = [IsAuthenticated]
     queryset = (
-        PostModel.objects.prefetch_related("reactions")
-        .select_related("author", "event")
+        PostModel.objects.select_related("author__service", "event")
         .filter(is_active=True)
-        .order_by("-date_joined")
+        .order_by("-date_joined", "-id")
         .only(
             "id",
             "author",
             "event",
-            "reactions",
             "date_joined",
             "attachment",
+            "attachment_type",
             "description",
+            "reactions_count",
+            "reactions_by_type",
+            "comments_count",
         )
     )
+    pagination_class = PostCursorPagination
+    etag_models = [PostModel, PostCommentModel, ReactionModel, UserModel]
     serializers = {
         "list": ListAllPostSerializer,
         "retrieve": ListPostSerializer,
+        "comments": ListPostCommentSerializer,
         "comment": CreatePostCommentSerializer,
         "update_comment": UpdatePostCommentSerializer,
         "react": CreateReactionSerializer,
@@ -84,14 +116,60 @@ class PostViewSet(
         "react_types": ListReactTypesSerializer,
     }
 
+    def get_etag_scope(self, request):
+        user = request.user
+
+        return user.service_id, user.event_id if user.is_guest else None
+
+    def get_shared_feed_page(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        context = {**self.get_serializer_context(), "skip_user_fields": True}
+        serializer = self.get_serializer(page, many=True, context=context)
+
+        return self.get_paginated_response(serializer.data).data
+
+    def get_feed_with_user_reactions(self, feed):
+        post_ids = [post["id"] for post in feed["results"]]
+        reactions = PostModel.get_reactions_by_user(post_ids, self.request.user)
+        results = []
+
+        for post in feed["results"]:
+            reaction = reactions.get(post["id"])
+            my_reaction = ListReactionSerializer(reaction).data if reaction else None
+            results.append({**post, "my_reaction": my_reaction})
+
+        return {**feed, "results": results}
+
     @swagger_auto_schema(operation_summary=_("Post List"))
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        user = request.user
+        feed_cache = PostFeedCache(
+            user.service_id, user.event_id if user.is_guest else None
+        )
+        feed = feed_cache.get_or_set(
+            request.build_absolute_uri(), self.get_shared_feed_page
+        )
+
+        return Response(self.get_feed_with_user_reactions(feed))
 
     @swagger_auto_schema(operation_summary=_("Post Detail"))
     def retrieve(self, request, *args, **kwargs):
         return super().retrieve(request, *args, **kwargs)
 
+    @swagger_auto_schema(operation_summary=_("Post comments"))
+    @action(detail=True, methods=["get"], url_path="comments")
+    def comments(self, request, *args, **kwargs):
+        post = self.get_object()
+        paginator = CommentThreadPagination()
+        roots = paginator.paginate_queryset(
+            CommentThread.get_roots_queryset(post), request, view=self
+        )
+        thread = CommentThread(roots, user=request.user).build()
+        serializer = self.get_serializer(thread, many=True)
+
+        return paginator.get_paginated_response(serializer.data)
+
     @swagger_auto_schema(operation_summary=_("Comment to post"))
     @action(detail=False, methods=["post"])
     def comment(self, request):
@@ -99,6 +177,7 @@ class PostViewSet(
         serializer = self.get_serializer(data=data)
         serializer.is_valid(raise_exception=True)
         comment = serializer.save()
+        (comment,) = CommentThread([comment], user=request.user).build()
         response = ListPostCommentSerializer(comment, context={"request": request}).data
 
         return Response(response)
@@ -126,7 +205,8 @@ class PostViewSet(
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
         comment = serializer.save()
-        response = ListPostCommentSerializer(comment).data
+        context = self.get_serializer_context()
+        response = ListPostCommentSerializer(comment, context=context).data
 
         return Response(response)
 
@@ -164,23 +244,34 @@ class PostViewSet(
 
 
 class MissionViewSet(
+    ConditionalGetMixin,
     ServiceAndEventContextMixin,
     MultiSerializerMixin,
     GenericViewSet,
     mixins.RetrieveModelMixin,
     mixins.ListModelMixin,
 ):
-    queryset = (
-        MissionModel.objects.prefetch_related("interactions").all().order_by("order")
-    )
+    queryset = MissionModel.objects.prefetch_related("type").order_by("order")
     serializers = {
         "list": ListMissionSerializer,
         "retrieve": ListMissionSerializer,
         "complete": CompleteMissionSerializer,
+        "upload": CreateMissionUploadSerializer,
+        "upload_part": MissionUploadPartSerializer,
+        "upload_status": MultipartUploadStatusSerializer,
+        "complete_upload": CompleteMissionUploadSerializer,
+        "leaderboard": LeaderboardEntrySerializer,
+        "my_rank": LeaderboardRankSerializer,
     }
+    etag_models = [MissionModel, MissionTypeModel, MissionInteractionModel]
     authentication_classes = [BearerTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
+    def get_etag_scope(self, request):
+        user = request.user
+
+        return user.service_id, user.event_id if user.is_guest else None
+
     @swagger_auto_schema(operation_summary=_("Mission List"))
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
@@ -199,6 +290,92 @@ class MissionViewSet(
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @swagger_auto_schema(
+        operation_summary=_("Start Mission Upload"),
+        responses={201: MultipartUploadSerializer},
+    )
+    @action(detail=False, methods=["post"])
+    def upload(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.save()
+
+        return Response(
+            MultipartUploadSerializer(upload).data, status=status.HTTP_201_CREATED
+        )
+
+    @swagger_auto_schema(
+        operation_summary=_("Mission Upload Part"),
+        responses={200: MultipartUploadPartUrlSerializer},
+    )
+    @action(detail=False, methods=["post"], url_path="upload/part")
+    def upload_part(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        part = serializer.save()
+
+        return Response(MultipartUploadPartUrlSerializer(part).data)
+
+    @swagger_auto_schema(
+        operation_summary=_("Mission Upload Status"),
+        query_serializer=MissionUploadStatusSerializer,
+    )
+    @action(detail=False, methods=["get"], url_path="upload/status")
+    def upload_status(self, request):
+        query = MissionUploadStatusSerializer(
+            data=request.query_params, context=self.get_serializer_context()
+        )
+        query.is_valid(raise_exception=True)
+        upload_status = list_multipart_parts(query.validated_data["upload"])
+
+        serializer = self.get_serializer(upload_status)
+
+        return Response(serializer.data)
+
+    @swagger_auto_schema(operation_summary=_("Complete Mission Upload"))
+    @action(detail=False, methods=["post"], url_path="upload/complete")
+    def complete_upload(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @swagger_auto_schema(
+        operation_summary=_("Mission Leaderboard"),
+        query_serializer=LeaderboardQuerySerializer,
+    )
+    @action(detail=False, methods=["get"])
+    def leaderboard(self, request):
+        query = LeaderboardQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        user = request.user
+        key = get_leaderboard_key(user.service_id, user.event_id)
+        scores = get_leaderboard().get_top(key, query.validated_data["limit"])
+        users = UserModel.objects.select_related("service").in_bulk(
+            [user_id for user_id, _score in scores]
+        )
+        entries = [
+            {"position": position, "score": score, "user": users[user_id]}
+            for position, (user_id, score) in enumerate(scores, start=1)
+            if user_id in users
+        ]
+
+        serializer = self.get_serializer(entries, many=True)
+
+        return Response(serializer.data)
+
+    @swagger_auto_schema(operation_summary=_("My Mission Rank"))
+    @action(detail=False, methods=["get"], url_path="leaderboard/me")
+    def my_rank(self, request):
+        user = request.user
+        key = get_leaderboard_key(user.service_id, user.event_id)
+        position, score = get_leaderboard().get_rank(key, user.pk) or (None, 0)
+
+        serializer = self.get_serializer({"position": position, "score": score})
+
+        return Response(serializer.data)
+
 
 class LoginQuestionViewSet(
     MultiSerializerMixin,
@@ -275,12 +452,39 @@ class GuestViewSet(
         if not user.is_guest:
             raise ValidationError({"error": _("Only guests can get event guests")})
 
+        search_name = UserModel.get_search_name(query)
         users = (
             UserModel.objects.only("id", "first_name")
-            .filter(event_id=user.event_id, first_name__icontains=query)
-            .order_by("first_name")
+            .filter(
+                Q(search_name__startswith=search_name)
+                | Q(search_last_name__startswith=search_name),
+                event_id=user.event_id,
+            )
+            .order_by("search_name", "id")
         )
+        page = GuestSearchPagination().paginate_queryset(users, request, self)
 
-        serializer = self.get_serializer(users, many=True)
+        serializer = self.get_serializer(page, many=True)
 
         return Response(serializer.data)
+
+
+class DirectUploadViewSet(MultiSerializerMixin, GenericViewSet):
+    serializers = {
+        "create": CreateDirectUploadSerializer,
+    }
+    authentication_classes = [BearerTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary=_("Create Direct Upload"),
+        responses={201: DirectUploadSerializer},
+    )
+    def create(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.save()
+
+        return Response(
+            DirectUploadSerializer(upload).data, status=status.HTTP_201_CREATED
+        )
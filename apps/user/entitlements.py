@@ -0,0 +1,35 @@
+from django.core.cache import cache
+
+
+class CourseEntitlements:
+    """
+    Caches, per user, the ids of the courses unlocked by their active
+    contracts, so access checks don't join contracts, packages and courses
+    on every request. Changes to contracts and to the packages' courses
+    invalidate the users involved.
+    """
+
+    timeout = 60 * 60 * 24
+
+    @staticmethod
+    def get_key(user_id):
+        return f"user:entitlements:{user_id}"
+
+    @classmethod
+    def get_course_ids(cls, user) -> frozenset:
+        key = cls.get_key(user.pk)
+        course_ids = cache.get(key)
+
+        if course_ids is None:
+            course_ids = frozenset(
+                user.contracts.filter(is_active=True, package__courses__isnull=False)
+                .values_list("package__courses", flat=True)
+                .distinct()
+            )
+            cache.set(key, course_ids, cls.timeout)
+
+        return course_ids
+
+    @classmethod
+    def invalidate(cls, *user_ids):
+        cache.delete_many([cls.get_key(user_id) for user_id in user_ids])
@@ -0,0 +1,64 @@
+# Generated by Django 3.2.25 on 2026-10-17 20:25
+
+import unicodedata
+
+from django.db import migrations, models
+
+CHUNK_SIZE = 1000
+MAX_LENGTH = 61
+
+
+def get_search_name(*names):
+    decomposed = unicodedata.normalize("NFKD", " ".join(filter(None, names)))
+    name = "".join(char for char in decomposed if not unicodedata.combining(char))
+
+    return " ".join(name.lower().split())[:MAX_LENGTH]
+
+
+def fill_search_name(apps, _schema_editor):
+    UserModel = apps.get_model("user", "UserModel")
+    users = UserModel.objects.only("id", "first_name", "last_name").order_by("pk")
+    last_id = 0
+
+    while True:
+        chunk = list(users.filter(pk__gt=last_id)[:CHUNK_SIZE])
+
+        if not chunk:
+            break
+
+        for user in chunk:
+            user.search_name = get_search_name(user.first_name, user.last_name)
+
+        UserModel.objects.bulk_update(chunk, ["search_name"])
+        last_id = chunk[-1].pk
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("user", "0002_usermodel_event"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="usermodel",
+            name="search_name",
+            field=models.CharField(
+                blank=True,
+                db_collation="C",
+                default="",
+                editable=False,
+                help_text=(
+                    "Full name without accents, in lowercase, used by the search."
+                ),
+                max_length=61,
+                verbose_name="Search Name",
+            ),
+        ),
+        migrations.RunPython(fill_search_name, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="usermodel",
+            index=models.Index(
+                fields=["event", "search_name", "id"], name="user_guest_search_idx"
+            ),
+        ),
+    ]
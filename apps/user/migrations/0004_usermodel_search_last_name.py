@@ -0,0 +1,65 @@
+# Generated by Django 3.2.25 on 2026-10-17 23:10
+
+import unicodedata
+
+from django.db import migrations, models
+
+CHUNK_SIZE = 1000
+MAX_LENGTH = 30
+
+
+def get_search_name(*names):
+    decomposed = unicodedata.normalize("NFKD", " ".join(filter(None, names)))
+    name = "".join(char for char in decomposed if not unicodedata.combining(char))
+
+    return " ".join(name.lower().split())[:MAX_LENGTH]
+
+
+def fill_search_last_name(apps, _schema_editor):
+    UserModel = apps.get_model("user", "UserModel")
+    users = UserModel.objects.only("id", "last_name").order_by("pk")
+    last_id = 0
+
+    while True:
+        chunk = list(users.filter(pk__gt=last_id)[:CHUNK_SIZE])
+
+        if not chunk:
+            break
+
+        for user in chunk:
+            user.search_last_name = get_search_name(user.last_name)
+
+        UserModel.objects.bulk_update(chunk, ["search_last_name"])
+        last_id = chunk[-1].pk
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("user", "0003_usermodel_search_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="usermodel",
+            name="search_last_name",
+            field=models.CharField(
+                blank=True,
+                db_collation="C",
+                default="",
+                editable=False,
+                help_text=(
+                    "Last name without accents, in lowercase, used by the search."
+                ),
+                max_length=30,
+                verbose_name="Search Last Name",
+            ),
+        ),
+        migrations.RunPython(fill_search_last_name, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="usermodel",
+            index=models.Index(
+                fields=["event", "search_last_name", "id"],
+                name="user_guest_last_name_idx",
+            ),
+        ),
+    ]
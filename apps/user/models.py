@@ -1,3 +1,4 @@
+import unicodedata
 from datetime import datetime
 
 from django.contrib.auth.models import AbstractUser
@@ -8,6 +9,7 @@ from django.utils.translation import gettext_lazy as _
 from storages.backends.s3boto3 import S3Boto3Storage
 
 from apps.service.models import ServiceModel
+from apps.user.entitlements import CourseEntitlements
 from apps.user.managers import UserForRetentionManager, UserManager
 
 
@@ -32,6 +34,24 @@ class UserModel(AbstractUser):
     email = models.EmailField(verbose_name=_("Email Address"))
     first_name = models.CharField(verbose_name=_("First Name"), max_length=30)
     last_name = models.CharField(verbose_name=_("Last Name"), max_length=30)
+    search_name = models.CharField(
+        verbose_name=_("Search Name"),
+        max_length=61,
+        blank=True,
+        default="",
+        editable=False,
+        db_collation="C",
+        help_text=_("Full name without accents, in lowercase, used by the search."),
+    )
+    search_last_name = models.CharField(
+        verbose_name=_("Search Last Name"),
+        max_length=30,
+        blank=True,
+        default="",
+        editable=False,
+        db_collation="C",
+        help_text=_("Last name without accents, in lowercase, used by the search."),
+    )
     username = models.CharField(
         verbose_name=_("Username"),
         max_length=150,
@@ -78,23 +98,66 @@ class UserModel(AbstractUser):
         on_delete=models.CASCADE,
     )
 
+    version_scope_fields = ("service_id",)
+
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
         unique_together = ["document", "service"]
+        indexes = [
+            models.Index(
+                fields=["event", "search_name", "id"], name="user_guest_search_idx"
+            ),
+            models.Index(
+                fields=["event", "search_last_name", "id"],
+                name="user_guest_last_name_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
+    def save(self, *args, **kwargs):
+        self.search_name = self.get_search_name(self.first_name, self.last_name)
+        self.search_last_name = self.get_search_name(
+            self.last_name, field="search_last_name"
+        )
+        update_fields = kwargs.get("update_fields")
+
+        if update_fields is not None and {"first_name", "last_name"} & set(
+            update_fields
+        ):
+            kwargs["update_fields"] = {
+                *update_fields,
+                "search_name",
+                "search_last_name",
+            }
+
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def get_search_name(cls, *names, field="search_name"):
+        """
+        Joins the names in lowercase and without accents, so "José  Ávila"
+        is searched as "jose avila", truncated to the length of `field`. The
+        columns use the "C" collation, which lets the indexes serve both the
+        prefix match and the ordering.
+        """
+        decomposed = unicodedata.normalize("NFKD", " ".join(filter(None, names)))
+        name = "".join(char for char in decomposed if not unicodedata.combining(char))
+        max_length = cls._meta.get_field(field).max_length
+
+        return " ".join(name.lower().split())[:max_length]
+
+    def get_course_ids(self):
+        """
+        Ids of the courses unlocked by the user's active contracts, cached
+        until one of them (or the courses of their packages) changes.
+        """
+        return CourseEntitlements.get_course_ids(self)
+
     def can_access(self, course):
-        if course.is_paid:
-            contracts_amount = (
-                self.contracts.only("id")
-                .filter(package__courses__in=[course], is_active=True)
-                .count()
-            )
-            return contracts_amount > 0
-        return True
+        return not course.is_paid or course.pk in self.get_course_ids()
 
     @property
     def is_guest(self):
@@ -8,6 +8,7 @@ from rest_framework.exceptions import ValidationError
 from apps.service.models import ServiceModel
 from apps.user.models import UserModel
 from pipelines.pipes.user import CreateUserPipeline
+from utils.direct_upload import DirectUploadField, DirectUploadSerializerMixin
 from utils.messages import LOGIN_ERROR, NO_VERIFIED_USER
 
 
@@ -109,10 +110,14 @@ class CreateUserSerializer(serializers.ModelSerializer):
         pipeline.run()
 
 
-class UserDataSerializer(serializers.ModelSerializer):
+class UserDataSerializer(DirectUploadSerializerMixin, serializers.ModelSerializer):
     service = serializers.SlugRelatedField(
         slug_field="slug", queryset=ServiceModel.objects.all()
     )
+    profile_image_upload = DirectUploadField("profile_image", required=False)
+
+    file_field = "profile_image"
+    upload_field = "profile_image_upload"
 
     class Meta:
         model = UserModel
@@ -121,6 +126,7 @@ class UserDataSerializer(serializers.ModelSerializer):
             "first_name",
             "last_name",
             "profile_image",
+            "profile_image_upload",
             "username",
             "service",
             "is_verified",
@@ -4,4 +4,15 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core_api.settings.local")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from apps.social.stream import PostStreamApplication  # noqa: E402
+
+post_stream_application = PostStreamApplication()
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "http" and scope["path"] == PostStreamApplication.path:
+        return await post_stream_application(scope, receive, send)
+
+    return await django_application(scope, receive, send)
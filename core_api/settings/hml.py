@@ -3,6 +3,10 @@ from .base import *  # noqa
 AWS_ACCESS_KEY_ID = env("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = env("AWS_SECRET_ACCESS_KEY")
 
+# The cache must be shared by the instances, so Redis is required here.
+REDIS_URL = env("REDIS_URL")  # noqa: F405
+CACHES = get_caches(REDIS_URL)  # noqa: F405
+
 HOMOLOG_APPS = ["django_s3_storage"]
 
 INSTALLED_APPS += HOMOLOG_APPS  # noqa
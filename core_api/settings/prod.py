@@ -5,6 +5,10 @@ DEBUG = False
 AWS_ACCESS_KEY_ID = env("AWS_ACCESS_KEY_ID")  # noqa: F405
 AWS_SECRET_ACCESS_KEY = env("AWS_SECRET_ACCESS_KEY")  # noqa: F405
 
+# The cache must be shared by the instances, so Redis is required here.
+REDIS_URL = env("REDIS_URL")  # noqa: F405
+CACHES = get_caches(REDIS_URL)  # noqa: F405
+
 PROD_APPS = ["django_s3_storage"]
 
 INSTALLED_APPS += PROD_APPS  # noqa
@@ -1,11 +1,15 @@
+from pipelines.items.create_guests import CreateGuests
 from pipelines.items.create_user import CreateUser
 from pipelines.items.generate_random_username import GenerateRandomUsername
 from pipelines.items.generate_token import GenerateToken
+from pipelines.items.send_bulk_email import SendBulkEmail
 from pipelines.items.send_email_to_verification import SendEmail
 
 __all__ = [
+    "CreateGuests",
     "CreateUser",
     "GenerateToken",
     "GenerateRandomUsername",
     "SendEmail",
+    "SendBulkEmail",
 ]
@@ -5,8 +5,4 @@ class AddMentionOnComment(BasePipeItem):
     def _run(self):
         pipeline = self.pipeline
 
-        mention = pipeline.user
-        comment = pipeline.comment
-
-        comment.mentions.add(mention)
-        comment.save()
+        pipeline.comment.mentions.add(*pipeline.users)
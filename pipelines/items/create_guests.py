@@ -0,0 +1,130 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from random import randint
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+
+from apps.user.models import UserModel
+from pipelines.base import BasePipeItem
+
+
+class CreateGuests(BasePipeItem):
+    """
+    Bulk creates the new guests of the event and their tokens. Passwords are
+    hashed in threads, since hashlib's PBKDF2 releases the GIL.
+    """
+
+    password_length = 6
+    username_digits = 4
+
+    def _get_new_guests(self):
+        pipeline = self.pipeline
+        emails = {guest["email"] for guest in pipeline.guests}
+        existing_emails = set(
+            UserModel.objects.filter(
+                event=pipeline.event, email__in=emails
+            ).values_list("email", flat=True)
+        )
+        new_guests = []
+
+        for guest in pipeline.guests:
+            email = guest["email"]
+
+            if email in existing_emails:
+                pipeline.results.append({"email": email, "status": "exists"})
+                continue
+
+            existing_emails.add(email)
+            new_guests.append(guest)
+
+        return new_guests
+
+    def _generate_usernames(self, amount: int):
+        service_slug = self.pipeline.service.slug
+        digits = self.username_digits
+        usernames = set()
+
+        while len(usernames) < amount:
+            candidates = {
+                f"{service_slug}-{randint(0, 10 ** digits - 1):0{digits}d}"
+                for _ in range(amount - len(usernames))
+            } - usernames
+            taken = set(
+                UserModel.objects.filter(username__in=candidates).values_list(
+                    "username", flat=True
+                )
+            )
+            usernames |= candidates - taken
+            digits += 1
+
+        return list(usernames)
+
+    def _generate_passwords(self, amount: int):
+        return [
+            UserModel.objects.make_random_password(self.password_length, "0123456789")
+            for _ in range(amount)
+        ]
+
+    @staticmethod
+    def _hash_passwords(passwords: list):
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            return list(executor.map(make_password, passwords))
+
+    @staticmethod
+    def _truncate(field: str, value: str):
+        return value[: UserModel._meta.get_field(field).max_length]
+
+    def _run(self):
+        pipeline = self.pipeline
+        guests = self._get_new_guests()
+
+        if not guests:
+            return
+
+        usernames = self._generate_usernames(len(guests))
+        passwords = self._generate_passwords(len(guests))
+        hashed_passwords = self._hash_passwords(passwords)
+        users = []
+
+        for guest, username, hashed_password in zip(
+            guests, usernames, hashed_passwords
+        ):
+            first_name = self._truncate("first_name", guest["first_name"])
+            last_name = self._truncate("last_name", guest["last_name"])
+            users.append(
+                UserModel(
+                    username=username,
+                    first_name=first_name,
+                    last_name=last_name,
+                    search_name=UserModel.get_search_name(first_name, last_name),
+                    search_last_name=UserModel.get_search_name(
+                        last_name, field="search_last_name"
+                    ),
+                    email=guest["email"],
+                    password=hashed_password,
+                    service=pipeline.service,
+                    event=pipeline.event,
+                    is_verified=True,
+                )
+            )
+
+        with transaction.atomic():
+            users = UserModel.objects.bulk_create(users)
+            tokens = Token.objects.bulk_create(
+                [Token(user=user, key=Token.generate_key()) for user in users]
+            )
+
+        for user, password, token in zip(users, passwords, tokens):
+            pipeline.users_html_keys[user.pk] = {
+                "TOKEN": token.key,
+                "GUEST_PASSWORD": password,
+            }
+            pipeline.results.append(
+                {"email": user.email, "status": "created", "username": user.username}
+            )
+
+        pipeline.users = users
+
+        self.log(f"{len(users)} guests were created for the event {pipeline.event.pk}")
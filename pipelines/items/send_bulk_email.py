@@ -0,0 +1,49 @@
+from collections import defaultdict
+
+from pipelines.items.send_email_to_verification import SendEmail
+
+
+class SendBulkEmail(SendEmail):
+    """
+    Sends the pipeline email to every `pipeline.users`, with one settings
+    lookup and one personalized send per service or event.
+    """
+
+    @staticmethod
+    def _get_email_context(user):
+        if user.is_guest:
+            return "event", user.event_id
+
+        return "service", user.service_id
+
+    def _group_users_by_context(self):
+        groups = defaultdict(list)
+
+        for user in self.pipeline.users:
+            if user.email:
+                groups[self._get_email_context(user)].append(user)
+
+        return groups.values()
+
+    def _get_user_html_keys(self, user):
+        html_keys = super()._get_user_html_keys(user)
+        html_keys.update(getattr(self.pipeline, "users_html_keys", {}).get(user.pk, {}))
+
+        return html_keys
+
+    def _run(self):
+        if not self.pipeline.send_mail:
+            return
+
+        for users in self._group_users_by_context():
+            email_config = self._get_email_config(users[0])
+
+            if email_config is None:
+                continue
+
+            email_config.send_personalized_email(
+                from_email=self._get_email_from(users[0]),
+                personalizations={
+                    user.email: self._get_user_html_keys(user) for user in users
+                },
+            )
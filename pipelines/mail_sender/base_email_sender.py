@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class BaseEmailSender:
@@ -9,23 +9,38 @@ class BaseEmailSender:
         from_email: str,
         to_emails: List[str],
         html_keys: Optional[dict] = None,
+        personalizations: Optional[Dict[str, dict]] = None,
     ):
         self.subject = subject
         self.html_body = html_body
         self.from_email = from_email
         self.to_emails = to_emails
         self.html_keys = html_keys or {}
+        self.personalizations = personalizations or {}
 
-    def compile_html_body(self):
-        html_keys = self.html_keys
-
+    @staticmethod
+    def replace_html_keys(html_body: str, html_keys: dict):
         for key, value in html_keys.items():
-            self.html_body = self.html_body.replace(f"[{key}]", value or "")
+            html_body = html_body.replace(f"[{key}]", value or "")
+
+        return html_body
+
+    def compile_html_body(self):
+        self.html_body = self.replace_html_keys(self.html_body, self.html_keys)
 
         return self.html_body
 
+    def get_recipient_html_keys(self, to_email: str):
+        return {**self.html_keys, **self.personalizations.get(to_email, {})}
+
     def send(self):
+        if self.personalizations:
+            return self._send_personalized()
+
         return self._send()
 
     def _send(self):
         raise NotImplementedError  # pragma: no cover
+
+    def _send_personalized(self):
+        raise NotImplementedError  # pragma: no cover
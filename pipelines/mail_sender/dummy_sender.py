@@ -15,3 +15,22 @@ class DummySender(BaseEmailSender):
             },
             "compiled_html_body": self.compile_html_body(),
         }
+
+    def _send_personalized(self):
+        return {
+            "status": "success",
+            "message": "Email sent successfully",
+            "data": {
+                "subject": self.subject,
+                "html_body": self.html_body,
+                "from_email": self.from_email,
+                "to_emails": self.to_emails,
+                "personalizations": self.personalizations,
+            },
+            "compiled_html_bodies": {
+                to_email: self.replace_html_keys(
+                    self.html_body, self.get_recipient_html_keys(to_email)
+                )
+                for to_email in self.to_emails
+            },
+        }
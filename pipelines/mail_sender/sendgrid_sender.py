@@ -1,11 +1,14 @@
 from decouple import config as env
 from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
+from sendgrid.helpers.mail import Mail, Personalization, Substitution, To
 
 from pipelines.mail_sender.base_email_sender import BaseEmailSender
 
 
 class SendGridSender(BaseEmailSender):
+    # SendGrid limit of personalizations per request
+    personalizations_per_request = 1000
+
     def _send(self):
         message = Mail(
             from_email=self.from_email,
@@ -16,3 +19,32 @@ class SendGridSender(BaseEmailSender):
 
         sg = SendGridAPIClient(env("SENDGRID_API_KEY"))
         return sg.send(message)
+
+    def get_personalization(self, to_email: str):
+        personalization = Personalization()
+        personalization.add_to(To(to_email))
+
+        for key, value in self.get_recipient_html_keys(to_email).items():
+            personalization.add_substitution(Substitution(f"[{key}]", value or ""))
+
+        return personalization
+
+    def _send_personalized(self):
+        sg = SendGridAPIClient(env("SENDGRID_API_KEY"))
+        size = self.personalizations_per_request
+        responses = []
+
+        for start in range(0, len(self.to_emails), size):
+            end = start + size
+            message = Mail(
+                from_email=self.from_email,
+                subject=self.subject,
+                html_content=self.html_body,
+            )
+
+            for to_email in self.to_emails[start:end]:
+                message.add_personalization(self.get_personalization(to_email))
+
+            responses.append(sg.send(message))
+
+        return responses
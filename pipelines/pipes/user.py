@@ -1,5 +1,14 @@
+from datetime import datetime
+
 from pipelines.base import BasePipeline
-from pipelines.items import CreateUser, GenerateRandomUsername, GenerateToken, SendEmail
+from pipelines.items import (
+    CreateGuests,
+    CreateUser,
+    GenerateRandomUsername,
+    GenerateToken,
+    SendBulkEmail,
+    SendEmail,
+)
 from pipelines.items.add_mention_on_comment import AddMentionOnComment
 
 
@@ -37,8 +46,8 @@ class CreateUserPipeline(BasePipeline):
 
 
 class MentionGuestPipeline(BasePipeline):
-    def __init__(self, user, comment):
-        self.user = user
+    def __init__(self, users, comment):
+        self.users = users
         self.comment = comment
         self.email_type = "mention_notification"
         self.send_mail = True
@@ -46,19 +55,55 @@ class MentionGuestPipeline(BasePipeline):
         super().__init__(
             steps=[
                 AddMentionOnComment,
-                SendEmail,
+                SendBulkEmail,
             ]
         )
 
 
 class NotifyGuestNewPostPipeline(BasePipeline):
-    def __init__(self, user):
-        self.user = user
+    def __init__(self, users):
+        self.users = users
         self.email_type = "new_post_notification"
         self.send_mail = True
 
         super().__init__(
             steps=[
-                SendEmail,
+                SendBulkEmail,
             ]
         )
+
+
+class CreateGuestsPipeline(BasePipeline):
+    def __init__(self, event, guests, send_mail=False):
+        self.event = event
+        self.service = event.service
+        self.guests = guests
+        self.send_mail = send_mail
+        self.email_type = "guest_invitation"
+        self.users = []
+        self.users_html_keys = {}
+        self.results = []
+
+        super().__init__(
+            steps=[
+                CreateGuests,
+                SendBulkEmail,
+            ]
+        )
+
+    def get_report(self):
+        elapsed = (datetime.now() - self.date_init).total_seconds()
+        created = len(self.users)
+
+        return {
+            "results": self.results,
+            "created": created,
+            "existing": len(self.results) - created,
+            "elapsed": elapsed,
+            "throughput": created / elapsed if elapsed else float(created),
+        }
+
+    def run(self):
+        super().run()
+
+        return self.get_report()
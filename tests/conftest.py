@@ -1,14 +1,22 @@
+import boto3
 import pytest
+from django.core.cache import cache
+from moto import mock_aws
 from rest_framework.test import APIClient
 
+from apps.social.leaderboard import get_leaderboard
 from tests.factories.color import ColorFactory
 from tests.factories.color_palette import ColorPaletteFactory
 from tests.factories.comment import CommentFactory
 from tests.factories.course import CourseFactory
 from tests.factories.course_category import CourseCategoryFactory
+from tests.factories.event import EventFactory
 from tests.factories.lesson import LessonFactory
 from tests.factories.live import LiveFactory
 from tests.factories.package import PackageFactory
+from tests.factories.post import PostFactory
+from tests.factories.post_comment import PostCommentFactory
+from tests.factories.reaction_type import ReactionTypeFactory
 from tests.factories.service import ServiceFactory
 from tests.factories.service_email_config import ServiceEmailConfigFactory
 from tests.factories.store import StoreFactory
@@ -16,6 +24,16 @@ from tests.factories.token import TokenFactory
 from tests.factories.user import UserFactory
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_leaderboard():
+    get_leaderboard.cache_clear()
+
+
 @pytest.fixture()
 def api_client():
     return APIClient()
@@ -128,3 +146,55 @@ def dummy_client_logged(dummy_user):
     client = APIClient()
     client.credentials(HTTP_AUTHORIZATION=f"Bearer {dummy_user.auth_token}")
     return client
+
+
+@pytest.fixture()
+def event(dummy_service):
+    return EventFactory(service=dummy_service)
+
+
+@pytest.fixture()
+def guest_user(dummy_service, event):
+    user = UserFactory(service=dummy_service, event=event, username="guest")
+    TokenFactory(user=user)
+    return user
+
+
+@pytest.fixture()
+def guest_client_logged(guest_user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {guest_user.auth_token}")
+    return client
+
+
+@pytest.fixture()
+def reaction_type(dummy_service):
+    return ReactionTypeFactory(service=dummy_service)
+
+
+@pytest.fixture()
+def post(event, guest_user):
+    return PostFactory(event=event, author=guest_user)
+
+
+@pytest.fixture()
+def post_comment(post, guest_user):
+    return PostCommentFactory(post=post, author=guest_user)
+
+
+@pytest.fixture()
+def s3_storage(settings, monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_SESSION_TOKEN", raising=False)
+
+    with mock_aws():
+        settings.AWS_ACCESS_KEY_ID = "testing"
+        settings.AWS_SECRET_ACCESS_KEY = "testing"
+        settings.AWS_STORAGE_BUCKET_NAME = "test-bucket"
+        settings.AWS_S3_REGION_NAME = "us-east-1"
+        settings.AWS_S3_SIGNATURE_VERSION = "s3v4"
+        settings.DEFAULT_FILE_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket="test-bucket")
+
+        yield
@@ -0,0 +1,13 @@
+import factory
+
+from apps.social.models import EventModel
+from tests.factories.service import ServiceFactory
+
+
+class EventFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = EventModel
+
+    title = "Some Title"
+    description = "Some Description"
+    service = factory.SubFactory(ServiceFactory)
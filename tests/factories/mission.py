@@ -0,0 +1,37 @@
+import factory
+
+from apps.social.models import MissionInteractionModel, MissionModel, MissionTypeModel
+from tests.factories.event import EventFactory
+from tests.factories.user import UserFactory
+
+
+class MissionTypeFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = MissionTypeModel
+        django_get_or_create = ["name"]
+
+    name = "Text"
+
+
+class MissionFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = MissionModel
+
+    title = "Some Mission"
+    description = "Some Description"
+    event = factory.SubFactory(EventFactory)
+    service = factory.SelfAttribute("event.service")
+
+    @factory.post_generation
+    def type(self, create, extracted, **_kwargs):
+        if create:
+            self.type.add(*(extracted or [MissionTypeFactory()]))
+
+
+class MissionInteractionFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = MissionInteractionModel
+
+    mission = factory.SubFactory(MissionFactory)
+    user = factory.SubFactory(UserFactory)
+    content = "Some Content"
@@ -0,0 +1,15 @@
+import factory
+
+from apps.social.models import PostModel
+from tests.factories.event import EventFactory
+from tests.factories.user import UserFactory
+
+
+class PostFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = PostModel
+
+    description = "Some Description"
+    author = factory.SubFactory(UserFactory)
+    event = factory.SubFactory(EventFactory)
+    service = factory.SelfAttribute("event.service")
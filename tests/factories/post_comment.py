@@ -0,0 +1,14 @@
+import factory
+
+from apps.social.models import PostCommentModel
+from tests.factories.post import PostFactory
+from tests.factories.user import UserFactory
+
+
+class PostCommentFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = PostCommentModel
+
+    content = "Some Content"
+    post = factory.SubFactory(PostFactory)
+    author = factory.SubFactory(UserFactory)
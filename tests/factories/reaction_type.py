@@ -0,0 +1,12 @@
+import factory
+
+from apps.social.models import ReactionTypeModel
+from tests.factories.service import ServiceFactory
+
+
+class ReactionTypeFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = ReactionTypeModel
+
+    name = "like"
+    service = factory.SubFactory(ServiceFactory)
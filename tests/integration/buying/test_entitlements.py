@@ -0,0 +1,79 @@
+import pytest
+
+from apps.user.models import UserModel
+from tests.factories.contract import ContractFactory
+from tests.factories.course import CourseFactory
+
+
+@pytest.mark.django_db
+class TestCourseEntitlements:
+    @pytest.fixture(autouse=True)
+    def setup(self, course, package, dummy_user):
+        self.course = course
+        self.package = package
+        self.dummy_user = dummy_user
+
+    def get_course_ids(self):
+        return UserModel.objects.get(pk=self.dummy_user.pk).get_course_ids()
+
+    def test_cached(self, django_assert_num_queries):
+        ContractFactory(package=self.package, user=self.dummy_user)
+
+        with django_assert_num_queries(1):
+            assert self.dummy_user.get_course_ids() == {self.course.id}
+
+        with django_assert_num_queries(0):
+            assert self.dummy_user.can_access(self.course) is True
+
+    def test_create_contract(self, dummy_client_logged):
+        assert self.get_course_ids() == frozenset()
+
+        response = dummy_client_logged.post(
+            "/api/v1/contract/",
+            {"package": self.package.slug, "receipt": "dummy_receipt"},
+        )
+
+        assert response.status_code == 201
+        assert self.get_course_ids() == {self.course.id}
+
+    def test_contract_deactivation(self):
+        contract = ContractFactory(package=self.package, user=self.dummy_user)
+
+        assert self.get_course_ids() == {self.course.id}
+
+        contract.is_active = False
+        contract.save()
+
+        assert self.get_course_ids() == frozenset()
+
+    def test_contract_deletion(self):
+        contract = ContractFactory(package=self.package, user=self.dummy_user)
+
+        assert self.get_course_ids() == {self.course.id}
+
+        contract.delete()
+
+        assert self.get_course_ids() == frozenset()
+
+    def test_package_courses_change(self):
+        ContractFactory(package=self.package, user=self.dummy_user)
+        other_course = CourseFactory(service=self.course.service)
+
+        assert self.get_course_ids() == {self.course.id}
+
+        self.package.courses.add(other_course)
+
+        assert self.get_course_ids() == {self.course.id, other_course.id}
+
+        self.package.courses.remove(self.course)
+
+        assert self.get_course_ids() == {other_course.id}
+
+        other_course.packages.clear()
+
+        assert self.get_course_ids() == frozenset()
+
+    def test_other_user_contract(self):
+        ContractFactory(package=self.package)
+
+        assert self.dummy_user.can_access(self.course) is False
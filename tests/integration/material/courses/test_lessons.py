@@ -0,0 +1,138 @@
+import pytest
+
+from apps.material.models import LessonModel
+from tests.factories.comment import CommentFactory
+from tests.factories.lesson import LessonFactory
+from tests.factories.user import UserFactory
+from tests.integration.social.test_react import run_concurrently
+
+
+@pytest.mark.django_db
+class TestLessonSubResources:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/course/{slug}/lessons/{lesson_id}/"
+
+    @pytest.fixture(autouse=True)
+    def setup(self, course, dummy_user, dummy_client_logged):
+        course.is_paid = False
+        course.save()
+        self.lesson = LessonFactory(course=course)
+        self.dummy_user = dummy_user
+        self.client = dummy_client_logged
+        self.path = self.endpoint.format(slug=course.slug, lesson_id=self.lesson.id)
+
+    def get_lesson(self):
+        return LessonModel.objects.get(pk=self.lesson.pk)
+
+    def test_comments(self):
+        comments = CommentFactory.create_batch(3, lesson=self.lesson)
+
+        response = self.client.get(f"{self.path}comments/", {"page_size": 2})
+        body = response.json()
+        next_page = self.client.get(body["next"]).json()
+
+        assert response.status_code == 200
+        assert [comment["text"] for comment in body["results"]] == [
+            comments[2].text,
+            comments[1].text,
+        ]
+        assert body["results"][0]["author"]["id"] == comments[2].author_id
+        assert len(next_page["results"]) == 1
+        assert next_page["next"] is None
+        assert self.get_lesson().comments_count == 3
+
+    def test_comments_count_after_delete(self):
+        comments = CommentFactory.create_batch(2, lesson=self.lesson)
+        comments[0].delete()
+
+        assert self.get_lesson().comments_count == 1
+
+    def test_likes(self):
+        users = UserFactory.create_batch(3, service=self.dummy_user.service)
+
+        for user in users:
+            self.lesson.likes.add(user)
+
+        response = self.client.get(f"{self.path}likes/", {"page_size": 2})
+        body = response.json()
+
+        assert response.status_code == 200
+        assert [user["id"] for user in body["results"]] == [users[2].id, users[1].id]
+        assert body["next"] is not None
+        assert self.get_lesson().likes_count == 3
+
+    def test_toggle_like(self):
+        response = self.client.post(f"{self.path}likes/")
+
+        assert response.status_code == 200
+        assert response.json() == {"liked": True, "likes_count": 1}
+        assert self.lesson.likes.filter(pk=self.dummy_user.pk).exists()
+
+        response = self.client.post(f"{self.path}likes/")
+
+        assert response.json() == {"liked": False, "likes_count": 0}
+        assert not self.lesson.likes.exists()
+        assert self.get_lesson().likes_count == 0
+
+    def test_toggle_like_updates_retrieve(self):
+        course_path = f"/api/v1/course/{self.lesson.course.slug}/"
+        etag = self.client.get(course_path)["ETag"]
+
+        self.client.post(f"{self.path}likes/")
+        response = self.client.get(course_path, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.json()["lessons"][0]["likes_count"] == 1
+        assert response.json()["lessons"][0]["is_liked"] is True
+
+    def test_likes_count_with_relation_changes(self):
+        users = UserFactory.create_batch(2, service=self.dummy_user.service)
+        self.lesson.likes.add(*users)
+        self.lesson.likes.remove(users[0])
+        users[1].lessons_likes.clear()
+        users[0].lessons_likes.add(self.lesson)
+
+        assert self.get_lesson().likes_count == 1
+
+    def test_lesson_from_other_course(self):
+        other_lesson = LessonFactory()
+        path = self.endpoint.format(
+            slug=self.lesson.course.slug, lesson_id=other_lesson.id
+        )
+
+        response = self.client.post(f"{path}likes/")
+
+        assert response.status_code == 404
+        assert not other_lesson.likes.exists()
+
+    def test_paid_course(self, course):
+        course.is_paid = True
+        course.save()
+
+        response = self.client.get(f"{self.path}comments/")
+
+        assert response.status_code == 402
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentLessonLikes:
+    rounds = 10
+
+    def test_concurrent_toggles(self, course, dummy_user):
+        for _ in range(self.rounds):
+            lesson = LessonFactory(course=course)
+
+            results = run_concurrently(
+                *[
+                    lambda: LessonModel.objects.get(pk=lesson.pk).toggle_like(
+                        dummy_user
+                    )
+                    for _ in range(2)
+                ]
+            )
+            lesson = LessonModel.objects.get(pk=lesson.pk)
+
+            assert sorted(results) == [False, True]
+            assert not lesson.likes.exists()
+            assert lesson.likes_count == 0
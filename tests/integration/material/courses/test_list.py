@@ -1,5 +1,11 @@
 import pytest
 
+from tests.factories.comment import CommentFactory
+from tests.factories.contract import ContractFactory
+from tests.factories.course import CourseFactory
+from tests.factories.lesson import LessonFactory
+from tests.factories.user import UserFactory
+
 
 @pytest.mark.django_db
 class TestListCourses:
@@ -64,32 +70,97 @@ class TestListCourses:
                     ],
                 },
                 "course_mode": course.course_mode,
-                "lessons": [
-                    {
-                        "id": lesson.id,
-                        "is_active": lesson.is_active,
-                        "title": lesson.title,
-                        "description": lesson.description,
-                        "thumbnail": None,
-                        "likes": [
-                            {
-                                "id": dummy_user.id,
-                                "username": dummy_user.username,
-                                "first_name": dummy_user.first_name,
-                                "last_name": dummy_user.last_name,
-                                "country": dummy_user.country,
-                            }
-                        ],
-                        "order": lesson.order,
-                        "lesson_type": lesson.lesson_type,
-                        "text": lesson.text,
-                        "reading_time": lesson.reading_time,
-                        "video": None,
-                        "video_transcript": lesson.video_transcript,
-                        "audio": None,
-                        "audio_transcript": lesson.audio_transcript,
-                        "comments": [],
-                    }
-                ],
+                "lessons_count": 1,
+                "duration": lesson.reading_time,
+                "likes_count": 1,
+                "is_locked": True,
             }
         ]
+
+    def test_list_courses_summary(self, dummy_client_logged, course, dummy_user):
+        lessons = LessonFactory.create_batch(3, course=course, reading_time=5)
+        LessonFactory(course=course, reading_time=None)
+        other_users = UserFactory.create_batch(2, service=dummy_user.service)
+
+        for lesson in lessons:
+            lesson.likes.add(dummy_user, *other_users)
+            CommentFactory.create_batch(2, lesson=lesson, author=dummy_user)
+
+        empty_course = CourseFactory(
+            service=dummy_user.service, color_palette=course.color_palette
+        )
+
+        response = dummy_client_logged.get(self.endpoint)
+        summaries = {summary["id"]: summary for summary in response.json()}
+
+        assert response.status_code == 200
+        assert len(summaries) == 2
+        assert "lessons" not in summaries[course.id]
+        assert summaries[course.id]["lessons_count"] == 4
+        assert summaries[course.id]["duration"] == 15
+        assert summaries[course.id]["likes_count"] == 9
+        assert summaries[empty_course.id]["lessons_count"] == 0
+        assert summaries[empty_course.id]["duration"] == 0
+        assert summaries[empty_course.id]["likes_count"] == 0
+
+    def test_list_courses_queries(
+        self, dummy_client_logged, course, dummy_user, django_assert_num_queries
+    ):
+        for _ in range(3):
+            other_course = CourseFactory(
+                service=dummy_user.service, color_palette=course.color_palette
+            )
+            other_course.categories.add(*course.categories.all())
+            lesson = LessonFactory(course=other_course)
+            lesson.likes.add(dummy_user)
+            CommentFactory(lesson=lesson, author=dummy_user)
+
+        with django_assert_num_queries(6):
+            response = dummy_client_logged.get(self.endpoint)
+
+        assert len(response.json()) == 4
+
+        with django_assert_num_queries(5):
+            dummy_client_logged.get(self.endpoint)
+
+    def test_list_courses_locked(
+        self, dummy_client_logged, course, package, dummy_user
+    ):
+        free_course = CourseFactory(service=dummy_user.service, is_paid=False)
+        other_course = CourseFactory(service=dummy_user.service, is_paid=True)
+        locked = {
+            summary["id"]: summary["is_locked"]
+            for summary in dummy_client_logged.get(self.endpoint).json()
+        }
+
+        ContractFactory(package=package, user=dummy_user)
+        unlocked = {
+            summary["id"]: summary["is_locked"]
+            for summary in dummy_client_logged.get(self.endpoint).json()
+        }
+
+        assert locked == {course.id: True, free_course.id: False, other_course.id: True}
+        assert unlocked == {
+            course.id: False,
+            free_course.id: False,
+            other_course.id: True,
+        }
+
+    def test_list_courses_not_modified(self, dummy_client_logged, course):
+        etag = dummy_client_logged.get(self.endpoint)["ETag"]
+
+        response = dummy_client_logged.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_list_courses_modified_after_lesson_change(
+        self, dummy_client_logged, course, lesson
+    ):
+        etag = dummy_client_logged.get(self.endpoint)["ETag"]
+        lesson.reading_time = 10
+        lesson.save()
+
+        response = dummy_client_logged.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.json()[0]["duration"] == 10
@@ -0,0 +1,122 @@
+import pytest
+
+from apps.material.models import CourseProgressModel
+from tests.factories.course import CourseFactory
+from tests.factories.lesson import LessonFactory
+
+
+@pytest.mark.django_db
+class TestCourseProgress:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/course/"
+
+    @pytest.fixture(autouse=True)
+    def setup(self, course, dummy_user, dummy_client_logged):
+        course.is_paid = False
+        course.course_mode = "progressive"
+        course.save()
+        self.course = course
+        self.lessons = [
+            LessonFactory(course=course, order=2),
+            LessonFactory(course=course, order=1),
+            LessonFactory(course=course, order=None),
+        ]
+        self.dummy_user = dummy_user
+        self.client = dummy_client_logged
+
+    def complete(self, lesson, course=None):
+        slug = (course or self.course).slug
+
+        return self.client.post(f"{self.endpoint}{slug}/lessons/{lesson.id}/complete/")
+
+    def test_complete_lessons_in_order(self):
+        first = self.complete(self.lessons[1])
+        second = self.complete(self.lessons[0])
+
+        assert first.status_code == 200
+        assert first.json() == {
+            "course": self.course.slug,
+            "completed_lessons": [self.lessons[1].id],
+            "completed_lessons_count": 1,
+            "lessons_count": 3,
+            "percent_complete": 33,
+            "next_lesson": self.lessons[0].id,
+        }
+        assert second.json()["percent_complete"] == 67
+        assert second.json()["next_lesson"] == self.lessons[2].id
+
+    def test_complete_lesson_with_big_id(self):
+        lesson = LessonFactory(id=2**31 + 1, course=self.course, order=0)
+
+        response = self.complete(lesson)
+
+        assert response.status_code == 200
+        assert response.json()["completed_lessons"] == [lesson.id]
+
+    def test_complete_locked_lesson(self):
+        response = self.complete(self.lessons[0])
+
+        assert response.status_code == 403
+        assert response.json() == {"detail": "Complete the previous lessons first."}
+        assert not CourseProgressModel.objects.exists()
+
+    def test_complete_lesson_twice(self):
+        self.complete(self.lessons[1])
+        response = self.complete(self.lessons[1])
+
+        assert response.status_code == 200
+        assert response.json()["completed_lessons"] == [self.lessons[1].id]
+
+    def test_complete_any_lesson_of_open_course(self):
+        self.course.course_mode = "open"
+        self.course.save()
+
+        response = self.complete(self.lessons[2])
+
+        assert response.status_code == 200
+        assert response.json()["next_lesson"] == self.lessons[1].id
+
+    def test_complete_lesson_from_other_course(self):
+        other_course = CourseFactory(
+            service=self.dummy_user.service, slug="other_slug", is_paid=False
+        )
+
+        response = self.complete(self.lessons[1], course=other_course)
+
+        assert response.status_code == 404
+
+    def test_progress(self, django_assert_num_queries):
+        other_course = CourseFactory(
+            service=self.dummy_user.service, slug="other_slug", is_paid=False
+        )
+        other_lesson = LessonFactory(course=other_course)
+        self.complete(self.lessons[1])
+        self.complete(other_lesson, course=other_course)
+        other_lesson.delete()
+        CourseProgressModel.complete_lesson(
+            self.dummy_user, LessonFactory(course=CourseFactory())
+        )
+
+        with django_assert_num_queries(2):
+            response = self.client.get(f"{self.endpoint}progress/")
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "course": other_course.slug,
+                "completed_lessons": [],
+                "completed_lessons_count": 0,
+                "lessons_count": 0,
+                "percent_complete": 0,
+                "next_lesson": None,
+            },
+            {
+                "course": self.course.slug,
+                "completed_lessons": [self.lessons[1].id],
+                "completed_lessons_count": 1,
+                "lessons_count": 3,
+                "percent_complete": 33,
+                "next_lesson": self.lessons[0].id,
+            },
+        ]
@@ -1,6 +1,9 @@
 import pytest
 
+from tests.factories.comment import CommentFactory
 from tests.factories.contract import ContractFactory
+from tests.factories.lesson import LessonFactory
+from tests.factories.user import UserFactory
 
 
 @pytest.mark.django_db
@@ -90,15 +93,8 @@ class TestRetrieveCourse:
                     "title": lesson.title,
                     "description": lesson.description,
                     "thumbnail": None,
-                    "likes": [
-                        {
-                            "id": dummy_user.id,
-                            "username": dummy_user.username,
-                            "first_name": dummy_user.first_name,
-                            "last_name": dummy_user.last_name,
-                            "country": dummy_user.country,
-                        }
-                    ],
+                    "likes_count": 1,
+                    "is_liked": True,
                     "order": lesson.order,
                     "lesson_type": lesson.lesson_type,
                     "text": lesson.text,
@@ -107,7 +103,7 @@ class TestRetrieveCourse:
                     "video_transcript": lesson.video_transcript,
                     "audio": None,
                     "audio_transcript": lesson.audio_transcript,
-                    "comments": [],
+                    "comments_count": 0,
                 }
             ],
         }
@@ -169,15 +165,8 @@ class TestRetrieveCourse:
                     "title": lesson.title,
                     "description": lesson.description,
                     "thumbnail": None,
-                    "likes": [
-                        {
-                            "id": dummy_user.id,
-                            "username": dummy_user.username,
-                            "first_name": dummy_user.first_name,
-                            "last_name": dummy_user.last_name,
-                            "country": dummy_user.country,
-                        }
-                    ],
+                    "likes_count": 1,
+                    "is_liked": True,
                     "order": lesson.order,
                     "lesson_type": lesson.lesson_type,
                     "text": lesson.text,
@@ -186,7 +175,31 @@ class TestRetrieveCourse:
                     "video_transcript": lesson.video_transcript,
                     "audio": None,
                     "audio_transcript": lesson.audio_transcript,
-                    "comments": [],
+                    "comments_count": 0,
                 }
             ],
         }
+
+    def test_retrieve_queries(
+        self, dummy_client_logged, course, dummy_user, django_assert_max_num_queries
+    ):
+        course.is_paid = False
+        course.save()
+        other_users = UserFactory.create_batch(2, service=dummy_user.service)
+
+        for lesson in LessonFactory.create_batch(3, course=course):
+            lesson.likes.add(dummy_user, *other_users)
+            CommentFactory(lesson=lesson, author=other_users[0])
+            CommentFactory(lesson=lesson, author=other_users[1])
+
+        path = self.endpoint.format(slug=course.slug)
+
+        with django_assert_max_num_queries(8):
+            response = dummy_client_logged.get(path)
+
+        lessons = response.json()["lessons"]
+
+        assert len(lessons) == 3
+        assert {lesson["likes_count"] for lesson in lessons} == {3}
+        assert {lesson["comments_count"] for lesson in lessons} == {2}
+        assert {lesson["is_liked"] for lesson in lessons} == {True}
@@ -39,3 +39,69 @@ class TestListLives:
                 "image": None,
             }
         ]
+
+    def test_list_lives_range(self, dummy_client_logged, dummy_service):
+        today = timezone.localdate()
+        lives = [
+            LiveFactory(
+                service=dummy_service,
+                starts_at=timezone.now() + timezone.timedelta(days=days),
+            )
+            for days in [1, 3, 40]
+        ]
+        LiveFactory(starts_at=timezone.now() + timezone.timedelta(days=1))
+        LiveFactory(
+            service=dummy_service,
+            is_active=False,
+            starts_at=timezone.now() + timezone.timedelta(days=1),
+        )
+
+        default_range = dummy_client_logged.get(self.endpoint)
+        custom_range = dummy_client_logged.get(
+            self.endpoint,
+            {
+                "from": today + timezone.timedelta(days=2),
+                "to": today + timezone.timedelta(days=40),
+            },
+        )
+
+        assert [live["id"] for live in default_range.json()] == [
+            lives[0].id,
+            lives[1].id,
+        ]
+        assert [live["id"] for live in custom_range.json()] == [
+            lives[1].id,
+            lives[2].id,
+        ]
+
+    def test_list_lives_invalid_range(self, dummy_client_logged):
+        today = timezone.localdate()
+
+        response = dummy_client_logged.get(
+            self.endpoint, {"from": today, "to": today - timezone.timedelta(days=1)}
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {
+            "to": ["The last day must not be before the first one."]
+        }
+
+    def test_list_lives_cached(
+        self, dummy_client_logged, dummy_service, django_assert_num_queries
+    ):
+        live = LiveFactory(
+            service=dummy_service,
+            starts_at=timezone.now() + timezone.timedelta(days=1),
+        )
+        dummy_client_logged.get(self.endpoint)
+
+        with django_assert_num_queries(1):
+            response = dummy_client_logged.get(self.endpoint)
+
+        assert [live["id"] for live in response.json()] == [live.id]
+
+        live.title = "New Title"
+        live.save()
+        response = dummy_client_logged.get(self.endpoint)
+
+        assert response.json()[0]["title"] == "New Title"
@@ -49,3 +49,22 @@ class TestServiceDetail:
             "language": dummy_service.language,
             "terms": dummy_service.terms,
         }
+
+    def test_get_service_by_slug_not_modified(self, api_client, dummy_service):
+        path = self.endpoint.format(service_slug=dummy_service.slug)
+        etag = api_client.get(path=path)["ETag"]
+
+        response = api_client.get(path=path, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_get_service_by_slug_modified(self, api_client, dummy_service):
+        path = self.endpoint.format(service_slug=dummy_service.slug)
+        etag = api_client.get(path=path)["ETag"]
+        dummy_service.name = "Other name"
+        dummy_service.save()
+
+        response = api_client.get(path=path, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "Other name"
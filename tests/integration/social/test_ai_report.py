@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.social.chat_ai import DummyTextAI
+from apps.social.models import AITextReportModel, PostModel
+from apps.social.tasks import generate_ai_text_reports
+from tests.factories.post import PostFactory
+from tests.factories.post_comment import PostCommentFactory
+
+
+@pytest.mark.django_db
+class TestGenerateAITextReports:
+    @pytest.fixture(autouse=True)
+    def setup(self, event, guest_user):
+        ai_text_report = AITextReportModel.objects.create(
+            title="Report", pre_set="You are a reporter", text_ai="dummy"
+        )
+        self.posts = [
+            PostFactory(
+                event=event,
+                author=guest_user,
+                ai_text_report=ai_text_report,
+                description=f"Post {index}",
+            )
+            for index in range(3)
+        ]
+        self.post_ids = [post.id for post in self.posts]
+        PostFactory(event=event, author=guest_user)
+
+    @patch.object(DummyTextAI, "get_response", autospec=True)
+    def test_generate_ai_text_reports(self, mock_get_response):
+        mock_get_response.side_effect = lambda client: f"Report of {client.message}"
+
+        summary = generate_ai_text_reports(self.post_ids)
+        posts = PostModel.objects.filter(pk__in=self.post_ids).order_by("pk")
+
+        assert summary == {"generated": 3, "skipped": 0, "failed": 0}
+        assert mock_get_response.call_count == 3
+        assert all("Post" in post.ai_report for post in posts)
+        assert len({post.ai_report_hash for post in posts}) == 3
+
+    @patch.object(DummyTextAI, "get_response", autospec=True, return_value="Report")
+    def test_skip_unchanged_posts(self, mock_get_response):
+        generate_ai_text_reports(self.post_ids)
+        PostCommentFactory(post=self.posts[0], content="New comment")
+
+        with CaptureQueriesContext(connection) as context:
+            summary = generate_ai_text_reports(self.post_ids)
+
+        assert summary == {"generated": 1, "skipped": 2, "failed": 0}
+        assert mock_get_response.call_count == 4
+        assert len([query for query in context if "UPDATE" in query["sql"]]) == 1
+
+    @patch.object(DummyTextAI, "get_response", autospec=True, return_value="Report")
+    def test_reuse_cached_reports(self, mock_get_response):
+        generate_ai_text_reports(self.post_ids)
+        PostModel.objects.filter(pk__in=self.post_ids).update(
+            ai_report=None, ai_report_hash=""
+        )
+
+        summary = generate_ai_text_reports(self.post_ids)
+
+        assert summary == {"generated": 3, "skipped": 0, "failed": 0}
+        assert mock_get_response.call_count == 3
+
+    @patch.object(DummyTextAI, "get_response", autospec=True)
+    def test_keep_failed_reports_pending(self, mock_get_response):
+        mock_get_response.side_effect = ValueError("Invalid key")
+
+        summary = generate_ai_text_reports(self.post_ids[:1])
+
+        assert summary == {"generated": 0, "skipped": 0, "failed": 1}
+        assert PostModel.objects.get(pk=self.post_ids[0]).ai_report is None
+
+        mock_get_response.side_effect = None
+        mock_get_response.return_value = "Report"
+
+        assert generate_ai_text_reports(self.post_ids[:1])["generated"] == 1
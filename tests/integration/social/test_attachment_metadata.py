@@ -0,0 +1,70 @@
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from PIL import Image
+
+from apps.social.models import PostModel
+from tests.factories.post import PostFactory
+
+
+def get_png():
+    buffer = BytesIO()
+    Image.new("RGB", (4, 3)).save(buffer, "PNG")
+
+    return buffer.getvalue()
+
+
+@pytest.mark.django_db
+class TestAttachmentMetadata:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, tmp_path, event, guest_user):
+        settings.MEDIA_ROOT = tmp_path
+        self.post = PostFactory(
+            event=event,
+            author=guest_user,
+            attachment=ContentFile(get_png(), name="image.png"),
+        )
+
+    def test_metadata_stored_on_upload(self, guest_client_logged):
+        post = PostModel.objects.get(pk=self.post.pk)
+
+        response = guest_client_logged.get("/api/v1/post/")
+
+        assert post.attachment_type == "image"
+        assert post.attachment_mime_type == "image/png"
+        assert post.attachment_size == post.attachment.size
+        assert (post.attachment_width, post.attachment_height) == (4, 3)
+        assert post.attachment_duration is None
+        assert response.json()["results"][0]["attachment_type"] == "image"
+
+    def test_metadata_cleared_with_attachment(self):
+        self.post.attachment = None
+        self.post.save(update_fields=["attachment"])
+        post = PostModel.objects.get(pk=self.post.pk)
+
+        assert post.attachment_type is None
+        assert post.attachment_size is None
+
+    def test_backfill_attachment_metadata(self):
+        missing = PostFactory(
+            event=self.post.event,
+            author=self.post.author,
+            attachment="post/missing.mp4",
+        )
+        PostModel.objects.update(
+            attachment_type=None, attachment_mime_type="", attachment_size=None
+        )
+        out = StringIO()
+
+        call_command("backfill_attachment_metadata", stdout=out, stderr=StringIO())
+        post = PostModel.objects.get(pk=self.post.pk)
+        missing.refresh_from_db()
+
+        assert "social.PostModel: 1 updated, 1 failed" in out.getvalue()
+        assert post.attachment_type == "image"
+        assert post.attachment_size == post.attachment.size
+        assert post.attachment_width == 4
+        assert missing.attachment_type == "video"
+        assert missing.attachment_size is None
@@ -0,0 +1,96 @@
+from itertools import count
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+
+from apps.user.models import UserModel
+from pipelines.mail_sender.dummy_sender import DummySender
+from tests.factories.service_email_config import ServiceEmailConfigFactory
+
+
+@pytest.mark.django_db
+class TestCreateGuests:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, event, guest_user):
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+        ServiceEmailConfigFactory(
+            service=None,
+            event=event,
+            email_config_type="guest_invitation",
+            email_html_template="[USERNAME] [GUEST_PASSWORD] [TOKEN]",
+        )
+        self.event = event
+        self.guest_user = guest_user
+
+    def set_guests(self, amount):
+        guests = [
+            f"Guest Number {index};guest{index}@email.com" for index in range(amount)
+        ]
+        guests += ["Again;guest0@email.com", f"Old;{self.guest_user.email}"]
+        self.event.guests = ",".join(guests)
+        self.event.send_email_to_guests = True
+        self.event.save()
+
+    @patch.object(DummySender, "_send_personalized", autospec=True)
+    def test_create_guests(self, mock_send_personalized):
+        self.set_guests(3)
+
+        report = self.event.create_guests()
+        guests = UserModel.objects.filter(
+            event=self.event, email__startswith="guest"
+        ).exclude(pk=self.guest_user.pk)
+        (sender,) = [
+            call_args[0][0] for call_args in mock_send_personalized.call_args_list
+        ]
+
+        assert report["created"] == 3
+        assert report["existing"] == 2
+        assert {result["status"] for result in report["results"][:2]} == {"exists"}
+        assert guests.count() == 3
+        assert Token.objects.filter(user__in=guests).count() == 3
+        assert sorted(sender.to_emails) == [
+            f"guest{index}@email.com" for index in range(3)
+        ]
+
+        for guest in guests.select_related("auth_token"):
+            html_keys = sender.get_recipient_html_keys(guest.email)
+
+            assert guest.first_name == "Guest"
+            assert guest.last_name.startswith("Number ")
+            assert guest.check_password(html_keys["GUEST_PASSWORD"])
+            assert html_keys["TOKEN"] == guest.auth_token.key
+            assert guest.username.startswith(f"{self.event.service.slug}-")
+
+    @patch("pipelines.items.create_guests.randint", side_effect=count())
+    @patch.object(DummySender, "_send_personalized", autospec=True)
+    def test_create_guests_constant_queries(
+        self, _mock_send_personalized, _mock_randint
+    ):
+        self.set_guests(2)
+
+        with CaptureQueriesContext(connection) as few_guests:
+            self.event.create_guests()
+
+        UserModel.objects.filter(email__startswith="guest").exclude(
+            pk=self.guest_user.pk
+        ).delete()
+        self.set_guests(40)
+
+        with CaptureQueriesContext(connection) as many_guests:
+            report = self.event.create_guests()
+
+        assert report["created"] == 40
+        assert len(many_guests) == len(few_guests)
+
+    def test_create_guests_again(self):
+        self.set_guests(2)
+        self.event.send_email_to_guests = False
+
+        self.event.create_guests()
+        report = self.event.create_guests()
+
+        assert report["created"] == 0
+        assert report["existing"] == 4
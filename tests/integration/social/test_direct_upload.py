@@ -0,0 +1,203 @@
+import pytest
+import requests
+
+from apps.social.models import MissionInteractionModel, PostCommentModel
+from apps.user.models import UserModel
+from tests.factories.mission import MissionFactory
+from tests.factories.post_comment import PostCommentFactory
+from tests.factories.token import TokenFactory
+from tests.factories.user import UserFactory
+
+
+@pytest.mark.django_db
+class TestDirectUpload:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/upload/"
+
+    @pytest.fixture(autouse=True)
+    def setup(self, s3_storage, event, guest_client_logged):
+        self.event = event
+        self.client = guest_client_logged
+
+    def upload(self, target, content=b"video", size=None, file_name="video.mp4"):
+        response = self.client.post(
+            self.endpoint,
+            {
+                "target": target,
+                "file_name": file_name,
+                "content_type": "video/mp4",
+                "size": size or len(content),
+            },
+        )
+
+        assert response.status_code == 201
+
+        upload = response.json()
+        s3_response = requests.post(
+            upload["url"], data=upload["fields"], files={"file": content}
+        )
+
+        assert s3_response.status_code == 204
+
+        return upload
+
+    def test_complete_mission(self, guest_user):
+        mission = MissionFactory(event=self.event)
+        upload = self.upload("mission_interaction")
+
+        response = self.client.post(
+            "/api/v1/mission/complete/",
+            {"mission": mission.id, "upload": upload["token"]},
+        )
+        interaction = MissionInteractionModel.objects.get(mission=mission)
+
+        assert response.status_code == 204
+        assert interaction.user == guest_user
+        assert interaction.attachment.name == upload["key"]
+        assert interaction.attachment_type == "video"
+        assert interaction.attachment.read() == b"video"
+        assert upload["key"].startswith(f"media/mission_interaction/{guest_user.id}/")
+
+    def test_comment(self, post):
+        upload = self.upload("post_comment")
+
+        response = self.client.post(
+            "/api/v1/post/comment/",
+            {"post": post.id, "content": "Hi", "upload": upload["token"]},
+        )
+        comment = PostCommentModel.objects.get(post=post)
+
+        assert response.status_code == 200
+        assert comment.attachment.name == upload["key"]
+        assert comment.attachment_type == "video"
+        assert comment.attachment_mime_type == "video/mp4"
+        assert comment.attachment_size == len(b"video")
+
+    def test_update_comment_replaces_metadata(self, post, guest_user):
+        comment = PostCommentFactory(
+            post=post,
+            author=guest_user,
+            attachment="media/posts/image.png",
+            attachment_type="image",
+            attachment_mime_type="image/png",
+            attachment_size=1000,
+            attachment_width=4,
+            attachment_height=3,
+        )
+        upload = self.upload("post_comment", content=b"new video")
+
+        response = self.client.patch(
+            f"/api/v1/post/comment/{comment.id}/",
+            {"content": "Hi", "upload": upload["token"]},
+        )
+        comment.refresh_from_db()
+
+        assert response.status_code == 200
+        assert comment.attachment.name == upload["key"]
+        assert comment.attachment_type == "video"
+        assert comment.attachment_mime_type == "video/mp4"
+        assert comment.attachment_size == len(b"new video")
+        assert comment.attachment_width is None
+        assert comment.attachment_height is None
+
+    def test_profile_image(self, guest_user):
+        upload = self.upload("profile_image", file_name="me.png")
+
+        response = self.client.patch(
+            "/api/v1/user/update_me/", {"profile_image_upload": upload["token"]}
+        )
+        user = UserModel.objects.get(pk=guest_user.pk)
+
+        assert response.status_code == 200
+        assert user.profile_image.name == upload["key"]
+
+    def test_reuse_upload(self, post):
+        upload = self.upload("post_comment")
+        data = {"post": post.id, "content": "Hi", "upload": upload["token"]}
+
+        first = self.client.post("/api/v1/post/comment/", data)
+        second = self.client.post("/api/v1/post/comment/", data)
+
+        assert first.status_code == 200
+        assert second.status_code == 400
+        assert second.json() == {"upload": ["This upload was already used."]}
+        assert PostCommentModel.objects.filter(post=post).count() == 1
+
+    def test_upload_of_other_user(self, post, dummy_service):
+        upload = self.upload("post_comment")
+        other_user = UserFactory(service=dummy_service, username="other")
+        TokenFactory(user=other_user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {other_user.auth_token}")
+
+        response = self.client.post(
+            "/api/v1/post/comment/",
+            {"post": post.id, "content": "Hi", "upload": upload["token"]},
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"upload": ["Invalid or expired upload."]}
+        assert not PostCommentModel.objects.exists()
+
+    def test_upload_for_other_target(self):
+        mission = MissionFactory(event=self.event)
+        upload = self.upload("post_comment")
+
+        response = self.client.post(
+            "/api/v1/mission/complete/",
+            {"mission": mission.id, "upload": upload["token"]},
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"upload": ["Invalid or expired upload."]}
+        assert not MissionInteractionModel.objects.exists()
+
+    def test_missing_file(self):
+        mission = MissionFactory(event=self.event)
+        response = self.client.post(
+            self.endpoint,
+            {
+                "target": "mission_interaction",
+                "file_name": "video.mp4",
+                "content_type": "video/mp4",
+                "size": 5,
+            },
+        )
+
+        response = self.client.post(
+            "/api/v1/mission/complete/",
+            {"mission": mission.id, "upload": response.json()["token"]},
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"upload": ["The uploaded file was not found."]}
+
+    def test_wrong_size(self):
+        mission = MissionFactory(event=self.event)
+        upload = self.upload("mission_interaction", size=1)
+
+        response = self.client.post(
+            "/api/v1/mission/complete/",
+            {"mission": mission.id, "upload": upload["token"]},
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {
+            "upload": ["The uploaded file does not have the declared size."]
+        }
+
+
+@pytest.mark.django_db
+def test_direct_upload_without_s3(guest_client_logged):
+    response = guest_client_logged.post(
+        "/api/v1/upload/",
+        {
+            "target": "post_comment",
+            "file_name": "video.mp4",
+            "content_type": "video/mp4",
+            "size": 5,
+        },
+    )
+
+    assert response.status_code == 400
+    assert response.json() == ["Direct uploads are not available for this storage."]
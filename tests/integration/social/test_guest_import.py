@@ -0,0 +1,156 @@
+from io import BytesIO
+from itertools import count
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from openpyxl import Workbook
+
+from apps.social.models import GuestImportModel
+from apps.user.models import UserModel
+from pipelines.mail_sender.dummy_sender import DummySender
+from tests.factories.service_email_config import ServiceEmailConfigFactory
+
+
+@pytest.mark.django_db
+class TestGuestImport:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, tmp_path, event, guest_user):
+        settings.MEDIA_ROOT = tmp_path
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+        ServiceEmailConfigFactory(
+            service=None,
+            event=event,
+            email_config_type="guest_invitation",
+            email_html_template="[USERNAME] [GUEST_PASSWORD]",
+        )
+        event.send_email_to_guests = True
+        event.save()
+        self.event = event
+        self.guest_user = guest_user
+
+    def get_rows(self, amount):
+        rows = [["Name", "Email"]]
+        rows += [
+            [f"Guest Number {index}", f"guest{index}@email.com"]
+            for index in range(amount)
+        ]
+        rows += [
+            ["Again", "GUEST0@email.com"],
+            ["Old", self.guest_user.email],
+            ["Wrong", "not an email"],
+            ["", ""],
+            ["", "noname@email.com"],
+        ]
+
+        return rows
+
+    def create_import(self, rows, file_format="csv"):
+        if file_format == "csv":
+            content = "\n".join(",".join(row) for row in rows).encode()
+        else:
+            workbook = Workbook()
+
+            for row in rows:
+                workbook.active.append(row)
+
+            buffer = BytesIO()
+            workbook.save(buffer)
+            content = buffer.getvalue()
+
+        return GuestImportModel.objects.create(
+            event=self.event,
+            file=SimpleUploadedFile(f"guests.{file_format}", content),
+        )
+
+    @pytest.mark.parametrize("file_format", ["csv", "xlsx"])
+    @patch.object(DummySender, "_send_personalized", autospec=True)
+    def test_run(self, mock_send_personalized, file_format):
+        guest_import = self.create_import(self.get_rows(3), file_format)
+
+        guest_import.run()
+        guest_import.refresh_from_db()
+        (sender,) = [
+            call_args[0][0] for call_args in mock_send_personalized.call_args_list
+        ]
+        rows = {row.line: row for row in guest_import.rows.all()}
+
+        assert guest_import.status == "done"
+        assert guest_import.rows_count == 7
+        assert guest_import.created_count == 4
+        assert guest_import.get_summary() == {
+            "created": 4,
+            "duplicated": 1,
+            "exists": 1,
+            "invalid": 1,
+        }
+        assert rows[5].status == "duplicated"
+        assert rows[6].status == "exists"
+        assert rows[7].error == "Wrong email format."
+        assert 8 not in rows
+        assert sorted(sender.to_emails) == [
+            "guest0@email.com",
+            "guest1@email.com",
+            "guest2@email.com",
+            "noname@email.com",
+        ]
+        assert UserModel.objects.get(email="guest1@email.com").last_name == "Number 1"
+        assert UserModel.objects.get(email="noname@email.com").last_name == (
+            "noname@email.com"
+        )
+
+    @patch("pipelines.items.create_guests.randint", side_effect=count())
+    @patch.object(DummySender, "_send_personalized", autospec=True)
+    def test_run_constant_queries(self, _mock_send_personalized, _mock_randint):
+        few_guests = self.create_import(self.get_rows(2))
+
+        with CaptureQueriesContext(connection) as few_queries:
+            few_guests.run()
+
+        many_guests = self.create_import(
+            [["email"]]
+            + [[f"new{index}@email.com"] for index in range(50)]
+            + self.get_rows(0)[1:]
+        )
+
+        with CaptureQueriesContext(connection) as many_queries:
+            many_guests.run()
+
+        assert many_guests.created_count == 50
+        assert len(many_queries) == len(few_queries)
+
+    @patch.object(GuestImportModel, "chunk_size", 2)
+    def test_run_in_chunks(self):
+        self.event.send_email_to_guests = False
+        self.event.save()
+        guest_import = self.create_import(self.get_rows(3))
+
+        guest_import.run()
+
+        assert guest_import.rows_count == 7
+        assert guest_import.created_count == 4
+
+    def test_run_without_email_column(self):
+        guest_import = self.create_import([["name"], ["John"]])
+
+        with pytest.raises(Exception, match="email"):
+            guest_import.run()
+
+        guest_import.refresh_from_db()
+
+        assert guest_import.status == "failed"
+        assert "email" in guest_import.error
+
+    def test_run_only_once(self):
+        self.event.send_email_to_guests = False
+        self.event.save()
+        guest_import = self.create_import(self.get_rows(1))
+
+        guest_import.run()
+
+        with CaptureQueriesContext(connection) as queries:
+            guest_import.run()
+
+        assert len(queries) == 1
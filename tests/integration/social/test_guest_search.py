@@ -0,0 +1,113 @@
+import pytest
+from django.db import connection
+
+from apps.user.models import UserModel
+from tests.factories.event import EventFactory
+from tests.factories.user import UserFactory
+
+
+@pytest.mark.django_db
+class TestGuestSearch:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/event/guests/"
+
+    @pytest.fixture(autouse=True)
+    def setup(self, dummy_service, event):
+        names = [
+            ("José", "Ávila"),
+            ("Joana", "Silva"),
+            ("JOÃO", "Pedro"),
+            ("Maria", "José"),
+        ]
+        self.guests = {
+            first_name: UserFactory(
+                service=dummy_service,
+                event=event,
+                username=f"guest-{index}",
+                first_name=first_name,
+                last_name=last_name,
+            )
+            for index, (first_name, last_name) in enumerate(names)
+        }
+        UserFactory(
+            service=dummy_service,
+            event=EventFactory(service=dummy_service),
+            username="other-event",
+            first_name="Josefa",
+        )
+
+    def search(self, client, **params):
+        response = client.get(self.endpoint, params)
+
+        assert response.status_code == 200
+
+        return [guest["first_name"] for guest in response.json()]
+
+    def test_search_accent_insensitive_prefix(self, guest_client_logged):
+        assert self.search(guest_client_logged, query="jo") == [
+            "Joana",
+            "JOÃO",
+            "José",
+            "Maria",
+        ]
+        assert self.search(guest_client_logged, query=" Jose  Av") == ["José"]
+        assert self.search(guest_client_logged, query="joão") == ["JOÃO"]
+        assert self.search(guest_client_logged, query="silva jo") == []
+
+    def test_search_last_name_prefix(self, guest_client_logged):
+        assert self.search(guest_client_logged, query="silva") == ["Joana"]
+        assert self.search(guest_client_logged, query="Ávi") == ["José"]
+        assert self.search(guest_client_logged, query="ped") == ["JOÃO"]
+
+    def test_search_limit_offset(self, guest_client_logged):
+        assert self.search(guest_client_logged, query="jo", limit=2) == [
+            "Joana",
+            "JOÃO",
+        ]
+        assert self.search(guest_client_logged, query="jo", limit=2, offset=2) == [
+            "José",
+            "Maria",
+        ]
+
+    def test_search_all_guests(self, guest_client_logged):
+        assert self.search(guest_client_logged) == [
+            "Joana",
+            "JOÃO",
+            "José",
+            "Maria",
+            "some first_name",
+        ]
+
+    def test_search_uses_the_index(self, guest_client_logged, guest_user):
+        queryset = UserModel.objects.filter(
+            event_id=guest_user.event_id, search_name__startswith="jo"
+        ).order_by("search_name", "id")
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_bitmapscan = off")
+            cursor.execute("SET LOCAL enable_sort = off")
+            plan = queryset.explain()
+
+        assert "user_guest_search_idx" in plan
+        assert "Sort" not in plan
+
+    def test_search_last_name_uses_the_index(self, guest_client_logged, guest_user):
+        queryset = UserModel.objects.filter(
+            event_id=guest_user.event_id, search_last_name__startswith="jo"
+        ).order_by("search_last_name", "id")
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_bitmapscan = off")
+            cursor.execute("SET LOCAL enable_sort = off")
+            plan = queryset.explain()
+
+        assert "user_guest_last_name_idx" in plan
+        assert "Sort" not in plan
+
+    def test_search_failure_not_guest(self, api_client_logged):
+        response = api_client_logged.get(self.endpoint, {"query": "jo"})
+
+        assert response.status_code == 400
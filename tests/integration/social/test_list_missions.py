@@ -0,0 +1,71 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.factories.mission import MissionFactory, MissionInteractionFactory
+from tests.factories.user import UserFactory
+
+
+@pytest.mark.django_db
+class TestListMissions:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/mission/"
+
+    def create_missions(self, event, guest_user, amount):
+        other_guest = UserFactory(
+            service=event.service, event=event, username=f"other-{amount}"
+        )
+
+        for order in range(amount):
+            mission = MissionFactory(event=event, order=order)
+            MissionInteractionFactory(mission=mission, user=other_guest)
+
+            if order % 2 == 0:
+                MissionInteractionFactory(
+                    mission=mission, user=guest_user, content=f"Answer {order}"
+                )
+
+    def test_list_missions_completion(self, guest_client_logged, guest_user, event):
+        self.create_missions(event, guest_user, 3)
+
+        response = guest_client_logged.get(self.endpoint)
+        missions = response.json()
+
+        assert response.status_code == 200
+        assert [mission["is_completed"] for mission in missions] == [
+            True,
+            False,
+            True,
+        ]
+        assert missions[0]["completed_info"]["content"] == "Answer 0"
+        assert missions[1]["completed_info"] is None
+        assert missions[0]["type"][0]["name"] == "Text"
+
+    def test_list_missions_runs_constant_queries(
+        self, guest_client_logged, guest_user, event
+    ):
+        def get_queries_amount():
+            with CaptureQueriesContext(connection) as context:
+                response = guest_client_logged.get(self.endpoint)
+
+            assert response.status_code == 200
+
+            return len(context)
+
+        self.create_missions(event, guest_user, 2)
+        few_missions = get_queries_amount()
+        self.create_missions(event, guest_user, 10)
+
+        assert get_queries_amount() == few_missions
+
+    def test_retrieve_mission(self, guest_client_logged, guest_user, event):
+        self.create_missions(event, guest_user, 1)
+        mission = event.missions.get()
+
+        with CaptureQueriesContext(connection) as context:
+            response = guest_client_logged.get(f"{self.endpoint}{mission.id}/")
+
+        assert response.status_code == 200
+        assert response.json()["completed_info"]["content"] == "Answer 0"
+        assert len([query for query in context if "interaction" in query["sql"]]) == 1
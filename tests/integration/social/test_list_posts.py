@@ -0,0 +1,71 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.factories.post import PostFactory
+
+
+@pytest.mark.django_db
+class TestListPosts:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/post/"
+
+    def test_list_posts_failure_unauthenticated(self, api_client):
+        response = api_client.get(self.endpoint)
+
+        assert response.status_code == 401
+
+    def test_list_posts_with_my_reaction(
+        self, guest_client_logged, guest_user, post, reaction_type
+    ):
+        other_post = PostFactory(event=post.event, author=guest_user)
+        reaction = post.react(guest_user, reaction_type.id)
+
+        response = guest_client_logged.get(self.endpoint)
+        my_reactions = {
+            item["id"]: item["my_reaction"] for item in response.json()["results"]
+        }
+
+        assert response.status_code == 200
+        assert my_reactions[other_post.id] is None
+        assert my_reactions[post.id]["id"] == reaction.id
+        assert my_reactions[post.id]["reaction_type"]["name"] == "like"
+        assert my_reactions[post.id]["user"]["service"] == guest_user.service.slug
+
+    def test_list_posts_runs_constant_queries(
+        self, guest_client_logged, guest_user, event, reaction_type
+    ):
+        def get_queries_amount():
+            with CaptureQueriesContext(connection) as context:
+                guest_client_logged.get(self.endpoint)
+
+            return len(context.captured_queries)
+
+        PostFactory(event=event, author=guest_user).react(guest_user, reaction_type.id)
+        few_posts_queries = get_queries_amount()
+
+        for post in PostFactory.create_batch(10, event=event, author=guest_user):
+            post.react(guest_user, reaction_type.id)
+
+        assert get_queries_amount() == few_posts_queries
+
+    def test_list_posts_paginated_by_cursor(self, guest_client_logged, post):
+        posts = PostFactory.create_batch(4, event=post.event, author=post.author)
+        expected_ids = [item.id for item in reversed([post, *posts])]
+
+        response = guest_client_logged.get(self.endpoint, {"page_size": 2})
+        first_page = response.json()
+        next_page = guest_client_logged.get(first_page["next"]).json()
+        last_page = guest_client_logged.get(next_page["next"]).json()
+
+        ids = [
+            item["id"]
+            for page in (first_page, next_page, last_page)
+            for item in page["results"]
+        ]
+
+        assert response.status_code == 200
+        assert first_page["previous"] is None
+        assert last_page["next"] is None
+        assert ids == expected_ids
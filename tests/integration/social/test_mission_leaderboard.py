@@ -0,0 +1,126 @@
+import pytest
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from apps.social.leaderboard import get_leaderboard, get_leaderboard_key
+from apps.social.models import MissionInteractionModel, MissionModel
+from tests.factories.mission import MissionFactory, MissionInteractionFactory
+from tests.factories.token import TokenFactory
+from tests.factories.user import UserFactory
+from tests.integration.social.test_react import run_concurrently
+
+
+@pytest.mark.django_db(transaction=True)
+class TestMissionLeaderboard:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/mission/"
+
+    @pytest.fixture(autouse=True)
+    def setup(self, event, guest_user, guest_client_logged):
+        self.event = event
+        self.guest_user = guest_user
+        self.guest_client = guest_client_logged
+        self.missions = [MissionFactory(event=event, order=order) for order in range(3)]
+
+    def create_guest(self, username):
+        guest = UserFactory(
+            service=self.event.service, event=self.event, username=username
+        )
+        TokenFactory(user=guest)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {guest.auth_token}")
+
+        return guest, client
+
+    def complete(self, client, missions):
+        for mission in missions:
+            response = client.post(
+                f"{self.endpoint}complete/", {"mission": mission.id, "content": "Ok"}
+            )
+
+            assert response.status_code == 204
+
+    def test_leaderboard(self):
+        other_guest, other_client = self.create_guest("other")
+        self.complete(self.guest_client, self.missions[:1])
+        self.complete(other_client, self.missions)
+
+        response = self.guest_client.get(f"{self.endpoint}leaderboard/")
+        entries = response.json()
+
+        assert response.status_code == 200
+        assert [
+            (entry["position"], entry["score"], entry["user"]["username"])
+            for entry in entries
+        ] == [(1, 3, "other"), (2, 1, "guest")]
+
+        response = self.guest_client.get(f"{self.endpoint}leaderboard/?limit=1")
+
+        assert [entry["user"]["username"] for entry in response.json()] == ["other"]
+
+    def test_my_rank(self):
+        response = self.guest_client.get(f"{self.endpoint}leaderboard/me/")
+
+        assert response.status_code == 200
+        assert response.json() == {"position": None, "score": 0}
+
+        self.complete(self.guest_client, self.missions[:2])
+        response = self.guest_client.get(f"{self.endpoint}leaderboard/me/")
+
+        assert response.json() == {"position": 1, "score": 2}
+
+    def test_concurrent_completions_score_once(self):
+        key = get_leaderboard_key(self.event.service_id, self.event.id)
+
+        for mission in self.missions:
+            run_concurrently(
+                *[
+                    lambda pk=mission.pk: MissionModel.objects.get(pk=pk).complete(
+                        self.guest_user
+                    )
+                    for _ in range(2)
+                ]
+            )
+
+        interactions = MissionInteractionModel.objects.filter(user=self.guest_user)
+
+        assert interactions.count() == 3
+        assert get_leaderboard().get_rank(key, self.guest_user.pk) == (1, 3)
+
+    def test_deleted_completion_unscored(self):
+        key = get_leaderboard_key(self.event.service_id, self.event.id)
+        self.complete(self.guest_client, self.missions[:2])
+
+        MissionInteractionModel.objects.filter(mission=self.missions[0]).delete()
+
+        assert get_leaderboard().get_rank(key, self.guest_user.pk) == (1, 1)
+
+        self.missions[1].delete()
+
+        assert get_leaderboard().get_rank(key, self.guest_user.pk) is None
+
+    def test_leaderboard_invalid_limit(self):
+        response = self.guest_client.get(f"{self.endpoint}leaderboard/?limit=0")
+
+        assert response.status_code == 400
+
+    def test_rebuild_mission_leaderboard(self):
+        key = get_leaderboard_key(self.event.service_id, self.event.id)
+        other_guest, _other_client = self.create_guest("other")
+
+        for mission in self.missions:
+            MissionInteractionFactory(mission=mission, user=other_guest)
+
+        MissionInteractionFactory(mission=self.missions[0], user=self.guest_user)
+        get_leaderboard().increment(get_leaderboard_key(0), self.guest_user.pk)
+
+        assert get_leaderboard().get_top(key, 10) == []
+
+        call_command("rebuild_mission_leaderboard")
+
+        assert get_leaderboard().get_top(key, 10) == [
+            (other_guest.pk, 3),
+            (self.guest_user.pk, 1),
+        ]
+        assert get_leaderboard().get_top(get_leaderboard_key(0), 10) == []
@@ -0,0 +1,234 @@
+import base64
+import hashlib
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+import requests
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.social.models import MissionInteractionModel
+from tests.factories.mission import MissionFactory, MissionInteractionFactory
+from utils.direct_upload import MULTIPART_UPLOAD_PART_SIZE
+
+
+def get_checksum(chunk):
+    return base64.b64encode(hashlib.md5(chunk).digest()).decode()
+
+
+@pytest.mark.django_db
+class TestMissionUpload:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/mission/upload/"
+        cls.content = b"a" * MULTIPART_UPLOAD_PART_SIZE + b"b" * 10
+        cls.chunks = [cls.content[:MULTIPART_UPLOAD_PART_SIZE], b"b" * 10]
+
+    @pytest.fixture(autouse=True)
+    def setup(self, s3_storage, event, guest_user, guest_client_logged):
+        self.mission = MissionFactory(event=event)
+        self.guest_user = guest_user
+        self.client = guest_client_logged
+
+    def start(self):
+        response = self.client.post(
+            self.endpoint,
+            {
+                "mission": self.mission.id,
+                "file_name": "video.mp4",
+                "content_type": "video/mp4",
+                "size": len(self.content),
+            },
+        )
+
+        assert response.status_code == 201
+
+        return response.json()
+
+    def send_part(self, upload, part_number, chunk):
+        response = self.client.post(
+            f"{self.endpoint}part/",
+            {
+                "upload": upload["token"],
+                "part_number": part_number,
+                "checksum": get_checksum(self.chunks[part_number - 1]),
+            },
+        )
+
+        assert response.status_code == 200
+
+        part = response.json()
+        s3_response = requests.put(part["url"], data=chunk, headers=part["headers"])
+
+        assert s3_response.status_code == 200
+
+    def get_status(self, upload):
+        response = self.client.get(
+            f"{self.endpoint}status/", {"upload": upload["token"]}
+        )
+
+        assert response.status_code == 200
+
+        return response.json()
+
+    def complete(self, upload):
+        return self.client.post(
+            f"{self.endpoint}complete/",
+            {
+                "upload": upload["token"],
+                "content": "Ok",
+                "parts": [
+                    {"part_number": part_number, "checksum": get_checksum(chunk)}
+                    for part_number, chunk in enumerate(self.chunks, start=1)
+                ],
+            },
+            format="json",
+        )
+
+    def test_resumable_upload(self):
+        upload = self.start()
+
+        assert upload["part_size"] == MULTIPART_UPLOAD_PART_SIZE
+        assert upload["parts_count"] == 2
+        assert self.get_status(upload) == {"offset": 0, "parts": []}
+
+        self.send_part(upload, 1, self.chunks[0])
+        upload_status = self.get_status(upload)
+
+        assert upload_status["offset"] == MULTIPART_UPLOAD_PART_SIZE
+        assert upload_status["parts"] == [
+            {
+                "part_number": 1,
+                "checksum": get_checksum(self.chunks[0]),
+                "size": MULTIPART_UPLOAD_PART_SIZE,
+            }
+        ]
+
+        self.send_part(upload, 2, self.chunks[1])
+        response = self.complete(upload)
+        interaction = MissionInteractionModel.objects.get(mission=self.mission)
+
+        assert response.status_code == 204
+        assert interaction.user == self.guest_user
+        assert interaction.content == "Ok"
+        assert interaction.attachment.name == upload["key"]
+        assert interaction.attachment_type == "video"
+        assert interaction.attachment_mime_type == "video/mp4"
+        assert interaction.attachment_size == len(self.content)
+        assert interaction.attachment.size == len(self.content)
+
+    def test_corrupted_part(self):
+        upload = self.start()
+        self.send_part(upload, 1, self.chunks[0])
+        self.send_part(upload, 2, b"c" * 10)
+
+        response = self.complete(upload)
+
+        assert response.status_code == 400
+        assert response.json() == {"parts": "Missing or corrupted parts: 2."}
+        assert not MissionInteractionModel.objects.exists()
+
+        self.send_part(upload, 2, self.chunks[1])
+
+        assert self.complete(upload).status_code == 204
+
+    def test_missing_part(self):
+        upload = self.start()
+        self.send_part(upload, 2, self.chunks[1])
+
+        response = self.complete(upload)
+
+        assert self.get_status(upload)["offset"] == 0
+        assert response.status_code == 400
+        assert response.json() == {"parts": "Missing or corrupted parts: 1."}
+
+    def test_part_out_of_range(self):
+        upload = self.start()
+
+        response = self.client.post(
+            f"{self.endpoint}part/",
+            {
+                "upload": upload["token"],
+                "part_number": 3,
+                "checksum": get_checksum(b""),
+            },
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"part_number": ["This part is out of range."]}
+
+    def test_completed_upload(self):
+        upload = self.start()
+        self.send_part(upload, 1, self.chunks[0])
+        self.send_part(upload, 2, self.chunks[1])
+        self.complete(upload)
+
+        response = self.client.get(
+            f"{self.endpoint}status/", {"upload": upload["token"]}
+        )
+
+        assert response.status_code == 400
+        assert response.json() == ["Invalid or expired upload."]
+
+    def test_complete_upload_of_completed_mission(self):
+        upload = self.start()
+        self.send_part(upload, 1, self.chunks[0])
+        MissionInteractionFactory(mission=self.mission, user=self.guest_user)
+
+        response = self.complete(upload)
+
+        assert response.status_code == 400
+        assert response.json() == {"error": "Mission already completed"}
+        assert self.client.get(
+            f"{self.endpoint}status/", {"upload": upload["token"]}
+        ).json() == ["Invalid or expired upload."]
+
+    def test_abort_stale_uploads(self):
+        stale_upload = self.start()
+        self.send_part(stale_upload, 1, self.chunks[0])
+        two_days_later = timezone.now() + timedelta(days=2)
+
+        with patch("utils.direct_upload.timezone.now", return_value=two_days_later):
+            call_command("abort_stale_uploads", stdout=StringIO())
+
+        response = self.client.get(
+            f"{self.endpoint}status/", {"upload": stale_upload["token"]}
+        )
+
+        assert response.json() == ["Invalid or expired upload."]
+
+    def test_start_completed_mission(self):
+        MissionInteractionFactory(mission=self.mission, user=self.guest_user)
+
+        response = self.client.post(
+            self.endpoint,
+            {
+                "mission": self.mission.id,
+                "file_name": "video.mp4",
+                "content_type": "video/mp4",
+                "size": 10,
+            },
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"mission": ["Mission already completed"]}
+
+    def test_direct_upload_token(self):
+        response = self.client.post(
+            "/api/v1/upload/",
+            {
+                "target": "mission_interaction",
+                "file_name": "video.mp4",
+                "content_type": "video/mp4",
+                "size": 10,
+            },
+        )
+
+        response = self.client.get(
+            f"{self.endpoint}status/", {"upload": response.json()["token"]}
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"upload": ["Invalid or expired upload."]}
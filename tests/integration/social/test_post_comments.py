@@ -0,0 +1,196 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.social.threads import CommentThread
+from pipelines.mail_sender.dummy_sender import DummySender
+from tests.factories.post_comment import PostCommentFactory
+from tests.factories.service_email_config import ServiceEmailConfigFactory
+from tests.factories.user import UserFactory
+
+
+@pytest.mark.django_db
+class TestPostComments:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/post/"
+
+    def _create_thread(self, post, author, reaction_type, replies=2):
+        root = PostCommentFactory(post=post, author=author)
+        root.react(author, reaction_type.id)
+        root.mentions.add(author)
+
+        for _ in range(replies):
+            answer = PostCommentFactory(post=None, answer=root, author=author)
+            PostCommentFactory(post=None, answer=answer, author=author)
+
+        return root
+
+    def test_retrieve_post_with_comment_thread(
+        self, guest_client_logged, guest_user, post, reaction_type
+    ):
+        root = self._create_thread(post, guest_user, reaction_type)
+        PostCommentFactory(post=None, answer=root, author=guest_user, is_deleted=True)
+
+        response = guest_client_logged.get(f"{self.endpoint}{post.id}/")
+        (comment,) = response.json()["comments"]
+
+        assert response.status_code == 200
+        assert comment["id"] == root.id
+        assert comment["answers_count"] == 2
+        assert comment["my_reaction"]["reaction_type"]["name"] == "like"
+        assert comment["mentions"][0]["id"] == guest_user.id
+        assert len(comment["answers"]) == 2
+        assert len(comment["answers"][0]["answers"]) == 1
+        assert comment["answers"][0]["my_reaction"] is None
+        assert response.json()["comments_next"] is None
+
+    def test_retrieve_post_with_more_comments(
+        self, guest_client_logged, guest_user, post
+    ):
+        PostCommentFactory.create_batch(21, post=post, author=guest_user)
+
+        response = guest_client_logged.get(f"{self.endpoint}{post.id}/")
+        data = response.json()
+        next_page = guest_client_logged.get(data["comments_next"]).json()
+
+        assert response.status_code == 200
+        assert len(data["comments"]) == 20
+        assert data["comments_count"] == 21
+        assert data["comments_next"].endswith(
+            f"{self.endpoint}{post.id}/comments/?limit=20&offset=20"
+        )
+        assert len(next_page["results"]) == 1
+        assert next_page["results"][0]["id"] not in [
+            comment["id"] for comment in data["comments"]
+        ]
+
+    def test_list_post_comments_paginated(self, guest_client_logged, post, guest_user):
+        comments = PostCommentFactory.create_batch(3, post=post, author=guest_user)
+
+        response = guest_client_logged.get(
+            f"{self.endpoint}{post.id}/comments/", {"limit": 2}
+        )
+        data = response.json()
+
+        assert response.status_code == 200
+        assert data["count"] == 3
+        assert data["next"] is not None
+        assert [item["id"] for item in data["results"]] == [
+            comments[2].id,
+            comments[1].id,
+        ]
+
+    def test_list_post_comments_runs_constant_queries(
+        self, guest_client_logged, guest_user, post, reaction_type
+    ):
+        path = f"{self.endpoint}{post.id}/comments/"
+
+        def get_queries_amount():
+            with CaptureQueriesContext(connection) as context:
+                guest_client_logged.get(path)
+
+            return len(context.captured_queries)
+
+        self._create_thread(post, guest_user, reaction_type, replies=1)
+        few_comments_queries = get_queries_amount()
+
+        for _ in range(5):
+            self._create_thread(post, guest_user, reaction_type, replies=3)
+
+        assert get_queries_amount() == few_comments_queries
+
+    def test_thread_max_depth(self, post, guest_user, reaction_type):
+        root = self._create_thread(post, guest_user, reaction_type)
+
+        (thread_root,) = CommentThread([root], max_depth=2).build()
+        answer = thread_root._thread_answers[0]
+
+        assert len(thread_root._thread_answers) == 2
+        assert answer._thread_answers == []
+        assert answer.comments_count == 1
+
+    def _comment_with_mentions(self, client, post, mentions):
+        data = {"content": "Hi", "post": post.id, "mentions": mentions}
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(f"{self.endpoint}comment/", data, format="json")
+
+        return response, len(context.captured_queries)
+
+    @patch.object(DummySender, "_send_personalized")
+    def test_comment_with_mentions(
+        self, mock_send_personalized, guest_client_logged, post, event
+    ):
+        ServiceEmailConfigFactory(
+            service=None,
+            event=event,
+            email_config_type="mention_notification",
+            email_html_template="Hi [FIRST_NAME]",
+        )
+        guests = [
+            UserFactory(
+                service=event.service,
+                event=event,
+                username=f"mentioned{index}",
+                email=f"mentioned{index}@email.com",
+                first_name=f"Guest {index}",
+            )
+            for index in range(20)
+        ]
+
+        response, one_mention_queries = self._comment_with_mentions(
+            guest_client_logged, post, [guests[0].id]
+        )
+        _, many_mentions_queries = self._comment_with_mentions(
+            guest_client_logged, post, [guest.id for guest in guests]
+        )
+
+        assert response.status_code == 200
+        assert [user["id"] for user in response.json()["mentions"]] == [guests[0].id]
+        assert many_mentions_queries == one_mention_queries
+        assert mock_send_personalized.call_count == 2
+
+    def test_comment_with_mentions_personalizes_the_email(
+        self, guest_client_logged, post, event
+    ):
+        ServiceEmailConfigFactory(
+            service=None,
+            event=event,
+            email_config_type="mention_notification",
+            email_html_template="Hi [FIRST_NAME]",
+        )
+        guests = [
+            UserFactory(
+                service=event.service,
+                event=event,
+                username=f"mentioned{index}",
+                email=f"mentioned{index}@email.com",
+                first_name=f"Guest {index}",
+            )
+            for index in range(2)
+        ]
+
+        with patch.object(
+            DummySender, "_send_personalized", autospec=True
+        ) as mock_send_personalized:
+            self._comment_with_mentions(
+                guest_client_logged, post, [guest.id for guest in guests]
+            )
+
+        (sender,), _ = mock_send_personalized.call_args
+
+        assert sender.to_emails == ["mentioned0@email.com", "mentioned1@email.com"]
+        assert sender.personalizations["mentioned1@email.com"]["FIRST_NAME"] == (
+            "Guest 1"
+        )
+
+    def test_comment_with_unknown_mention(self, guest_client_logged, post):
+        response, _ = self._comment_with_mentions(guest_client_logged, post, [0])
+
+        assert response.status_code == 400
+        assert response.json() == {
+            "mentions": ['Invalid pk "0" - object does not exist.']
+        }
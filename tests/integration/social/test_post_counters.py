@@ -0,0 +1,88 @@
+import pytest
+from django.core.management import call_command
+
+from apps.social.models import PostModel, ReactionModel
+from tests.factories.reaction_type import ReactionTypeFactory
+from tests.factories.user import UserFactory
+
+
+@pytest.mark.django_db
+class TestPostCounters:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/post/"
+
+    def _get_post_counters(self, client, post):
+        response = client.get(self.endpoint)
+        data = next(
+            item for item in response.json()["results"] if item["id"] == post.id
+        )
+
+        return data["reactions"]["length"], data["comments"]["length"]
+
+    def test_reaction_counters(
+        self, guest_client_logged, post, reaction_type, guest_user
+    ):
+        path = f"{self.endpoint}react/"
+        payload = {"post": post.id, "reaction_type": reaction_type.id}
+
+        response = guest_client_logged.post(path, payload)
+        guest_client_logged.post(path, payload)
+
+        assert self._get_post_counters(guest_client_logged, post) == (1, 0)
+
+        reaction_id = response.json()["id"]
+        guest_client_logged.post(f"{self.endpoint}unreact/", {"reaction": reaction_id})
+
+        assert self._get_post_counters(guest_client_logged, post) == (0, 0)
+
+    def test_comment_counters(self, guest_client_logged, post):
+        path = f"{self.endpoint}comment/"
+
+        response = guest_client_logged.post(path, {"post": post.id, "content": "Hi"})
+        comment_id = response.json()["id"]
+        guest_client_logged.post(
+            path, {"post": post.id, "answer": comment_id, "content": "Hello"}
+        )
+
+        assert self._get_post_counters(guest_client_logged, post) == (0, 2)
+
+        guest_client_logged.delete(f"{self.endpoint}comment/{comment_id}/")
+        guest_client_logged.delete(f"{self.endpoint}comment/{comment_id}/")
+
+        assert self._get_post_counters(guest_client_logged, post) == (0, 1)
+
+    def test_rebuild_social_counters(self, post, post_comment, reaction_type):
+        post.react(post_comment.author, reaction_type.id)
+        PostModel.objects.filter(pk=post.pk).update(
+            reactions_count=10, comments_count=10, reactions_by_type={"love": 10}
+        )
+
+        call_command("rebuild_social_counters")
+        post.refresh_from_db()
+
+        assert post.reactions_count == 1
+        assert post.comments_count == 1
+        assert post.reactions_by_type == {"like": 1}
+
+    def test_reactions_by_type(
+        self, guest_client_logged, guest_user, post, reaction_type
+    ):
+        love = ReactionTypeFactory(service=reaction_type.service, name="love")
+        other_user = UserFactory(service=guest_user.service)
+        post.react(other_user, love.id)
+        reaction = post.react(guest_user, love.id)
+        post.react(guest_user, reaction_type.id)
+
+        response = guest_client_logged.get(f"{self.endpoint}{post.id}/")
+
+        assert response.json()["reactions"] == {
+            "length": 2,
+            "by_type": {"like": 1, "love": 1},
+        }
+        assert post.format_reactions_to_text() == "like: 1\nlove: 1\n"
+
+        ReactionModel.objects.get(pk=reaction.pk).delete()
+        post.refresh_from_db()
+
+        assert post.reactions_by_type == {"love": 1}
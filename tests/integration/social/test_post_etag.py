@@ -0,0 +1,128 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.factories.event import EventFactory
+from tests.factories.post import PostFactory
+from tests.factories.post_comment import PostCommentFactory
+
+
+@pytest.mark.django_db
+class TestPostETag:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/post/"
+
+    def test_list_posts_returns_etag(self, guest_client_logged, post):
+        response = guest_client_logged.get(self.endpoint)
+
+        assert response.status_code == 200
+        assert response["ETag"]
+
+    def test_list_posts_not_modified(self, guest_client_logged, post):
+        etag = guest_client_logged.get(self.endpoint)["ETag"]
+
+        with CaptureQueriesContext(connection) as context:
+            response = guest_client_logged.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        queried_tables = " ".join(query["sql"] for query in context.captured_queries)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert response.content == b""
+        assert "social_postmodel" not in queried_tables
+
+    def test_list_posts_modified_after_new_post(self, guest_client_logged, post):
+        etag = guest_client_logged.get(self.endpoint)["ETag"]
+        PostFactory(event=post.event, author=post.author)
+
+        response = guest_client_logged.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert len(response.json()["results"]) == 2
+
+    def test_list_posts_modified_after_author_change(self, guest_client_logged, post):
+        etag = guest_client_logged.get(self.endpoint)["ETag"]
+        post.author.first_name = "Renamed"
+        post.author.save()
+
+        response = guest_client_logged.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["author"]["first_name"] == "Renamed"
+
+    def test_retrieve_post_modified_after_author_change(
+        self, guest_client_logged, post
+    ):
+        path = f"{self.endpoint}{post.id}/"
+        etag = guest_client_logged.get(path)["ETag"]
+        post.author.first_name = "Renamed"
+        post.author.save(update_fields=["first_name"])
+
+        response = guest_client_logged.get(path, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.json()["author"]["first_name"] == "Renamed"
+
+    def test_list_posts_modified_after_reaction(
+        self, guest_client_logged, guest_user, post, reaction_type
+    ):
+        etag = guest_client_logged.get(self.endpoint)["ETag"]
+        post.react(guest_user, reaction_type.id)
+
+        response = guest_client_logged.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["my_reaction"] is not None
+
+    def test_list_posts_not_modified_after_post_in_other_event(
+        self, guest_client_logged, dummy_service, post
+    ):
+        etag = guest_client_logged.get(self.endpoint)["ETag"]
+        PostFactory(event=EventFactory(service=dummy_service), author=post.author)
+
+        response = guest_client_logged.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_retrieve_post_modified_after_nested_answer(
+        self, guest_client_logged, guest_user, post
+    ):
+        comment = PostCommentFactory(post=post, author=guest_user)
+        answer = PostCommentFactory(post=None, answer=comment, author=guest_user)
+        path = f"{self.endpoint}{post.id}/"
+        etag = guest_client_logged.get(path)["ETag"]
+        PostCommentFactory(post=None, answer=answer, author=guest_user)
+
+        response = guest_client_logged.get(path, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+
+    def test_retrieve_post_modified_after_comment(
+        self, guest_client_logged, guest_user, post
+    ):
+        path = f"{self.endpoint}{post.id}/"
+        etag = guest_client_logged.get(path)["ETag"]
+        PostCommentFactory(post=post, author=guest_user)
+
+        response = guest_client_logged.get(path, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_retrieve_post_not_modified(self, guest_client_logged, post):
+        path = f"{self.endpoint}{post.id}/"
+        etag = guest_client_logged.get(path)["ETag"]
+
+        response = guest_client_logged.get(path, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_unauthenticated_request_is_not_short_circuited(
+        self, api_client, guest_client_logged, post
+    ):
+        etag = guest_client_logged.get(self.endpoint)["ETag"]
+
+        response = api_client.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 401
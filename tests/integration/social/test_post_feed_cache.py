@@ -0,0 +1,79 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from tests.factories.post import PostFactory
+from tests.factories.post_comment import PostCommentFactory
+from tests.factories.token import TokenFactory
+from tests.factories.user import UserFactory
+
+
+@pytest.mark.django_db
+class TestPostFeedCache:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/post/"
+
+    def get_feed(self, client):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(self.endpoint)
+
+        return response.json(), len(context.captured_queries)
+
+    @staticmethod
+    def get_post(feed, post):
+        return next(item for item in feed["results"] if item["id"] == post.id)
+
+    def test_second_request_uses_the_cache(self, guest_client_logged, post):
+        first_feed, first_queries = self.get_feed(guest_client_logged)
+        second_feed, second_queries = self.get_feed(guest_client_logged)
+
+        assert second_feed == first_feed
+        assert second_queries < first_queries
+
+    def test_new_post_invalidates_the_cache(self, guest_client_logged, post):
+        self.get_feed(guest_client_logged)
+        new_post = PostFactory(event=post.event, author=post.author)
+
+        feed, _ = self.get_feed(guest_client_logged)
+
+        assert feed["results"][0]["id"] == new_post.id
+
+    def test_reaction_invalidates_the_cache(
+        self, guest_client_logged, guest_user, post, reaction_type
+    ):
+        self.get_feed(guest_client_logged)
+        post.react(guest_user, reaction_type.id)
+
+        feed, _ = self.get_feed(guest_client_logged)
+
+        assert self.get_post(feed, post)["reactions"] == {
+            "length": 1,
+            "by_type": {"like": 1},
+        }
+
+    def test_comment_invalidates_the_cache(self, guest_client_logged, guest_user, post):
+        self.get_feed(guest_client_logged)
+        PostCommentFactory(post=post, author=guest_user)
+
+        feed, _ = self.get_feed(guest_client_logged)
+
+        assert self.get_post(feed, post)["comments"] == {"length": 1}
+
+    def test_my_reaction_is_not_shared_between_users(
+        self, guest_client_logged, guest_user, post, reaction_type
+    ):
+        other_user = UserFactory(
+            service=guest_user.service, event=guest_user.event, username="other"
+        )
+        TokenFactory(user=other_user)
+        other_client = APIClient()
+        other_client.credentials(HTTP_AUTHORIZATION=f"Bearer {other_user.auth_token}")
+        post.react(guest_user, reaction_type.id)
+
+        guest_feed, _ = self.get_feed(guest_client_logged)
+        other_feed, _ = self.get_feed(other_client)
+
+        assert self.get_post(guest_feed, post)["my_reaction"] is not None
+        assert self.get_post(other_feed, post)["my_reaction"] is None
@@ -0,0 +1,109 @@
+from unittest.mock import patch
+
+import pytest
+
+from apps.social.models import PostNotificationJobModel
+from pipelines.mail_sender.dummy_sender import DummySender
+from tests.factories.post import PostFactory
+from tests.factories.service_email_config import ServiceEmailConfigFactory
+from tests.factories.user import UserFactory
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPostNotification:
+    @pytest.fixture(autouse=True)
+    def setup(self, event, guest_user):
+        ServiceEmailConfigFactory(
+            service=None,
+            event=event,
+            email_config_type="new_post_notification",
+            email_html_template="Hi [FIRST_NAME]",
+        )
+        self.guests = [guest_user] + [
+            UserFactory(
+                service=event.service,
+                event=event,
+                username=f"guest{index}",
+                email=f"guest{index}@email.com",
+            )
+            for index in range(4)
+        ]
+        UserFactory(service=event.service, event=event, is_active=False)
+        self.post = PostFactory(event=event, author=guest_user)
+
+    @patch.object(PostNotificationJobModel, "chunk_size", 2)
+    @patch.object(DummySender, "_send_personalized", autospec=True)
+    def test_notify_new_post(self, mock_send_personalized):
+        job = self.post.notify_new_post()
+        job.refresh_from_db()
+        senders = [
+            call_args[0][0] for call_args in mock_send_personalized.call_args_list
+        ]
+
+        assert job.status == "done"
+        assert job.guests_count == 5
+        assert job.notified_count == 5
+        assert job.progress == 100
+        assert [len(sender.to_emails) for sender in senders] == [2, 2, 1]
+
+    @patch.object(PostNotificationJobModel, "chunk_size", 2)
+    @patch.object(DummySender, "_send_personalized", autospec=True)
+    def test_resume_after_failure(self, mock_send_personalized):
+        mock_send_personalized.side_effect = [None, Exception("SendGrid is down")]
+
+        with pytest.raises(Exception, match="SendGrid is down"):
+            self.post.notify_new_post()
+
+        job = self.post.notification_jobs.get()
+
+        assert job.status == "failed"
+        assert job.error == "SendGrid is down"
+        assert job.notified_count == 2
+        assert job.last_guest_id == self.guests[1].pk
+
+        mock_send_personalized.side_effect = None
+        mock_send_personalized.reset_mock()
+
+        assert self.post.notify_new_post() == job
+
+        job.refresh_from_db()
+        resent = [
+            email
+            for call_args in mock_send_personalized.call_args_list
+            for email in call_args[0][0].to_emails
+        ]
+
+        assert job.status == "done"
+        assert job.notified_count == 5
+        assert resent == [guest.email for guest in self.guests[2:]]
+
+    @patch.object(PostNotificationJobModel, "chunk_size", 2)
+    @patch.object(PostNotificationJobModel, "time_budget", 0)
+    @patch.object(DummySender, "_send_personalized")
+    def test_continues_after_the_time_budget(self, mock_send_personalized):
+        job = self.post.notify_new_post()
+        job.refresh_from_db()
+
+        assert job.status == "done"
+        assert job.notified_count == 5
+        assert mock_send_personalized.call_count == 3
+
+    def test_running_job_is_not_claimed_twice(self):
+        job = PostNotificationJobModel.objects.create(post=self.post, status="running")
+
+        assert job.claim() is False
+
+    @patch.object(PostNotificationJobModel, "stale_after", 0)
+    def test_stale_running_job_is_claimed(self):
+        job = PostNotificationJobModel.objects.create(post=self.post, status="running")
+
+        assert job.claim() is True
+
+    def test_event_without_email_config(self, event):
+        event.email_configs.all().delete()
+
+        job = self.post.notify_new_post()
+        job.refresh_from_db()
+
+        assert job.status == "failed"
+        assert job.error == "The event has no new_post_notification email config."
@@ -0,0 +1,140 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from rest_framework.authtoken.models import Token
+
+from apps.social.broker import InMemoryBroker
+from apps.social.stream import PostStreamApplication
+from tests.factories.post import PostFactory
+from tests.factories.post_comment import PostCommentFactory
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPostStream:
+    @staticmethod
+    def get_events(sent):
+        events = []
+
+        for message in sent[1:]:
+            body = message.get("body", b"").decode()
+
+            if body.startswith("event: "):
+                event_line, data_line = body.strip().split("\n")
+                events.append((event_line[7:], json.loads(data_line[6:])))
+
+        return events
+
+    def stream_while(self, user, action):
+        broker = InMemoryBroker()
+        application = PostStreamApplication(broker)
+        token, _ = Token.objects.get_or_create(user=user)
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": PostStreamApplication.path,
+            "headers": [(b"authorization", f"Bearer {token.key}".encode())],
+        }
+        sent = []
+        done = asyncio.Event()
+
+        async def receive():
+            await done.wait()
+
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        async def act():
+            while not broker.subscribers:
+                await asyncio.sleep(0.01)
+
+            await sync_to_async(action)()
+            await asyncio.sleep(0.1)
+            done.set()
+
+        async def run():
+            await asyncio.gather(application(scope, receive, send), act())
+
+        with patch("apps.social.stream.get_broker", return_value=broker):
+            async_to_sync(run)()
+
+        return sent
+
+    def test_stream_new_post_and_comment(self, guest_user, event):
+        created = {}
+
+        def action():
+            created["post"] = PostFactory(event=event, author=guest_user)
+            created["comment"] = PostCommentFactory(
+                post=created["post"], author=guest_user
+            )
+
+        sent = self.stream_while(guest_user, action)
+        events = self.get_events(sent)
+        post, comment = created["post"], created["comment"]
+
+        assert sent[0]["status"] == 200
+        assert events[0] == (
+            "post.created",
+            {
+                "id": post.id,
+                "author": guest_user.id,
+                "description": post.description,
+                "attachment_type": None,
+                "date_joined": post.date_joined.isoformat(),
+            },
+        )
+        assert ("comment.created", {"id": comment.id}) in [
+            (name, {"id": data["id"]}) for name, data in events
+        ]
+        assert events[-1][0] == "post.counters"
+        assert events[-1][1]["id"] == post.id
+        assert events[-1][1]["comments_count"] == 1
+
+    def test_stream_reaction_counters(self, guest_user, post, reaction_type):
+        sent = self.stream_while(
+            guest_user, lambda: post.react(guest_user, reaction_type.id)
+        )
+
+        assert self.get_events(sent) == [
+            (
+                "post.counters",
+                {
+                    "id": post.id,
+                    "reactions_count": 1,
+                    "reactions_by_type": {reaction_type.name: 1},
+                    "comments_count": 0,
+                },
+            )
+        ]
+
+    def test_stream_ignores_other_events(self, guest_user, dummy_service):
+        sent = self.stream_while(
+            guest_user, lambda: PostFactory(event__service=dummy_service)
+        )
+
+        assert self.get_events(sent) == []
+
+    def test_stream_without_token(self):
+        sent = []
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": PostStreamApplication.path,
+            "headers": [(b"authorization", b"Bearer invalid")],
+        }
+
+        async_to_sync(PostStreamApplication(InMemoryBroker()))(scope, receive, send)
+
+        assert sent[0]["status"] == 401
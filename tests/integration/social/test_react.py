@@ -0,0 +1,156 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection
+
+from apps.social.models import PostModel, ReactionModel
+from tests.factories.post import PostFactory
+from tests.factories.reaction_type import ReactionTypeFactory
+from tests.factories.user import UserFactory
+
+
+@pytest.mark.django_db
+class TestReact:
+    @classmethod
+    def setup_class(cls):
+        cls.endpoint = "/api/v1/post/react/"
+
+    def test_react_twice_keeps_a_single_reaction(
+        self, guest_client_logged, post, reaction_type
+    ):
+        love = ReactionTypeFactory(service=reaction_type.service, name="love")
+        payload = {"post": post.id, "reaction_type": reaction_type.id}
+
+        first = guest_client_logged.post(self.endpoint, payload).json()
+        second = guest_client_logged.post(
+            self.endpoint, {**payload, "reaction_type": love.id}
+        ).json()
+        post.refresh_from_db()
+
+        assert first["id"] == second["id"]
+        assert second["reaction_type"]["name"] == "love"
+        assert post.reactions_count == 1
+        assert list(post.reactions.values_list("id", flat=True)) == [first["id"]]
+
+    def test_react_to_comment(self, guest_user, post_comment, reaction_type):
+        reaction = post_comment.react(guest_user, reaction_type.id)
+        post_comment.react(guest_user, reaction_type.id)
+        post_comment.refresh_from_db()
+
+        assert reaction.comment_id == post_comment.id
+        assert post_comment.reactions_count == 1
+        assert post_comment.reactions.get() == reaction
+
+    def test_unique_reaction_per_post(self, guest_user, post, reaction_type):
+        post.react(guest_user, reaction_type.id)
+
+        with pytest.raises(IntegrityError):
+            ReactionModel.objects.create(
+                user=guest_user, post=post, reaction_type=reaction_type
+            )
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBenchmarkReactions:
+    def test_benchmark_reactions(self, capsys, post, reaction_type):
+        UserFactory.create_batch(3, service=post.service)
+
+        call_command(
+            "benchmark_reactions", post.id, "--workers=4", "--reactions-per-worker=5"
+        )
+        post.refresh_from_db()
+
+        assert "The reactions of the post are consistent" in capsys.readouterr().out
+        assert post.reactions_count == 4
+        assert post.reactions.count() == 4
+
+    def test_benchmark_reactions_without_enough_users(self, post, reaction_type):
+        with pytest.raises(CommandError):
+            call_command("benchmark_reactions", post.id, "--workers=10")
+
+    def test_benchmark_reactions_post_not_found(self):
+        with pytest.raises(CommandError):
+            call_command("benchmark_reactions", 0)
+
+    def test_benchmark_reactions_without_reaction_types(self, post):
+        with pytest.raises(CommandError):
+            call_command("benchmark_reactions", post.id, "--workers=1")
+
+
+def run_concurrently(*functions):
+    """
+    Runs each function in its own thread (and database connection), all of
+    them released at the same time.
+    """
+    barrier = threading.Barrier(len(functions))
+
+    def run(function):
+        try:
+            barrier.wait()
+            return function()
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=len(functions)) as executor:
+        futures = [executor.submit(run, function) for function in functions]
+
+        return [future.result() for future in futures]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentReactions:
+    rounds = 10
+
+    def assert_consistent(self, post):
+        post = PostModel.objects.get(pk=post.pk)
+        reactions = ReactionModel.objects.filter(post=post).select_related(
+            "reaction_type"
+        )
+        by_type = {}
+
+        for reaction in reactions:
+            name = reaction.reaction_type.name
+            by_type[name] = by_type.get(name, 0) + 1
+
+        assert post.reactions_count == len(reactions) == post.reactions.count()
+        assert post.reactions_by_type == by_type
+
+    def test_concurrent_first_reactions(self, event, guest_user, reaction_type):
+        love = ReactionTypeFactory(service=reaction_type.service, name="love")
+
+        for reaction_type_ids in [
+            (reaction_type.id,) * 2,
+            (reaction_type.id, love.id),
+        ] * (self.rounds // 2):
+            post = PostFactory(event=event, author=guest_user)
+
+            run_concurrently(
+                *[
+                    lambda reaction_type_id=reaction_type_id: post.react(
+                        guest_user, reaction_type_id
+                    )
+                    for reaction_type_id in reaction_type_ids
+                ]
+            )
+
+            self.assert_consistent(post)
+
+    def test_concurrent_unreacts(self, event, guest_user, reaction_type):
+        other_user = UserFactory(service=guest_user.service)
+
+        for _ in range(self.rounds):
+            post = PostFactory(event=event, author=guest_user)
+            post.react(other_user, reaction_type.id)
+            post.react(guest_user, reaction_type.id)
+            reactions = [
+                ReactionModel.objects.get(post=post, user=guest_user),
+                ReactionModel.objects.get(post=post, user=guest_user),
+            ]
+
+            run_concurrently(*[reaction.delete for reaction in reactions])
+
+            self.assert_consistent(post)
+            assert not ReactionModel.objects.filter(post=post, user=guest_user).exists()
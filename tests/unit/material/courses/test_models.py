@@ -1,5 +1,6 @@
 from unittest.mock import Mock, patch
 
+import pytest
 from django.db import models
 
 from apps.material.models import (
@@ -13,6 +14,7 @@ from apps.service.models import ServiceModel
 from apps.user.models import UserModel
 from apps.visual_structure.models import ColorModel, ColorPaletteModel
 from utils.abstract_models.base_model import BaseModel
+from utils.mixins.counter import CounterMixin
 
 
 class TestCourseCategoryModel:
@@ -186,6 +188,7 @@ class TestLessonModel:
 
     def test_parent_class(self):
         assert issubclass(self.model, BaseModel)
+        assert issubclass(self.model, CounterMixin)
 
     def test_meta_verbose_name(self):
         assert self.model._meta.verbose_name == "Lesson"
@@ -305,18 +308,19 @@ class TestLessonModel:
         assert field.null is True
         assert field.blank is True
 
-    @patch("apps.material.models.LessonModel.likes")
-    def test_likes_amount(self, mock_likes):
-        lesson = LessonModel(id=1)
-        result = lesson.likes_amount
+    def test_likes_amount(self):
+        assert LessonModel(likes_count=3).likes_amount == 3
 
-        mock_likes.only.assert_called_once_with("id")
-        mock_likes.only.return_value.count.assert_called_once()
+    @pytest.mark.parametrize("field_name", ["likes_count", "comments_count"])
+    def test_counter_fields(self, field_name):
+        field = self.model._meta.get_field(field_name)
 
-        assert result == mock_likes.only.return_value.count.return_value
+        assert type(field) == models.PositiveIntegerField
+        assert field.default == 0
+        assert field.editable is False
 
     def test_length_fields(self):
-        assert len(self.model._meta.fields) == 16
+        assert len(self.model._meta.fields) == 18
 
 
 class TestCommentModel:
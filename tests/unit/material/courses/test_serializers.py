@@ -11,6 +11,8 @@ from apps.material.serializers import (
     CommentSerializer,
     CourseCategorySerializer,
     CourseSerializer,
+    CourseSummarySerializer,
+    LessonLikeSerializer,
     LessonSerializer,
 )
 from apps.user.models import UserModel
@@ -75,7 +77,8 @@ class TestLessonSerializer:
             "title",
             "description",
             "thumbnail",
-            "likes",
+            "likes_count",
+            "is_liked",
             "order",
             "lesson_type",
             "text",
@@ -84,9 +87,23 @@ class TestLessonSerializer:
             "video_transcript",
             "audio",
             "audio_transcript",
-            "comments",
+            "comments_count",
         ]
 
+    def test_get_is_liked(self):
+        serializer = self.serializer(context={"liked_lesson_ids": {1}})
+
+        assert serializer.get_is_liked(LessonModel(id=1)) is True
+        assert serializer.get_is_liked(LessonModel(id=2)) is False
+        assert self.serializer().get_is_liked(LessonModel(id=1)) is False
+
+
+class TestLessonLikeSerializer:
+    def test_data(self):
+        data = {"liked": True, "likes_count": 3}
+
+        assert LessonLikeSerializer(data).data == data
+
 
 class TestCourseCategorySerializer:
     @classmethod
@@ -138,3 +155,50 @@ class TestCourseSerializer:
 
     def test_depth(self):
         assert self.serializer.Meta.depth == 2
+
+
+class TestCourseSummarySerializer:
+    @classmethod
+    def setup_class(cls):
+        cls.serializer = CourseSummarySerializer
+
+    def test_subclass_serializer(self):
+        assert issubclass(CourseSummarySerializer, serializers.ModelSerializer)
+
+    def test_model(self):
+        assert self.serializer.Meta.model == CourseModel
+
+    def test_fields(self):
+        assert self.serializer.Meta.fields == [
+            "id",
+            "is_active",
+            "title",
+            "description",
+            "image",
+            "trailer",
+            "is_paid",
+            "slug",
+            "categories",
+            "color_palette",
+            "course_mode",
+            "lessons_count",
+            "duration",
+            "likes_count",
+            "is_locked",
+        ]
+
+    def test_summary_fields_read_only(self):
+        fields = self.serializer().fields
+
+        assert fields["lessons_count"].read_only
+        assert fields["duration"].read_only
+        assert fields["likes_count"].read_only
+        assert fields["is_locked"].read_only
+
+    def test_get_is_locked(self):
+        serializer = self.serializer(context={"entitled_course_ids": {1}})
+
+        assert serializer.get_is_locked(CourseModel(id=1, is_paid=True)) is False
+        assert serializer.get_is_locked(CourseModel(id=2, is_paid=True)) is True
+        assert serializer.get_is_locked(CourseModel(id=2, is_paid=False)) is False
+        assert self.serializer().get_is_locked(CourseModel(id=1, is_paid=True)) is True
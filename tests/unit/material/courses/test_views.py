@@ -1,13 +1,22 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
-from apps.material.serializers import CourseSerializer
+from apps.material.serializers import (
+    AuthorSerializer,
+    CommentSerializer,
+    CourseProgressSerializer,
+    CourseSerializer,
+    CourseSummarySerializer,
+    LessonLikeSerializer,
+)
 from apps.material.views import CourseViewSet
 from utils.auth import BearerTokenAuthentication
 from utils.exceptions.http import HttpPaymentRequired
+from utils.mixins.multiserializer import MultiSerializerMixin
 from utils.mixins.service_context import ReadWithServiceContextMixin
 
 
@@ -18,6 +27,7 @@ class TestCourseViewSet:
 
     def test_parent_class(self):
         assert issubclass(CourseViewSet, ReadWithServiceContextMixin)
+        assert issubclass(CourseViewSet, MultiSerializerMixin)
         assert issubclass(CourseViewSet, ReadOnlyModelViewSet)
 
     def test_authentication_classes(self):
@@ -26,18 +36,179 @@ class TestCourseViewSet:
     def test_permission_classes(self):
         assert self.view.permission_classes == [IsAuthenticated]
 
-    def test_serializer_class(self):
-        assert self.view.serializer_class == CourseSerializer
+    def test_serializers(self):
+        assert self.view.serializers == {
+            "list": CourseSummarySerializer,
+            "retrieve": CourseSerializer,
+            "lesson_comments": CommentSerializer,
+            "lesson_likes": AuthorSerializer,
+            "toggle_lesson_like": LessonLikeSerializer,
+            "progress": CourseProgressSerializer,
+            "complete_lesson": CourseProgressSerializer,
+        }
+
+    @patch("apps.material.views.courses.get_course_summary_annotations")
+    @patch("apps.material.views.courses.super")
+    def test_get_queryset_list(self, mock_super, mock_get_annotations):
+        mock_get_annotations.return_value = {"lessons_count": Mock()}
+        view = CourseViewSet(action="list")
+
+        result = view.get_queryset()
+
+        queryset = mock_super.return_value.get_queryset.return_value
+        queryset.annotate.assert_called_once_with(**mock_get_annotations.return_value)
+        queryset.prefetch_related.assert_not_called()
+        assert result == queryset.annotate.return_value
+
+    @patch("apps.material.views.courses.super")
+    def test_get_queryset_retrieve(self, mock_super):
+        view = CourseViewSet(action="retrieve")
+
+        result = view.get_queryset()
+
+        queryset = mock_super.return_value.get_queryset.return_value
+        queryset.annotate.assert_not_called()
+        queryset.prefetch_related.assert_called_once_with("lessons")
+        assert result == queryset.prefetch_related.return_value
+
+    @patch("apps.material.views.courses.super")
+    def test_get_queryset_lesson_action(self, mock_super):
+        view = CourseViewSet(action="lesson_likes")
+
+        result = view.get_queryset()
+
+        assert result == mock_super.return_value.get_queryset.return_value
 
     def test_lookup_field(self):
         assert self.view.lookup_field == "slug"
 
-    @patch("apps.material.views.courses.super")
-    def test_retrieve(self, mock_super):
-        result = self.view.retrieve({}, [], {})
+    def test_retrieve(self):
+        request = Mock()
+        view = CourseViewSet(request=request, format_kwarg=None, action="retrieve")
+        view.get_object = Mock()
+        view.get_serializer = Mock()
+
+        with patch(
+            "apps.material.views.courses.LessonModel.get_liked_ids"
+        ) as mock_get_liked_ids, patch(
+            "apps.material.views.courses.Response"
+        ) as mock_response:
+            result = view.retrieve(request)
+
+        course = view.get_object.return_value
+        mock_get_liked_ids.assert_called_once_with(
+            course.lessons.all.return_value, request.user
+        )
+        context = view.get_serializer.call_args.kwargs["context"]
+        assert context["liked_lesson_ids"] == mock_get_liked_ids.return_value
+        assert context["request"] == request
+        mock_response.assert_called_once_with(view.get_serializer.return_value.data)
+        assert result == mock_response.return_value
 
-        mock_super.return_value.retrieve.asset_called_once_with({}, [], {})
-        assert result == mock_super.return_value.retrieve.return_value
+    def test_get_serializer_context_list(self):
+        request = Mock()
+        view = CourseViewSet(request=request, format_kwarg=None, action="list")
+
+        context = view.get_serializer_context()
+
+        request.user.get_course_ids.assert_called_once_with()
+        assert (
+            context["entitled_course_ids"] == request.user.get_course_ids.return_value
+        )
+
+    def test_get_serializer_context_retrieve(self):
+        request = Mock()
+        view = CourseViewSet(request=request, format_kwarg=None, action="retrieve")
+
+        context = view.get_serializer_context()
+
+        request.user.get_course_ids.assert_not_called()
+        assert "entitled_course_ids" not in context
+
+    @patch("apps.material.views.courses.get_object_or_404")
+    def test_get_lesson(self, mock_get_object_or_404):
+        view = CourseViewSet()
+        view.get_object = Mock()
+
+        result = view.get_lesson("1")
+
+        mock_get_object_or_404.assert_called_once_with(
+            view.get_object.return_value.lessons.all.return_value, pk="1"
+        )
+        assert result == mock_get_object_or_404.return_value
+
+    @patch("apps.material.views.courses.Response")
+    @patch("apps.material.views.courses.CourseProgressModel")
+    def test_progress(self, mock_progress_model, mock_response):
+        request = Mock()
+        view = CourseViewSet()
+        view.get_serializer = Mock()
+
+        result = view.progress(request)
+
+        mock_progress_model.get_for_user.assert_called_once_with(request.user)
+        view.get_serializer.assert_called_once_with(
+            mock_progress_model.get_for_user.return_value, many=True
+        )
+        mock_response.assert_called_once_with(view.get_serializer.return_value.data)
+        assert result == mock_response.return_value
+
+    @patch("apps.material.views.courses.Response")
+    @patch("apps.material.views.courses.CourseProgressModel")
+    def test_complete_lesson(self, mock_progress_model, mock_response):
+        request = Mock()
+        view = CourseViewSet()
+        view.get_lesson = Mock()
+        view.get_serializer = Mock()
+        locked_progress = Mock()
+        progress = Mock()
+        mock_progress_model.get_course_progress.side_effect = [
+            locked_progress,
+            progress,
+        ]
+
+        result = view.complete_lesson(request, "1")
+
+        lesson = view.get_lesson.return_value
+        locked_progress.is_unlocked.assert_called_once_with(lesson)
+        mock_progress_model.complete_lesson.assert_called_once_with(
+            request.user, lesson
+        )
+        view.get_serializer.assert_called_once_with(progress)
+        assert result == mock_response.return_value
+
+    @patch("apps.material.views.courses.CourseProgressModel")
+    def test_complete_locked_lesson(self, mock_progress_model):
+        view = CourseViewSet()
+        view.get_lesson = Mock()
+        progress = mock_progress_model.get_course_progress.return_value
+        progress.is_unlocked.return_value = False
+
+        with pytest.raises(PermissionDenied):
+            view.complete_lesson(Mock(), "1")
+
+        mock_progress_model.complete_lesson.assert_not_called()
+
+    @patch("apps.material.views.courses.Response")
+    def test_toggle_lesson_like(self, mock_response):
+        request = Mock()
+        view = CourseViewSet()
+        view.get_lesson = Mock()
+        view.get_serializer = Mock()
+
+        result = view.toggle_lesson_like(request, "1")
+
+        lesson = view.get_lesson.return_value
+        view.get_lesson.assert_called_once_with("1")
+        lesson.toggle_like.assert_called_once_with(request.user)
+        view.get_serializer.assert_called_once_with(
+            {
+                "liked": lesson.toggle_like.return_value,
+                "likes_count": lesson.likes_count,
+            }
+        )
+        mock_response.assert_called_once_with(view.get_serializer.return_value.data)
+        assert result == mock_response.return_value
 
     @patch("apps.material.views.courses.super")
     def test_list(self, mock_super):
@@ -0,0 +1,73 @@
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from apps.material.live_cache import LiveCalendarCache
+
+NOW = datetime(2026, 10, 17, 21, 0, tzinfo=timezone.utc)
+
+
+class TestLiveCalendarCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.calendar_cache = LiveCalendarCache(
+            1, date(2026, 10, 17), date(2026, 11, 16)
+        )
+
+    def test_get_version_key(self):
+        assert LiveCalendarCache.get_version_key(1) == "material:lives:1:version"
+
+    @patch("apps.material.live_cache.get_version")
+    def test_get_version(self, mock_get_version):
+        result = self.calendar_cache.get_version()
+
+        mock_get_version.assert_called_once_with("material:lives:1:version")
+        assert result == mock_get_version.return_value
+
+    @patch.object(LiveCalendarCache, "get_version", return_value=3)
+    def test_key(self, mock_get_version):
+        assert self.calendar_cache.key == "material:lives:1:3:2026-10-17:2026-11-16"
+        assert self.calendar_cache.key == "material:lives:1:3:2026-10-17:2026-11-16"
+        mock_get_version.assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        "starts_at,timeout",
+        [
+            ([], 60 * 60),
+            ([NOW - timedelta(hours=1), NOW + timedelta(minutes=10)], 60 * 10),
+            ([NOW + timedelta(days=1)], 60 * 60),
+        ],
+    )
+    @patch("apps.material.live_cache.timezone.now", Mock(return_value=NOW))
+    def test_get_timeout(self, starts_at, timeout):
+        lives = [Mock(starts_at=value) for value in starts_at]
+
+        assert self.calendar_cache.get_timeout(lives) == timeout
+
+    @patch("apps.material.live_cache.timezone.now")
+    def test_get_timeout_at_the_end_of_the_day(self, mock_now):
+        mock_now.return_value = NOW.replace(hour=23, minute=59, second=30)
+
+        assert self.calendar_cache.get_timeout([]) == 30
+
+    @patch.object(LiveCalendarCache, "key", "key")
+    @patch("apps.material.live_cache.cache")
+    def test_get(self, mock_cache):
+        assert self.calendar_cache.get() == mock_cache.get.return_value
+        mock_cache.get.assert_called_once_with("key")
+
+    @patch.object(LiveCalendarCache, "get_timeout", return_value=60)
+    @patch.object(LiveCalendarCache, "key", "key")
+    @patch("apps.material.live_cache.cache")
+    def test_set(self, mock_cache, mock_get_timeout):
+        self.calendar_cache.set(["data"], ["lives"])
+
+        mock_get_timeout.assert_called_once_with(["lives"])
+        mock_cache.set.assert_called_once_with("key", ["data"], 60)
+
+    @patch("apps.material.live_cache.bump_version")
+    def test_invalidate(self, mock_bump_version):
+        LiveCalendarCache.invalidate(1)
+
+        mock_bump_version.assert_called_once_with("material:lives:1:version")
@@ -1,6 +1,9 @@
+from unittest.mock import Mock, patch
+
 from django.db import models
 
 from apps.material.models import LiveModel
+from apps.material.models.lives import invalidate_calendar_on_live_change
 from apps.material.models.utils.file import material_file_directory_path
 from apps.service.models import ServiceModel
 from utils.abstract_models.base_model import BaseModel
@@ -96,3 +99,18 @@ class TestLiveModel:
 
     def test_length_fields(self):
         assert len(self.model._meta.fields) == 13
+
+    def test_meta_indexes(self):
+        (index,) = self.model._meta.indexes
+
+        assert index.name == "live_calendar_idx"
+        assert index.fields == ["service", "is_active", "starts_at"]
+
+
+@patch("apps.material.models.lives.LiveCalendarCache")
+def test_invalidate_calendar_on_live_change(mock_calendar_cache):
+    instance = Mock(service_id=1)
+
+    invalidate_calendar_on_live_change(LiveModel, instance)
+
+    mock_calendar_cache.invalidate.assert_called_once_with(1)
@@ -1,7 +1,11 @@
+from datetime import date
+from unittest.mock import patch
+
+import pytest
 from rest_framework import serializers
 
 from apps.material.models import LiveModel
-from apps.material.serializers import LiveSerializer
+from apps.material.serializers import LiveCalendarQuerySerializer, LiveSerializer
 
 
 class TestLiveSerializer:
@@ -27,3 +31,46 @@ class TestLiveSerializer:
             "live_type",
             "image",
         ]
+
+
+@patch(
+    "apps.material.serializers.lives.timezone.localdate",
+    return_value=date(2026, 10, 17),
+)
+class TestLiveCalendarQuerySerializer:
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            ({}, {"from": date(2026, 10, 17), "to": date(2026, 11, 16)}),
+            (
+                {"from": "2026-12-01"},
+                {"from": date(2026, 12, 1), "to": date(2026, 12, 31)},
+            ),
+            (
+                {"from": "2026-10-01", "to": "2026-10-01"},
+                {"from": date(2026, 10, 1), "to": date(2026, 10, 1)},
+            ),
+            (
+                {"to": "2027-01-17"},
+                {"from": date(2026, 10, 17), "to": date(2027, 1, 17)},
+            ),
+        ],
+    )
+    def test_validated_data(self, _mock_localdate, data, expected):
+        serializer = LiveCalendarQuerySerializer(data=data)
+
+        assert serializer.is_valid() is True
+        assert serializer.validated_data == expected
+
+    @pytest.mark.parametrize(
+        "data,error",
+        [
+            ({"to": "2026-10-16"}, "The last day must not be before the first one."),
+            ({"to": "2027-01-18"}, "The calendar must not span more than 92 days."),
+        ],
+    )
+    def test_invalid_range(self, _mock_localdate, data, error):
+        serializer = LiveCalendarQuerySerializer(data=data)
+
+        assert serializer.is_valid() is False
+        assert serializer.errors == {"to": [error]}
@@ -1,5 +1,8 @@
-from unittest.mock import patch
+from datetime import date, datetime, timezone
+from unittest.mock import Mock, patch
 
+import pytest
+from rest_framework.exceptions import ValidationError
 from rest_framework.mixins import ListModelMixin
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.viewsets import GenericViewSet
@@ -29,9 +32,61 @@ class TestLiveViewSet:
     def test_serializer_class(self):
         assert self.view.serializer_class == LiveSerializer
 
-    @patch("apps.material.views.lives.super")
-    def test_list(self, mock_super):
-        result = self.view.list({}, [], {})
+    @patch("apps.material.views.lives.Response")
+    @patch("apps.material.views.lives.LiveCalendarCache")
+    def test_list_cached(self, mock_calendar_cache, mock_response):
+        request = Mock(query_params={"from": "2026-10-17", "to": "2026-10-20"})
+        view = LiveViewSet(request=request, format_kwarg=None)
+        view.get_calendar = Mock()
 
-        mock_super.return_value.list.asset_called_once_with({}, [], {})
-        assert result == mock_super.return_value.list.return_value
+        result = view.list(request)
+
+        mock_calendar_cache.assert_called_once_with(
+            request.user.service_id, date(2026, 10, 17), date(2026, 10, 20)
+        )
+        view.get_calendar.assert_not_called()
+        mock_response.assert_called_once_with(
+            mock_calendar_cache.return_value.get.return_value
+        )
+        assert result == mock_response.return_value
+
+    @patch("apps.material.views.lives.Response")
+    @patch("apps.material.views.lives.LiveCalendarCache")
+    def test_list_not_cached(self, mock_calendar_cache, mock_response):
+        request = Mock(query_params={"from": "2026-10-17", "to": "2026-10-20"})
+        view = LiveViewSet(request=request, format_kwarg=None)
+        view.get_calendar = Mock(return_value=["live"])
+        view.get_serializer = Mock()
+        calendar_cache = mock_calendar_cache.return_value
+        calendar_cache.get.return_value = None
+
+        view.list(request)
+
+        data = view.get_serializer.return_value.data
+        view.get_calendar.assert_called_once_with(
+            date(2026, 10, 17), date(2026, 10, 20)
+        )
+        view.get_serializer.assert_called_once_with(["live"], many=True)
+        calendar_cache.set.assert_called_once_with(data, ["live"])
+        mock_response.assert_called_once_with(data)
+
+    def test_list_invalid_range(self):
+        request = Mock(query_params={"from": "2026-10-17", "to": "2026-10-16"})
+
+        with pytest.raises(ValidationError):
+            LiveViewSet(request=request, format_kwarg=None).list(request)
+
+    def test_get_calendar(self):
+        view = LiveViewSet()
+        view.get_queryset = Mock()
+        view.filter_queryset = Mock()
+
+        result = view.get_calendar(date(2026, 10, 17), date(2026, 10, 20))
+
+        view.filter_queryset.assert_called_once_with(view.get_queryset.return_value)
+        queryset = view.filter_queryset.return_value
+        queryset.filter.assert_called_once_with(
+            starts_at__gte=datetime(2026, 10, 17, tzinfo=timezone.utc),
+            starts_at__lt=datetime(2026, 10, 21, tzinfo=timezone.utc),
+        )
+        assert result == queryset.filter.return_value
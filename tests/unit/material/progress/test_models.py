@@ -0,0 +1,157 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+from apps.material.models import CourseModel, CourseProgressModel, LessonModel
+from apps.user.models import UserModel
+from utils.abstract_models.base_model import BaseModel
+
+
+class TestCourseProgressModel:
+    @classmethod
+    def setup_class(cls):
+        cls.model = CourseProgressModel
+
+    def get_progress(self, lesson_ids, completed_lesson_ids, course_mode="open"):
+        progress = CourseProgressModel(
+            course=CourseModel(course_mode=course_mode),
+            completed_lesson_ids=completed_lesson_ids,
+        )
+        progress.lesson_ids = lesson_ids
+
+        return progress
+
+    def test_str(self):
+        progress = CourseProgressModel(
+            user=UserModel(first_name="Ana"), course=CourseModel(title="Python")
+        )
+
+        assert str(progress) == "Ana's progress in Python"
+
+    def test_parent_class(self):
+        assert issubclass(self.model, BaseModel)
+
+    def test_meta_verbose_name(self):
+        assert self.model._meta.verbose_name == "Course Progress"
+
+    def test_meta_verbose_name_plural(self):
+        assert self.model._meta.verbose_name_plural == "Courses Progress"
+
+    def test_meta_constraints(self):
+        (constraint,) = self.model._meta.constraints
+
+        assert constraint.name == "unique_user_course_progress"
+        assert constraint.fields == ("user", "course")
+
+    def test_user_field(self):
+        field = self.model._meta.get_field("user")
+
+        assert type(field) == models.ForeignKey
+        assert field.verbose_name == "User"
+        assert field.related_model == UserModel
+        assert field.remote_field.related_name == "courses_progress"
+        assert field.remote_field.on_delete.__name__ == "CASCADE"
+
+    def test_course_field(self):
+        field = self.model._meta.get_field("course")
+
+        assert type(field) == models.ForeignKey
+        assert field.verbose_name == "Course"
+        assert field.related_model == CourseModel
+        assert field.remote_field.related_name == "progress"
+        assert field.remote_field.on_delete.__name__ == "CASCADE"
+
+    def test_completed_lesson_ids_field(self):
+        field = self.model._meta.get_field("completed_lesson_ids")
+
+        assert type(field) == ArrayField
+        assert type(field.base_field) == models.PositiveBigIntegerField
+        assert field.verbose_name == "Completed Lessons"
+        assert field.default is list
+        assert field.editable is False
+
+    def test_length_fields(self):
+        assert len(self.model._meta.fields) == 7
+
+    @pytest.mark.parametrize(
+        "lesson_ids,completed_lesson_ids,completed,percent,next_lesson_id",
+        [
+            ([3, 1, 2], [], [], 0, 3),
+            ([3, 1, 2], [1, 3], [3, 1], 67, 2),
+            ([3, 1, 2], [2, 1, 3], [3, 1, 2], 100, None),
+            ([3, 1], [5, 3], [3], 50, 1),
+            (None, [5], [], 0, None),
+        ],
+    )
+    def test_progress(
+        self, lesson_ids, completed_lesson_ids, completed, percent, next_lesson_id
+    ):
+        progress = self.get_progress(lesson_ids, completed_lesson_ids)
+
+        assert progress.completed_lessons == completed
+        assert progress.completed_lessons_count == len(completed)
+        assert progress.lessons_count == len(lesson_ids or [])
+        assert progress.percent_complete == percent
+        assert progress.next_lesson_id == next_lesson_id
+
+    @pytest.mark.parametrize(
+        "course_mode,lesson_id,expected",
+        [
+            ("open", 2, True),
+            ("progressive", 3, True),
+            ("progressive", 1, True),
+            ("progressive", 2, False),
+        ],
+    )
+    def test_is_unlocked(self, course_mode, lesson_id, expected):
+        progress = self.get_progress([3, 1, 2], [3], course_mode)
+
+        assert progress.is_unlocked(LessonModel(id=lesson_id)) is expected
+
+    @patch.object(CourseProgressModel, "with_lesson_ids")
+    @patch.object(CourseProgressModel, "objects")
+    def test_get_for_user(self, mock_objects, mock_with_lesson_ids):
+        user = Mock(service_id=1)
+
+        result = CourseProgressModel.get_for_user(user, course=2)
+
+        mock_objects.select_related.assert_called_once_with("course")
+        mock_objects.select_related.return_value.filter.assert_called_once_with(
+            user=user, course__service_id=1, course__is_active=True, course=2
+        )
+        mock_with_lesson_ids.assert_called_once_with(
+            mock_objects.select_related.return_value.filter.return_value
+        )
+        order_by = mock_with_lesson_ids.return_value.order_by
+        order_by.assert_called_once_with("-date_modified")
+        assert result == order_by.return_value
+
+    @patch.object(CourseProgressModel, "get_for_user")
+    def test_get_course_progress(self, mock_get_for_user):
+        user = Mock()
+        course = Mock()
+
+        result = CourseProgressModel.get_course_progress(user, course)
+
+        mock_get_for_user.assert_called_once_with(user, course=course)
+        course.lessons.order_by.assert_not_called()
+        assert result == mock_get_for_user.return_value.first.return_value
+
+    @patch.object(CourseProgressModel, "get_for_user")
+    def test_get_course_progress_without_progress(self, mock_get_for_user):
+        mock_get_for_user.return_value.first.return_value = None
+        course = CourseModel(id=2)
+
+        with patch.object(CourseModel, "lessons") as mock_lessons:
+            mock_lessons.order_by.return_value.values_list.return_value = [3, 1]
+            result = CourseProgressModel.get_course_progress(UserModel(id=1), course)
+
+        mock_lessons.order_by.return_value.values_list.assert_called_once_with(
+            "pk", flat=True
+        )
+        assert result.pk is None
+        assert result.course == course
+        assert result.lesson_ids == [3, 1]
+        assert result.completed_lesson_ids == []
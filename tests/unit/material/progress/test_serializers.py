@@ -0,0 +1,41 @@
+from rest_framework import serializers
+
+from apps.material.models import CourseModel, CourseProgressModel
+from apps.material.serializers import CourseProgressSerializer
+
+
+class TestCourseProgressSerializer:
+    @classmethod
+    def setup_class(cls):
+        cls.serializer = CourseProgressSerializer
+
+    def test_subclass_serializer(self):
+        assert issubclass(CourseProgressSerializer, serializers.ModelSerializer)
+
+    def test_model(self):
+        assert self.serializer.Meta.model == CourseProgressModel
+
+    def test_fields(self):
+        assert self.serializer.Meta.fields == [
+            "course",
+            "completed_lessons",
+            "completed_lessons_count",
+            "lessons_count",
+            "percent_complete",
+            "next_lesson",
+        ]
+
+    def test_data(self):
+        progress = CourseProgressModel(
+            course=CourseModel(slug="python"), completed_lesson_ids=[1]
+        )
+        progress.lesson_ids = [1, 2]
+
+        assert self.serializer(progress).data == {
+            "course": "python",
+            "completed_lessons": [1],
+            "completed_lessons_count": 1,
+            "lessons_count": 2,
+            "percent_complete": 50,
+            "next_lesson": 2,
+        }
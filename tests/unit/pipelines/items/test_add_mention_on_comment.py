@@ -13,9 +13,9 @@ class TestAddMentionOnComment:
         assert issubclass(self.item, BasePipeItem)
 
     def test_run(self):
-        pipeline = Mock()
+        pipeline = Mock(users=[Mock(), Mock()])
         item = self.item(pipeline)
         item._run()
 
-        pipeline.comment.mentions.add.assert_called_once_with(pipeline.user)
-        pipeline.comment.save.assert_called_once_with()
+        pipeline.comment.mentions.add.assert_called_once_with(*pipeline.users)
+        pipeline.comment.save.assert_not_called()
@@ -0,0 +1,131 @@
+from unittest.mock import Mock, call, patch
+
+from pipelines.base import BasePipeItem
+from pipelines.items import CreateGuests
+
+
+class TestCreateGuests:
+    @classmethod
+    def setup_class(cls):
+        cls.item = CreateGuests
+
+    def test_parent_class(self):
+        assert issubclass(self.item, BasePipeItem)
+
+    @patch("pipelines.items.create_guests.UserModel.objects.filter")
+    def test_get_new_guests(self, mock_filter):
+        mock_filter.return_value.values_list.return_value = ["old@email.com"]
+        guests = [
+            {"email": "old@email.com"},
+            {"email": "new@email.com"},
+            {"email": "new@email.com"},
+        ]
+        pipeline = Mock(guests=guests, results=[])
+
+        new_guests = self.item(pipeline)._get_new_guests()
+
+        mock_filter.assert_called_once_with(
+            event=pipeline.event, email__in={"old@email.com", "new@email.com"}
+        )
+        assert new_guests == [{"email": "new@email.com"}]
+        assert pipeline.results == [
+            {"email": "old@email.com", "status": "exists"},
+            {"email": "new@email.com", "status": "exists"},
+        ]
+
+    @patch("pipelines.items.create_guests.randint")
+    @patch("pipelines.items.create_guests.UserModel.objects.filter")
+    def test_generate_usernames(self, mock_filter, mock_randint):
+        mock_randint.side_effect = [7, 7, 12, 345, 6]
+        mock_filter.return_value.values_list.side_effect = [["slug-0007"], []]
+        pipeline = Mock()
+        pipeline.service.slug = "slug"
+
+        usernames = self.item(pipeline)._generate_usernames(3)
+
+        assert mock_randint.call_args_list[0][0] == (0, 9999)
+        assert mock_randint.call_args_list[3][0] == (0, 99999)
+        assert sorted(usernames) == ["slug-00006", "slug-0012", "slug-00345"]
+
+    @patch("pipelines.items.create_guests.UserModel.objects.make_random_password")
+    def test_generate_passwords(self, mock_make_random_password):
+        passwords = self.item(Mock())._generate_passwords(2)
+
+        mock_make_random_password.assert_called_with(6, "0123456789")
+        assert passwords == [mock_make_random_password.return_value] * 2
+
+    @patch("pipelines.items.create_guests.make_password")
+    def test_hash_passwords(self, mock_make_password):
+        mock_make_password.side_effect = lambda password: f"hashed {password}"
+
+        assert self.item._hash_passwords(["1", "2"]) == ["hashed 1", "hashed 2"]
+
+    def test_truncate(self):
+        assert self.item._truncate("first_name", "a" * 40) == "a" * 30
+
+    @patch.object(CreateGuests, "_get_new_guests", return_value=[])
+    @patch.object(CreateGuests, "_generate_usernames")
+    def test_run_without_new_guests(self, mock_generate_usernames, _mock_new_guests):
+        pipeline = Mock(users=[])
+
+        self.item(pipeline)._run()
+
+        mock_generate_usernames.assert_not_called()
+        assert pipeline.users == []
+
+    @patch("pipelines.items.create_guests.transaction")
+    @patch("pipelines.items.create_guests.Token")
+    @patch("pipelines.items.create_guests.UserModel")
+    @patch.object(CreateGuests, "_hash_passwords", return_value=["hashed"])
+    @patch.object(CreateGuests, "_generate_passwords", return_value=["123456"])
+    @patch.object(CreateGuests, "_generate_usernames", return_value=["slug-0001"])
+    @patch.object(CreateGuests, "_get_new_guests")
+    def test_run(
+        self,
+        mock_get_new_guests,
+        _mock_generate_usernames,
+        _mock_generate_passwords,
+        mock_hash_passwords,
+        mock_user_model,
+        mock_token,
+        mock_transaction,
+    ):
+        mock_get_new_guests.return_value = [
+            {"first_name": "John", "last_name": "Doe", "email": "john@email.com"}
+        ]
+        mock_user_model._meta.get_field.return_value.max_length = 30
+        user = Mock(pk=1, email="john@email.com", username="slug-0001")
+        mock_user_model.objects.bulk_create.return_value = [user]
+        mock_token.objects.bulk_create.return_value = [Mock(key="key")]
+        pipeline = Mock(users_html_keys={}, results=[])
+
+        self.item(pipeline)._run()
+
+        mock_hash_passwords.assert_called_once_with(["123456"])
+        mock_transaction.atomic.assert_called_once_with()
+        mock_user_model.assert_called_once_with(
+            username="slug-0001",
+            first_name="John",
+            last_name="Doe",
+            search_name=mock_user_model.get_search_name.return_value,
+            search_last_name=mock_user_model.get_search_name.return_value,
+            email="john@email.com",
+            password="hashed",
+            service=pipeline.service,
+            event=pipeline.event,
+            is_verified=True,
+        )
+        assert mock_user_model.get_search_name.call_args_list == [
+            call("John", "Doe"),
+            call("Doe", field="search_last_name"),
+        ]
+        mock_token.assert_called_once_with(
+            user=user, key=mock_token.generate_key.return_value
+        )
+        assert pipeline.users == [user]
+        assert pipeline.users_html_keys == {
+            1: {"TOKEN": "key", "GUEST_PASSWORD": "123456"}
+        }
+        assert pipeline.results == [
+            {"email": "john@email.com", "status": "created", "username": "slug-0001"}
+        ]
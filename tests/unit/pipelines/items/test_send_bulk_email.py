@@ -0,0 +1,88 @@
+from unittest.mock import Mock, call, patch
+
+from pipelines.items import SendBulkEmail, SendEmail
+
+
+class TestSendBulkEmail:
+    @classmethod
+    def setup_class(cls):
+        cls.item = SendBulkEmail
+
+    def test_parent_class(self):
+        assert issubclass(self.item, SendEmail)
+
+    def test_get_email_context(self):
+        guest = Mock(is_guest=True)
+        user = Mock(is_guest=False)
+
+        assert self.item._get_email_context(guest) == ("event", guest.event_id)
+        assert self.item._get_email_context(user) == ("service", user.service_id)
+
+    def test_group_users_by_context(self):
+        guests = [Mock(is_guest=True, event_id=1) for _ in range(2)]
+        user = Mock(is_guest=False, service_id=1)
+        without_email = Mock(is_guest=False, service_id=1, email="")
+        pipe_item = self.item(Mock(users=[guests[0], user, guests[1], without_email]))
+
+        groups = list(pipe_item._group_users_by_context())
+
+        assert groups == [guests, [user]]
+
+    @patch.object(SendEmail, "_get_user_html_keys")
+    def test_get_user_html_keys(self, mock_get_user_html_keys):
+        mock_get_user_html_keys.return_value = {"FIRST_NAME": "John", "TOKEN": ""}
+        pipeline = Mock(users_html_keys={1: {"TOKEN": "key"}})
+
+        html_keys = self.item(pipeline)._get_user_html_keys(Mock(pk=1))
+
+        assert html_keys == {"FIRST_NAME": "John", "TOKEN": "key"}
+
+    @patch.object(SendEmail, "_get_user_html_keys", return_value={"TOKEN": ""})
+    def test_get_user_html_keys_without_users_html_keys(self, _mock):
+        pipeline = Mock(spec=["users"])
+
+        assert self.item(pipeline)._get_user_html_keys(Mock(pk=1)) == {"TOKEN": ""}
+
+    @patch.object(SendBulkEmail, "_get_email_config")
+    @patch.object(SendBulkEmail, "_get_email_from")
+    @patch.object(SendBulkEmail, "_get_user_html_keys")
+    def test_run(
+        self, mock_get_user_html_keys, mock_get_email_from, mock_get_email_config
+    ):
+        users = [
+            Mock(is_guest=True, event_id=1, email="a@email.com"),
+            Mock(is_guest=True, event_id=1, email="b@email.com"),
+        ]
+        mock_get_user_html_keys.side_effect = lambda user: {"EMAIL": user.email}
+        pipe_item = self.item(Mock(users=users, send_mail=True))
+
+        pipe_item._run()
+
+        mock_get_email_config.assert_called_once_with(users[0])
+        mock_get_email_from.assert_called_once_with(users[0])
+        mock_get_user_html_keys.assert_has_calls([call(users[0]), call(users[1])])
+        mock_email_config = mock_get_email_config.return_value
+        mock_email_config.send_personalized_email.assert_called_once_with(
+            from_email=mock_get_email_from.return_value,
+            personalizations={
+                "a@email.com": {"EMAIL": "a@email.com"},
+                "b@email.com": {"EMAIL": "b@email.com"},
+            },
+        )
+
+    @patch.object(SendBulkEmail, "_get_email_config", return_value=None)
+    @patch.object(SendBulkEmail, "_get_email_from")
+    def test_run_without_email_config(self, mock_get_email_from, _mock_config):
+        pipe_item = self.item(Mock(users=[Mock(is_guest=False)], send_mail=True))
+
+        pipe_item._run()
+
+        mock_get_email_from.assert_not_called()
+
+    @patch.object(SendBulkEmail, "_get_email_config")
+    def test_run_without_send_mail(self, mock_get_email_config):
+        pipe_item = self.item(Mock(users=[Mock()], send_mail=False))
+
+        pipe_item._run()
+
+        mock_get_email_config.assert_not_called()
@@ -49,3 +49,47 @@ class TestBaseEmailSender:
         mock_send.assert_called_once()
 
         assert result == mock_send.return_value
+
+    def test_replace_html_keys(self):
+        result = self.sender.replace_html_keys(
+            "[FIRST_NAME] [LAST_NAME] [EMAIL]", {"FIRST_NAME": "John", "EMAIL": None}
+        )
+
+        assert result == "John [LAST_NAME] "
+
+    def test_get_recipient_html_keys(self):
+        sender = self.sender(
+            subject="test",
+            html_body="[test]",
+            from_email="test",
+            to_emails=["a", "b"],
+            html_keys={"SERVICE_NAME": "service", "FIRST_NAME": "default"},
+            personalizations={"a": {"FIRST_NAME": "John"}},
+        )
+
+        assert sender.get_recipient_html_keys("a") == {
+            "SERVICE_NAME": "service",
+            "FIRST_NAME": "John",
+        }
+        assert sender.get_recipient_html_keys("b") == {
+            "SERVICE_NAME": "service",
+            "FIRST_NAME": "default",
+        }
+
+    @patch.object(BaseEmailSender, "_send_personalized")
+    @patch.object(BaseEmailSender, "_send")
+    def test_send_personalized(self, mock_send, mock_send_personalized):
+        sender = self.sender(
+            subject="test",
+            html_body="[test]",
+            from_email="test",
+            to_emails=["a"],
+            personalizations={"a": {"test": "test"}},
+        )
+
+        result = sender.send()
+
+        mock_send.assert_not_called()
+        mock_send_personalized.assert_called_once()
+
+        assert result == mock_send_personalized.return_value
@@ -27,3 +27,20 @@ class TestDummySender:
             },
             "compiled_html_body": mock_compile_html_body.return_value,
         }
+
+    def test_send_personalized(self):
+        sender = DummySender(
+            subject="test",
+            html_body="[FIRST_NAME] [SERVICE_NAME]",
+            from_email="test",
+            to_emails=["a", "b"],
+            html_keys={"SERVICE_NAME": "service"},
+            personalizations={"a": {"FIRST_NAME": "John"}, "b": {"FIRST_NAME": "Jo"}},
+        )
+        result = sender._send_personalized()
+
+        assert result["data"]["personalizations"] == sender.personalizations
+        assert result["compiled_html_bodies"] == {
+            "a": "John service",
+            "b": "Jo service",
+        }
@@ -32,3 +32,53 @@ class TestSendGridSender:
         mock_sendgrid_api_client.assert_called_once_with(mock_env.return_value)
 
         assert result == mock_sendgrid_api_client.return_value.send.return_value
+
+    def test_get_personalization(self):
+        sender = SendGridSender(
+            subject="test",
+            html_body="[FIRST_NAME]",
+            from_email="test",
+            to_emails=["a@email.com"],
+            html_keys={"SERVICE_NAME": "service"},
+            personalizations={"a@email.com": {"FIRST_NAME": "John", "TOKEN": None}},
+        )
+
+        personalization = sender.get_personalization("a@email.com").get()
+
+        assert personalization == {
+            "to": [{"email": "a@email.com"}],
+            "substitutions": {
+                "[SERVICE_NAME]": "service",
+                "[FIRST_NAME]": "John",
+                "[TOKEN]": "",
+            },
+        }
+
+    @patch("pipelines.mail_sender.sendgrid_sender.SendGridAPIClient")
+    @patch("pipelines.mail_sender.sendgrid_sender.env")
+    def test_send_personalized_in_batches(self, mock_env, mock_sendgrid_api_client):
+        to_emails = [f"user{index}@email.com" for index in range(5)]
+        sender = SendGridSender(
+            subject="test",
+            html_body="Hi [FIRST_NAME]",
+            from_email="from@email.com",
+            to_emails=to_emails,
+            personalizations={email: {"FIRST_NAME": email} for email in to_emails},
+        )
+        sender.personalizations_per_request = 2
+
+        result = sender._send_personalized()
+
+        mock_sendgrid_api_client.assert_called_once_with(mock_env.return_value)
+        mock_send = mock_sendgrid_api_client.return_value.send
+        messages = [call_args[0][0].get() for call_args in mock_send.call_args_list]
+
+        assert result == [mock_send.return_value] * 3
+        assert [len(message["personalizations"]) for message in messages] == [2, 2, 1]
+        assert messages[0]["content"] == [
+            {"type": "text/html", "value": "Hi [FIRST_NAME]"}
+        ]
+        assert messages[2]["personalizations"][0] == {
+            "to": [{"email": "user4@email.com"}],
+            "substitutions": {"[FIRST_NAME]": "user4@email.com"},
+        }
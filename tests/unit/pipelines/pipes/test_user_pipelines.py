@@ -1,10 +1,22 @@
-from unittest.mock import Mock
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
 
 from pipelines.base import BasePipeline
-from pipelines.items import CreateUser, GenerateRandomUsername, GenerateToken, SendEmail
+from pipelines.items import (
+    CreateGuests,
+    CreateUser,
+    GenerateRandomUsername,
+    GenerateToken,
+    SendBulkEmail,
+    SendEmail,
+)
 from pipelines.items.add_mention_on_comment import AddMentionOnComment
 from pipelines.pipes import CreateUserPipeline
-from pipelines.pipes.user import MentionGuestPipeline, NotifyGuestNewPostPipeline
+from pipelines.pipes.user import (
+    CreateGuestsPipeline,
+    MentionGuestPipeline,
+    NotifyGuestNewPostPipeline,
+)
 
 
 class TestCreateUserPipeline:
@@ -56,30 +68,30 @@ class TestMentionGuestPipeline:
         assert issubclass(self.pipeline, BasePipeline)
 
     def test_init(self):
-        mock_user = Mock()
+        mock_users = [Mock()]
         mock_comment = Mock()
         mention_guest_pipeline = self.pipeline(
-            user=mock_user,
+            users=mock_users,
             comment=mock_comment,
         )
 
-        assert mention_guest_pipeline.user == mock_user
+        assert mention_guest_pipeline.users == mock_users
         assert mention_guest_pipeline.comment == mock_comment
         assert mention_guest_pipeline.email_type == "mention_notification"
         assert mention_guest_pipeline.send_mail is True
 
     def test_pipelines_items(self):
-        mock_user = Mock()
+        mock_users = [Mock()]
         mock_comment = Mock()
         mention_guest_pipeline = self.pipeline(
-            user=mock_user,
+            users=mock_users,
             comment=mock_comment,
         )
 
         steps = mention_guest_pipeline.steps
         assert steps == [
             AddMentionOnComment,
-            SendEmail,
+            SendBulkEmail,
         ]
 
 
@@ -92,22 +104,84 @@ class TestNotifyGuestNewPostPipeline:
         assert issubclass(self.pipeline, BasePipeline)
 
     def test_init(self):
-        mock_user = Mock()
+        mock_users = [Mock()]
         mention_guest_pipeline = self.pipeline(
-            user=mock_user,
+            users=mock_users,
         )
 
-        assert mention_guest_pipeline.user == mock_user
+        assert mention_guest_pipeline.users == mock_users
         assert mention_guest_pipeline.email_type == "new_post_notification"
         assert mention_guest_pipeline.send_mail is True
 
     def test_pipelines_items(self):
-        mock_user = Mock()
+        mock_users = [Mock()]
         mention_guest_pipeline = self.pipeline(
-            user=mock_user,
+            users=mock_users,
         )
 
         steps = mention_guest_pipeline.steps
         assert steps == [
-            SendEmail,
+            SendBulkEmail,
         ]
+
+
+class TestCreateGuestsPipeline:
+    @classmethod
+    def setup_class(cls):
+        cls.pipeline = CreateGuestsPipeline
+
+    def test_parent_class(self):
+        assert issubclass(self.pipeline, BasePipeline)
+
+    def test_init(self):
+        mock_event = Mock()
+        guests = [{"email": "some@email.com"}]
+        pipeline = self.pipeline(event=mock_event, guests=guests, send_mail=True)
+
+        assert pipeline.event == mock_event
+        assert pipeline.service == mock_event.service
+        assert pipeline.guests == guests
+        assert pipeline.send_mail is True
+        assert pipeline.email_type == "guest_invitation"
+        assert pipeline.users == []
+        assert pipeline.users_html_keys == {}
+        assert pipeline.results == []
+
+    def test_pipelines_items(self):
+        pipeline = self.pipeline(event=Mock(), guests=[])
+
+        assert pipeline.steps == [
+            CreateGuests,
+            SendBulkEmail,
+        ]
+
+    @patch("pipelines.pipes.user.datetime")
+    def test_get_report(self, mock_datetime):
+        pipeline = self.pipeline(event=Mock(), guests=[])
+        pipeline.date_init = datetime(2026, 1, 1)
+        mock_datetime.now.return_value = pipeline.date_init + timedelta(seconds=2)
+        pipeline.users = [Mock(), Mock()]
+        pipeline.results = [{}, {}, {}]
+
+        assert pipeline.get_report() == {
+            "results": pipeline.results,
+            "created": 2,
+            "existing": 1,
+            "elapsed": 2.0,
+            "throughput": 1.0,
+        }
+
+    @patch("pipelines.pipes.user.datetime")
+    def test_get_report_without_elapsed_time(self, mock_datetime):
+        pipeline = self.pipeline(event=Mock(), guests=[])
+        mock_datetime.now.return_value = pipeline.date_init
+
+        assert pipeline.get_report()["throughput"] == 0.0
+
+    @patch.object(CreateGuestsPipeline, "get_report")
+    @patch("pipelines.pipes.user.BasePipeline.run")
+    def test_run(self, mock_run, mock_get_report):
+        result = self.pipeline(event=Mock(), guests=[]).run()
+
+        mock_run.assert_called_once_with()
+        assert result == mock_get_report.return_value
@@ -322,6 +322,22 @@ class TestServiceEmailConfigModel:
         )
         mock_email_sender_client.return_value.send.assert_called_once()
 
+    @patch.object(ServiceEmailConfigModel, "email_sender_client")
+    def test_send_personalized_email(self, mock_email_sender_client):
+        email_config = ServiceEmailConfigModel()
+        personalizations = {"a@email.com": {"FIRST_NAME": "John"}}
+
+        email_config.send_personalized_email("some_from_email", personalizations)
+
+        mock_email_sender_client.assert_called_once_with(
+            from_email="some_from_email",
+            to_emails=["a@email.com"],
+            subject=email_config.email_subject,
+            html_body=email_config.email_html_template,
+            personalizations=personalizations,
+        )
+        mock_email_sender_client.return_value.send.assert_called_once()
+
 
 class TestServiceCredentialConfigModel:
     @classmethod
@@ -5,6 +5,8 @@ from django.contrib import admin
 from apps.service.admin import ServiceEmailConfigInline
 from apps.social.admin import (
     EventAdmin,
+    GuestImportAdmin,
+    GuestImportRowAdmin,
     LoginAnswerInline,
     MissionAdmin,
     MissionInteractionAdmin,
@@ -13,15 +15,19 @@ from apps.social.admin import (
     PostCommentAdmin,
     PostCommentInline,
     PostInline,
+    PostNotificationJobAdmin,
     ReactionInline,
 )
 from apps.social.models import (
     EventModel,
+    GuestImportModel,
+    GuestImportRowModel,
     LoginAnswer,
     MissionInteractionModel,
     MissionModel,
     PostCommentModel,
     PostModel,
+    PostNotificationJobModel,
     ReactionModel,
 )
 from utils.admin.mixins import (
@@ -162,14 +168,15 @@ class TestPostAdmin:
     def test_actions(self):
         assert self.admin.actions == ["generate_ai_report", "notify_new_post"]
 
-    def test_generate_ai_report(self):
-        post_1 = Mock()
-        post_2 = Mock()
-        queryset = [post_1, post_2]
+    @patch("apps.social.admin.generate_ai_text_reports")
+    def test_generate_ai_report(self, mock_generate_ai_text_reports):
+        queryset = Mock()
+        queryset.values_list.return_value = [1, 2]
+
         self.admin.generate_ai_report(None, queryset)
 
-        post_1.generate_ai_text_report.assert_called_once()
-        post_2.generate_ai_text_report.assert_called_once()
+        queryset.values_list.assert_called_once_with("pk", flat=True)
+        mock_generate_ai_text_reports.assert_called_once_with([1, 2])
 
     def test_notify_new_post(self):
         post_1 = Mock()
@@ -187,6 +194,40 @@ class TestPostAdmin:
         post.reactions.all.assert_called_once()
 
 
+class TestPostNotificationJobAdmin:
+    @classmethod
+    def setup_class(cls):
+        cls.admin = PostNotificationJobAdmin(
+            PostNotificationJobModel, admin.AdminSite()
+        )
+
+    def test_meta_model(self):
+        assert self.admin.model == PostNotificationJobModel
+
+    def test_list_filter(self):
+        assert self.admin.list_filter == ["status"]
+
+    def test_actions(self):
+        assert self.admin.actions == ["resume"]
+
+    def test_has_add_permission(self):
+        assert self.admin.has_add_permission(None, None) is False
+
+    def test_progress(self):
+        assert self.admin.progress(Mock(progress=25)) == "25%"
+
+    @patch("apps.social.admin.run_post_notification_job")
+    def test_resume(self, mock_run_post_notification_job):
+        job = Mock(pk=1)
+        queryset = Mock()
+        queryset.exclude.return_value = [job]
+
+        self.admin.resume(None, queryset)
+
+        queryset.exclude.assert_called_once_with(status="done")
+        mock_run_post_notification_job.assert_called_once_with(1)
+
+
 class TestPostCommentAdmin:
     @classmethod
     def setup_class(cls):
@@ -331,12 +372,91 @@ class TestEventAdmin:
     def test_inlines(self):
         assert self.admin.inlines == [ServiceEmailConfigInline, PostInline]
 
-    def test_send_invite_to_guests(self):
+    @patch.object(EventAdmin, "message_user")
+    def test_send_invite_to_guests(self, mock_message_user):
         events = [Mock(), Mock()]
+        report = {"created": 2, "existing": 1, "elapsed": 0.5, "throughput": 4.0}
+        events[0].create_guests.return_value = report
+        events[1].create_guests.return_value = report
         self.admin.send_invite_to_guests(None, events)
 
         events[0].create_guests.assert_called_once()
         events[1].create_guests.assert_called_once()
+        mock_message_user.assert_called_with(
+            None,
+            f"{events[1]}: 2 guests created and 1 already existing in 0.5s "
+            "(4 guests/s).",
+        )
+
+
+class TestGuestImportAdmin:
+    @classmethod
+    def setup_class(cls):
+        cls.admin = GuestImportAdmin(GuestImportModel, admin.AdminSite())
+
+    def test_meta_model(self):
+        assert self.admin.model == GuestImportModel
+
+    def test_list_filter(self):
+        assert self.admin.list_filter == ["status"]
+
+    def test_actions(self):
+        assert self.admin.actions == ["retry"]
+
+    def test_get_readonly_fields(self):
+        assert "file" not in self.admin.get_readonly_fields(None)
+        assert self.admin.get_readonly_fields(None, Mock())[:2] == ["event", "file"]
+
+    def test_summary(self):
+        obj = Mock()
+        obj.get_summary.return_value = {"created": 2, "invalid": 1}
+
+        assert self.admin.summary(obj) == "created: 2, invalid: 1"
+
+    @patch("apps.social.admin.run_guest_import")
+    @patch("apps.social.admin.transaction")
+    @patch("apps.social.admin.admin.ModelAdmin.save_model")
+    def test_save_model(self, mock_save_model, mock_transaction, mock_task):
+        mock_transaction.on_commit.side_effect = lambda function: function()
+        obj = Mock(pk=1)
+
+        self.admin.save_model(None, obj, None, False)
+
+        mock_save_model.assert_called_once_with(None, obj, None, False)
+        mock_task.assert_called_once_with(1)
+
+    @patch("apps.social.admin.transaction")
+    @patch("apps.social.admin.admin.ModelAdmin.save_model")
+    def test_save_model_change(self, _mock_save_model, mock_transaction):
+        self.admin.save_model(None, Mock(), None, True)
+
+        mock_transaction.on_commit.assert_not_called()
+
+    @patch("apps.social.admin.run_guest_import")
+    def test_retry(self, mock_run_guest_import):
+        queryset = Mock()
+        queryset.filter.return_value = [Mock(pk=1)]
+
+        self.admin.retry(None, queryset)
+
+        queryset.filter.assert_called_once_with(status="failed")
+        mock_run_guest_import.assert_called_once_with(1)
+
+
+class TestGuestImportRowAdmin:
+    @classmethod
+    def setup_class(cls):
+        cls.admin = GuestImportRowAdmin(GuestImportRowModel, admin.AdminSite())
+
+    def test_list_filter(self):
+        assert self.admin.list_filter == ["status"]
+
+    def test_search_fields(self):
+        assert self.admin.search_fields == ["email", "name"]
+
+    def test_permissions(self):
+        assert self.admin.has_add_permission(None) is False
+        assert self.admin.has_change_permission(None, None) is False
 
 
 class TestMissionInteractionInline:
@@ -0,0 +1,85 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+
+from apps.social.ai_report import (
+    get_ai_report_cache_key,
+    get_ai_report_hash,
+    get_ai_reports,
+    request_ai_report,
+)
+from apps.social.chat_ai import DummyTextAI
+
+
+def test_get_ai_report_hash():
+    digest = get_ai_report_hash("dummy", "Pre Set", "Message")
+
+    assert len(digest) == 64
+    assert digest == get_ai_report_hash("dummy", "Pre Set", "Message")
+    assert digest != get_ai_report_hash("gpt-3", "Pre Set", "Message")
+    assert digest != get_ai_report_hash("dummy", "Pre Set", "Other Message")
+    assert get_ai_report_hash("dummy", "a", "bc") != get_ai_report_hash(
+        "dummy", "ab", "c"
+    )
+
+
+def test_get_ai_report_cache_key():
+    assert get_ai_report_cache_key("abc") == "social:ai-report:abc"
+
+
+def test_request_ai_report():
+    assert request_ai_report(DummyTextAI, "Pre Set", "Message") == (
+        "Dummy response for Dummy test"
+    )
+
+
+class TestGetAIReports:
+    def test_request_missing_reports(self):
+        result = get_ai_reports(
+            {"first": (DummyTextAI, "Pre Set", "Message")}, max_workers=2
+        )
+
+        assert result == {"first": "Dummy response for Dummy test"}
+        assert cache.get("social:ai-report:first") == "Dummy response for Dummy test"
+
+    @patch("apps.social.ai_report.request_ai_report", return_value="Report")
+    def test_reuse_cached_reports(self, mock_request_ai_report):
+        cache.set("social:ai-report:first", "Cached Report")
+
+        result = get_ai_reports(
+            {
+                "first": (DummyTextAI, "Pre Set", "Message"),
+                "second": (DummyTextAI, "Pre Set", "Other Message"),
+            }
+        )
+
+        mock_request_ai_report.assert_called_once_with(
+            DummyTextAI, "Pre Set", "Other Message"
+        )
+        assert result == {
+            "first": "Cached Report",
+            "second": "Report",
+        }
+        assert cache.get("social:ai-report:second") == "Report"
+
+    @patch("apps.social.ai_report.request_ai_report")
+    def test_all_cached(self, mock_request_ai_report):
+        cache.set("social:ai-report:first", "Cached Report")
+
+        result = get_ai_reports({"first": (DummyTextAI, "Pre Set", "Message")})
+
+        mock_request_ai_report.assert_not_called()
+        assert result == {"first": "Cached Report"}
+
+    def test_leave_out_failed_requests(self):
+        failing_text_ai = Mock(side_effect=ValueError("Invalid key"))
+
+        result = get_ai_reports(
+            {
+                "failed": (failing_text_ai, "Pre Set", "Message"),
+                "first": (DummyTextAI, "Pre Set", "Message"),
+            }
+        )
+
+        assert result == {"first": "Dummy response for Dummy test"}
+        assert cache.get("social:ai-report:failed") is None
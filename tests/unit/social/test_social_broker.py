@@ -0,0 +1,185 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import redis
+from asgiref.sync import async_to_sync
+
+from apps.social.broker import (
+    InMemoryBroker,
+    RedisBroker,
+    Subscription,
+    get_broker,
+    get_stream_channel,
+)
+
+
+def test_get_stream_channel():
+    assert get_stream_channel(1, 2) == "social:stream:1:2"
+    assert get_stream_channel(1) == "social:stream:1:None"
+
+
+class TestSubscription:
+    def test_get(self):
+        async def get():
+            queue = asyncio.Queue()
+            queue.put_nowait({"type": "post.created"})
+
+            return await Subscription(queue).get(1)
+
+        assert async_to_sync(get)() == {"type": "post.created"}
+
+    def test_get_timeout(self):
+        async def get():
+            return await Subscription(asyncio.Queue()).get(0.01)
+
+        assert async_to_sync(get)() is None
+
+
+class TestInMemoryBroker:
+    def test_publish_to_subscribers(self):
+        broker = InMemoryBroker()
+
+        async def subscribe():
+            async with broker.subscribe("a", "b") as subscription:
+                broker.publish("a", {"id": 1})
+                broker.publish("b", {"id": 2})
+                broker.publish("c", {"id": 3})
+
+                return [
+                    await subscription.get(1),
+                    await subscription.get(1),
+                    await subscription.get(0.01),
+                ]
+
+        assert async_to_sync(subscribe)() == [{"id": 1}, {"id": 2}, None]
+
+    def test_subscribe_removes_subscriber_on_exit(self):
+        broker = InMemoryBroker()
+
+        async def subscribe():
+            async with broker.subscribe("a"):
+                assert len(broker.subscribers["a"]) == 1
+
+        async_to_sync(subscribe)()
+
+        assert broker.subscribers["a"] == set()
+
+    def test_publish_without_subscribers(self):
+        broker = InMemoryBroker()
+
+        broker.publish("a", {"id": 1})
+
+        assert broker.subscribers["a"] == set()
+
+
+class TestRedisBroker:
+    @patch("apps.social.broker.redis.Redis")
+    def test_publish(self, mock_redis):
+        broker = RedisBroker("redis://localhost:6379/1")
+
+        broker.publish("a", {"id": 1})
+
+        mock_redis.from_url.assert_called_once_with("redis://localhost:6379/1")
+        mock_redis.from_url.return_value.publish.assert_called_once_with(
+            "a", json.dumps({"id": 1})
+        )
+
+    @patch("apps.social.broker.redis.Redis")
+    def test_publish_ignores_redis_errors(self, mock_redis):
+        mock_redis.from_url.return_value.publish.side_effect = redis.RedisError
+
+        RedisBroker("redis://localhost:6379/1").publish("a", {"id": 1})
+
+    @patch("apps.social.broker.redis.asyncio.Redis")
+    @patch("apps.social.broker.redis.Redis")
+    def test_listen_delivers_messages(self, _mock_redis, mock_async_redis):
+        broker = RedisBroker("redis://localhost:6379/1")
+        pubsub = mock_async_redis.from_url.return_value.pubsub.return_value
+        pubsub.psubscribe = AsyncMock()
+        pubsub.close = AsyncMock()
+        mock_async_redis.from_url.return_value.close = AsyncMock()
+
+        async def listen():
+            yield {"type": "psubscribe", "channel": b"social:stream:*", "data": 1}
+            yield {"type": "pmessage", "channel": b"a", "data": b'{"id": 1}'}
+            raise asyncio.CancelledError
+
+        pubsub.listen = listen
+
+        async def subscribe():
+            async with InMemoryBroker.subscribe(broker, "a") as subscription:
+                try:
+                    await broker.listen()
+                except asyncio.CancelledError:
+                    pass
+
+                return await subscription.get(1)
+
+        assert async_to_sync(subscribe)() == {"id": 1}
+        pubsub.psubscribe.assert_awaited_once_with("social:stream:*")
+        pubsub.close.assert_awaited_once()
+
+    @patch("apps.social.broker.asyncio.sleep")
+    @patch("apps.social.broker.redis.asyncio.Redis")
+    @patch("apps.social.broker.redis.Redis")
+    def test_listen_reconnects_on_redis_errors(
+        self, _mock_redis, mock_async_redis, mock_sleep
+    ):
+        broker = RedisBroker("redis://localhost:6379/1")
+        pubsub = mock_async_redis.from_url.return_value.pubsub.return_value
+        pubsub.psubscribe = AsyncMock(side_effect=redis.RedisError)
+        pubsub.close = AsyncMock()
+        mock_async_redis.from_url.return_value.close = AsyncMock()
+        mock_sleep.side_effect = [None, asyncio.CancelledError]
+
+        async def listen():
+            try:
+                await broker.listen()
+            except asyncio.CancelledError:
+                pass
+
+        async_to_sync(listen)()
+
+        assert mock_async_redis.from_url.call_count == 2
+        mock_sleep.assert_called_with(RedisBroker.reconnect_delay)
+
+    @patch.object(RedisBroker, "listen")
+    @patch("apps.social.broker.redis.Redis")
+    def test_subscribe_starts_a_single_listener(self, _mock_redis, mock_listen):
+        broker = RedisBroker("redis://localhost:6379/1")
+        mock_listen.side_effect = lambda: asyncio.sleep(1)
+
+        async def subscribe():
+            async with broker.subscribe("a"):
+                async with broker.subscribe("b"):
+                    pass
+
+            broker.listener.cancel()
+
+        async_to_sync(subscribe)()
+
+        mock_listen.assert_called_once_with()
+
+
+class TestGetBroker:
+    def setup_method(self):
+        get_broker.cache_clear()
+
+    def teardown_method(self):
+        get_broker.cache_clear()
+
+    @patch("apps.social.broker.settings", Mock(REDIS_URL=None))
+    def test_in_memory_broker(self):
+        broker = get_broker()
+
+        assert type(broker) is InMemoryBroker
+        assert get_broker() is broker
+
+    @patch("apps.social.broker.redis.Redis", Mock())
+    @patch("apps.social.broker.settings", Mock(REDIS_URL="redis://localhost/1"))
+    def test_redis_broker(self):
+        broker = get_broker()
+
+        assert isinstance(broker, RedisBroker)
+        assert broker.url == "redis://localhost/1"
@@ -0,0 +1,212 @@
+from io import StringIO
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.management import CommandError, call_command
+
+from apps.social.management.commands.backfill_attachment_metadata import (
+    Command as BackfillAttachmentMetadataCommand,
+)
+from apps.social.management.commands.rebuild_social_counters import (
+    count_subquery,
+    rebuild_reactions_by_type,
+)
+from apps.social.models import PostModel
+from apps.user.models import UserModel
+
+
+@patch("apps.social.management.commands.rebuild_social_counters.Coalesce")
+@patch("apps.social.management.commands.rebuild_social_counters.Subquery")
+@patch("apps.social.management.commands.rebuild_social_counters.OuterRef")
+def test_count_subquery(mock_outer_ref, mock_subquery, mock_coalesce):
+    mock_queryset = MagicMock()
+
+    result = count_subquery(mock_queryset, "post")
+
+    mock_outer_ref.assert_called_once_with("pk")
+    mock_queryset.filter.assert_called_once_with(post=mock_outer_ref.return_value)
+    counts = (
+        mock_queryset.filter.return_value.order_by.return_value.values.return_value
+    ).annotate.return_value.values.return_value
+    counts.__getitem__.assert_called_once_with(slice(None, 1))
+    mock_subquery.assert_called_once_with(counts.__getitem__.return_value)
+    mock_coalesce.assert_called_once_with(mock_subquery.return_value, 0)
+    assert result == mock_coalesce.return_value
+
+
+@patch(
+    "apps.social.management.commands.rebuild_social_counters.rebuild_reactions_by_type"
+)
+@patch("apps.social.management.commands.rebuild_social_counters.count_subquery")
+@patch("apps.social.management.commands.rebuild_social_counters.PostCommentModel")
+@patch("apps.social.management.commands.rebuild_social_counters.PostModel")
+def test_rebuild_social_counters(
+    mock_post_model,
+    mock_post_comment_model,
+    mock_count_subquery,
+    mock_rebuild_reactions_by_type,
+):
+    mock_post_model.objects.update.return_value = 2
+    mock_post_comment_model.objects.update.return_value = 3
+    active_comments = mock_post_comment_model.objects.filter.return_value
+    out = StringIO()
+
+    call_command("rebuild_social_counters", stdout=out)
+
+    mock_post_comment_model.objects.filter.assert_called_once_with(is_deleted=False)
+    mock_count_subquery.assert_has_calls(
+        [
+            call(mock_post_model.reactions.through.objects.all(), "postmodel"),
+            call(active_comments, "post"),
+            call(
+                mock_post_comment_model.reactions.through.objects.all(),
+                "postcommentmodel",
+            ),
+            call(active_comments, "answer"),
+        ]
+    )
+    mock_post_model.objects.update.assert_called_once_with(
+        reactions_count=mock_count_subquery.return_value,
+        comments_count=mock_count_subquery.return_value,
+    )
+    mock_post_comment_model.objects.update.assert_called_once_with(
+        reactions_count=mock_count_subquery.return_value,
+        comments_count=mock_count_subquery.return_value,
+    )
+    mock_rebuild_reactions_by_type.assert_has_calls(
+        [call(mock_post_model), call(mock_post_comment_model)]
+    )
+    assert "Rebuilt counters of 2 posts and 3 comments" in out.getvalue()
+
+
+@patch("apps.social.management.commands.rebuild_social_counters.connection")
+def test_rebuild_reactions_by_type(mock_connection):
+    rebuild_reactions_by_type(PostModel)
+
+    mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+    sql = mock_cursor.execute.call_args.args[0]
+    assert "UPDATE social_postmodel AS target SET reactions_by_type" in sql
+    assert "FROM social_postmodel_reactions AS through" in sql
+    assert "WHERE through.postmodel_id = target.id" in sql
+
+
+@patch("apps.social.management.commands.create_event_guests.EventModel")
+def test_create_event_guests(mock_event_model):
+    event = mock_event_model.objects.select_related.return_value.get.return_value
+    event.create_guests.return_value = {
+        "results": [
+            {"email": "old@email.com", "status": "exists"},
+            {"email": "new@email.com", "status": "created", "username": "s-0001"},
+        ],
+        "created": 1,
+        "existing": 1,
+        "elapsed": 0.5,
+        "throughput": 2.0,
+    }
+    out = StringIO()
+
+    call_command("create_event_guests", "7", stdout=out)
+
+    mock_event_model.objects.select_related.assert_called_once_with("service")
+    mock_event_model.objects.select_related.return_value.get.assert_called_once_with(
+        pk=7
+    )
+    assert "old@email.com: exists" in out.getvalue()
+    assert "new@email.com: created" in out.getvalue()
+    assert "1 guests created and 1 already existing in 0.50s (2 guests/s)" in (
+        out.getvalue()
+    )
+
+
+@patch("apps.social.management.commands.create_event_guests.EventModel")
+def test_create_event_guests_not_found(mock_event_model):
+    mock_event_model.DoesNotExist = ObjectDoesNotExist
+    get = mock_event_model.objects.select_related.return_value.get
+    get.side_effect = ObjectDoesNotExist
+
+    with pytest.raises(CommandError, match="Event not found."):
+        call_command("create_event_guests", "7")
+
+
+@patch("apps.social.management.commands.rebuild_mission_leaderboard.get_leaderboard")
+@patch(
+    "apps.social.management.commands.rebuild_mission_leaderboard."
+    "MissionInteractionModel"
+)
+def test_rebuild_mission_leaderboard(mock_interaction_model, mock_get_leaderboard):
+    values = mock_interaction_model.objects.order_by.return_value.values
+    completions = values.return_value.annotate.return_value
+    completions.iterator.return_value = [
+        {"mission__service_id": 1, "mission__event_id": 2, "user_id": 3, "score": 4},
+        {"mission__service_id": 1, "mission__event_id": 2, "user_id": 5, "score": 1},
+        {"mission__service_id": 1, "mission__event_id": None, "user_id": 6, "score": 2},
+    ]
+    out = StringIO()
+
+    call_command("rebuild_mission_leaderboard", stdout=out)
+
+    values.assert_called_once_with(
+        "mission__service_id", "mission__event_id", "user_id"
+    )
+    mock_get_leaderboard.return_value.rebuild.assert_called_once_with(
+        {
+            "social:leaderboard:1:2": {3: 4, 5: 1},
+            "social:leaderboard:1:None": {6: 2},
+        }
+    )
+    assert "Rebuilt 2 leaderboards with 3 users" in out.getvalue()
+
+
+@patch(
+    "apps.social.management.commands.backfill_attachment_metadata.Command."
+    "backfill_model",
+    return_value=(3, 1),
+)
+@patch("apps.social.management.commands.backfill_attachment_metadata.apps")
+def test_backfill_attachment_metadata(mock_apps, mock_backfill_model):
+    mock_apps.get_models.return_value = [UserModel, PostModel]
+    out = StringIO()
+
+    call_command("backfill_attachment_metadata", chunk_size=10, stdout=out)
+
+    mock_backfill_model.assert_called_once_with(PostModel, 10)
+    assert "social.PostModel: 3 updated, 1 failed" in out.getvalue()
+
+
+def test_backfill_attachment_metadata_instance():
+    instance = MagicMock()
+
+    assert BackfillAttachmentMetadataCommand().backfill_instance(instance) is True
+    instance.set_attachment_metadata.assert_called_once_with()
+    instance.attachment.close.assert_called_once_with()
+
+
+def test_backfill_attachment_metadata_instance_failure():
+    instance = MagicMock(pk=1, _meta=MagicMock(label="social.PostModel"))
+    instance.set_attachment_metadata.side_effect = [OSError("Missing"), None]
+    err = StringIO()
+
+    result = BackfillAttachmentMetadataCommand(stderr=err).backfill_instance(instance)
+
+    assert result is False
+    instance.set_attachment_metadata.assert_called_with(read_file=False)
+    instance.attachment.close.assert_called_once_with()
+    assert "social.PostModel 1: Missing" in err.getvalue()
+
+
+@patch(
+    "apps.social.management.commands.abort_stale_uploads.abort_stale_multipart_uploads"
+)
+def test_abort_stale_uploads(mock_abort_stale_multipart_uploads):
+    mock_abort_stale_multipart_uploads.return_value = 2
+    out = StringIO()
+
+    call_command("abort_stale_uploads", stdout=out)
+
+    assert "Aborted 2 uploads" in out.getvalue()
+
+
+def test_abort_stale_uploads_without_s3():
+    with pytest.raises(CommandError):
+        call_command("abort_stale_uploads")
@@ -0,0 +1,50 @@
+from unittest.mock import call, patch
+
+from apps.social.feed_cache import PostFeedCache
+
+
+class TestPostFeedCache:
+    def test_get_version_key(self):
+        assert PostFeedCache.get_version_key(1, 2) == "social:feed:1:2:version"
+        assert PostFeedCache.get_version_key(1) == "social:feed:1:None:version"
+
+    @patch("apps.social.feed_cache.get_version")
+    def test_get_version(self, mock_get_version):
+        assert PostFeedCache(1, 2).get_version() == mock_get_version.return_value
+        mock_get_version.assert_called_once_with("social:feed:1:2:version")
+
+    @patch.object(PostFeedCache, "get_version", return_value=3)
+    def test_get_page_key(self, _mock_get_version):
+        feed_cache = PostFeedCache(1, 2)
+
+        key = feed_cache.get_page_key("/api/v1/post/")
+
+        assert key.startswith("social:feed:1:2:3:")
+        assert key == feed_cache.get_page_key("/api/v1/post/")
+        assert key != feed_cache.get_page_key("/api/v1/post/?cursor=abc")
+
+    @patch.object(PostFeedCache, "get_page_key")
+    @patch("apps.social.feed_cache.cache")
+    def test_get_or_set(self, mock_cache, mock_get_page_key):
+        result = PostFeedCache(1).get_or_set("page", "default")
+
+        mock_get_page_key.assert_called_once_with("page")
+        mock_cache.get_or_set.assert_called_once_with(
+            mock_get_page_key.return_value, "default", PostFeedCache.timeout
+        )
+        assert result == mock_cache.get_or_set.return_value
+
+    @patch("apps.social.feed_cache.bump_version")
+    def test_invalidate(self, mock_bump_version):
+        PostFeedCache.invalidate(1, 2)
+
+        mock_bump_version.assert_has_calls(
+            [call("social:feed:1:2:version"), call("social:feed:1:None:version")],
+            any_order=True,
+        )
+
+    @patch("apps.social.feed_cache.bump_version")
+    def test_invalidate_service_feed(self, mock_bump_version):
+        PostFeedCache.invalidate(1)
+
+        mock_bump_version.assert_called_once_with("social:feed:1:None:version")
@@ -0,0 +1,95 @@
+from io import BytesIO
+
+import pytest
+from django.core.exceptions import ValidationError
+from openpyxl import Workbook
+
+from apps.social.guest_import import (
+    get_column,
+    is_valid_guest_email,
+    read_csv_rows,
+    read_guest_rows,
+    read_xlsx_rows,
+)
+
+
+def get_xlsx_file(rows):
+    workbook = Workbook()
+
+    for row in rows:
+        workbook.active.append(row)
+
+    file = BytesIO()
+    workbook.save(file)
+    file.seek(0)
+
+    return file
+
+
+def test_read_csv_rows():
+    file = BytesIO("﻿name,email\nJoão,joao@email.com\n".encode())
+
+    assert list(read_csv_rows(file)) == [
+        ["name", "email"],
+        ["João", "joao@email.com"],
+    ]
+    assert not file.closed
+
+
+def test_read_xlsx_rows():
+    file = get_xlsx_file([["name", "email"], [None, "john@email.com"], [1, None]])
+
+    assert list(read_xlsx_rows(file)) == [
+        ["name", "email"],
+        ["", "john@email.com"],
+        ["1", ""],
+    ]
+
+
+@pytest.mark.parametrize(
+    "row, index, expected",
+    [
+        ([" John "], 0, "John"),
+        (["John"], 1, ""),
+        (["John"], None, ""),
+    ],
+)
+def test_get_column(row, index, expected):
+    assert get_column(row, index) == expected
+
+
+def test_read_guest_rows_from_csv():
+    file = BytesIO(b"Email,Name\nJOHN@email.com, John Doe\n,\n\nmary@email.com\n")
+
+    assert list(read_guest_rows(file, "guests.csv")) == [
+        (2, "John Doe", "john@email.com"),
+        (5, "", "mary@email.com"),
+    ]
+
+
+def test_read_guest_rows_from_xlsx():
+    file = get_xlsx_file([["email"], ["john@email.com"]])
+
+    assert list(read_guest_rows(file, "GUESTS.XLSX")) == [
+        (2, "", "john@email.com"),
+    ]
+
+
+@pytest.mark.parametrize("content", [b"", b"name\nJohn\n"])
+def test_read_guest_rows_without_email_column(content):
+    with pytest.raises(ValidationError):
+        list(read_guest_rows(BytesIO(content), "guests.csv"))
+
+
+@pytest.mark.parametrize(
+    "email, is_valid",
+    [
+        ("john@email.com", True),
+        ("john.doe@email.com.br", True),
+        ("john", False),
+        ("John@email.com", False),
+        (f"{'a' * 250}@email.com", False),
+    ],
+)
+def test_is_valid_guest_email(email, is_valid):
+    assert is_valid_guest_email(email) is is_valid
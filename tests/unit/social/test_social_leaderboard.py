@@ -0,0 +1,166 @@
+from unittest.mock import Mock, call, patch
+
+import redis
+
+from apps.social.leaderboard import (
+    InMemoryLeaderboard,
+    RedisLeaderboard,
+    get_leaderboard,
+    get_leaderboard_key,
+    score_mission_completion,
+)
+
+
+def test_get_leaderboard_key():
+    assert get_leaderboard_key(1, 2) == "social:leaderboard:1:2"
+    assert get_leaderboard_key(1) == "social:leaderboard:1:None"
+
+
+class TestInMemoryLeaderboard:
+    def setup_method(self):
+        self.leaderboard = InMemoryLeaderboard()
+        self.leaderboard.increment("board", 1)
+        self.leaderboard.increment("board", 2, 3)
+        self.leaderboard.increment("board", 3, 3)
+        self.leaderboard.increment("other", 1, 10)
+
+    def test_get_top(self):
+        assert self.leaderboard.get_top("board", 2) == [(3, 3), (2, 3)]
+        assert self.leaderboard.get_top("board", 10) == [(3, 3), (2, 3), (1, 1)]
+        assert self.leaderboard.get_top("empty", 10) == []
+
+    def test_get_rank(self):
+        assert self.leaderboard.get_rank("board", 3) == (1, 3)
+        assert self.leaderboard.get_rank("board", 1) == (3, 1)
+        assert self.leaderboard.get_rank("other", 1) == (1, 10)
+        assert self.leaderboard.get_rank("board", 4) is None
+
+    def test_increment_removes_users_without_score(self):
+        self.leaderboard.increment("board", 2, -1)
+        self.leaderboard.increment("board", 1, -1)
+
+        assert self.leaderboard.get_top("board", 10) == [(3, 3), (2, 2)]
+        assert self.leaderboard.get_rank("board", 1) is None
+
+    def test_rebuild(self):
+        self.leaderboard.rebuild({"board": {5: 2}})
+
+        assert self.leaderboard.get_top("board", 10) == [(5, 2)]
+        assert self.leaderboard.get_top("other", 10) == []
+
+
+class TestRedisLeaderboard:
+    @patch("apps.social.leaderboard.redis.Redis")
+    def setup_method(self, _method, mock_redis):
+        self.leaderboard = RedisLeaderboard("redis://localhost/1")
+        self.client = mock_redis.from_url.return_value
+
+    def test_init(self):
+        assert self.leaderboard.url == "redis://localhost/1"
+
+    def test_increment(self):
+        self.leaderboard.increment("board", 1)
+
+        self.client.zincrby.assert_called_once_with("board", 1, 1)
+        self.client.zremrangebyscore.assert_not_called()
+
+    def test_decrement(self):
+        self.leaderboard.increment("board", 1, -1)
+
+        self.client.zincrby.assert_called_once_with("board", -1, 1)
+        self.client.zremrangebyscore.assert_called_once_with("board", "-inf", 0)
+
+    def test_increment_ignores_redis_errors(self):
+        self.client.zincrby.side_effect = redis.ConnectionError
+
+        self.leaderboard.increment("board", 1, 2)
+
+        self.client.zincrby.assert_called_once_with("board", 2, 1)
+
+    def test_get_top(self):
+        self.client.zrevrange.return_value = [(b"3", 3.0), (b"1", 1.0)]
+
+        result = self.leaderboard.get_top("board", 2)
+
+        self.client.zrevrange.assert_called_once_with("board", 0, 1, withscores=True)
+        assert result == [(3, 3), (1, 1)]
+
+    def test_get_rank(self):
+        mock_pipeline = self.client.pipeline.return_value
+        mock_pipeline.execute.return_value = [0, 4.0]
+
+        result = self.leaderboard.get_rank("board", 3)
+
+        self.client.pipeline.assert_called_once_with(transaction=False)
+        mock_pipeline.zrevrank.assert_called_once_with("board", 3)
+        mock_pipeline.zscore.assert_called_once_with("board", 3)
+        assert result == (1, 4)
+
+    def test_get_rank_without_score(self):
+        self.client.pipeline.return_value.execute.return_value = [None, None]
+
+        assert self.leaderboard.get_rank("board", 3) is None
+
+    @patch.object(RedisLeaderboard, "chunk_size", 2)
+    def test_rebuild(self):
+        self.client.scan_iter.return_value = iter(
+            [b"social:leaderboard:1:None", b"social:leaderboard:2:None"]
+        )
+
+        self.leaderboard.rebuild(
+            {
+                "social:leaderboard:1:None": {1: 3, 2: 2, 3: 1},
+                "social:leaderboard:3:None": {},
+            }
+        )
+
+        self.client.scan_iter.assert_called_once_with(match="social:leaderboard:*")
+        assert self.client.zadd.call_args_list == [
+            call("social:leaderboard:1:None:rebuild", {1: 3, 2: 2}),
+            call("social:leaderboard:1:None:rebuild", {3: 1}),
+        ]
+        self.client.rename.assert_called_once_with(
+            "social:leaderboard:1:None:rebuild", "social:leaderboard:1:None"
+        )
+        assert self.client.delete.call_args_list == [
+            call("social:leaderboard:1:None:rebuild"),
+            call(b"social:leaderboard:2:None"),
+        ]
+
+
+class TestGetLeaderboard:
+    def setup_method(self):
+        get_leaderboard.cache_clear()
+
+    def teardown_method(self):
+        get_leaderboard.cache_clear()
+
+    @patch("apps.social.leaderboard.settings", Mock(REDIS_URL=None))
+    def test_in_memory_leaderboard(self):
+        leaderboard = get_leaderboard()
+
+        assert type(leaderboard) is InMemoryLeaderboard
+        assert get_leaderboard() is leaderboard
+
+    @patch("apps.social.leaderboard.redis.Redis", Mock())
+    @patch("apps.social.leaderboard.settings", Mock(REDIS_URL="redis://localhost/1"))
+    def test_redis_leaderboard(self):
+        leaderboard = get_leaderboard()
+
+        assert isinstance(leaderboard, RedisLeaderboard)
+        assert leaderboard.url == "redis://localhost/1"
+
+
+@patch("apps.social.leaderboard.get_leaderboard")
+@patch("apps.social.leaderboard.transaction")
+def test_score_mission_completion(mock_transaction, mock_get_leaderboard):
+    mission = Mock(service_id=1, event_id=2)
+
+    score_mission_completion(mission, 3)
+
+    mock_get_leaderboard.assert_not_called()
+    (callback,) = mock_transaction.on_commit.call_args[0]
+    callback()
+    mock_get_leaderboard.return_value.increment.assert_called_once_with(
+        "social:leaderboard:1:2", 3, 1
+    )
@@ -1,12 +1,18 @@
-from unittest.mock import Mock, call, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Greatest
 
 from apps.service.models import ServiceClientModel, ServiceModel
+from apps.social.ai_report import get_ai_report_hash
+from apps.social.chat_ai import DummyTextAI
 from apps.social.models import (
     AITextReportModel,
     EventModel,
+    GuestImportModel,
+    GuestImportRowModel,
     LoginAnswer,
     LoginQuestionOption,
     LoginQuestions,
@@ -15,16 +21,26 @@ from apps.social.models import (
     MissionTypeModel,
     PostCommentModel,
     PostModel,
+    PostNotificationJobModel,
     ReactionModel,
     ReactionsMixin,
     ReactionTypeModel,
     event_directory_path,
+    guest_import_directory_path,
+    invalidate_feed_on_author_change,
+    invalidate_feed_on_post_change,
     mission_directory_path,
     mission_interaction_directory_path,
+    notify_post_counter_change,
     post_attachment_directory_path,
+    publish_created_comment,
+    publish_created_post,
+    unscore_deleted_mission_completion,
 )
+from apps.social.tasks import run_post_notification_job
 from apps.user.models import UserModel
 from utils.abstract_models.base_model import BaseModel
+from utils.mixins.counter import JSONCounterIncrement
 
 
 @patch("apps.social.models.datetime")
@@ -53,6 +69,16 @@ def test_event_directory_path(mock_datetime):
     assert result == "media/event/Test_1_01012020_12:00:00_test.jpg"
 
 
+@patch("apps.social.models.datetime")
+def test_guest_import_directory_path(mock_datetime):
+    mock_datetime.now.return_value.strftime.return_value = "01012020_12:00:00"
+    instance = Mock(event_id=1)
+
+    result = guest_import_directory_path(instance, "guests.csv")
+
+    assert result == "media/guest_import/1_01012020_12:00:00_guests.csv"
+
+
 @patch("apps.social.models.get_formatted_datetime_now")
 def test_mission_interaction_directory_path(mock_get_formatted_datetime_now):
     mock_instance = Mock()
@@ -94,37 +120,120 @@ class TestReactionsMixin:
 
         assert result == mixin.reactions.count.return_value
 
-    def test_react_with_user_reaction(self):
-        user = Mock()
-        user_reaction = Mock()
-        mixin = ReactionsMixin()
-        mixin.reactions = Mock()
-        mixin.reactions.filter.return_value.first.return_value = user_reaction
+    def test_get_react_sql(self):
+        sql = PostModel.get_react_sql()
 
-        result = mixin.react(user, 1)
-        mixin.reactions.filter.assert_called_once_with(user=user)
-        mixin.reactions.filter.return_value.first.assert_called_once()
-        mixin.reactions.create.assert_not_called()
+        assert "INSERT INTO social_reactionmodel" in sql
+        assert "ON CONFLICT (user_id, post_id) DO UPDATE" in sql
+        assert (
+            "INSERT INTO social_postmodel_reactions (postmodel_id, reactionmodel_id)"
+            in sql
+        )
+        assert "UPDATE social_postmodel AS target SET" in sql
+        assert "JOIN social_reactiontypemodel AS new_type" in sql
+
+    def test_get_react_sql_for_comments(self):
+        sql = PostCommentModel.get_react_sql()
+
+        assert "ON CONFLICT (user_id, comment_id) DO UPDATE" in sql
+        assert "INSERT INTO social_postcommentmodel_reactions" in sql
+        assert "UPDATE social_postcommentmodel AS target SET" in sql
+
+    @patch("apps.social.models.counter_updated")
+    @patch("apps.social.models.post_save")
+    @patch("apps.social.models.timezone")
+    @patch("apps.social.models.connection")
+    def test_react_creating_reaction(
+        self, mock_connection, mock_timezone, mock_post_save, mock_counter_updated
+    ):
+        user = UserModel(id=2)
+        post = PostModel(id=1, reactions_count=3)
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = (
+            10,
+            "date joined",
+            True,
+            4,
+            '{"like": 4}',
+        )
 
-        user_reaction.save.assert_called_once()
+        result = post.react(user, 5)
 
-        assert result == user_reaction
-        assert user_reaction.reaction_type_id == 1
+        mock_cursor.execute.assert_called_once_with(
+            PostModel.get_react_sql(),
+            {
+                "now": mock_timezone.now.return_value,
+                "reaction_type_id": 5,
+                "user_id": 2,
+                "target_id": 1,
+            },
+        )
+        mock_post_save.send.assert_called_once_with(
+            sender=ReactionModel,
+            instance=result,
+            created=True,
+            update_fields=None,
+            raw=False,
+            using=mock_connection.alias,
+        )
+        mock_counter_updated.send.assert_called_once_with(
+            sender=PostModel,
+            fields=("reactions_count", "reactions_by_type"),
+            filters={"pk": 1},
+        )
 
-    def test_react_without_user_reaction(self):
-        user = Mock()
-        user_reaction = Mock()
-        mixin = ReactionsMixin()
-        mixin.reactions = Mock()
-        mixin.reactions.filter.return_value.first.return_value = None
-        mixin.reactions.create.return_value = user_reaction
+        assert result.id == 10
+        assert result.date_joined == "date joined"
+        assert result.reaction_type_id == 5
+        assert result.user == user
+        assert result.post == post
+        assert result._state.adding is False
+        assert post.reactions_count == 4
+        assert post.reactions_by_type == {"like": 4}
+
+    @patch("apps.social.models.counter_updated")
+    @patch("apps.social.models.post_save")
+    @patch("apps.social.models.connection")
+    def test_react_updating_reaction(
+        self, mock_connection, mock_post_save, mock_counter_updated
+    ):
+        comment = PostCommentModel(
+            id=1, reactions_count=3, reactions_by_type={"like": 3}
+        )
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = (
+            10,
+            "date joined",
+            False,
+            3,
+            '{"like": 2, "love": 1}',
+        )
 
-        result = mixin.react(user, 1)
-        mixin.reactions.filter.assert_called_once_with(user=user)
-        mixin.reactions.filter.return_value.first.assert_called_once()
-        mixin.reactions.create.assert_called_once_with(reaction_type_id=1, user=user)
+        result = comment.react(UserModel(id=2), 5)
 
-        assert result == user_reaction
+        assert mock_post_save.send.call_args.kwargs["created"] is False
+        mock_counter_updated.send.assert_called_once_with(
+            sender=PostCommentModel, fields=("reactions_by_type",), filters={"pk": 1}
+        )
+
+        assert result.comment == comment
+        assert comment.reactions_count == 3
+        assert comment.reactions_by_type == {"like": 2, "love": 1}
+
+    @patch("apps.social.models.counter_updated")
+    @patch("apps.social.models.post_save", Mock())
+    @patch("apps.social.models.connection")
+    def test_react_with_same_reaction_type(self, mock_connection, mock_counter_updated):
+        post = PostModel(id=1, reactions_count=3, reactions_by_type={"like": 3})
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = (10, "date joined", False, None, None)
+
+        post.react(UserModel(id=2), 5)
+
+        mock_counter_updated.send.assert_not_called()
+
+        assert post.reactions_count == 3
+        assert post.reactions_by_type == {"like": 3}
 
     def test_get_reaction_by_user(self):
         mock_user = Mock()
@@ -139,6 +248,47 @@ class TestReactionsMixin:
 
         assert result == mixin.reactions.filter.return_value.first.return_value
 
+    def test_get_reaction_by_user_with_attached_reactions(self):
+        mock_user = Mock(pk=1)
+        mock_reaction = Mock()
+
+        mixin = ReactionsMixin()
+        mixin.reactions = Mock()
+        mixin._reactions_by_user = {1: mock_reaction}
+
+        result = mixin.get_reaction_by_user(mock_user)
+
+        mixin.reactions.filter.assert_not_called()
+
+        assert result == mock_reaction
+
+    @patch("apps.social.models.ReactionModel")
+    def test_attach_reactions_by_user(self, mock_reaction_model):
+        mock_user = Mock(pk=1)
+        first_post, second_post = PostModel(id=1), PostModel(id=2)
+        mock_reaction = Mock(target_id=2)
+        mock_queryset = mock_reaction_model.objects.filter.return_value
+        mock_annotated = mock_queryset.select_related.return_value.annotate
+        mock_annotated.return_value.order_by.return_value = [mock_reaction]
+
+        result = PostModel.attach_reactions_by_user(
+            [first_post, second_post], mock_user
+        )
+
+        mock_reaction_model.objects.filter.assert_called_once_with(
+            user=mock_user, posts__in=[first_post, second_post]
+        )
+        mock_queryset.select_related.assert_called_once_with(
+            "reaction_type", "user__service"
+        )
+        mock_queryset.select_related.return_value.annotate.assert_called_once_with(
+            target_id=models.F("posts__id")
+        )
+
+        assert result == [first_post, second_post]
+        assert first_post._reactions_by_user == {1: None}
+        assert second_post._reactions_by_user == {1: mock_reaction}
+
 
 class TestReactionTypeModel:
     @classmethod
@@ -194,7 +344,7 @@ class TestReactionTypeModel:
         assert field.blank is True
 
     def test_length_fields(self):
-        assert len(self.model._meta.fields) == 8
+        assert len(self.model._meta.fields) == 14
 
 
 class TestReactionModel:
@@ -234,8 +384,99 @@ class TestReactionModel:
         assert field.remote_field.related_name == "reactions"
         assert field.remote_field.on_delete.__name__ == "CASCADE"
 
+    def test_post_field(self):
+        field = self.model._meta.get_field("post")
+
+        assert type(field) == models.ForeignKey
+        assert field.related_model is PostModel
+        assert field.verbose_name == "Post"
+        assert field.null is True
+        assert field.editable is False
+        assert field.remote_field.on_delete.__name__ == "CASCADE"
+
+    def test_comment_field(self):
+        field = self.model._meta.get_field("comment")
+
+        assert type(field) == models.ForeignKey
+        assert field.related_model is PostCommentModel
+        assert field.verbose_name == "Comment"
+        assert field.null is True
+        assert field.editable is False
+        assert field.remote_field.on_delete.__name__ == "CASCADE"
+
+    def test_meta_constraints(self):
+        constraints = {
+            constraint.name: constraint.fields
+            for constraint in self.model._meta.constraints
+        }
+
+        assert constraints == {
+            "unique_user_post_reaction": ("user", "post"),
+            "unique_user_comment_reaction": ("user", "comment"),
+        }
+
     def test_length_fields(self):
-        assert len(self.model._meta.fields) == 6
+        assert len(self.model._meta.fields) == 8
+
+    @pytest.mark.parametrize(
+        "target, model",
+        [({"post_id": 2}, PostModel), ({"comment_id": 3}, PostCommentModel)],
+    )
+    @patch("apps.social.models.transaction")
+    @patch.object(ReactionModel, "objects")
+    @patch("django.db.models.Model.delete")
+    @patch.object(PostCommentModel, "update_counters")
+    @patch.object(PostModel, "update_counters")
+    def test_delete(
+        self,
+        mock_post_update_counters,
+        mock_comment_update_counters,
+        mock_delete,
+        mock_objects,
+        mock_transaction,
+        target,
+        model,
+    ):
+        reaction = ReactionModel(
+            id=1, reaction_type=ReactionTypeModel(name="like"), **target
+        )
+        mock_update_counters, mock_other_update_counters = {
+            PostModel: (mock_post_update_counters, mock_comment_update_counters),
+            PostCommentModel: (mock_comment_update_counters, mock_post_update_counters),
+        }[model]
+
+        result = reaction.delete()
+
+        mock_transaction.atomic.assert_called_once_with()
+        mock_objects.select_for_update.return_value.filter.assert_called_once_with(pk=1)
+        mock_other_update_counters.assert_not_called()
+        (values,) = mock_update_counters.call_args.args
+        assert mock_update_counters.call_args.kwargs == {"reactions": reaction}
+        assert values["reactions_count"] == Greatest(F("reactions_count") + -1, 0)
+        assert isinstance(values["reactions_by_type"], JSONCounterIncrement)
+        assert [
+            source.value
+            for source in values["reactions_by_type"].source_expressions[1:]
+        ] == ["like", -1]
+
+        mock_delete.assert_called_once()
+        assert result == mock_delete.return_value
+
+    @patch("apps.social.models.transaction")
+    @patch.object(ReactionModel, "objects")
+    @patch("django.db.models.Model.delete")
+    @patch.object(PostModel, "update_counters")
+    def test_delete_already_deleted(
+        self, mock_update_counters, mock_delete, mock_objects, _mock_transaction
+    ):
+        mock_objects.select_for_update.return_value.filter.return_value = []
+        reaction = ReactionModel(id=1, reaction_type=ReactionTypeModel(name="like"))
+
+        result = reaction.delete()
+
+        mock_update_counters.assert_not_called()
+        mock_delete.assert_not_called()
+        assert result == (0, {})
 
 
 class TestPostCommentModel:
@@ -312,13 +553,37 @@ class TestPostCommentModel:
         assert field.remote_field.related_name == "post_comments"
         assert field.remote_field.on_delete.__name__ == "CASCADE"
 
+    def test_reactions_count_field(self):
+        field = self.model._meta.get_field("reactions_count")
+
+        assert type(field) == models.PositiveIntegerField
+        assert field.verbose_name == "Reactions Count"
+        assert field.default == 0
+        assert field.editable is False
+
+    def test_comments_count_field(self):
+        field = self.model._meta.get_field("comments_count")
+
+        assert type(field) == models.PositiveIntegerField
+        assert field.verbose_name == "Answers Count"
+        assert field.default == 0
+        assert field.editable is False
+
+    def test_reactions_by_type_field(self):
+        field = self.model._meta.get_field("reactions_by_type")
+
+        assert type(field) == models.JSONField
+        assert field.verbose_name == "Reactions By Type"
+        assert field.default is dict
+        assert field.editable is False
+
     def test_is_answer(self):
         post_comment = PostCommentModel()
 
         assert post_comment.is_answer is False
 
     def test_length_fields(self):
-        assert len(self.model._meta.fields) == 10
+        assert len(self.model._meta.fields) == 19
 
     @patch.object(PostCommentModel, "save")
     def test_delete(self, mock_save):
@@ -329,6 +594,66 @@ class TestPostCommentModel:
 
         assert post_comment.is_deleted is True
 
+    @patch.object(PostCommentModel, "_update_thread_counters")
+    @patch.object(PostCommentModel, "save")
+    def test_delete_updates_thread_counters(
+        self, mock_save, mock_update_thread_counters
+    ):
+        post_comment = PostCommentModel()
+        post_comment.delete()
+
+        mock_update_thread_counters.assert_called_once_with(-1)
+
+    @patch.object(PostCommentModel, "_update_thread_counters")
+    @patch.object(PostCommentModel, "save")
+    def test_delete_already_deleted(self, mock_save, mock_update_thread_counters):
+        post_comment = PostCommentModel(is_deleted=True)
+        post_comment.delete()
+
+        mock_save.assert_not_called()
+        mock_update_thread_counters.assert_not_called()
+
+    @patch.object(PostCommentModel, "update_counter")
+    @patch.object(PostModel, "update_counter")
+    def test_update_thread_counters(
+        self, mock_post_update_counter, mock_comment_update_counter
+    ):
+        post_comment = PostCommentModel(post_id=1, answer_id=2)
+
+        post_comment._update_thread_counters(1)
+
+        mock_post_update_counter.assert_called_once_with("comments_count", 1, pk=1)
+        mock_comment_update_counter.assert_called_once_with("comments_count", 1, pk=2)
+
+    @patch.object(PostCommentModel, "update_counter")
+    @patch.object(PostModel, "update_counter")
+    def test_update_thread_counters_without_parents(
+        self, mock_post_update_counter, mock_comment_update_counter
+    ):
+        PostCommentModel()._update_thread_counters(1)
+
+        mock_post_update_counter.assert_not_called()
+        mock_comment_update_counter.assert_not_called()
+
+    @patch.object(PostCommentModel, "_update_thread_counters")
+    @patch("django.db.models.Model.save")
+    def test_save_new_comment(self, mock_save, mock_update_thread_counters):
+        PostCommentModel().save()
+
+        mock_save.assert_called_once()
+        mock_update_thread_counters.assert_called_once_with(1)
+
+    @patch.object(PostCommentModel, "_update_thread_counters")
+    @patch("django.db.models.Model.save")
+    def test_save_existing_comment(self, mock_save, mock_update_thread_counters):
+        post_comment = PostCommentModel()
+        post_comment._state.adding = False
+
+        post_comment.save()
+
+        mock_save.assert_called_once()
+        mock_update_thread_counters.assert_not_called()
+
 
 class TestEventModel:
     @classmethod
@@ -413,6 +738,8 @@ class TestEventModel:
             Like:
             <br>
             John Doe;john@mail.com,Elisa Jax;elisa@mail.com,Edward,edward.us@mail.com,...
+            <br>
+            For large lists, upload a CSV or XLSX file in Guest Imports instead.
         """  # noqa: E501
         )
 
@@ -434,7 +761,7 @@ class TestEventModel:
         assert field.blank is True
 
     def test_length_fields(self):
-        assert len(self.model._meta.fields) == 15
+        assert len(self.model._meta.fields) == 21
 
     def test_get_guests(self):
         event = EventModel(guests="Some Name1;email1,Some Name2;email2")
@@ -573,62 +900,31 @@ class TestEventModel:
     @patch.object(
         EventModel,
         "get_guests",
-        return_value=["Some Name;email", "Some Name;email"],
+        return_value=["Some Name;email", "other"],
     )
-    @patch.object(
-        EventModel, "_get_guest_name_and_email", return_value=["Some Name", "email"]
-    )
-    @patch.object(EventModel, "_get_guest_full_name", return_value=("Some", "Name"))
-    @patch("apps.social.models.UserModel")
-    @patch("apps.social.models.CreateUserPipeline")
+    @patch("apps.social.models.CreateGuestsPipeline")
     def test_create_guests(
         self,
-        mock_create_user_pipeline,
-        mock_user_model,
-        mock_get_guest_full_name,
-        mock_get_guest_name_and_email,
+        mock_create_guests_pipeline,
         mock_get_guests,
         mock_validate_guests_format,
     ):
-        event = EventModel(service=ServiceModel())
-        mock_user_model.objects.filter.return_value.exists.side_effect = [
-            True,
-            False,
-        ]
+        event = EventModel(service=ServiceModel(), send_email_to_guests=True)
 
-        event.create_guests()
+        result = event.create_guests()
 
         mock_validate_guests_format.assert_called_once()
         mock_get_guests.assert_called_once()
-        mock_get_guest_name_and_email.assert_has_calls(
-            [call("Some Name;email"), call("Some Name;email")]
-        )
-        mock_get_guest_full_name.assert_has_calls(
-            [call("Some Name"), call("Some Name")]
-        )
-        mock_user_model.objects.make_random_password.assert_called_once_with(
-            6, "0123456789"
-        )
-        mock_create_user_pipeline.assert_called_once_with(
-            email="email",
-            password=mock_user_model.objects.make_random_password.return_value,
-            service=event.service,
-            first_name="Some",
-            last_name="Name",
+        mock_create_guests_pipeline.assert_called_once_with(
             event=event,
-            is_verified=True,
-            send_mail=event.send_email_to_guests,
-            email_type="guest_invitation",
+            guests=[
+                {"first_name": "Some", "last_name": "Name", "email": "email"},
+                {"first_name": "Guest", "last_name": "other", "email": "other"},
+            ],
+            send_mail=True,
         )
-        mock_user_model.objects.filter.assert_has_calls(
-            [
-                call(email="email", event=event),
-                call().exists(),
-                call(email="email", event=event),
-                call().exists(),
-            ]
-        )
-        mock_create_user_pipeline.return_value.run.assert_called_once()
+
+        assert result == mock_create_guests_pipeline.return_value.run.return_value
 
 
 class TestAITextReportModel:
@@ -781,20 +1077,53 @@ class TestPostModel:
         assert field.null is True
         assert field.blank is True
 
+    def test_ai_report_hash_field(self):
+        field = self.model._meta.get_field("ai_report_hash")
+
+        assert type(field) == models.CharField
+        assert field.verbose_name == "AI Report Hash"
+        assert field.max_length == 64
+        assert field.blank is True
+        assert field.default == ""
+        assert field.editable is False
+
+    def test_reactions_count_field(self):
+        field = self.model._meta.get_field("reactions_count")
+
+        assert type(field) == models.PositiveIntegerField
+        assert field.verbose_name == "Reactions Count"
+        assert field.default == 0
+        assert field.editable is False
+
+    def test_comments_count_field(self):
+        field = self.model._meta.get_field("comments_count")
+
+        assert type(field) == models.PositiveIntegerField
+        assert field.verbose_name == "Comments Count"
+        assert field.default == 0
+        assert field.editable is False
+
+    def test_reactions_by_type_field(self):
+        field = self.model._meta.get_field("reactions_by_type")
+
+        assert type(field) == models.JSONField
+        assert field.verbose_name == "Reactions By Type"
+        assert field.default is dict
+        assert field.editable is False
+
     def test_length_fields(self):
-        assert len(self.model._meta.fields) == 11
+        assert len(self.model._meta.fields) == 21
 
-    def test_count_reactions(self):
-        reaction = Mock(reaction_type=Mock())
-        reaction.reaction_type.name = "Like"
-        mock_self = Mock(reactions=Mock(all=Mock(return_value=[reaction])))
+    def test_meta_indexes(self):
+        (index,) = self.model._meta.indexes
 
-        result = PostModel.count_reactions(mock_self)
+        assert index.name == "post_feed_idx"
+        assert index.fields == ["service", "event", "is_active", "date_joined"]
 
-        mock_self.reactions.all.assert_called_once()
-        assert result == {
-            "Like": 1,
-        }
+    def test_count_reactions(self):
+        post = PostModel(reactions_by_type={"Like": 1})
+
+        assert post.count_reactions() == {"Like": 1}
 
     @patch.object(PostModel, "count_reactions", return_value={"Like": 1})
     def test_format_reactions_to_text(self, mock_count_reactions):
@@ -844,35 +1173,426 @@ class TestPostModel:
         """
         )
 
-    def test_generate_ai_text_report(self):
+    @patch.object(PostModel, "get_message_to_send", return_value="Message")
+    def test_get_ai_report_prompt(self, _mock_get_message_to_send):
+        ai_text_report = AITextReportModel(pre_set="Pre Set", text_ai="dummy")
+        post = PostModel(ai_text_report=ai_text_report)
+
+        digest, prompt = post.get_ai_report_prompt()
+
+        assert digest == get_ai_report_hash("dummy", "Pre Set", "Message")
+        assert prompt == (DummyTextAI, "Pre Set", "Message")
+
+    @patch("apps.social.models.get_ai_reports")
+    @patch("apps.social.models.PostModel.objects.bulk_update")
+    def test_generate_ai_text_reports(self, mock_bulk_update, mock_get_ai_reports):
+        prompt = Mock()
+        without_config = Mock(ai_text_report_id=None)
+        unchanged = Mock(ai_report="Report", ai_report_hash="unchanged")
+        unchanged.get_ai_report_prompt.return_value = ("unchanged", prompt)
+        changed = Mock(ai_report="Report", ai_report_hash="old")
+        changed.get_ai_report_prompt.return_value = ("new", prompt)
+        same_prompt = Mock(ai_report=None, ai_report_hash="")
+        same_prompt.get_ai_report_prompt.return_value = ("new", prompt)
+        failed = Mock(ai_report=None, ai_report_hash="")
+        failed.get_ai_report_prompt.return_value = ("failed", prompt)
+        mock_get_ai_reports.return_value = {"new": "New Report"}
+
+        result = PostModel.generate_ai_text_reports(
+            [without_config, unchanged, changed, same_prompt, failed]
+        )
+
+        without_config.get_ai_report_prompt.assert_not_called()
+        mock_get_ai_reports.assert_called_once_with({"new": prompt, "failed": prompt})
+        mock_bulk_update.assert_called_once_with(
+            [changed, same_prompt], ["ai_report", "ai_report_hash"]
+        )
+        assert changed.ai_report == "New Report"
+        assert changed.ai_report_hash == "new"
+        assert same_prompt.ai_report == "New Report"
+        assert failed.ai_report is None
+        assert result == {"generated": 2, "skipped": 1, "failed": 1}
+
+    @patch.object(PostModel, "generate_ai_text_reports")
+    def test_generate_ai_text_report(self, mock_generate_ai_text_reports):
+        post = PostModel()
+
+        result = post.generate_ai_text_report()
+
+        mock_generate_ai_text_reports.assert_called_once_with([post])
+        assert result == mock_generate_ai_text_reports.return_value
+
+    @patch("apps.social.models.UserModel.objects.filter")
+    @patch("apps.social.models.transaction")
+    def test_notify_new_post(self, mock_transaction, mock_user_model_objects_filter):
         mock_self = Mock()
+        mock_jobs = mock_self.notification_jobs
+        mock_jobs.exclude.return_value.first.return_value = None
 
-        PostModel.generate_ai_text_report(mock_self)
+        result = PostModel.notify_new_post(mock_self)
 
-        mock_self.get_message_to_send.assert_called_once()
-        mock_text_ai = mock_self.ai_text_report.text_ai_client
-        mock_text_ai.assert_called_once_with(
-            mock_self.ai_text_report.pre_set, mock_self.get_message_to_send.return_value
+        mock_jobs.exclude.assert_called_once_with(status="done")
+        mock_user_model_objects_filter.assert_called_once_with(
+            event_id=mock_self.event_id, is_active=True
         )
+        mock_jobs.create.assert_called_once_with(
+            guests_count=mock_user_model_objects_filter.return_value.count.return_value
+        )
+        (callback,), _ = mock_transaction.on_commit.call_args
+
+        assert result == mock_jobs.create.return_value
+        assert callback.func is run_post_notification_job
+        assert callback.args == (mock_jobs.create.return_value.pk,)
+
+    @patch("apps.social.models.transaction")
+    def test_notify_new_post_resumes_unfinished_job(self, mock_transaction):
+        mock_self = Mock()
+        mock_jobs = mock_self.notification_jobs
+
+        result = PostModel.notify_new_post(mock_self)
+
+        mock_jobs.create.assert_not_called()
+        mock_transaction.on_commit.assert_called_once()
+
+        assert result == mock_jobs.exclude.return_value.first.return_value
+
+    @patch("apps.social.models.transaction")
+    def test_notify_new_post_without_event(self, mock_transaction):
+        mock_self = Mock(event_id=None)
+
+        assert PostModel.notify_new_post(mock_self) is None
+        mock_transaction.on_commit.assert_not_called()
+
+
+class TestPostNotificationJobModel:
+    @classmethod
+    def setup_class(cls):
+        cls.model = PostNotificationJobModel
+
+    def test_parent_class(self):
+        assert issubclass(self.model, BaseModel)
+
+    def test_meta_verbose_name(self):
+        assert self.model._meta.verbose_name == "Post Notification Job"
 
-        mock_client = mock_text_ai.return_value
-        mock_client.get_response.assert_called_once()
+    def test_meta_verbose_name_plural(self):
+        assert self.model._meta.verbose_name_plural == "Post Notification Jobs"
+
+    def test_str(self):
+        job = PostNotificationJobModel(
+            post=PostModel(author=UserModel(first_name="John")), status="running"
+        )
+
+        assert str(job) == "John's post's notification (running)"
+
+    def test_post_field(self):
+        field = self.model._meta.get_field("post")
+
+        assert type(field) == models.ForeignKey
+        assert field.related_model is PostModel
+        assert field.remote_field.related_name == "notification_jobs"
+        assert field.remote_field.on_delete == models.CASCADE
+
+    def test_status_field(self):
+        field = self.model._meta.get_field("status")
+
+        assert type(field) == models.CharField
+        assert field.choices == self.model.STATUS_CHOICES
+        assert field.default == "pending"
+
+    def test_length_fields(self):
+        assert len(self.model._meta.fields) == 10
+
+    @pytest.mark.parametrize(
+        "status, notified_count, guests_count, progress",
+        [
+            ("running", 0, 0, 0),
+            ("done", 0, 0, 100),
+            ("running", 250, 1000, 25),
+            ("done", 1010, 1000, 100),
+        ],
+    )
+    def test_progress(self, status, notified_count, guests_count, progress):
+        job = PostNotificationJobModel(
+            status=status, notified_count=notified_count, guests_count=guests_count
+        )
 
-        mock_self.save.assert_called_once()
+        assert job.progress == progress
+
+    @patch("apps.social.models.UserModel.objects.filter")
+    def test_get_pending_guests(self, mock_user_model_objects_filter):
+        mock_self = Mock(last_guest_id=10)
+
+        result = PostNotificationJobModel.get_pending_guests(mock_self)
+
+        mock_user_model_objects_filter.assert_called_once_with(
+            event_id=mock_self.post.event_id, is_active=True, pk__gt=10
+        )
+        mock_select_related = mock_user_model_objects_filter.return_value.select_related
+        mock_select_related.assert_called_once_with("service", "event")
+        mock_select_related.return_value.order_by.assert_called_once_with("pk")
+
+        assert result == mock_select_related.return_value.order_by.return_value
+
+    def test_has_email_config(self):
+        mock_self = Mock(EMAIL_TYPE="new_post_notification")
+
+        result = PostNotificationJobModel.has_email_config(mock_self)
+
+        mock_email_configs = mock_self.post.event.email_configs
+        mock_email_configs.filter.assert_called_once_with(
+            email_config_type="new_post_notification"
+        )
+
+        assert result == mock_email_configs.filter.return_value.exists.return_value
+
+    @patch.object(PostNotificationJobModel, "save")
+    def test_save_progress(self, mock_save):
+        job = PostNotificationJobModel()
+
+        job.save_progress(status="done", notified_count=3)
+
+        assert job.status == "done"
+        assert job.notified_count == 3
+        mock_save.assert_called_once_with(
+            update_fields=["status", "notified_count", "date_modified"]
+        )
+
+    @staticmethod
+    def get_job_mock(guests_chunks):
+        mock_self = Mock(
+            spec=PostNotificationJobModel,
+            notified_count=0,
+            chunk_size=2,
+            time_budget=300,
+            STATUS_PENDING="pending",
+            STATUS_DONE="done",
+            STATUS_FAILED="failed",
+            EMAIL_TYPE="new_post_notification",
+        )
+        mock_self.claim.return_value = True
+        mock_self.has_email_config.return_value = True
+        mock_self.get_pending_guests.return_value.__getitem__ = Mock(
+            side_effect=guests_chunks
+        )
+
+        def save_progress(**fields):
+            for field, value in fields.items():
+                setattr(mock_self, field, value)
+
+        mock_self.save_progress.side_effect = save_progress
+
+        return mock_self
 
     @patch("apps.social.models.NotifyGuestNewPostPipeline")
-    def test_notify_new_post(self, mock_notify_guest_new_post_pipeline):
-        mock_guests = [Mock()]
-        mock_self = Mock()
-        mock_self.event.users.filter.return_value = mock_guests
+    def test_run(self, mock_pipeline):
+        guests = [Mock(pk=1), Mock(pk=2), Mock(pk=3)]
+        mock_self = self.get_job_mock([guests[:2], guests[2:], []])
+
+        PostNotificationJobModel.run(mock_self)
+
+        mock_pipeline.assert_has_calls(
+            [call(users=guests[:2]), call().run(), call(users=guests[2:]), call().run()]
+        )
+        assert mock_self.last_guest_id == 3
+        assert mock_self.notified_count == 3
+        assert mock_self.status == "done"
 
-        PostModel.notify_new_post(mock_self)
+    @patch("apps.social.models.NotifyGuestNewPostPipeline")
+    def test_run_not_claimed(self, mock_pipeline):
+        mock_self = self.get_job_mock([])
+        mock_self.claim.return_value = False
+
+        PostNotificationJobModel.run(mock_self)
+
+        mock_self.has_email_config.assert_not_called()
+        mock_pipeline.assert_not_called()
+
+    @patch("apps.social.models.NotifyGuestNewPostPipeline")
+    def test_run_without_email_config(self, mock_pipeline):
+        mock_self = self.get_job_mock([])
+        mock_self.has_email_config.return_value = False
+
+        PostNotificationJobModel.run(mock_self)
+
+        mock_pipeline.assert_not_called()
+        mock_self.save_progress.assert_called_once_with(
+            status="failed",
+            error="The event has no new_post_notification email config.",
+        )
+
+    @patch("apps.social.models.NotifyGuestNewPostPipeline")
+    def test_run_failure_keeps_the_checkpoint(self, mock_pipeline):
+        guests = [Mock(pk=1), Mock(pk=2), Mock(pk=3)]
+        mock_self = self.get_job_mock([guests[:2], guests[2:]])
+        mock_pipeline.return_value.run.side_effect = [None, Exception("Timeout")]
+
+        with pytest.raises(Exception, match="Timeout"):
+            PostNotificationJobModel.run(mock_self)
+
+        assert mock_self.last_guest_id == 2
+        assert mock_self.notified_count == 2
+        assert mock_self.status == "failed"
+        assert mock_self.error == "Timeout"
 
-        mock_self.event.users.filter.assert_called_once_with(is_active=True)
-        mock_notify_guest_new_post_pipeline.assert_called_once_with(user=mock_guests[0])
+    @patch("apps.social.models.run_post_notification_job")
+    @patch("apps.social.models.NotifyGuestNewPostPipeline")
+    def test_run_continues_after_the_time_budget(self, _mock_pipeline, mock_task):
+        guests = [Mock(pk=1), Mock(pk=2), Mock(pk=3)]
+        mock_self = self.get_job_mock([guests[:2], guests[2:]])
+        mock_self.time_budget = 0
+
+        PostNotificationJobModel.run(mock_self)
+
+        mock_task.assert_called_once_with(mock_self.pk)
+        assert mock_self.last_guest_id == 2
+        assert mock_self.status == "pending"
+
+
+class TestGuestImportModel:
+    @classmethod
+    def setup_class(cls):
+        cls.model = GuestImportModel
+
+    def test_parent_class(self):
+        assert issubclass(self.model, BaseModel)
 
-        mock_pipeline = mock_notify_guest_new_post_pipeline.return_value
-        mock_pipeline.run.assert_called_once()
+    def test_meta_verbose_name(self):
+        assert self.model._meta.verbose_name == "Guest Import"
+
+    def test_meta_verbose_name_plural(self):
+        assert self.model._meta.verbose_name_plural == "Guest Imports"
+
+    def test_str(self):
+        guest_import = GuestImportModel(event=EventModel(title="Foo"), status="done")
+
+        assert str(guest_import) == "Foo's guest import (done)"
+
+    def test_event_field(self):
+        field = self.model._meta.get_field("event")
+
+        assert type(field) == models.ForeignKey
+        assert field.related_model is EventModel
+        assert field.remote_field.related_name == "guest_imports"
+        assert field.remote_field.on_delete == models.CASCADE
+
+    def test_file_field(self):
+        field = self.model._meta.get_field("file")
+
+        assert type(field) == models.FileField
+        assert field.upload_to == guest_import_directory_path
+        assert field.validators[0].allowed_extensions == ["csv", "xlsx"]
+
+    def test_length_fields(self):
+        assert len(self.model._meta.fields) == 10
+
+    def test_build_row(self):
+        guest_import = GuestImportModel()
+
+        row = guest_import.build_row(2, "John", "john@email.com")
+
+        assert row.guest_import is guest_import
+        assert (row.line, row.name, row.email) == (2, "John", "john@email.com")
+        assert row.status == "pending"
+        assert row.error is None
+
+    def test_build_invalid_row(self):
+        row = GuestImportModel().build_row(3, "John", "john")
+
+        assert row.status == "invalid"
+        assert row.error == "Wrong email format."
+
+    @pytest.mark.parametrize(
+        "name, first_name, last_name",
+        [
+            ("John Doe Jr", "John", "Doe Jr"),
+            ("John", "John", ""),
+            ("", "Guest", "john@email.com"),
+        ],
+    )
+    def test_get_guest(self, name, first_name, last_name):
+        guest_import = GuestImportModel(event=EventModel())
+        row = GuestImportRowModel(name=name, email="john@email.com")
+
+        assert guest_import.get_guest(row) == {
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": "john@email.com",
+        }
+
+    def test_run(self):
+        mock_self = Mock(spec=GuestImportModel, STATUS_DONE="done")
+        mock_self.claim.return_value = True
+
+        GuestImportModel.run(mock_self)
+
+        mock_self.stage.assert_called_once_with()
+        mock_self.create_guests.assert_called_once_with()
+        mock_self.save_progress.assert_called_once_with(status="done")
+
+    def test_run_not_claimed(self):
+        mock_self = Mock(spec=GuestImportModel)
+        mock_self.claim.return_value = False
+
+        GuestImportModel.run(mock_self)
+
+        mock_self.stage.assert_not_called()
+
+    def test_run_failure(self):
+        mock_self = Mock(spec=GuestImportModel, STATUS_FAILED="failed")
+        mock_self.claim.return_value = True
+        mock_self.create_guests.side_effect = Exception("Timeout")
+
+        with pytest.raises(Exception, match="Timeout"):
+            GuestImportModel.run(mock_self)
+
+        mock_self.save_progress.assert_called_once_with(
+            status="failed", error="Timeout"
+        )
+
+
+class TestGuestImportRowModel:
+    @classmethod
+    def setup_class(cls):
+        cls.model = GuestImportRowModel
+
+    def test_parent_class(self):
+        assert issubclass(self.model, BaseModel)
+
+    def test_meta_verbose_name(self):
+        assert self.model._meta.verbose_name == "Guest Import Row"
+
+    def test_meta_verbose_name_plural(self):
+        assert self.model._meta.verbose_name_plural == "Guest Import Rows"
+
+    def test_meta_indexes(self):
+        (index,) = self.model._meta.indexes
+
+        assert index.name == "guest_import_row_email_idx"
+        assert index.fields == ["guest_import", "email"]
+
+    def test_str(self):
+        row = GuestImportRowModel(email="john@email.com", status="exists")
+
+        assert str(row) == "john@email.com (exists)"
+
+    def test_guest_import_field(self):
+        field = self.model._meta.get_field("guest_import")
+
+        assert type(field) == models.ForeignKey
+        assert field.related_model is GuestImportModel
+        assert field.remote_field.related_name == "rows"
+        assert field.remote_field.on_delete == models.CASCADE
+
+    def test_status_field(self):
+        field = self.model._meta.get_field("status")
+
+        assert type(field) == models.CharField
+        assert field.choices == self.model.STATUS_CHOICES
+        assert field.default == "pending"
+
+    def test_length_fields(self):
+        assert len(self.model._meta.fields) == 10
 
 
 class TestMissionTypeModel:
@@ -1017,13 +1737,14 @@ class TestMissionModel:
         assert field.default == 0
 
     def test_length_fields(self):
-        assert len(self.model._meta.fields) == 12
+        assert len(self.model._meta.fields) == 18
 
     def test_get_completed_info(self):
-        mock_user = Mock()
-        mock_self = Mock()
+        mock_user = Mock(pk=1)
+        mock_self = Mock(spec=["interactions"])
 
         result = self.model.get_completed_info(mock_self, mock_user)
+        self.model.get_completed_info(mock_self, mock_user)
 
         mock_self.interactions.filter.assert_called_once_with(
             user=mock_user,
@@ -1032,23 +1753,54 @@ class TestMissionModel:
 
         assert result == (mock_self.interactions.filter.return_value.first.return_value)
 
-    def test_is_completed(self):
+    def test_get_completed_info_attached(self):
+        interaction = Mock()
+        mock_self = Mock(_interactions_by_user={1: interaction})
+
+        result = self.model.get_completed_info(mock_self, Mock(pk=1))
+
+        mock_self.interactions.filter.assert_not_called()
+        assert result is interaction
+
+    @pytest.mark.parametrize("interaction, expected", [(Mock(), True), (None, False)])
+    def test_is_completed(self, interaction, expected):
         mock_user = Mock()
         mock_self = Mock()
+        mock_self.get_completed_info.return_value = interaction
 
         result = self.model.is_completed(mock_self, mock_user)
 
-        mock_self.interactions.filter.assert_called_once_with(user=mock_user)
+        mock_self.get_completed_info.assert_called_once_with(mock_user)
+        assert result is expected
 
-        mock_self.interactions.filter.return_value.exists.assert_called_once()
+    @patch("apps.social.models.MissionInteractionModel.objects.filter")
+    def test_attach_interactions_by_user(self, mock_filter):
+        missions = [MissionModel(pk=1), MissionModel(pk=2)]
+        user = Mock(pk=3)
+        first, second = Mock(mission_id=1), Mock(mission_id=1)
+        mock_filter.return_value.order_by.return_value = [first, second]
 
-        assert result == (
-            mock_self.interactions.filter.return_value.exists.return_value
-        )
+        result = self.model.attach_interactions_by_user(missions, user)
+
+        mock_filter.assert_called_once_with(user=user, mission__in=missions)
+        mock_filter.return_value.order_by.assert_called_once_with("pk")
+        assert result is missions
+        assert missions[0]._interactions_by_user == {3: first}
+        assert missions[1]._interactions_by_user == {3: None}
 
+    @patch("apps.social.models.UserModel.objects")
+    @patch("apps.social.models.transaction")
+    @patch("apps.social.models.score_mission_completion")
     @patch("apps.social.models.MissionInteractionModel")
-    def test_complete(self, mock_mission_interaction_model):
+    def test_complete(
+        self,
+        mock_mission_interaction_model,
+        mock_score_mission_completion,
+        mock_transaction,
+        mock_user_objects,
+    ):
         mock_self = Mock()
+        mock_self.interactions.filter.return_value.first.return_value = None
         mock_user = Mock()
         mock_attachment = Mock()
         mock_content = Mock()
@@ -1057,6 +1809,11 @@ class TestMissionModel:
             mock_self, mock_user, mock_attachment, mock_content
         )
 
+        mock_transaction.atomic.assert_called_once_with()
+        mock_user_objects.select_for_update.return_value.filter.assert_called_once_with(
+            pk=mock_user.pk
+        )
+        mock_self.interactions.filter.assert_called_once_with(user=mock_user)
         mock_mission_interaction_model.objects.create.assert_called_once_with(
             user=mock_user,
             mission=mock_self,
@@ -1064,8 +1821,37 @@ class TestMissionModel:
             attachment=mock_attachment,
         )
 
+        mock_score_mission_completion.assert_called_once_with(mock_self, mock_user.pk)
+
         assert result == (mock_mission_interaction_model.objects.create.return_value)
 
+    @patch("apps.social.models.UserModel.objects", Mock())
+    @patch("apps.social.models.transaction", MagicMock())
+    @patch("apps.social.models.score_mission_completion")
+    @patch("apps.social.models.MissionInteractionModel")
+    def test_complete_already_completed(
+        self, mock_mission_interaction_model, mock_score_mission_completion
+    ):
+        mock_self = Mock()
+
+        result = self.model.complete(mock_self, Mock())
+
+        mock_mission_interaction_model.objects.create.assert_not_called()
+        mock_score_mission_completion.assert_not_called()
+        assert result == mock_self.interactions.filter.return_value.first.return_value
+
+    @patch("apps.social.models.UserModel.objects", Mock())
+    @patch("apps.social.models.transaction", MagicMock())
+    @patch("apps.social.models.score_mission_completion", Mock())
+    @patch("apps.social.models.MissionInteractionModel")
+    def test_complete_clears_the_attached_interaction(self, _mock_interaction_model):
+        mock_user = Mock(pk=1)
+        mock_self = Mock(_interactions_by_user={1: None, 2: None})
+
+        self.model.complete(mock_self, mock_user)
+
+        assert mock_self._interactions_by_user == {2: None}
+
 
 class TestMissionInteractionModel:
     @classmethod
@@ -1124,7 +1910,7 @@ class TestMissionInteractionModel:
         assert field.blank is True
 
     def test_length_fields(self):
-        assert len(self.model._meta.fields) == 8
+        assert len(self.model._meta.fields) == 14
 
 
 class TestLoginQuestions:
@@ -1292,3 +2078,177 @@ class TestLoginAnswer:
 
     def test_length_fields(self):
         assert len(self.model._meta.fields) == 7
+
+
+@patch("apps.social.models.PostFeedCache")
+def test_invalidate_feed_on_post_change(mock_post_feed_cache):
+    instance = Mock()
+
+    invalidate_feed_on_post_change(PostModel, instance)
+
+    mock_post_feed_cache.invalidate.assert_called_once_with(
+        instance.service_id, instance.event_id
+    )
+
+
+@patch("apps.social.models.PostModel.objects")
+@patch("apps.social.models.PostFeedCache")
+def test_invalidate_feed_on_author_change(mock_post_feed_cache, mock_post_objects):
+    instance = Mock()
+    scopes = mock_post_objects.filter.return_value.values_list.return_value
+    scopes.distinct.return_value = [(1, None), (1, 2)]
+
+    invalidate_feed_on_author_change(UserModel, instance, created=False)
+
+    mock_post_objects.filter.assert_called_once_with(author=instance)
+    assert mock_post_feed_cache.invalidate.call_args_list == [
+        call(1, None),
+        call(1, 2),
+    ]
+
+
+@patch("apps.social.models.PostFeedCache")
+def test_invalidate_feed_on_author_created(mock_post_feed_cache):
+    invalidate_feed_on_author_change(UserModel, Mock(), created=True)
+
+    mock_post_feed_cache.invalidate.assert_not_called()
+
+
+@patch("apps.social.models.publish_to_feed")
+@patch("apps.social.models.PostFeedCache")
+def test_notify_post_counter_change(mock_post_feed_cache, mock_publish_to_feed):
+    mock_sender = Mock()
+    mock_values = mock_sender.objects.filter.return_value.values
+    mock_values.return_value = [
+        {"id": 3, "service_id": 1, "event_id": 2, "reactions_count": 1},
+        {"id": 4, "service_id": 1, "event_id": 2, "reactions_count": 0},
+    ]
+
+    notify_post_counter_change(mock_sender, filters={"pk__in": [3, 4]})
+
+    mock_sender.objects.filter.assert_called_once_with(pk__in=[3, 4])
+    mock_values.assert_called_once_with(
+        "id",
+        "service_id",
+        "event_id",
+        "reactions_count",
+        "reactions_by_type",
+        "comments_count",
+    )
+    mock_publish_to_feed.assert_has_calls(
+        [
+            call(
+                1,
+                2,
+                {"type": "post.counters", "data": {"id": 3, "reactions_count": 1}},
+            ),
+            call(
+                1,
+                2,
+                {"type": "post.counters", "data": {"id": 4, "reactions_count": 0}},
+            ),
+        ]
+    )
+    mock_post_feed_cache.invalidate.assert_called_once_with(1, 2)
+
+
+@patch("apps.social.models.publish_to_feed")
+def test_publish_created_post(mock_publish_to_feed):
+    instance = Mock()
+    instance.attachment_type = "image"
+
+    publish_created_post(PostModel, instance, created=True)
+
+    mock_publish_to_feed.assert_called_once_with(
+        instance.service_id,
+        instance.event_id,
+        {
+            "type": "post.created",
+            "data": {
+                "id": instance.id,
+                "author": instance.author_id,
+                "description": instance.description,
+                "attachment_type": "image",
+                "date_joined": instance.date_joined.isoformat.return_value,
+            },
+        },
+    )
+
+
+@patch("apps.social.models.publish_to_feed")
+def test_publish_created_post_not_created(mock_publish_to_feed):
+    publish_created_post(PostModel, Mock(), created=False)
+
+    mock_publish_to_feed.assert_not_called()
+
+
+@patch("apps.social.models.publish_to_feed")
+def test_publish_created_comment(mock_publish_to_feed):
+    instance = Mock(is_deleted=False)
+
+    publish_created_comment(PostCommentModel, instance, created=True)
+
+    mock_publish_to_feed.assert_called_once_with(
+        instance.post.service_id,
+        instance.post.event_id,
+        {
+            "type": "comment.created",
+            "data": {
+                "id": instance.id,
+                "post": instance.post.id,
+                "answer": instance.answer_id,
+                "author": instance.author_id,
+                "content": instance.content,
+                "date_joined": instance.date_joined.isoformat.return_value,
+            },
+        },
+    )
+
+
+@patch("apps.social.models.publish_to_feed")
+def test_publish_created_comment_answer(mock_publish_to_feed):
+    instance = Mock(is_deleted=False, post_id=None)
+
+    publish_created_comment(PostCommentModel, instance, created=True)
+
+    assert mock_publish_to_feed.call_args[0][0] == instance.answer.post.service_id
+    assert mock_publish_to_feed.call_args[0][2]["data"]["post"] == (
+        instance.answer.post.id
+    )
+
+
+@pytest.mark.parametrize(
+    "created, is_deleted, post_id, answer",
+    [(False, False, 1, None), (True, True, 1, None), (True, False, None, None)],
+)
+@patch("apps.social.models.publish_to_feed")
+def test_publish_created_comment_skipped(
+    mock_publish_to_feed, created, is_deleted, post_id, answer
+):
+    instance = Mock(is_deleted=is_deleted, post_id=post_id, answer=answer)
+
+    publish_created_comment(PostCommentModel, instance, created=created)
+
+    mock_publish_to_feed.assert_not_called()
+
+
+@pytest.mark.parametrize("completed, scored", [(True, False), (False, True)])
+@patch("apps.social.models.score_mission_completion")
+def test_unscore_deleted_mission_completion(
+    mock_score_mission_completion, completed, scored
+):
+    sender = Mock()
+    sender.objects.filter.return_value.exists.return_value = completed
+    instance = Mock()
+
+    unscore_deleted_mission_completion(sender, instance)
+
+    sender.objects.filter.assert_called_once_with(
+        user_id=instance.user_id, mission_id=instance.mission_id
+    )
+    assert mock_score_mission_completion.called is scored
+
+    if scored:
+        mock_score_mission_completion.assert_called_once_with(
+            instance.mission, instance.user_id, -1
+        )
@@ -0,0 +1,66 @@
+from unittest.mock import Mock
+
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+
+from apps.social.pagination import (
+    CommentThreadPagination,
+    GuestSearchPagination,
+    PostCursorPagination,
+)
+
+
+class TestPostCursorPagination:
+    @classmethod
+    def setup_class(cls):
+        cls.pagination = PostCursorPagination
+
+    def test_parent_class(self):
+        assert issubclass(self.pagination, CursorPagination)
+
+    def test_page_size(self):
+        assert self.pagination.page_size == 20
+        assert self.pagination.page_size_query_param == "page_size"
+        assert self.pagination.max_page_size == 100
+
+    def test_ordering(self):
+        assert self.pagination.ordering == ("-date_joined", "-id")
+
+
+class TestCommentThreadPagination:
+    @classmethod
+    def setup_class(cls):
+        cls.pagination = CommentThreadPagination
+
+    def test_parent_class(self):
+        assert issubclass(self.pagination, LimitOffsetPagination)
+
+    def test_limits(self):
+        assert self.pagination.default_limit == 20
+        assert self.pagination.max_limit == 100
+
+
+class TestGuestSearchPagination:
+    @classmethod
+    def setup_class(cls):
+        cls.pagination = GuestSearchPagination
+
+    def test_parent_class(self):
+        assert issubclass(self.pagination, LimitOffsetPagination)
+
+    def test_limits(self):
+        assert self.pagination.default_limit == 20
+        assert self.pagination.max_limit == 100
+
+    def test_paginate_queryset(self):
+        request = Mock(query_params={"limit": "2", "offset": "1"})
+
+        page = self.pagination().paginate_queryset([1, 2, 3, 4], request)
+
+        assert page == [2, 3]
+
+    def test_paginate_queryset_default_limit(self):
+        request = Mock(query_params={"limit": "500"})
+
+        page = self.pagination().paginate_queryset(list(range(200)), request)
+
+        assert page == list(range(100))
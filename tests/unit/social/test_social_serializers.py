@@ -17,8 +17,15 @@ from apps.social.models import (
 from apps.social.serializers import (
     AnswerLoginQuestionSerializer,
     CompleteMissionSerializer,
+    CompleteMissionUploadSerializer,
+    CreateDirectUploadSerializer,
+    CreateMissionUploadSerializer,
     CreatePostCommentSerializer,
     CreateReactionSerializer,
+    DirectUploadSerializer,
+    LeaderboardEntrySerializer,
+    LeaderboardQuerySerializer,
+    LeaderboardRankSerializer,
     ListAllPostSerializer,
     ListMissionSerializer,
     ListPostCommentSerializer,
@@ -28,8 +35,18 @@ from apps.social.serializers import (
     LoginQuestionOptionSerializer,
     LoginQuestionSerializer,
     MissionTypeSerializer,
+    MissionUploadPartSerializer,
+    MultipartUploadStatusSerializer,
     UnreactSerializer,
     UpdatePostCommentSerializer,
+    UserInteractionsListSerializer,
+    UserReactionsListSerializer,
+)
+from apps.user.serializers import UserDataSerializer
+from utils.direct_upload import (
+    DirectUploadField,
+    DirectUploadSerializerMixin,
+    MultipartUploadField,
 )
 
 
@@ -44,13 +61,78 @@ class TestListReactionSerializer:
     def test_meta_model(self):
         assert self.serializer.Meta.model == ReactionModel
 
-    def test_meta_fields(self):
-        assert self.serializer.Meta.fields == "__all__"
+    def test_meta_exclude(self):
+        assert self.serializer.Meta.exclude == ["post", "comment"]
 
     def test_meta_depth(self):
         assert self.serializer.Meta.depth == 1
 
 
+class TestUserReactionsListSerializer:
+    @classmethod
+    def setup_class(cls):
+        cls.serializer = UserReactionsListSerializer
+
+    def test_parent_class(self):
+        assert issubclass(self.serializer, serializers.ListSerializer)
+
+    @patch.object(PostModel, "attach_reactions_by_user")
+    @patch("rest_framework.serializers.ListSerializer.to_representation")
+    def test_to_representation(self, mock_to_representation, mock_attach):
+        mock_request = Mock()
+        instances = [PostModel(id=1), PostModel(id=2)]
+        serializer = ListAllPostSerializer(many=True, context={"request": mock_request})
+
+        result = serializer.to_representation(iter(instances))
+
+        mock_attach.assert_called_once_with(instances, mock_request.user)
+        mock_to_representation.assert_called_once_with(instances)
+        assert result == mock_to_representation.return_value
+
+    @patch.object(PostModel, "attach_reactions_by_user")
+    @patch("rest_framework.serializers.ListSerializer.to_representation")
+    def test_to_representation_with_attached_reactions(
+        self, mock_to_representation, mock_attach
+    ):
+        mock_request = Mock()
+        attached, pending = PostModel(id=1), PostModel(id=2)
+        attached._reactions_by_user = {mock_request.user.pk: None}
+        serializer = ListAllPostSerializer(many=True, context={"request": mock_request})
+
+        serializer.to_representation([attached, pending])
+
+        mock_attach.assert_called_once_with([pending], mock_request.user)
+
+    @patch.object(PostModel, "attach_reactions_by_user")
+    @patch("rest_framework.serializers.ListSerializer.to_representation")
+    def test_to_representation_without_request(
+        self, mock_to_representation, mock_attach
+    ):
+        serializer = ListAllPostSerializer(many=True)
+
+        serializer.to_representation([PostModel(id=1)])
+
+        mock_attach.assert_not_called()
+
+    @patch.object(PostModel, "attach_reactions_by_user")
+    @patch("rest_framework.serializers.ListSerializer.to_representation")
+    def test_to_representation_skipping_user_fields(
+        self, mock_to_representation, mock_attach
+    ):
+        serializer = ListAllPostSerializer(
+            many=True, context={"request": Mock(), "skip_user_fields": True}
+        )
+
+        serializer.to_representation([PostModel(id=1)])
+
+        mock_attach.assert_not_called()
+
+    def test_post_serializers_use_it(self):
+        assert ListAllPostSerializer.Meta.list_serializer_class == self.serializer
+        assert ListPostSerializer.Meta.list_serializer_class == self.serializer
+        assert ListPostCommentSerializer.Meta.list_serializer_class == self.serializer
+
+
 class TestListPostSerializer:
     @classmethod
     def setup_class(cls):
@@ -74,26 +156,63 @@ class TestListPostSerializer:
             "attachment_type",
             "my_reaction",
             "description",
+            "comments_count",
+            "comments_next",
         ]
 
     def test_meta_depth(self):
         assert self.serializer.Meta.depth == 1
 
+    @patch("apps.social.serializers.CommentThread")
+    def test_get_comment_roots(self, mock_thread):
+        obj = Mock(spec=["pk"])
+        roots = mock_thread.get_roots_queryset.return_value
+        roots.__getitem__.return_value = range(21)
+
+        result = self.serializer.get_comment_roots(obj)
+        self.serializer.get_comment_roots(obj)
+
+        mock_thread.get_roots_queryset.assert_called_once_with(obj)
+        roots.__getitem__.assert_called_once_with(slice(None, 21))
+        assert result == list(range(21))
+
+    @patch("apps.social.serializers.CommentThread")
     @patch("apps.social.serializers.ListPostCommentSerializer")
-    def test_get_comments(self, mock_list_post_comment_serializer):
+    @patch.object(ListPostSerializer, "get_comment_roots", return_value=list(range(21)))
+    def test_get_comments(
+        self, mock_get_comment_roots, mock_list_post_comment_serializer, mock_thread
+    ):
         obj = Mock()
+        mock_request = Mock()
+        context = {"request": mock_request}
 
-        result = self.serializer().get_comments(obj)
+        result = self.serializer(context=context).get_comments(obj)
 
-        obj.comments.filter.assert_called_once_with(is_deleted=False)
+        mock_get_comment_roots.assert_called_once_with(obj)
+        mock_thread.assert_called_once_with(list(range(20)), user=mock_request.user)
         mock_list_post_comment_serializer.assert_called_once_with(
-            obj.comments.filter.return_value.order_by.return_value,
+            mock_thread.return_value.build.return_value,
             many=True,
-            context={},
+            context=context,
         )
 
         assert result == mock_list_post_comment_serializer.return_value.data
 
+    @patch.object(ListPostSerializer, "get_comment_roots", return_value=list(range(20)))
+    def test_get_comments_next_without_next_page(self, _mock_get_comment_roots):
+        assert self.serializer().get_comments_next(Mock(pk=1)) is None
+
+    @patch.object(ListPostSerializer, "get_comment_roots", return_value=list(range(21)))
+    def test_get_comments_next(self, _mock_get_comment_roots):
+        request = Mock()
+        request.build_absolute_uri.side_effect = lambda url: f"http://api{url}"
+
+        result = self.serializer(context={"request": request}).get_comments_next(
+            Mock(pk=1)
+        )
+
+        assert result == "http://api/api/v1/post/1/comments/?limit=20&offset=20"
+
     def test_get_attachment_type(self):
         obj = Mock()
         result = self.serializer().get_attachment_type(obj)
@@ -113,6 +232,17 @@ class TestListPostSerializer:
         )
         assert result == mock_list_reaction_serializer.return_value.data
 
+    def test_get_my_reaction_skipping_user_fields(self):
+        mock_obj = Mock()
+        serializer = self.serializer(
+            context={"request": Mock(), "skip_user_fields": True}
+        )
+
+        result = serializer.get_my_reaction(mock_obj)
+
+        mock_obj.get_reaction_by_user.assert_not_called()
+        assert result is None
+
 
 class TestCreatePostCommentSerializer:
     @classmethod
@@ -131,6 +261,13 @@ class TestCreatePostCommentSerializer:
     def test_answer_field(self):
         assert "answer" in self.serializer().fields
 
+    def test_upload_field(self):
+        field = self.serializer().fields["upload"]
+
+        assert issubclass(self.serializer, DirectUploadSerializerMixin)
+        assert isinstance(field, DirectUploadField)
+        assert field.target == "post_comment"
+
     @patch("apps.social.serializers.PostCommentModel.objects.create")
     @patch("apps.social.serializers.MentionGuestPipeline")
     def test_create(
@@ -144,7 +281,7 @@ class TestCreatePostCommentSerializer:
         result = self.serializer(context={"request": request}).create(validated_data)
 
         mock_mention_guest_pipeline.assert_called_once_with(
-            mock_mentions[0],
+            mock_mentions,
             mock_post_comment_model_objects_create.return_value,
         )
 
@@ -157,27 +294,61 @@ class TestCreatePostCommentSerializer:
 
         assert result == mock_post_comment_model_objects_create.return_value
 
+    @patch("apps.social.serializers.PostCommentModel.objects.create")
+    @patch("apps.social.serializers.MentionGuestPipeline")
+    def test_create_without_mentions(
+        self, mock_mention_guest_pipeline, mock_post_comment_model_objects_create
+    ):
+        request = Mock()
+
+        self.serializer(context={"request": request}).create({"content": "foo"})
+
+        mock_mention_guest_pipeline.assert_not_called()
+
+    @patch("apps.social.serializers.UserModel.objects.filter")
+    def test_validate_mentions(self, mock_user_model_objects_filter):
+        users = [Mock(pk=1), Mock(pk=2)]
+        mock_select_related = mock_user_model_objects_filter.return_value.select_related
+        mock_select_related.return_value = users
+
+        result = self.serializer().validate_mentions([1, 2, 1])
+
+        mock_user_model_objects_filter.assert_called_once_with(pk__in={1, 2})
+        mock_select_related.assert_called_once_with("service", "event")
+
+        assert result == users
+
+    @patch("apps.social.serializers.UserModel.objects.filter")
+    def test_validate_mentions_not_found(self, mock_user_model_objects_filter):
+        mock_select_related = mock_user_model_objects_filter.return_value.select_related
+        mock_select_related.return_value = [Mock(pk=1)]
+
+        with pytest.raises(ValidationError) as error:
+            self.serializer().validate_mentions([1, 3])
+
+        assert error.value.detail == ['Invalid pk "3" - object does not exist.']
+
 
 class TestListAllPostSerializer:
     def test_get_comments(self):
         mock_obj = Mock()
         result = ListAllPostSerializer.get_comments(Mock(), mock_obj)
 
-        mock_obj.comments.filter.assert_called_once_with(is_deleted=False)
-        mock_obj.comments.filter.return_value.count.assert_called_once()
+        mock_obj.comments.filter.assert_not_called()
 
         assert result == {
-            "length": mock_obj.comments.filter.return_value.count.return_value,
+            "length": mock_obj.comments_count,
         }
 
     def test_get_reactions(self):
         mock_obj = Mock()
         result = ListAllPostSerializer.get_reactions(Mock(), mock_obj)
 
-        mock_obj.reactions.count.assert_called_once()
+        mock_obj.reactions.count.assert_not_called()
 
         assert result == {
-            "length": mock_obj.reactions.count.return_value,
+            "length": mock_obj.reactions_count,
+            "by_type": mock_obj.reactions_by_type,
         }
 
     def test_get_event(self):
@@ -205,6 +376,12 @@ class TestUpdatePostCommentSerializer:
     def test_attachment_field(self):
         assert "attachment" in self.serializer().fields
 
+    def test_upload_field(self):
+        field = self.serializer().fields["upload"]
+
+        assert issubclass(self.serializer, DirectUploadSerializerMixin)
+        assert field.target == "post_comment"
+
     def test_update(self):
         mock_instance = Mock()
         mock_validated_data = {
@@ -239,6 +416,7 @@ class TestListPostCommentSerializer:
             "content",
             "author",
             "answers",
+            "answers_count",
             "reactions",
             "my_reaction",
             "attachment",
@@ -249,18 +427,37 @@ class TestListPostCommentSerializer:
 
     @patch("apps.social.serializers.ListPostCommentSerializer")
     def test_get_answers(self, mock_list_post_comment_serializer):
-        mock_obj = Mock()
+        mock_obj = Mock(spec=["answers"])
         serializer = self.serializer()
 
         result = serializer.get_answers(mock_obj)
 
-        mock_obj.answers.all.assert_called_once()
+        mock_obj.answers.filter.assert_called_once_with(is_deleted=False)
         mock_list_post_comment_serializer.assert_called_once_with(
-            mock_obj.answers.all.return_value, many=True, context={}
+            mock_obj.answers.filter.return_value, many=True, context={}
         )
 
         assert result == mock_list_post_comment_serializer.return_value.data
 
+    @patch("apps.social.serializers.ListPostCommentSerializer")
+    def test_get_answers_from_thread(self, mock_list_post_comment_serializer):
+        mock_obj = Mock(_thread_answers=[Mock()])
+        serializer = self.serializer()
+
+        serializer.get_answers(mock_obj)
+
+        mock_obj.answers.filter.assert_not_called()
+        mock_list_post_comment_serializer.assert_called_once_with(
+            mock_obj._thread_answers, many=True, context={}
+        )
+
+    def test_answers_count_field(self):
+        field = self.serializer().fields["answers_count"]
+
+        assert type(field) == serializers.IntegerField
+        assert field.source == "comments_count"
+        assert field.read_only is True
+
     @patch("apps.social.serializers.ListReactionSerializer")
     def test_get_my_reaction(self, mock_list_reaction_serializer):
         mock_obj = Mock()
@@ -364,6 +561,39 @@ class TestMissionTypeSerializer:
         assert self.serializer.Meta.fields == ["name"]
 
 
+class TestUserInteractionsListSerializer:
+    @classmethod
+    def setup_class(cls):
+        cls.serializer = UserInteractionsListSerializer
+
+    def test_parent_class(self):
+        assert issubclass(self.serializer, serializers.ListSerializer)
+
+    @patch.object(MissionModel, "attach_interactions_by_user")
+    @patch("rest_framework.serializers.ListSerializer.to_representation")
+    def test_to_representation(self, mock_to_representation, mock_attach):
+        mock_request = Mock()
+        missions = [MissionModel(id=1), MissionModel(id=2)]
+        serializer = ListMissionSerializer(many=True, context={"request": mock_request})
+
+        result = serializer.to_representation(iter(missions))
+
+        mock_attach.assert_called_once_with(missions, mock_request.user)
+        mock_to_representation.assert_called_once_with(missions)
+        assert result == mock_to_representation.return_value
+
+    @patch.object(MissionModel, "attach_interactions_by_user")
+    @patch("rest_framework.serializers.ListSerializer.to_representation")
+    def test_to_representation_without_missions(
+        self, mock_to_representation, mock_attach
+    ):
+        serializer = ListMissionSerializer(many=True, context={"request": Mock()})
+
+        serializer.to_representation([])
+
+        mock_attach.assert_not_called()
+
+
 class TestListMissionSerializer:
     @classmethod
     def setup_class(cls):
@@ -391,6 +621,11 @@ class TestListMissionSerializer:
     def test_meta_depth(self):
         assert self.serializer.Meta.depth == 1
 
+    def test_meta_list_serializer_class(self):
+        assert (
+            self.serializer.Meta.list_serializer_class == UserInteractionsListSerializer
+        )
+
     def test_get_completed_info(self):
         mock_obj = Mock()
         mock_request = Mock()
@@ -419,6 +654,82 @@ class TestListMissionSerializer:
         assert result == mock_obj.is_completed.return_value
 
 
+class TestCreateDirectUploadSerializer:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"target": "other", "file_name": "a.mp4", "content_type": "v", "size": 1},
+            {"target": "post_comment", "file_name": "a.mp4", "content_type": "v"},
+            {
+                "target": "post_comment",
+                "file_name": "a.mp4",
+                "content_type": "v",
+                "size": 1024**3 + 1,
+            },
+        ],
+    )
+    def test_invalid_data(self, data):
+        assert not CreateDirectUploadSerializer(data=data).is_valid()
+
+    @patch("apps.social.serializers.create_direct_upload")
+    def test_create(self, mock_create_direct_upload):
+        request = Mock()
+        validated_data = {
+            "target": "post_comment",
+            "file_name": "a.mp4",
+            "content_type": "video/mp4",
+            "size": 10,
+        }
+        serializer = CreateDirectUploadSerializer(context={"request": request})
+
+        result = serializer.create(validated_data)
+
+        mock_create_direct_upload.assert_called_once_with(
+            request.user, **validated_data
+        )
+        assert result == mock_create_direct_upload.return_value
+
+
+class TestDirectUploadSerializer:
+    def test_data(self):
+        upload = {
+            "key": "media/key.mp4",
+            "token": "token",
+            "url": "https://bucket.s3.amazonaws.com/",
+            "fields": {"key": "media/key.mp4"},
+            "expires_in": 3600,
+        }
+
+        assert DirectUploadSerializer(upload).data == upload
+
+
+class TestLeaderboardQuerySerializer:
+    def test_default_limit(self):
+        serializer = LeaderboardQuerySerializer(data={})
+
+        assert serializer.is_valid()
+        assert serializer.validated_data == {"limit": 10}
+
+    @pytest.mark.parametrize("limit", ["0", "101", "foo"])
+    def test_invalid_limit(self, limit):
+        assert not LeaderboardQuerySerializer(data={"limit": limit}).is_valid()
+
+
+class TestLeaderboardEntrySerializer:
+    def test_fields(self):
+        fields = LeaderboardEntrySerializer().fields
+
+        assert list(fields) == ["position", "score", "user"]
+        assert isinstance(fields["user"], UserDataSerializer)
+
+
+class TestLeaderboardRankSerializer:
+    def test_data(self):
+        serializer = LeaderboardRankSerializer({"position": None, "score": 0})
+
+        assert serializer.data == {"position": None, "score": 0}
+
+
 class TestCompleteMissionSerializer:
     @classmethod
     def setup_class(cls):
@@ -427,6 +738,12 @@ class TestCompleteMissionSerializer:
     def test_parent_class(self):
         assert issubclass(self.serializer, serializers.Serializer)
 
+    def test_upload_field(self):
+        field = self.serializer().fields["upload"]
+
+        assert issubclass(self.serializer, DirectUploadSerializerMixin)
+        assert field.target == "mission_interaction"
+
     def test_create_successfully(self):
         mock_validated_data = {
             "mission": Mock(is_completed=Mock(return_value=False)),
@@ -469,6 +786,139 @@ class TestCompleteMissionSerializer:
         mock_mission.complete.assert_not_called()
 
 
+class TestCreateMissionUploadSerializer:
+    def test_validate_mission(self):
+        request = Mock()
+        mission = Mock(is_completed=Mock(return_value=False))
+        serializer = CreateMissionUploadSerializer(context={"request": request})
+
+        assert serializer.validate_mission(mission) == mission
+        mission.is_completed.assert_called_once_with(request.user)
+
+    def test_validate_completed_mission(self):
+        mission = Mock(is_completed=Mock(return_value=True))
+        serializer = CreateMissionUploadSerializer(context={"request": Mock()})
+
+        with pytest.raises(ValidationError):
+            serializer.validate_mission(mission)
+
+    @patch("apps.social.serializers.create_multipart_upload")
+    def test_create(self, mock_create_multipart_upload):
+        request = Mock()
+        mission = Mock(pk=1)
+        serializer = CreateMissionUploadSerializer(context={"request": request})
+
+        result = serializer.create({"mission": mission, "size": 10})
+
+        mock_create_multipart_upload.assert_called_once_with(
+            request.user, "mission_interaction", mission=1, size=10
+        )
+        assert result == mock_create_multipart_upload.return_value
+
+
+class TestMissionUploadPartSerializer:
+    def test_upload_field(self):
+        field = MissionUploadPartSerializer().fields["upload"]
+
+        assert isinstance(field, MultipartUploadField)
+        assert field.target == "mission_interaction"
+
+    def test_validate(self):
+        attrs = {"upload": {"size": 10}, "part_number": 1}
+
+        assert MissionUploadPartSerializer().validate(attrs) == attrs
+
+    def test_validate_part_out_of_range(self):
+        attrs = {"upload": {"size": 10}, "part_number": 2}
+
+        with pytest.raises(ValidationError):
+            MissionUploadPartSerializer().validate(attrs)
+
+    @patch("apps.social.serializers.get_multipart_part_url")
+    def test_create(self, mock_get_multipart_part_url):
+        validated_data = {"upload": {}, "part_number": 1, "checksum": "checksum"}
+
+        result = MissionUploadPartSerializer().create(validated_data)
+
+        mock_get_multipart_part_url.assert_called_once_with(**validated_data)
+        assert result == mock_get_multipart_part_url.return_value
+
+
+class TestMultipartUploadStatusSerializer:
+    def test_data(self):
+        upload_status = {
+            "offset": 5,
+            "parts": [{"part_number": 1, "checksum": "checksum", "size": 5}],
+        }
+
+        assert MultipartUploadStatusSerializer(upload_status).data == upload_status
+
+
+@pytest.mark.django_db
+class TestCompleteMissionUploadSerializer:
+    @classmethod
+    def setup_class(cls):
+        cls.serializer = CompleteMissionUploadSerializer
+
+    def get_validated_data(self, mission_id):
+        return {
+            "upload": {"mission": mission_id},
+            "parts": [{"part_number": 1, "checksum": "checksum"}],
+            "content": "Ok",
+        }
+
+    @patch("apps.social.serializers.complete_multipart_upload")
+    @patch("apps.social.serializers.MissionModel.objects.filter")
+    def test_create(self, mock_filter, mock_complete_multipart_upload):
+        request = Mock()
+        mission = mock_filter.return_value.first.return_value
+        mission.is_completed.return_value = False
+        validated_data = self.get_validated_data(1)
+        serializer = self.serializer(context={"request": request})
+
+        result = serializer.create(validated_data)
+
+        mock_filter.assert_called_once_with(pk=1)
+        mock_complete_multipart_upload.assert_called_once_with(
+            validated_data["upload"], {1: "checksum"}
+        )
+        mission.complete.assert_called_once_with(
+            request.user, mock_complete_multipart_upload.return_value, "Ok"
+        )
+        assert result == mission.complete.return_value
+
+    @patch("apps.social.serializers.abort_multipart_upload")
+    @patch("apps.social.serializers.complete_multipart_upload")
+    def test_create_without_mission(
+        self, mock_complete_multipart_upload, mock_abort_multipart_upload
+    ):
+        serializer = self.serializer(context={"request": Mock()})
+        validated_data = self.get_validated_data(0)
+
+        with pytest.raises(ValidationError):
+            serializer.create(validated_data)
+
+        mock_complete_multipart_upload.assert_not_called()
+        mock_abort_multipart_upload.assert_called_once_with(validated_data["upload"])
+
+    @patch("apps.social.serializers.abort_multipart_upload")
+    @patch("apps.social.serializers.complete_multipart_upload")
+    @patch("apps.social.serializers.MissionModel.objects.filter")
+    def test_create_completed_mission(
+        self, mock_filter, mock_complete_multipart_upload, mock_abort_multipart_upload
+    ):
+        mission = mock_filter.return_value.first.return_value
+        mission.is_completed.return_value = True
+        serializer = self.serializer(context={"request": Mock()})
+        validated_data = self.get_validated_data(1)
+
+        with pytest.raises(ValidationError):
+            serializer.create(validated_data)
+
+        mock_complete_multipart_upload.assert_not_called()
+        mock_abort_multipart_upload.assert_called_once_with(validated_data["upload"])
+
+
 class TestLoginQuestionOptionSerializer:
     @classmethod
     def setup_class(cls):
@@ -0,0 +1,183 @@
+import asyncio
+from unittest.mock import Mock, call, patch
+
+from asgiref.sync import async_to_sync
+from rest_framework.exceptions import AuthenticationFailed
+
+from apps.social.broker import InMemoryBroker
+from apps.social.stream import PostStreamApplication, get_stream_user, publish_to_feed
+
+
+@patch("apps.social.stream.transaction")
+@patch("apps.social.stream.get_broker")
+def test_publish_to_feed(mock_get_broker, mock_transaction):
+    mock_transaction.on_commit.side_effect = lambda function: function()
+
+    publish_to_feed(1, 2, {"type": "post.created"})
+
+    mock_get_broker.return_value.publish.assert_has_calls(
+        [
+            call("social:stream:1:2", {"type": "post.created"}),
+            call("social:stream:1:None", {"type": "post.created"}),
+        ],
+        any_order=True,
+    )
+
+
+@patch("apps.social.stream.transaction")
+@patch("apps.social.stream.get_broker")
+def test_publish_to_feed_without_event(mock_get_broker, mock_transaction):
+    mock_transaction.on_commit.side_effect = lambda function: function()
+
+    publish_to_feed(1, None, {"type": "post.created"})
+
+    mock_get_broker.return_value.publish.assert_called_once_with(
+        "social:stream:1:None", {"type": "post.created"}
+    )
+
+
+@patch("apps.social.stream.transaction")
+@patch("apps.social.stream.get_broker")
+def test_publish_to_feed_waits_for_the_commit(mock_get_broker, mock_transaction):
+    publish_to_feed(1, 2, {"type": "post.created"})
+
+    mock_transaction.on_commit.assert_called_once()
+    mock_get_broker.return_value.publish.assert_not_called()
+
+
+@patch("apps.social.stream.close_old_connections")
+@patch("apps.social.stream.BearerTokenAuthentication")
+class TestGetStreamUser:
+    def test_get_stream_user(self, mock_authentication, _mock_close):
+        mock_authentication.keyword = "Bearer"
+        user = Mock()
+        credentials = mock_authentication.return_value.authenticate_credentials
+        credentials.return_value = (user, Mock())
+
+        assert get_stream_user("Bearer abc") is user
+        credentials.assert_called_once_with("abc")
+
+    def test_get_stream_user_invalid_token(self, mock_authentication, _mock_close):
+        mock_authentication.keyword = "Bearer"
+        credentials = mock_authentication.return_value.authenticate_credentials
+        credentials.side_effect = AuthenticationFailed
+
+        assert get_stream_user("Bearer abc") is None
+
+    def test_get_stream_user_without_credentials(
+        self, mock_authentication, _mock_close
+    ):
+        mock_authentication.keyword = "Bearer"
+
+        assert get_stream_user("") is None
+        assert get_stream_user("Bearer") is None
+        assert get_stream_user("Token abc") is None
+        mock_authentication.return_value.authenticate_credentials.assert_not_called()
+
+
+class TestPostStreamApplication:
+    @staticmethod
+    def get_scope(method="GET", headers=None):
+        return {
+            "type": "http",
+            "method": method,
+            "path": PostStreamApplication.path,
+            "headers": headers or [],
+        }
+
+    @staticmethod
+    def run(application, scope, disconnect_after=0.05):
+        sent = []
+
+        async def receive():
+            await asyncio.sleep(disconnect_after)
+
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        async_to_sync(application)(scope, receive, send)
+
+        return sent
+
+    def test_get_header(self):
+        scope = self.get_scope(headers=[(b"Authorization", b"Bearer abc")])
+
+        assert PostStreamApplication.get_header(scope, b"authorization") == (
+            "Bearer abc"
+        )
+        assert PostStreamApplication.get_header(scope, b"origin") == ""
+
+    def test_format_event(self):
+        message = {"type": "post.created", "data": {"id": 1}}
+
+        assert PostStreamApplication.format_event(message) == (
+            b'event: post.created\ndata: {"id": 1}\n\n'
+        )
+
+    def test_method_not_allowed(self):
+        sent = self.run(PostStreamApplication(), self.get_scope("POST"))
+
+        assert sent[0]["status"] == 405
+        assert sent[1]["body"] == b'{"detail": "Method \\"POST\\" not allowed."}'
+
+    @patch("apps.social.stream.get_stream_user", return_value=None)
+    def test_unauthorized(self, mock_get_stream_user):
+        scope = self.get_scope(headers=[(b"authorization", b"Bearer abc")])
+
+        sent = self.run(PostStreamApplication(), scope)
+
+        mock_get_stream_user.assert_called_once_with("Bearer abc")
+        assert sent[0]["status"] == 401
+
+    @patch("apps.social.stream.get_stream_user")
+    def test_stream(self, mock_get_stream_user):
+        mock_get_stream_user.return_value = Mock(service_id=1, event_id=2)
+        broker = InMemoryBroker()
+        application = PostStreamApplication(broker)
+        application.heartbeat_interval = 0.01
+
+        async def publish():
+            await asyncio.sleep(0.02)
+            broker.publish("social:stream:1:2", {"type": "ping", "data": {}})
+
+        async def run():
+            sent = []
+
+            async def receive():
+                await asyncio.sleep(0.1)
+
+                return {"type": "http.disconnect"}
+
+            async def send(message):
+                sent.append(message)
+
+            await asyncio.gather(
+                application(self.get_scope(), receive, send), publish()
+            )
+
+            return sent
+
+        sent = async_to_sync(run)()
+        bodies = [message.get("body") for message in sent[1:]]
+
+        assert sent[0]["status"] == 200
+        assert (b"content-type", b"text/event-stream") in sent[0]["headers"]
+        assert bodies[0] == b": connected\n\n"
+        assert b": ping\n\n" in bodies
+        assert b"event: ping\ndata: {}\n\n" in bodies
+        assert broker.subscribers["social:stream:1:2"] == set()
+
+    @patch("apps.social.stream.get_broker")
+    @patch("apps.social.stream.get_stream_user")
+    def test_stream_uses_the_default_broker(
+        self, mock_get_stream_user, mock_get_broker
+    ):
+        mock_get_stream_user.return_value = Mock(service_id=1, event_id=None)
+        mock_get_broker.return_value = InMemoryBroker()
+
+        sent = self.run(PostStreamApplication(), self.get_scope())
+
+        assert sent[0]["status"] == 200
+        assert "social:stream:1:None" in mock_get_broker.return_value.subscribers
@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+from apps.social.tasks import (
+    generate_ai_text_reports,
+    run_guest_import,
+    run_post_notification_job,
+)
+
+
+class TestRunPostNotificationJob:
+    @patch("apps.social.models.PostNotificationJobModel.objects.filter")
+    def test_run_post_notification_job(self, mock_filter):
+        run_post_notification_job(1)
+
+        mock_filter.assert_called_once_with(pk=1)
+        mock_filter.return_value.first.return_value.run.assert_called_once_with()
+
+    @patch("apps.social.models.PostNotificationJobModel.objects.filter")
+    def test_run_post_notification_job_not_found(self, mock_filter):
+        mock_filter.return_value.first.return_value = None
+
+        run_post_notification_job(1)
+
+    def test_dispatch_path(self):
+        assert run_post_notification_job.service == "lambda"
+        assert run_post_notification_job.sync.__module__ == "apps.social.tasks"
+
+
+class TestRunGuestImport:
+    @patch("apps.social.models.GuestImportModel.objects.select_related")
+    def test_run_guest_import(self, mock_select_related):
+        run_guest_import(1)
+
+        mock_select_related.assert_called_once_with("event__service")
+        mock_filter = mock_select_related.return_value.filter
+        mock_filter.assert_called_once_with(pk=1)
+        mock_filter.return_value.first.return_value.run.assert_called_once_with()
+
+    @patch("apps.social.models.GuestImportModel.objects.select_related")
+    def test_run_guest_import_not_found(self, mock_select_related):
+        mock_select_related.return_value.filter.return_value.first.return_value = None
+
+        run_guest_import(1)
+
+
+class TestGenerateAITextReports:
+    @patch("apps.social.models.PostModel.generate_ai_text_reports")
+    @patch("apps.social.models.PostModel.objects.select_related")
+    def test_generate_ai_text_reports(
+        self, mock_select_related, mock_generate_ai_text_reports
+    ):
+        result = generate_ai_text_reports([1, 2])
+
+        mock_select_related.assert_called_once_with("ai_text_report")
+        mock_filter = mock_select_related.return_value.filter
+        mock_filter.assert_called_once_with(pk__in=[1, 2])
+        mock_generate_ai_text_reports.assert_called_once_with(mock_filter.return_value)
+        assert result == mock_generate_ai_text_reports.return_value
@@ -0,0 +1,99 @@
+from unittest.mock import Mock, patch
+
+from apps.social.models import PostCommentModel
+from apps.social.threads import CommentThread
+
+
+class TestCommentThread:
+    @classmethod
+    def setup_class(cls):
+        cls.thread = CommentThread
+
+    def test_max_depth(self):
+        assert self.thread.max_depth == 9
+        assert self.thread([], max_depth=2).max_depth == 2
+
+    @patch("apps.social.threads.PostCommentModel")
+    def test_get_comments_queryset(self, mock_post_comment_model):
+        result = self.thread.get_comments_queryset()
+
+        mock_post_comment_model.objects.filter.assert_called_once_with(is_deleted=False)
+        mock_queryset = mock_post_comment_model.objects.filter.return_value
+        mock_queryset.select_related.assert_called_once_with("author__service")
+
+        assert result == mock_queryset.select_related.return_value
+
+    @patch.object(CommentThread, "get_comments_queryset")
+    def test_get_roots_queryset(self, mock_get_comments_queryset):
+        mock_post = Mock()
+
+        result = self.thread.get_roots_queryset(mock_post)
+
+        mock_queryset = mock_get_comments_queryset.return_value
+        mock_queryset.filter.assert_called_once_with(
+            post=mock_post, answer__isnull=True
+        )
+        mock_queryset.filter.return_value.order_by.assert_called_once_with(
+            "-date_joined", "-id"
+        )
+
+        assert result == mock_queryset.filter.return_value.order_by.return_value
+
+    @patch.object(CommentThread, "get_comments_queryset")
+    def test_load_answers(self, mock_get_comments_queryset):
+        root = PostCommentModel(id=1)
+        root._thread_answers = []
+        answer = PostCommentModel(id=2, answer_id=1)
+        mock_queryset = mock_get_comments_queryset.return_value
+        mock_queryset.filter.return_value.order_by.return_value = [answer]
+
+        result = self.thread([root])._load_answers([root])
+
+        mock_queryset.filter.assert_called_once_with(answer_id__in={1: root})
+        assert result == [answer]
+        assert root._thread_answers == [answer]
+
+    def test_attach_user_reactions(self):
+        user = Mock(pk=1)
+        comment = Mock()
+        reactions = [Mock(pk=3, user_id=1), Mock(pk=2, user_id=1), Mock(user_id=5)]
+        comment.reactions.all.return_value = reactions
+
+        self.thread([], user=user)._attach_user_reactions([comment])
+
+        assert comment._reactions_by_user == {1: reactions[1]}
+
+    @patch("apps.social.threads.prefetch_related_objects")
+    @patch.object(CommentThread, "_attach_user_reactions")
+    @patch.object(CommentThread, "_load_answers")
+    def test_build(self, mock_load_answers, mock_attach, mock_prefetch):
+        root, answer = Mock(), Mock()
+        mock_load_answers.side_effect = [[answer], []]
+        user = Mock()
+
+        result = self.thread([root], user=user).build()
+
+        mock_load_answers.assert_any_call([root])
+        mock_load_answers.assert_any_call([answer])
+        mock_prefetch.assert_called_once()
+        assert mock_prefetch.call_args[0][0] == [root, answer]
+        mock_attach.assert_called_once_with([root, answer])
+
+        assert result == [root]
+        assert root._thread_answers == []
+        assert answer._thread_answers == []
+
+    @patch("apps.social.threads.prefetch_related_objects")
+    @patch.object(CommentThread, "_attach_user_reactions")
+    @patch.object(CommentThread, "_load_answers")
+    def test_build_stops_at_max_depth(
+        self, mock_load_answers, mock_attach, mock_prefetch
+    ):
+        root, answer = Mock(), Mock()
+        mock_load_answers.return_value = [answer]
+
+        self.thread([root], max_depth=2).build()
+
+        mock_load_answers.assert_called_once_with([root])
+        mock_attach.assert_not_called()
+        assert answer._thread_answers == []
@@ -1,27 +1,38 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from django.db.models import Q
 from rest_framework import mixins
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.viewsets import GenericViewSet
 
 from apps.social.models import PostCommentModel
+from apps.social.pagination import PostCursorPagination
 from apps.social.serializers import (
     AnswerLoginQuestionSerializer,
     CompleteMissionSerializer,
+    CompleteMissionUploadSerializer,
+    CreateDirectUploadSerializer,
+    CreateMissionUploadSerializer,
     CreatePostCommentSerializer,
     CreateReactionSerializer,
     GuestEventSerializer,
+    LeaderboardEntrySerializer,
+    LeaderboardRankSerializer,
     ListAllPostSerializer,
     ListMissionSerializer,
+    ListPostCommentSerializer,
     ListPostSerializer,
     ListReactTypesSerializer,
     LoginQuestionSerializer,
+    MissionUploadPartSerializer,
+    MultipartUploadStatusSerializer,
     UnreactSerializer,
     UpdatePostCommentSerializer,
 )
 from apps.social.views import (
+    DirectUploadViewSet,
     GuestViewSet,
     LoginQuestionViewSet,
     MissionViewSet,
@@ -50,10 +61,14 @@ class TestPostViewSet:
     def test_permission_classes(self):
         assert PostViewSet.permission_classes == [IsAuthenticated]
 
+    def test_pagination_class(self):
+        assert PostViewSet.pagination_class == PostCursorPagination
+
     def test_serializers(self):
         assert PostViewSet.serializers == {
             "list": ListAllPostSerializer,
             "retrieve": ListPostSerializer,
+            "comments": ListPostCommentSerializer,
             "comment": CreatePostCommentSerializer,
             "react": CreateReactionSerializer,
             "unreact": UnreactSerializer,
@@ -80,17 +95,101 @@ class TestPostViewSet:
 
         assert result == queryset.filter.return_value
 
-    @patch("apps.social.views.super")
-    def test_list(self, mock_super):
+    @patch("apps.social.views.Response")
+    @patch("apps.social.views.PostFeedCache")
+    @patch.object(PostViewSet, "get_feed_with_user_reactions")
+    def test_list(self, mock_with_user_reactions, mock_feed_cache, mock_response):
         view = self.view
         request = Mock()
         view.request = request
         result = self.view.list(request)
 
-        mock_super.assert_called_once()
-        mock_super.return_value.list.assert_called_once_with(request)
+        mock_feed_cache.assert_called_once_with(
+            request.user.service_id, request.user.event_id
+        )
+        mock_feed_cache.return_value.get_or_set.assert_called_once_with(
+            request.build_absolute_uri(), view.get_shared_feed_page
+        )
+        mock_with_user_reactions.assert_called_once_with(
+            mock_feed_cache.return_value.get_or_set.return_value
+        )
+        mock_response.assert_called_once_with(mock_with_user_reactions.return_value)
 
-        assert result == mock_super.return_value.list.return_value
+        assert result == mock_response.return_value
+
+    @patch("apps.social.views.PostFeedCache")
+    @patch.object(PostViewSet, "get_feed_with_user_reactions", Mock())
+    @patch("apps.social.views.Response", Mock())
+    def test_list_not_guest(self, mock_feed_cache):
+        view = self.view
+        request = Mock()
+        request.user.is_guest = False
+        view.request = request
+        self.view.list(request)
+
+        mock_feed_cache.assert_called_once_with(request.user.service_id, None)
+
+    @patch.object(PostViewSet, "get_paginated_response")
+    @patch.object(PostViewSet, "get_serializer")
+    @patch.object(PostViewSet, "get_serializer_context")
+    @patch.object(PostViewSet, "paginate_queryset")
+    @patch.object(PostViewSet, "get_queryset")
+    @patch.object(PostViewSet, "filter_queryset")
+    def test_get_shared_feed_page(
+        self,
+        mock_filter_queryset,
+        mock_get_queryset,
+        mock_paginate_queryset,
+        mock_get_serializer_context,
+        mock_get_serializer,
+        mock_get_paginated_response,
+    ):
+        mock_get_serializer_context.return_value = {"request": "request"}
+        result = self.view.get_shared_feed_page()
+
+        mock_filter_queryset.assert_called_once_with(mock_get_queryset.return_value)
+        mock_paginate_queryset.assert_called_once_with(
+            mock_filter_queryset.return_value
+        )
+        mock_get_serializer.assert_called_once_with(
+            mock_paginate_queryset.return_value,
+            many=True,
+            context={"request": "request", "skip_user_fields": True},
+        )
+        mock_get_paginated_response.assert_called_once_with(
+            mock_get_serializer.return_value.data
+        )
+
+        assert result == mock_get_paginated_response.return_value.data
+
+    @patch("apps.social.views.ListReactionSerializer")
+    @patch("apps.social.views.PostModel")
+    def test_get_feed_with_user_reactions(
+        self, mock_post_model, mock_list_reaction_serializer
+    ):
+        view = self.view
+        view.request = Mock()
+        feed = {"next": None, "results": [{"id": 1}, {"id": 2}]}
+        mock_post_model.get_reactions_by_user.return_value = {2: "reaction"}
+
+        result = view.get_feed_with_user_reactions(feed)
+
+        mock_post_model.get_reactions_by_user.assert_called_once_with(
+            [1, 2], view.request.user
+        )
+        mock_list_reaction_serializer.assert_called_once_with("reaction")
+
+        assert result == {
+            "next": None,
+            "results": [
+                {"id": 1, "my_reaction": None},
+                {
+                    "id": 2,
+                    "my_reaction": mock_list_reaction_serializer.return_value.data,
+                },
+            ],
+        }
+        assert feed["results"] == [{"id": 1}, {"id": 2}]
 
     @patch("apps.social.views.super")
     def test_retrieve(self, mock_super):
@@ -104,18 +203,57 @@ class TestPostViewSet:
 
         assert result == mock_super.return_value.retrieve.return_value
 
+    @patch("apps.social.views.CommentThread")
+    @patch("apps.social.views.CommentThreadPagination")
+    @patch.object(PostViewSet, "get_serializer")
+    @patch.object(PostViewSet, "get_object")
+    def test_comments(
+        self, mock_get_object, mock_get_serializer, mock_pagination, mock_thread
+    ):
+        view = self.view
+        request = Mock()
+        paginator = mock_pagination.return_value
+
+        result = view.comments(request)
+
+        mock_thread.get_roots_queryset.assert_called_once_with(
+            mock_get_object.return_value
+        )
+        paginator.paginate_queryset.assert_called_once_with(
+            mock_thread.get_roots_queryset.return_value, request, view=view
+        )
+        mock_thread.assert_called_once_with(
+            paginator.paginate_queryset.return_value, user=request.user
+        )
+        mock_get_serializer.assert_called_once_with(
+            mock_thread.return_value.build.return_value, many=True
+        )
+        paginator.get_paginated_response.assert_called_once_with(
+            mock_get_serializer.return_value.data
+        )
+
+        assert result == paginator.get_paginated_response.return_value
+
+    @patch("apps.social.views.CommentThread")
     @patch.object(PostViewSet, "get_serializer")
     @patch("apps.social.views.ListPostCommentSerializer")
     @patch("apps.social.views.Response")
-    def test_comment(self, mock_response, mock_serializer, mock_get_serializer):
+    def test_comment(
+        self, mock_response, mock_serializer, mock_get_serializer, mock_comment_thread
+    ):
         view = self.view
         request = Mock()
         view.request = request
+        comment = Mock()
+        mock_comment_thread.return_value.build.return_value = [comment]
         result = self.view.comment(request)
 
         mock_get_serializer.assert_called_once_with(data=request.data)
+        mock_comment_thread.assert_called_once_with(
+            [mock_get_serializer.return_value.save.return_value], user=request.user
+        )
         mock_serializer.assert_called_once_with(
-            mock_get_serializer.return_value.save.return_value,
+            comment,
             context={"request": request},
         )
         mock_response.assert_called_once_with(mock_serializer.return_value.data)
@@ -125,10 +263,12 @@ class TestPostViewSet:
     @patch("apps.social.views.get_object_or_404")
     @patch("apps.social.views.Response")
     @patch("apps.social.views.ListPostCommentSerializer")
+    @patch.object(PostViewSet, "get_serializer_context")
     @patch.object(PostViewSet, "get_serializer")
     def test_update_comment_with_patch_method(
         self,
         mock_get_serializers,
+        mock_get_serializer_context,
         mock_list_post_comment_serializer,
         mock_response,
         mock_get_object_or_404,
@@ -153,7 +293,8 @@ class TestPostViewSet:
         mock_serializer.save.assert_called_once()
 
         mock_list_post_comment_serializer.assert_called_once_with(
-            mock_serializer.save.return_value
+            mock_serializer.save.return_value,
+            context=mock_get_serializer_context.return_value,
         )
         mock_response.assert_called_once_with(
             mock_list_post_comment_serializer.return_value.data
@@ -277,6 +418,12 @@ class TestMissionViewSet:
             "list": ListMissionSerializer,
             "retrieve": ListMissionSerializer,
             "complete": CompleteMissionSerializer,
+            "upload": CreateMissionUploadSerializer,
+            "upload_part": MissionUploadPartSerializer,
+            "upload_status": MultipartUploadStatusSerializer,
+            "complete_upload": CompleteMissionUploadSerializer,
+            "leaderboard": LeaderboardEntrySerializer,
+            "my_rank": LeaderboardRankSerializer,
         }
 
     @patch("apps.social.views.super")
@@ -319,6 +466,157 @@ class TestMissionViewSet:
 
         assert result == mock_response.return_value
 
+    @patch("apps.social.views.Response")
+    @patch("apps.social.views.MultipartUploadSerializer")
+    @patch.object(MissionViewSet, "get_serializer")
+    def test_upload(self, mock_get_serializer, mock_upload_serializer, mock_response):
+        request = Mock()
+
+        result = self.view.upload(request)
+
+        mock_serializer = mock_get_serializer.return_value
+        mock_get_serializer.assert_called_once_with(data=request.data)
+        mock_serializer.is_valid.assert_called_once_with(raise_exception=True)
+        mock_upload_serializer.assert_called_once_with(
+            mock_serializer.save.return_value
+        )
+        mock_response.assert_called_once_with(
+            mock_upload_serializer.return_value.data, status=201
+        )
+        assert result == mock_response.return_value
+
+    @patch("apps.social.views.Response")
+    @patch("apps.social.views.MultipartUploadPartUrlSerializer")
+    @patch.object(MissionViewSet, "get_serializer")
+    def test_upload_part(self, mock_get_serializer, mock_url_serializer, mock_response):
+        request = Mock()
+
+        result = self.view.upload_part(request)
+
+        mock_serializer = mock_get_serializer.return_value
+        mock_serializer.is_valid.assert_called_once_with(raise_exception=True)
+        mock_url_serializer.assert_called_once_with(mock_serializer.save.return_value)
+        mock_response.assert_called_once_with(mock_url_serializer.return_value.data)
+        assert result == mock_response.return_value
+
+    @patch("apps.social.views.Response")
+    @patch("apps.social.views.list_multipart_parts")
+    @patch("apps.social.views.MissionUploadStatusSerializer")
+    @patch.object(MissionViewSet, "get_serializer_context")
+    @patch.object(MissionViewSet, "get_serializer")
+    def test_upload_status(
+        self,
+        mock_get_serializer,
+        mock_get_serializer_context,
+        mock_status_serializer,
+        mock_list_multipart_parts,
+        mock_response,
+    ):
+        request = Mock()
+
+        result = self.view.upload_status(request)
+
+        mock_status_serializer.assert_called_once_with(
+            data=request.query_params,
+            context=mock_get_serializer_context.return_value,
+        )
+        query = mock_status_serializer.return_value
+        query.is_valid.assert_called_once_with(raise_exception=True)
+        mock_list_multipart_parts.assert_called_once_with(
+            query.validated_data["upload"]
+        )
+        mock_get_serializer.assert_called_once_with(
+            mock_list_multipart_parts.return_value
+        )
+        mock_response.assert_called_once_with(mock_get_serializer.return_value.data)
+        assert result == mock_response.return_value
+
+    @patch("apps.social.views.Response")
+    @patch.object(MissionViewSet, "get_serializer")
+    def test_complete_upload(self, mock_get_serializer, mock_response):
+        request = Mock()
+
+        result = self.view.complete_upload(request)
+
+        mock_get_serializer.assert_called_once_with(data=request.data)
+        mock_serializer = mock_get_serializer.return_value
+        mock_serializer.is_valid.assert_called_once_with(raise_exception=True)
+        mock_serializer.save.assert_called_once()
+        mock_response.assert_called_once_with(status=204)
+        assert result == mock_response.return_value
+
+    @patch("apps.social.views.Response")
+    @patch("apps.social.views.UserModel")
+    @patch("apps.social.views.get_leaderboard")
+    @patch.object(MissionViewSet, "get_serializer")
+    def test_leaderboard(
+        self, mock_get_serializer, mock_get_leaderboard, mock_user_model, mock_response
+    ):
+        view = self.view
+        request = Mock(query_params={"limit": "3"}, user=Mock(service_id=1, event_id=2))
+        view.request = request
+        first_user = Mock()
+        second_user = Mock()
+        mock_get_leaderboard.return_value.get_top.return_value = [
+            (10, 5),
+            (20, 3),
+            (30, 1),
+        ]
+        mock_in_bulk = mock_user_model.objects.select_related.return_value.in_bulk
+        mock_in_bulk.return_value = {10: first_user, 30: second_user}
+
+        result = self.view.leaderboard(request)
+
+        mock_get_leaderboard.return_value.get_top.assert_called_once_with(
+            "social:leaderboard:1:2", 3
+        )
+        mock_user_model.objects.select_related.assert_called_once_with("service")
+        mock_in_bulk.assert_called_once_with([10, 20, 30])
+        mock_get_serializer.assert_called_once_with(
+            [
+                {"position": 1, "score": 5, "user": first_user},
+                {"position": 3, "score": 1, "user": second_user},
+            ],
+            many=True,
+        )
+        mock_response.assert_called_once_with(mock_get_serializer.return_value.data)
+
+        assert result == mock_response.return_value
+
+    def test_leaderboard_invalid_limit(self):
+        request = Mock(query_params={"limit": "1000"})
+
+        with pytest.raises(ValidationError):
+            self.view.leaderboard(request)
+
+    @pytest.mark.parametrize(
+        "rank,expected",
+        [
+            ((2, 7), {"position": 2, "score": 7}),
+            (None, {"position": None, "score": 0}),
+        ],
+    )
+    @patch("apps.social.views.Response")
+    @patch("apps.social.views.get_leaderboard")
+    @patch.object(MissionViewSet, "get_serializer")
+    def test_my_rank(
+        self, mock_get_serializer, mock_get_leaderboard, mock_response, rank, expected
+    ):
+        view = self.view
+        request = Mock(user=Mock(pk=3, service_id=1, event_id=None))
+        view.request = request
+        mock_get_leaderboard.return_value.get_rank.return_value = rank
+
+        result = self.view.my_rank(request)
+
+        mock_get_leaderboard.return_value.get_rank.assert_called_once_with(
+            "social:leaderboard:1:None", 3
+        )
+        mock_get_serializer.assert_called_once_with(expected)
+        mock_response.assert_called_once_with(mock_get_serializer.return_value.data)
+
+        assert result == mock_response.return_value
+
 
 class TestLoginQuestionViewSet:
     @classmethod
@@ -441,11 +739,18 @@ class TestGuestViewSet:
             "guests": GuestEventSerializer,
         }
 
+    @patch("apps.social.views.GuestSearchPagination")
+    @patch.object(UserModel, "get_search_name")
     @patch.object(UserModel, "objects")
     @patch.object(GuestViewSet, "get_serializer")
     @patch("apps.social.views.Response")
     def test_guests_with_user_guest(
-        self, mock_response, mock_get_serializer, mock_user
+        self,
+        mock_response,
+        mock_get_serializer,
+        mock_user,
+        mock_get_search_name,
+        mock_pagination,
     ):
         view = self.view
         request = Mock()
@@ -457,14 +762,22 @@ class TestGuestViewSet:
 
         mock_user.only.assert_called_once_with("id", "first_name")
         mock_filter = mock_user.only.return_value.filter
+        search_name = mock_get_search_name.return_value
         mock_filter.assert_called_once_with(
+            Q(search_name__startswith=search_name)
+            | Q(search_last_name__startswith=search_name),
             event_id=request.user.event_id,
-            first_name__icontains=request.query_params.get.return_value,
         )
-        mock_filter.return_value.order_by.assert_called_once_with("first_name")
+        mock_get_search_name.assert_called_once_with(
+            request.query_params.get.return_value
+        )
+        mock_filter.return_value.order_by.assert_called_once_with("search_name", "id")
+        mock_pagination.return_value.paginate_queryset.assert_called_once_with(
+            mock_filter.return_value.order_by.return_value, request, view
+        )
 
         mock_get_serializer.assert_called_once_with(
-            mock_filter.return_value.order_by.return_value,
+            mock_pagination.return_value.paginate_queryset.return_value,
             many=True,
         )
 
@@ -493,3 +806,40 @@ class TestGuestViewSet:
         mock_user.assert_not_called()
         mock_get_serializer.assert_not_called()
         mock_response.assert_not_called()
+
+
+class TestDirectUploadViewSet:
+    def test_parent_class(self):
+        assert issubclass(DirectUploadViewSet, MultiSerializerMixin)
+        assert issubclass(DirectUploadViewSet, GenericViewSet)
+
+    def test_authentication_classes(self):
+        assert DirectUploadViewSet.authentication_classes == [BearerTokenAuthentication]
+
+    def test_permission_classes(self):
+        assert DirectUploadViewSet.permission_classes == [IsAuthenticated]
+
+    def test_serializers(self):
+        assert DirectUploadViewSet.serializers == {
+            "create": CreateDirectUploadSerializer,
+        }
+
+    @patch("apps.social.views.DirectUploadSerializer")
+    @patch("apps.social.views.Response")
+    def test_create(self, mock_response, mock_direct_upload_serializer):
+        view = DirectUploadViewSet()
+        view.get_serializer = Mock()
+        request = Mock()
+
+        result = view.create(request)
+
+        view.get_serializer.assert_called_once_with(data=request.data)
+        serializer = view.get_serializer.return_value
+        serializer.is_valid.assert_called_once_with(raise_exception=True)
+        mock_direct_upload_serializer.assert_called_once_with(
+            serializer.save.return_value
+        )
+        mock_response.assert_called_once_with(
+            mock_direct_upload_serializer.return_value.data, status=201
+        )
+        assert result == mock_response.return_value
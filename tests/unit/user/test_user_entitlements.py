@@ -0,0 +1,45 @@
+from unittest.mock import Mock, patch
+
+from apps.user.entitlements import CourseEntitlements
+
+
+class TestCourseEntitlements:
+    def test_get_key(self):
+        assert CourseEntitlements.get_key(1) == "user:entitlements:1"
+
+    @patch("apps.user.entitlements.cache")
+    def test_get_course_ids_cached(self, mock_cache):
+        user = Mock(pk=1)
+        mock_cache.get.return_value = frozenset({2})
+
+        result = CourseEntitlements.get_course_ids(user)
+
+        mock_cache.get.assert_called_once_with("user:entitlements:1")
+        mock_cache.set.assert_not_called()
+        user.contracts.filter.assert_not_called()
+        assert result == frozenset({2})
+
+    @patch("apps.user.entitlements.cache")
+    def test_get_course_ids_not_cached(self, mock_cache):
+        user = Mock(pk=1)
+        mock_cache.get.return_value = None
+        course_ids = user.contracts.filter.return_value.values_list.return_value
+        course_ids.distinct.return_value = [2, 3]
+
+        result = CourseEntitlements.get_course_ids(user)
+
+        user.contracts.filter.assert_called_once_with(
+            is_active=True, package__courses__isnull=False
+        )
+        mock_cache.set.assert_called_once_with(
+            "user:entitlements:1", frozenset({2, 3}), CourseEntitlements.timeout
+        )
+        assert result == frozenset({2, 3})
+
+    @patch("apps.user.entitlements.cache")
+    def test_invalidate(self, mock_cache):
+        CourseEntitlements.invalidate(1, 2)
+
+        mock_cache.delete_many.assert_called_once_with(
+            ["user:entitlements:1", "user:entitlements:2"]
+        )
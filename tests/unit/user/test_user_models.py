@@ -1,5 +1,6 @@
 from unittest.mock import Mock, patch
 
+import pytest
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
@@ -156,24 +157,95 @@ class TestUserModel:
         assert field.null is True
         assert field.blank is True
 
-    def test_length_fields(self):
-        assert len(self.model._meta.fields) == 21
+    def test_search_name_field(self):
+        field = self.model._meta.get_field("search_name")
 
-    def test_can_access_with_paid_course(self):
-        course = Mock(is_paid=True)
-        contracts = Mock()
-        contracts.only.return_value.filter.return_value.count.return_value = 1
+        assert type(field) == models.CharField
+        assert field.verbose_name == "Search Name"
+        assert field.max_length == 61
+        assert field.db_collation == "C"
+        assert field.editable is False
 
-        user = UserModel
-        mock_self = Mock(contracts=contracts)
-        result = user.can_access(mock_self, course)
+    def test_search_last_name_field(self):
+        field = self.model._meta.get_field("search_last_name")
+
+        assert type(field) == models.CharField
+        assert field.verbose_name == "Search Last Name"
+        assert field.max_length == 30
+        assert field.db_collation == "C"
+        assert field.editable is False
 
-        contracts.only.assert_called_once_with("id")
-        contracts.only.return_value.filter.assert_called_once_with(
-            package__courses__in=[course], is_active=True
+    def test_meta_indexes(self):
+        name_index, last_name_index = self.model._meta.indexes
+
+        assert name_index.name == "user_guest_search_idx"
+        assert name_index.fields == ["event", "search_name", "id"]
+        assert last_name_index.name == "user_guest_last_name_idx"
+        assert last_name_index.fields == ["event", "search_last_name", "id"]
+
+    def test_length_fields(self):
+        assert len(self.model._meta.fields) == 23
+
+    @pytest.mark.parametrize(
+        "names, search_name",
+        [
+            (("José", "Ávila"), "jose avila"),
+            (("  JOÃO ", " da  Silva"), "joao da silva"),
+            (("Ana", ""), "ana"),
+            (("Ｆｉｎｎ",), "finn"),
+            (("a" * 40, "b" * 40), f"{'a' * 40} {'b' * 20}"),
+        ],
+    )
+    def test_get_search_name(self, names, search_name):
+        assert UserModel.get_search_name(*names) == search_name
+
+    def test_get_search_name_field(self):
+        assert UserModel.get_search_name("Á" * 40, field="search_last_name") == (
+            "a" * 30
         )
-        contracts.only.return_value.filter.return_value.count.assert_called_once()
-        assert result is True
+
+    @patch("apps.user.models.AbstractUser.save")
+    def test_save(self, mock_save):
+        user = UserModel(first_name="José", last_name="Ávila")
+
+        user.save()
+
+        assert user.search_name == "jose avila"
+        assert user.search_last_name == "avila"
+        mock_save.assert_called_once_with()
+
+    @patch("apps.user.models.AbstractUser.save")
+    def test_save_with_update_fields(self, mock_save):
+        user = UserModel(first_name="José", last_name="Ávila")
+
+        user.save(update_fields=["first_name"])
+        user.save(update_fields=["email"])
+
+        assert mock_save.call_args_list[0].kwargs == {
+            "update_fields": {"first_name", "search_name", "search_last_name"}
+        }
+        assert mock_save.call_args_list[1].kwargs == {"update_fields": ["email"]}
+
+    @patch("apps.user.models.CourseEntitlements.get_course_ids")
+    def test_get_course_ids(self, mock_get_course_ids):
+        user = UserModel()
+
+        assert user.get_course_ids() == mock_get_course_ids.return_value
+        mock_get_course_ids.assert_called_once_with(user)
+
+    @pytest.mark.parametrize(
+        "course_id,expected",
+        [(1, True), (2, False)],
+    )
+    def test_can_access_with_paid_course(self, course_id, expected):
+        course = Mock(is_paid=True, pk=course_id)
+        mock_self = Mock()
+        mock_self.get_course_ids.return_value = frozenset({1})
+
+        result = UserModel.can_access(mock_self, course)
+
+        mock_self.get_course_ids.assert_called_once_with()
+        assert result is expected
 
     def test_can_access_with_not_paid_course(self):
         course = Mock(is_paid=False)
@@ -182,6 +254,7 @@ class TestUserModel:
         mock_self = Mock()
         result = user.can_access(mock_self, course)
 
+        mock_self.get_course_ids.assert_not_called()
         assert result is True
 
     def test_is_guest(self):
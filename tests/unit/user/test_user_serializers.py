@@ -12,6 +12,7 @@ from apps.user.serializers import (
     UserDataSerializer,
     UserForRetentionSerializer,
 )
+from utils.direct_upload import DirectUploadField, DirectUploadSerializerMixin
 
 
 class TestCreateUserSerializer:
@@ -205,8 +206,18 @@ class TestUserDataSerializer:
         cls.serializer = UserDataSerializer
 
     def test_parent_class(self):
+        assert issubclass(self.serializer, DirectUploadSerializerMixin)
         assert issubclass(self.serializer, serializers.ModelSerializer)
 
+    def test_direct_upload(self):
+        field = self.serializer().fields["profile_image_upload"]
+
+        assert isinstance(field, DirectUploadField)
+        assert field.target == "profile_image"
+        assert field.write_only is True
+        assert self.serializer.file_field == "profile_image"
+        assert self.serializer.upload_field == "profile_image_upload"
+
     def test_meta_model(self):
         assert self.serializer.Meta.model == UserModel
 
@@ -216,6 +227,7 @@ class TestUserDataSerializer:
             "first_name",
             "last_name",
             "profile_image",
+            "profile_image_upload",
             "username",
             "service",
             "is_verified",
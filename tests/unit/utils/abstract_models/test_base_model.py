@@ -1,7 +1,9 @@
+import pytest
 from django.db import models
 from django.utils import timezone
 
-from utils.abstract_models.base_model import BaseModel
+from utils.abstract_models.base_model import AttachmentModel, BaseModel
+from utils.mixins.attachment_type import GetAttachmentTypeMixin
 
 
 class TestBaseModel:
@@ -31,3 +33,44 @@ class TestBaseModel:
         assert type(field) is models.DateTimeField
         assert field.verbose_name == "date modified"
         assert field.default == timezone.now
+
+
+class TestAttachmentModel:
+    @classmethod
+    def setup_class(cls):
+        cls.model = AttachmentModel(upload_to="attachments").mixin
+
+    def test_parent_class(self):
+        assert issubclass(self.model, GetAttachmentTypeMixin)
+        assert self.model._meta.abstract is True
+
+    def test_attachment(self):
+        field = self.model._meta.get_field("attachment")
+
+        assert type(field) is models.FileField
+        assert field.upload_to == "attachments"
+        assert field.null is True
+
+    def test_attachment_type(self):
+        field = self.model._meta.get_field("attachment_type")
+
+        assert type(field) is models.CharField
+        assert field.choices == GetAttachmentTypeMixin.ATTACHMENT_TYPE_CHOICES
+        assert field.null is True
+        assert field.editable is False
+
+    @pytest.mark.parametrize(
+        "name,field_class",
+        [
+            ("attachment_mime_type", models.CharField),
+            ("attachment_size", models.PositiveBigIntegerField),
+            ("attachment_width", models.PositiveIntegerField),
+            ("attachment_height", models.PositiveIntegerField),
+            ("attachment_duration", models.FloatField),
+        ],
+    )
+    def test_metadata_fields(self, name, field_class):
+        field = self.model._meta.get_field(name)
+
+        assert type(field) is field_class
+        assert field.editable is False
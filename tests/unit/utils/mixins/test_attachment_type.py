@@ -1,4 +1,7 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+
+import pytest
+from django.db.models import DEFERRED
 
 from utils.mixins.attachment_type import (
     GetAttachmentTypeMixin,
@@ -6,6 +9,18 @@ from utils.mixins.attachment_type import (
 )
 
 
+class Saver:
+    def save(self, *_args, **kwargs):
+        self.saved_with = kwargs
+
+
+class Attachment(GetAttachmentTypeMixin, Saver):
+    def __init__(self, attachment, attachment_type=None):
+        self.attachment = attachment
+        self.attachment_type = attachment_type
+        self._saved_attachment_name = attachment.name
+
+
 class TestGetAttachmentTypeMixin:
     def test_video_extensions(self):
         assert GetAttachmentTypeMixin.VIDEO_EXTENSIONS == [
@@ -47,39 +62,207 @@ class TestGetAttachmentTypeMixin:
             "dsd",
         ]
 
-    def test_attachment_type(self):
-        class Attachment:
-            def __init__(self, name):
-                self.name = name
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("post/video.MP4", "video"),
+            ("post/sound.ogg", "video"),
+            ("post/image.jpg", "image"),
+            ("post/audio.mp3", "audio"),
+            ("post/file.txt", "file"),
+            ("post/file", "file"),
+            ("", None),
+        ],
+    )
+    def test_get_attachment_type(self, name, expected):
+        assert GetAttachmentTypeMixin.get_attachment_type(name) == expected
+
+    def test_attachment_metadata_fields(self):
+        assert GetAttachmentTypeMixin.ATTACHMENT_METADATA_FIELDS == [
+            "attachment_type",
+            "attachment_mime_type",
+            "attachment_size",
+            "attachment_width",
+            "attachment_height",
+            "attachment_duration",
+        ]
+
+    @patch("utils.mixins.attachment_type.get_attachment_metadata")
+    def test_set_attachment_metadata(self, mock_get_attachment_metadata):
+        mock_get_attachment_metadata.return_value = {
+            "mime_type": "video/mp4",
+            "size": 10,
+            "width": 640,
+            "height": 360,
+            "duration": 2.5,
+        }
+        instance = Attachment(Mock())
+        instance.attachment.name = "video.mp4"
+
+        instance.set_attachment_metadata()
+
+        mock_get_attachment_metadata.assert_called_once_with(
+            instance.attachment, "video"
+        )
+        assert instance.attachment_type == "video"
+        assert instance.attachment_mime_type == "video/mp4"
+        assert instance.attachment_size == 10
+        assert instance.attachment_width == 640
+        assert instance.attachment_height == 360
+        assert instance.attachment_duration == 2.5
+
+    @patch("utils.mixins.attachment_type.get_attachment_metadata")
+    def test_set_attachment_metadata_without_reading(
+        self, mock_get_attachment_metadata
+    ):
+        instance = Attachment(Mock())
+        instance.attachment.name = "image.png"
+
+        instance.set_attachment_metadata(read_file=False)
 
-        class AttachmentType(GetAttachmentTypeMixin):
-            def __init__(self, attachment):
-                self.attachment = attachment
+        mock_get_attachment_metadata.assert_not_called()
+        assert instance.attachment_type == "image"
+        assert instance.attachment_mime_type == ""
+        assert instance.attachment_size is None
 
-        attachment = Attachment("video.mp4")
-        attachment_type = AttachmentType(attachment)
+    @patch("utils.mixins.attachment_type.get_stored_attachment_metadata")
+    @patch("utils.mixins.attachment_type.get_attachment_metadata")
+    def test_set_attachment_metadata_reading_size(
+        self, mock_get_attachment_metadata, mock_get_stored_attachment_metadata
+    ):
+        mock_get_stored_attachment_metadata.return_value = {
+            "mime_type": "video/mp4",
+            "size": 10,
+        }
+        instance = Attachment(Mock())
+        instance.attachment.name = "video.mp4"
 
-        assert attachment_type.attachment_type == "video"
+        instance.set_attachment_metadata(read_file=False, read_size=True)
 
-        attachment = Attachment("image.jpg")
-        attachment_type = AttachmentType(attachment)
+        mock_get_attachment_metadata.assert_not_called()
+        mock_get_stored_attachment_metadata.assert_called_once_with(instance.attachment)
+        assert instance.attachment_type == "video"
+        assert instance.attachment_mime_type == "video/mp4"
+        assert instance.attachment_size == 10
+        assert instance.attachment_width is None
 
-        assert attachment_type.attachment_type == "image"
+    @patch(
+        "utils.mixins.attachment_type.get_stored_attachment_metadata",
+        side_effect=OSError("Missing"),
+    )
+    def test_set_attachment_metadata_reading_size_of_missing_file(
+        self, _mock_get_stored_attachment_metadata
+    ):
+        instance = Attachment(Mock())
+        instance.attachment.name = "video.mp4"
 
-        attachment = Attachment("audio.mp3")
-        attachment_type = AttachmentType(attachment)
+        instance.set_attachment_metadata(read_file=False, read_size=True)
 
-        assert attachment_type.attachment_type == "audio"
+        assert instance.attachment_type == "video"
+        assert instance.attachment_mime_type == ""
+        assert instance.attachment_size is None
 
-        attachment = Attachment("file.txt")
-        attachment_type = AttachmentType(attachment)
+    @patch("utils.mixins.attachment_type.get_attachment_metadata")
+    def test_set_attachment_metadata_without_attachment(
+        self, mock_get_attachment_metadata
+    ):
+        instance = Attachment(Mock(__bool__=Mock(return_value=False)))
+        instance.attachment.name = None
+
+        instance.set_attachment_metadata()
+
+        mock_get_attachment_metadata.assert_not_called()
+        assert instance.attachment_type is None
+        assert instance.attachment_duration is None
+
+    @pytest.mark.parametrize(
+        "has_file,committed,attachment_type,read_file",
+        [
+            (True, False, None, True),
+            (True, False, "image", True),
+            (True, True, None, False),
+            (False, True, "image", False),
+        ],
+    )
+    @patch.object(GetAttachmentTypeMixin, "set_attachment_metadata")
+    def test_save_sets_metadata(
+        self,
+        mock_set_attachment_metadata,
+        has_file,
+        committed,
+        attachment_type,
+        read_file,
+    ):
+        attachment = Mock(_committed=committed)
+        attachment.__bool__ = Mock(return_value=has_file)
+        instance = Attachment(attachment, attachment_type)
+
+        instance.save(update_fields=["attachment"])
+
+        if read_file:
+            mock_set_attachment_metadata.assert_called_once_with()
+        else:
+            mock_set_attachment_metadata.assert_called_once_with(read_file=False)
+
+        assert instance.saved_with == {
+            "update_fields": {
+                "attachment",
+                *GetAttachmentTypeMixin.ATTACHMENT_METADATA_FIELDS,
+            }
+        }
+
+    @pytest.mark.parametrize(
+        "saved_name,name,expected",
+        [
+            (None, "video.mp4", True),
+            ("image.png", "video.mp4", True),
+            ("image.png", "image.png", False),
+            ("", None, False),
+            (DEFERRED, "video.mp4", False),
+        ],
+    )
+    def test_is_attachment_replaced(self, saved_name, name, expected):
+        instance = Attachment(Mock())
+        instance.attachment.name = name
+        instance._saved_attachment_name = saved_name
+
+        assert instance.is_attachment_replaced() == expected
+
+    @patch.object(GetAttachmentTypeMixin, "set_attachment_metadata")
+    def test_save_replaced_attachment(self, mock_set_attachment_metadata):
+        attachment = Mock(_committed=True)
+        attachment.name = "media/posts/video.mp4"
+        instance = Attachment(attachment, "image")
+        instance._saved_attachment_name = "media/posts/image.png"
+
+        instance.save(update_fields=["attachment"])
+
+        mock_set_attachment_metadata.assert_called_once_with(
+            read_file=False, read_size=True
+        )
+        assert instance.saved_with == {
+            "update_fields": {
+                "attachment",
+                *GetAttachmentTypeMixin.ATTACHMENT_METADATA_FIELDS,
+            }
+        }
+        assert instance._saved_attachment_name == "media/posts/video.mp4"
 
-        assert attachment_type.attachment_type == "file"
+    @pytest.mark.parametrize(
+        "has_file,attachment_type", [(True, "image"), (False, None)]
+    )
+    @patch.object(GetAttachmentTypeMixin, "set_attachment_metadata")
+    def test_save_keeps_metadata(
+        self, mock_set_attachment_metadata, has_file, attachment_type
+    ):
+        attachment = Mock(_committed=True)
+        attachment.__bool__ = Mock(return_value=has_file)
+        instance = Attachment(attachment, attachment_type)
 
-        attachment = Attachment("")
-        attachment_type = AttachmentType(attachment)
+        instance.save(update_fields=["description"])
 
-        assert attachment_type.attachment_type is None
+        mock_set_attachment_metadata.assert_not_called()
+        assert instance.saved_with == {"update_fields": ["description"]}
 
 
 class TestGetAttachmentTypeSerializerMixin:
@@ -0,0 +1,287 @@
+from unittest.mock import MagicMock, Mock, call, patch
+
+import pytest
+from django.db.models import QuerySet
+
+from apps.social.models import PostModel, ReactionModel, ReactionTypeModel
+from utils.exceptions.http import HttpNotModified
+from utils.mixins.conditional_get import ConditionalGetMixin, ModelVersion
+
+
+class TestModelVersion:
+    def test_get_key(self):
+        assert ModelVersion.get_key(PostModel) == "model:version:social.postmodel"
+
+    def test_get_key_with_scope(self):
+        key = ModelVersion.get_key(PostModel, (1, None))
+
+        assert key == "model:version:social.postmodel:1:None"
+
+    def test_get_key_ignores_scope_of_unscoped_model(self):
+        key = ModelVersion.get_key(ReactionTypeModel, (1, 2))
+
+        assert key == "model:version:social.reactiontypemodel"
+
+    @patch("utils.mixins.conditional_get.get_version")
+    def test_get(self, mock_get_version):
+        result = ModelVersion.get(PostModel, (1, 2))
+
+        mock_get_version.assert_called_once_with("model:version:social.postmodel:1:2")
+        assert result == mock_get_version.return_value
+
+    @patch("utils.mixins.conditional_get.bump_version")
+    def test_bump(self, mock_bump_version):
+        ModelVersion.bump(PostModel)
+
+        mock_bump_version.assert_called_once_with("model:version:social.postmodel")
+
+    def test_get_scopes_of_unscoped_model(self):
+        assert ModelVersion.get_scopes(ReactionTypeModel, pk=1) == {()}
+
+    @patch.object(QuerySet, "values_list")
+    def test_get_scopes(self, mock_values_list):
+        rows = [(1, 2), (1, None), (3, 4)]
+        mock_values_list.return_value.distinct.return_value = rows
+
+        scopes = ModelVersion.get_scopes(PostModel, pk__in=[1, 2, 3])
+
+        mock_values_list.assert_called_once_with("service_id", "event_id")
+        assert scopes == {(1, 2), (1, None), (3, 4), (3, None)}
+
+    @patch("utils.mixins.conditional_get.m2m_changed")
+    @patch("utils.mixins.conditional_get.counter_updated")
+    @patch("utils.mixins.conditional_get.post_delete")
+    @patch("utils.mixins.conditional_get.pre_delete")
+    @patch("utils.mixins.conditional_get.post_save")
+    @patch.object(ModelVersion, "get_scopes", return_value={(1, 2), (1, None)})
+    @patch.object(ModelVersion, "bump")
+    def test_track(
+        self,
+        mock_bump,
+        mock_get_scopes,
+        mock_post_save,
+        mock_pre_delete,
+        mock_post_delete,
+        mock_counter_updated,
+        mock_m2m_changed,
+    ):
+        ModelVersion.track(PostModel)
+
+        for signal in [
+            mock_post_save,
+            mock_pre_delete,
+            mock_post_delete,
+            mock_counter_updated,
+        ]:
+            signal.connect.assert_called_once()
+            assert signal.connect.call_args.kwargs["sender"] == PostModel
+
+        m2m_senders = [
+            connect_call.kwargs["sender"]
+            for connect_call in mock_m2m_changed.connect.call_args_list
+        ]
+        assert m2m_senders == [PostModel.reactions.through]
+
+        bump_version = mock_post_save.connect.call_args.args[0]
+        bump_version(instance=Mock(pk=10))
+        mock_get_scopes.assert_called_once_with(PostModel, pk=10)
+        mock_bump.assert_has_calls(
+            [call(PostModel, (1, 2)), call(PostModel, (1, None))], any_order=True
+        )
+
+    @patch("utils.mixins.conditional_get.post_delete")
+    @patch("utils.mixins.conditional_get.pre_delete")
+    @patch.object(ModelVersion, "get_scopes", return_value={(1, 2)})
+    @patch.object(ModelVersion, "bump")
+    def test_track_delete(
+        self, mock_bump, mock_get_scopes, mock_pre_delete, mock_post_delete
+    ):
+        instance = Mock(pk=10)
+        ModelVersion.track(PostModel)
+
+        mock_pre_delete.connect.call_args.args[0](instance=instance)
+        mock_bump.assert_not_called()
+        mock_post_delete.connect.call_args.args[0](instance=instance)
+
+        mock_get_scopes.assert_called_once_with(PostModel, pk=10)
+        mock_bump.assert_called_once_with(PostModel, (1, 2))
+
+    @patch("utils.mixins.conditional_get.counter_updated")
+    @patch.object(ModelVersion, "get_scopes", return_value={(1, 2)})
+    @patch.object(ModelVersion, "bump")
+    def test_track_counter(self, mock_bump, mock_get_scopes, mock_counter_updated):
+        ModelVersion.track(PostModel)
+
+        mock_counter_updated.connect.call_args.args[0](filters={"pk": 10})
+
+        mock_get_scopes.assert_called_once_with(PostModel, pk=10)
+        mock_bump.assert_called_once_with(PostModel, (1, 2))
+
+    @pytest.mark.parametrize(
+        "instance, action, pk_set, filters",
+        [
+            (PostModel(pk=10), "post_add", {1}, {"pk": 10}),
+            (ReactionModel(pk=1), "post_remove", {10, 11}, {"pk__in": {10, 11}}),
+        ],
+    )
+    @patch("utils.mixins.conditional_get.m2m_changed")
+    @patch.object(ModelVersion, "get_scopes", return_value={(1, 2)})
+    @patch.object(ModelVersion, "bump")
+    def test_track_m2m(
+        self,
+        mock_bump,
+        mock_get_scopes,
+        mock_m2m_changed,
+        instance,
+        action,
+        pk_set,
+        filters,
+    ):
+        ModelVersion.track(PostModel)
+        bump_related = mock_m2m_changed.connect.call_args.args[0]
+
+        bump_related(instance=instance, action="pre_add", pk_set=pk_set)
+        mock_get_scopes.assert_not_called()
+        bump_related(instance=instance, action=action, pk_set=pk_set)
+
+        mock_get_scopes.assert_called_once_with(PostModel, **filters)
+        mock_bump.assert_called_once_with(PostModel, (1, 2))
+
+    @patch("utils.mixins.conditional_get.m2m_changed")
+    @patch.object(ModelVersion, "get_scopes", return_value={(1, 2)})
+    @patch.object(ModelVersion, "bump")
+    def test_track_m2m_reverse_clear(
+        self, mock_bump, mock_get_scopes, mock_m2m_changed
+    ):
+        reaction = ReactionModel(pk=1)
+        ModelVersion.track(PostModel)
+        bump_related = mock_m2m_changed.connect.call_args.args[0]
+
+        bump_related(instance=reaction, action="pre_clear", pk_set=None)
+        mock_bump.assert_not_called()
+        bump_related(instance=reaction, action="post_clear", pk_set=None)
+
+        mock_get_scopes.assert_called_once_with(PostModel, reactions=reaction)
+        mock_bump.assert_called_once_with(PostModel, (1, 2))
+
+
+class TestConditionalGetMixin:
+    @classmethod
+    def setup_class(cls):
+        class ParentView:
+            initial = Mock()
+            handle_exception = Mock()
+            finalize_response = Mock()
+
+        class View(ConditionalGetMixin, ParentView):
+            pass
+
+        cls.parent_class = ParentView
+        cls.view_class = View
+
+    @patch.object(ModelVersion, "track")
+    def test_subclass_tracks_etag_models(self, mock_track):
+        class View(ConditionalGetMixin):
+            etag_models = [PostModel]
+
+        mock_track.assert_called_once_with(PostModel)
+
+    @patch.object(ModelVersion, "get", side_effect=[1, 2])
+    def test_get_etag(self, mock_get):
+        view = ConditionalGetMixin()
+        view.etag_models = [PostModel, PostModel]
+        request = Mock(user=Mock(pk=1))
+        request.get_full_path.return_value = "/api/v1/post/"
+
+        etag = view.get_etag(request)
+
+        mock_get.assert_has_calls([call(PostModel, ()), call(PostModel, ())])
+        assert etag.startswith('"') and etag.endswith('"')
+
+    @patch.object(ModelVersion, "get", return_value=1)
+    def test_get_etag_with_scope(self, mock_get):
+        view = ConditionalGetMixin()
+        view.etag_models = [PostModel]
+        view.get_etag_scope = Mock(return_value=(1, 2))
+        request = Mock(user=Mock(pk=1))
+        request.get_full_path.return_value = "/api/v1/post/"
+
+        view.get_etag(request)
+
+        view.get_etag_scope.assert_called_once_with(request)
+        mock_get.assert_called_once_with(PostModel, (1, 2))
+
+    @patch.object(ModelVersion, "get", return_value=1)
+    def test_get_etag_changes_per_user(self, _mock_get):
+        view = ConditionalGetMixin()
+        view.etag_models = [PostModel]
+        request = Mock(user=Mock(pk=1))
+        request.get_full_path.return_value = "/api/v1/post/"
+        other_request = Mock(user=Mock(pk=2))
+        other_request.get_full_path.return_value = "/api/v1/post/"
+
+        assert view.get_etag(request) != view.get_etag(other_request)
+
+    @pytest.mark.parametrize("method, action", [("POST", "list"), ("GET", "complete")])
+    def test_initial_ignores_other_requests(self, method, action):
+        view = self.view_class()
+        view.action = action
+        view.get_etag = Mock()
+        request = Mock(method=method)
+
+        view.initial(request)
+
+        view.get_etag.assert_not_called()
+        assert view.etag is None
+
+    @pytest.mark.parametrize("if_none_match", ['"abc"', 'W/"abc"', '"xyz", "abc"'])
+    def test_initial_not_modified(self, if_none_match):
+        view = self.view_class()
+        view.action = "list"
+        view.get_etag = Mock(return_value='"abc"')
+        request = Mock(method="GET", headers={"If-None-Match": if_none_match})
+
+        with pytest.raises(HttpNotModified):
+            view.initial(request)
+
+    def test_initial_modified(self):
+        view = self.view_class()
+        view.action = "retrieve"
+        view.get_etag = Mock(return_value='"abc"')
+        request = Mock(method="GET", headers={"If-None-Match": '"xyz"'})
+
+        view.initial(request)
+
+        assert view.etag == '"abc"'
+
+    def test_handle_exception_not_modified(self):
+        response = self.view_class().handle_exception(HttpNotModified())
+
+        assert response.status_code == 304
+        assert response.data is None
+
+    def test_handle_exception(self):
+        view = self.view_class()
+        exc = Exception()
+
+        result = view.handle_exception(exc)
+
+        self.parent_class.handle_exception.assert_called_with(exc)
+        assert result == self.parent_class.handle_exception.return_value
+
+    @pytest.mark.parametrize(
+        "status_code, expected",
+        [(200, {"ETag": '"abc"'}), (304, {"ETag": '"abc"'}), (404, {})],
+    )
+    def test_finalize_response(self, status_code, expected):
+        view = self.view_class()
+        view.etag = '"abc"'
+        response = MagicMock(status_code=status_code)
+        headers = {}
+        response.__setitem__.side_effect = headers.__setitem__
+        self.parent_class.finalize_response.return_value = response
+
+        result = view.finalize_response(Mock(), Mock())
+
+        assert result == response
+        assert headers == expected
@@ -0,0 +1,97 @@
+from unittest.mock import Mock, patch
+
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from utils.mixins.counter import CounterMixin, JSONCounterIncrement
+
+
+class TestCounterMixin:
+    @patch("utils.mixins.counter.counter_updated")
+    def test_update_counter(self, mock_counter_updated):
+        mock_model = type("MockModel", (CounterMixin,), {"_default_manager": Mock()})
+
+        result = mock_model.update_counter("likes_count", 2, pk=1)
+
+        mock_model._default_manager.filter.assert_called_once_with(pk=1)
+        mock_model._default_manager.filter.return_value.update.assert_called_once_with(
+            likes_count=Greatest(F("likes_count") + 2, 0)
+        )
+        mock_counter_updated.send.assert_called_once_with(
+            sender=mock_model, fields=("likes_count",), filters={"pk": 1}
+        )
+        assert result == mock_model._default_manager.filter.return_value.update()
+
+    @patch("utils.mixins.counter.counter_updated")
+    def test_update_json_counter(self, mock_counter_updated):
+        mock_model = type("MockModel", (CounterMixin,), {"_default_manager": Mock()})
+
+        result = mock_model.update_json_counter("counters", "like", -1, pk=1)
+
+        mock_model._default_manager.filter.assert_called_once_with(pk=1)
+        update = mock_model._default_manager.filter.return_value.update
+        expression = update.call_args.kwargs["counters"]
+        assert isinstance(expression, JSONCounterIncrement)
+        assert [source.value for source in expression.source_expressions[1:]] == [
+            "like",
+            -1,
+        ]
+        mock_counter_updated.send.assert_called_once_with(
+            sender=mock_model, fields=("counters",), filters={"pk": 1}
+        )
+        assert result == update.return_value
+
+    @patch("utils.mixins.counter.counter_updated")
+    def test_update_counters(self, mock_counter_updated):
+        mock_model = type("MockModel", (CounterMixin,), {"_default_manager": Mock()})
+
+        result = mock_model.update_counters({"likes_count": 1, "counters": 2}, pk=1)
+
+        mock_model._default_manager.filter.assert_called_once_with(pk=1)
+        update = mock_model._default_manager.filter.return_value.update
+        update.assert_called_once_with(likes_count=1, counters=2)
+        mock_counter_updated.send.assert_called_once_with(
+            sender=mock_model, fields=("likes_count", "counters"), filters={"pk": 1}
+        )
+        assert result == update.return_value
+
+    @patch.object(CounterMixin, "update_counter")
+    def test_increment_counter(self, mock_update_counter):
+        instance = CounterMixin()
+        instance.pk = 1
+        instance.likes_count = 3
+
+        instance.increment_counter("likes_count")
+
+        mock_update_counter.assert_called_once_with("likes_count", 1, pk=1)
+        assert instance.likes_count == 4
+
+    @patch.object(CounterMixin, "update_counter")
+    def test_increment_counter_never_goes_below_zero(self, mock_update_counter):
+        instance = CounterMixin()
+        instance.pk = 1
+        instance.likes_count = 0
+
+        instance.increment_counter("likes_count", -1)
+
+        mock_update_counter.assert_called_once_with("likes_count", -1, pk=1)
+        assert instance.likes_count == 0
+
+
+class TestJSONCounterIncrement:
+    def test_as_sql(self):
+        mock_compiler = Mock()
+        mock_compiler.compile.side_effect = [
+            ("counters", []),
+            ("%s", ["like"]),
+            ("%s", [-1]),
+        ]
+        expression = JSONCounterIncrement("counters", "like", -1)
+
+        sql, params = expression.as_sql(mock_compiler, Mock())
+
+        assert sql == (
+            "jsonb_strip_nulls(counters || jsonb_build_object(%s::text, "
+            "NULLIF(GREATEST(COALESCE((counters ->> %s)::int, 0) + %s, 0), 0)))"
+        )
+        assert params == ["like", "like", -1]
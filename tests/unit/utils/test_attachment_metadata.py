@@ -0,0 +1,138 @@
+import struct
+import wave
+from io import BytesIO
+
+import pytest
+from django.core.files.base import ContentFile
+from PIL import Image
+
+from utils.attachment_metadata import (
+    get_attachment_metadata,
+    get_extension,
+    get_mp4_metadata,
+    get_wav_metadata,
+)
+
+
+def box(kind: bytes, body: bytes):
+    return struct.pack(">I4s", len(body) + 8, kind) + body
+
+
+def get_mp4(version=0, width=640, height=360):
+    if version == 1:
+        mvhd = struct.pack(">B3xQQIQ", 1, 0, 0, 1000, 2500) + bytes(80)
+        tkhd = bytes([1]) + bytes(87) + struct.pack(">II", width << 16, height << 16)
+    else:
+        mvhd = struct.pack(">B3xIIII", 0, 0, 0, 1000, 2500) + bytes(80)
+        tkhd = bytes(76) + struct.pack(">II", width << 16, height << 16)
+
+    audio_tkhd = bytes(84)
+    moov = box(
+        b"moov",
+        box(b"mvhd", mvhd)
+        + box(b"trak", box(b"tkhd", audio_tkhd))
+        + box(b"trak", box(b"tkhd", tkhd)),
+    )
+
+    return box(b"ftyp", b"isom0000") + box(b"mdat", bytes(100)) + moov
+
+
+def get_wav(frames=8000, rate=8000):
+    buffer = BytesIO()
+
+    with wave.open(buffer, "wb") as audio:
+        audio.setnchannels(1)
+        audio.setsampwidth(1)
+        audio.setframerate(rate)
+        audio.writeframes(bytes(frames))
+
+    return buffer.getvalue()
+
+
+def get_png(width=4, height=3):
+    buffer = BytesIO()
+    Image.new("RGB", (width, height)).save(buffer, "PNG")
+
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [("video.MP4", "mp4"), ("dir.v2/file", ""), ("archive.tar.gz", "gz")],
+)
+def test_get_extension(name, expected):
+    assert get_extension(name) == expected
+
+
+@pytest.mark.parametrize("version", [0, 1])
+def test_get_mp4_metadata(version):
+    metadata = get_mp4_metadata(BytesIO(get_mp4(version)))
+
+    assert metadata == {"duration": 2.5, "width": 640, "height": 360}
+
+
+def test_get_mp4_metadata_with_large_box():
+    content = get_mp4()
+    large_mdat = struct.pack(">I4sQ", 1, b"mdat", 24) + bytes(8)
+
+    metadata = get_mp4_metadata(BytesIO(large_mdat + content))
+
+    assert metadata["duration"] == 2.5
+
+
+def test_get_mp4_metadata_truncated():
+    assert get_mp4_metadata(BytesIO(get_mp4()[:-40])) == {"duration": 2.5}
+    assert get_mp4_metadata(BytesIO(b"not a video")) == {}
+
+
+def test_get_wav_metadata():
+    assert get_wav_metadata(BytesIO(get_wav(4000))) == {"duration": 0.5}
+    assert get_wav_metadata(BytesIO(b"not an audio")) == {}
+
+
+class TestGetAttachmentMetadata:
+    def test_image(self):
+        file = ContentFile(get_png(), name="post/image.png")
+
+        metadata = get_attachment_metadata(file, "image")
+
+        assert metadata == {
+            "mime_type": "image/png",
+            "size": file.size,
+            "width": 4,
+            "height": 3,
+        }
+        assert file.tell() == 0
+
+    def test_invalid_image(self):
+        file = ContentFile(b"<svg></svg>", name="post/image.svg")
+
+        assert get_attachment_metadata(file, "image") == {
+            "mime_type": "image/svg+xml",
+            "size": 11,
+        }
+
+    def test_video(self):
+        file = ContentFile(get_mp4(), name="mission/video.mp4")
+
+        metadata = get_attachment_metadata(file, "video")
+
+        assert metadata["mime_type"] == "video/mp4"
+        assert metadata["duration"] == 2.5
+        assert metadata["width"] == 640
+
+    def test_audio(self):
+        file = ContentFile(get_wav(), name="mission/audio.wav")
+
+        metadata = get_attachment_metadata(file, "audio")
+
+        assert metadata["mime_type"] in ["audio/x-wav", "audio/wav"]
+        assert metadata["duration"] == 1.0
+
+    def test_file(self):
+        file = ContentFile(b"content", name="post/file")
+
+        assert get_attachment_metadata(file, "file") == {
+            "mime_type": "application/octet-stream",
+            "size": 7,
+        }
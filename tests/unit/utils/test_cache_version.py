@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+from utils.cache_version import bump_version, get_version
+
+
+@patch("utils.cache_version.cache")
+def test_get_version(mock_cache):
+    mock_cache.get.return_value = 10
+
+    assert get_version("key") == 10
+    mock_cache.add.assert_not_called()
+
+
+@patch("utils.cache_version.time")
+@patch("utils.cache_version.cache")
+def test_get_version_initializes_missing_version(mock_cache, mock_time):
+    mock_cache.get.side_effect = [None, 20]
+
+    assert get_version("key") == 20
+    mock_cache.add.assert_called_once_with(
+        "key", mock_time.time_ns.return_value, timeout=None
+    )
+
+
+@patch("utils.cache_version.cache")
+def test_bump_version(mock_cache):
+    bump_version("key")
+
+    mock_cache.incr.assert_called_once_with("key")
+    mock_cache.set.assert_not_called()
+
+
+@patch("utils.cache_version.time")
+@patch("utils.cache_version.cache")
+def test_bump_version_missing_version(mock_cache, mock_time):
+    mock_cache.incr.side_effect = ValueError
+
+    bump_version("key")
+
+    mock_cache.set.assert_called_once_with(
+        "key", mock_time.time_ns.return_value, timeout=None
+    )
@@ -0,0 +1,427 @@
+from datetime import timedelta
+from unittest.mock import Mock, call, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from django.core import signing
+from django.utils import timezone
+from rest_framework import serializers
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from utils.direct_upload import (
+    DIRECT_UPLOAD_TARGETS,
+    DIRECT_UPLOAD_TOKEN_MAX_AGE,
+    MULTIPART_UPLOAD_PART_SIZE,
+    DirectUploadField,
+    DirectUploadSerializerMixin,
+    MultipartUploadField,
+    abort_multipart_upload,
+    abort_stale_multipart_uploads,
+    complete_multipart_upload,
+    consume_direct_upload,
+    create_direct_upload,
+    create_multipart_upload,
+    get_direct_upload_key,
+    get_etag_checksum,
+    get_multipart_part_url,
+    get_part_size,
+    get_parts_count,
+    list_multipart_parts,
+    validate_checksum,
+)
+
+ETAG = '"0cc175b9c0f1b6a831c399e269772661"'
+CHECKSUM = "DMF1ucDxtqgxw5niaXcmYQ=="
+
+
+def get_token(**upload):
+    upload = {
+        "key": "media/posts/1/abc/video.mp4",
+        "user": 1,
+        "target": "post_comment",
+        "size": 10,
+        **upload,
+    }
+
+    return signing.dumps(upload, salt="utils.direct_upload")
+
+
+@patch("utils.direct_upload.uuid4", Mock(return_value=Mock(hex="abc")))
+def test_get_direct_upload_key():
+    key = get_direct_upload_key("mission_interaction", 3, "my video (1).mp4")
+
+    assert key == "media/mission_interaction/3/abc/my_video_1.mp4"
+
+
+class TestCreateDirectUpload:
+    @patch("utils.direct_upload.get_direct_upload_key", return_value="media/key.mp4")
+    @patch("utils.direct_upload.default_storage", spec=S3Boto3Storage)
+    def test_create_direct_upload(self, mock_storage, _mock_get_direct_upload_key):
+        mock_storage.bucket_name = "bucket"
+        mock_storage._normalize_name.return_value = "location/media/key.mp4"
+        client = mock_storage.connection.meta.client
+        client.generate_presigned_post.return_value = {
+            "url": "https://bucket.s3.amazonaws.com/",
+            "fields": {"key": "location/media/key.mp4"},
+        }
+
+        result = create_direct_upload(Mock(pk=1), "post_comment", "key.mp4", "v", 10)
+
+        client.generate_presigned_post.assert_called_once_with(
+            Bucket="bucket",
+            Key="location/media/key.mp4",
+            Fields={"Content-Type": "v"},
+            Conditions=[{"Content-Type": "v"}, ["content-length-range", 10, 10]],
+            ExpiresIn=3600,
+        )
+        assert result["key"] == "media/key.mp4"
+        assert result["url"] == "https://bucket.s3.amazonaws.com/"
+        assert result["fields"] == {"key": "location/media/key.mp4"}
+        assert result["expires_in"] == 3600
+        assert signing.loads(result["token"], salt="utils.direct_upload") == {
+            "key": "media/key.mp4",
+            "user": 1,
+            "target": "post_comment",
+            "size": 10,
+        }
+
+    def test_create_direct_upload_without_s3(self):
+        with pytest.raises(serializers.ValidationError):
+            create_direct_upload(Mock(pk=1), "post_comment", "key.mp4", "v", 10)
+
+
+@pytest.mark.parametrize(
+    "size,parts_count,last_part_size",
+    [
+        (1, 1, 1),
+        (MULTIPART_UPLOAD_PART_SIZE, 1, MULTIPART_UPLOAD_PART_SIZE),
+        (MULTIPART_UPLOAD_PART_SIZE + 1, 2, 1),
+    ],
+)
+def test_get_parts_count(size, parts_count, last_part_size):
+    assert get_parts_count(size) == parts_count
+    assert get_part_size(size, parts_count) == last_part_size
+    assert get_part_size(size, 1) == min(size, MULTIPART_UPLOAD_PART_SIZE)
+
+
+def test_get_etag_checksum():
+    assert get_etag_checksum(ETAG) == CHECKSUM
+
+
+@pytest.mark.parametrize("checksum", ["invalid!", "YQ=="])
+def test_validate_checksum(checksum):
+    validate_checksum(CHECKSUM)
+
+    with pytest.raises(serializers.ValidationError):
+        validate_checksum(checksum)
+
+
+class TestMultipartUpload:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        with patch(
+            "utils.direct_upload.default_storage", spec=S3Boto3Storage
+        ) as mock_storage:
+            mock_storage.bucket_name = "bucket"
+            mock_storage._normalize_name.side_effect = lambda name: name
+            self.client = mock_storage.connection.meta.client
+            self.upload = {
+                "key": "media/key.mp4",
+                "size": MULTIPART_UPLOAD_PART_SIZE + 1,
+                "upload_id": "id",
+            }
+            self.params = {"Bucket": "bucket", "Key": "media/key.mp4", "UploadId": "id"}
+
+            yield
+
+    def set_parts(self, *parts):
+        self.client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Parts": [
+                    {"PartNumber": part_number, "Size": size, "ETag": ETAG}
+                    for part_number, size in parts
+                ]
+            }
+        ]
+
+    @patch("utils.direct_upload.get_direct_upload_key", return_value="media/key.mp4")
+    def test_create_multipart_upload(self, _mock_get_direct_upload_key):
+        self.client.create_multipart_upload.return_value = {"UploadId": "id"}
+
+        result = create_multipart_upload(
+            Mock(pk=1), "mission_interaction", "key.mp4", "v", 10, mission=2
+        )
+
+        self.client.create_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="media/key.mp4", ContentType="v"
+        )
+        assert result["key"] == "media/key.mp4"
+        assert result["part_size"] == MULTIPART_UPLOAD_PART_SIZE
+        assert result["parts_count"] == 1
+        assert signing.loads(result["token"], salt="utils.direct_upload") == {
+            "key": "media/key.mp4",
+            "user": 1,
+            "target": "mission_interaction",
+            "size": 10,
+            "upload_id": "id",
+            "mission": 2,
+        }
+
+    def test_get_multipart_part_url(self):
+        result = get_multipart_part_url(self.upload, 2, CHECKSUM)
+
+        self.client.generate_presigned_url.assert_called_once_with(
+            "upload_part",
+            Params={**self.params, "PartNumber": 2, "ContentMD5": CHECKSUM},
+            ExpiresIn=3600,
+        )
+        assert result == {
+            "url": self.client.generate_presigned_url.return_value,
+            "headers": {"Content-MD5": CHECKSUM},
+            "expires_in": 3600,
+        }
+
+    def test_list_multipart_parts(self):
+        self.set_parts((1, 5), (3, 1))
+
+        result = list_multipart_parts(self.upload)
+
+        self.client.get_paginator.assert_called_once_with("list_parts")
+        assert result == {
+            "offset": 5,
+            "parts": [
+                {"part_number": 1, "size": 5, "checksum": CHECKSUM},
+                {"part_number": 3, "size": 1, "checksum": CHECKSUM},
+            ],
+        }
+
+    def test_list_multipart_parts_with_invalid_upload(self):
+        paginate = self.client.get_paginator.return_value.paginate
+        paginate.side_effect = ClientError({}, "ListParts")
+
+        with pytest.raises(serializers.ValidationError):
+            list_multipart_parts(self.upload)
+
+    def test_complete_multipart_upload(self):
+        self.set_parts((1, MULTIPART_UPLOAD_PART_SIZE), (2, 1))
+
+        result = complete_multipart_upload(self.upload, {1: CHECKSUM, 2: CHECKSUM})
+
+        self.client.complete_multipart_upload.assert_called_once_with(
+            **self.params,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": 1, "ETag": ETAG},
+                    {"PartNumber": 2, "ETag": ETAG},
+                ]
+            },
+        )
+        assert result == "media/key.mp4"
+
+    @pytest.mark.parametrize(
+        "parts,checksums",
+        [
+            ([(1, MULTIPART_UPLOAD_PART_SIZE)], {1: CHECKSUM, 2: CHECKSUM}),
+            ([(1, MULTIPART_UPLOAD_PART_SIZE), (2, 2)], {1: CHECKSUM, 2: CHECKSUM}),
+            ([(1, MULTIPART_UPLOAD_PART_SIZE), (2, 1)], {1: CHECKSUM}),
+        ],
+    )
+    def test_complete_multipart_upload_with_invalid_parts(self, parts, checksums):
+        self.set_parts(*parts)
+
+        with pytest.raises(serializers.ValidationError) as error:
+            complete_multipart_upload(self.upload, checksums)
+
+        self.client.complete_multipart_upload.assert_not_called()
+        assert error.value.detail == {"parts": "Missing or corrupted parts: 2."}
+
+    def test_abort_multipart_upload(self):
+        abort_multipart_upload(self.upload)
+
+        self.client.abort_multipart_upload.assert_called_once_with(**self.params)
+
+    def test_abort_finished_multipart_upload(self):
+        self.client.abort_multipart_upload.side_effect = ClientError(
+            {}, "AbortMultipartUpload"
+        )
+
+        abort_multipart_upload(self.upload)
+
+    def test_abort_stale_multipart_uploads(self):
+        now = timezone.now()
+        self.client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Uploads": [
+                    {"Key": "old", "UploadId": "1", "Initiated": now - timedelta(2)},
+                    {"Key": "new", "UploadId": "2", "Initiated": now},
+                ]
+            }
+        ]
+
+        result = abort_stale_multipart_uploads()
+
+        self.client.get_paginator.assert_called_with("list_multipart_uploads")
+        self.client.get_paginator.return_value.paginate.assert_has_calls(
+            [
+                call(Bucket="bucket", Prefix=f"{prefix}/")
+                for prefix in DIRECT_UPLOAD_TARGETS.values()
+            ]
+        )
+        self.client.abort_multipart_upload.assert_called_with(
+            Bucket="bucket", Key="old", UploadId="1"
+        )
+        assert result == len(DIRECT_UPLOAD_TARGETS)
+
+
+@patch("utils.direct_upload.cache")
+def test_consume_direct_upload(mock_cache):
+    result = consume_direct_upload("media/key.mp4")
+
+    mock_cache.add.assert_called_once_with(
+        "direct_upload:used:media/key.mp4", True, timeout=DIRECT_UPLOAD_TOKEN_MAX_AGE
+    )
+    assert result == mock_cache.add.return_value
+
+
+class TestDirectUploadField:
+    def get_field(self, target="post_comment", user_id=1):
+        field = DirectUploadField(target)
+        field._context = {"request": Mock(user=Mock(pk=user_id))}
+
+        return field
+
+    def test_init(self):
+        field = DirectUploadField("post_comment", required=False)
+
+        assert field.target == "post_comment"
+        assert field.write_only is True
+        assert field.required is False
+
+    @patch("utils.direct_upload.default_storage")
+    def test_to_internal_value(self, mock_storage):
+        mock_storage.exists.return_value = True
+        mock_storage.size.return_value = 10
+
+        result = self.get_field().to_internal_value(get_token())
+
+        mock_storage.exists.assert_called_once_with("media/posts/1/abc/video.mp4")
+        assert result == "media/posts/1/abc/video.mp4"
+
+    @pytest.mark.parametrize(
+        "field_kwargs,token",
+        [
+            ({}, "invalid"),
+            ({}, get_token()[:-1]),
+            ({"user_id": 2}, get_token()),
+            ({"target": "profile_image"}, get_token()),
+        ],
+    )
+    @patch("utils.direct_upload.default_storage")
+    def test_invalid_upload(self, mock_storage, field_kwargs, token):
+        with pytest.raises(serializers.ValidationError) as error:
+            self.get_field(**field_kwargs).to_internal_value(token)
+
+        mock_storage.exists.assert_not_called()
+        assert error.value.detail == ["Invalid or expired upload."]
+
+    @patch("utils.direct_upload.abort_multipart_upload")
+    @patch("utils.direct_upload.signing.loads")
+    def test_expired_upload(self, mock_loads, mock_abort_multipart_upload):
+        mock_loads.side_effect = [signing.SignatureExpired, {"key": "key"}]
+
+        with pytest.raises(serializers.ValidationError):
+            self.get_field().to_internal_value(get_token())
+
+        mock_abort_multipart_upload.assert_not_called()
+
+    @patch("utils.direct_upload.abort_multipart_upload")
+    @patch("utils.direct_upload.signing.loads")
+    def test_expired_multipart_upload(self, mock_loads, mock_abort_multipart_upload):
+        upload = {"key": "key", "upload_id": "id"}
+        mock_loads.side_effect = [signing.SignatureExpired, upload]
+
+        with pytest.raises(serializers.ValidationError) as error:
+            self.get_field().to_internal_value(get_token(upload_id="id"))
+
+        mock_abort_multipart_upload.assert_called_once_with(upload)
+        assert error.value.detail == ["Invalid or expired upload."]
+
+    @patch("utils.direct_upload.default_storage")
+    def test_multipart_upload(self, mock_storage):
+        with pytest.raises(serializers.ValidationError):
+            self.get_field().to_internal_value(get_token(upload_id="id"))
+
+        mock_storage.exists.assert_not_called()
+
+    @patch("utils.direct_upload.default_storage")
+    def test_missing_file(self, mock_storage):
+        mock_storage.exists.return_value = False
+
+        with pytest.raises(serializers.ValidationError) as error:
+            self.get_field().to_internal_value(get_token())
+
+        assert error.value.detail == ["The uploaded file was not found."]
+
+    @patch("utils.direct_upload.default_storage")
+    def test_wrong_size(self, mock_storage):
+        mock_storage.exists.return_value = True
+        mock_storage.size.return_value = 11
+
+        with pytest.raises(serializers.ValidationError) as error:
+            self.get_field().to_internal_value(get_token())
+
+        assert error.value.detail == [
+            "The uploaded file does not have the declared size."
+        ]
+
+
+class TestMultipartUploadField:
+    def get_field(self):
+        field = MultipartUploadField("post_comment")
+        field._context = {"request": Mock(user=Mock(pk=1))}
+
+        return field
+
+    def test_to_internal_value(self):
+        result = self.get_field().to_internal_value(get_token(upload_id="id"))
+
+        assert result["upload_id"] == "id"
+        assert result["key"] == "media/posts/1/abc/video.mp4"
+
+    def test_direct_upload(self):
+        with pytest.raises(serializers.ValidationError):
+            self.get_field().to_internal_value(get_token())
+
+
+class TestDirectUploadSerializerMixin:
+    class Serializer(DirectUploadSerializerMixin, serializers.Serializer):
+        pass
+
+    def test_without_upload(self):
+        attrs = {"attachment": "file"}
+
+        assert self.Serializer().validate(attrs) == {"attachment": "file"}
+
+    @patch("utils.direct_upload.consume_direct_upload", return_value=True)
+    def test_with_upload(self, mock_consume_direct_upload):
+        attrs = {"upload": "media/key.mp4", "attachment": None}
+
+        assert self.Serializer().validate(attrs) == {"attachment": "media/key.mp4"}
+        mock_consume_direct_upload.assert_called_once_with("media/key.mp4")
+
+    @patch("utils.direct_upload.consume_direct_upload", return_value=False)
+    def test_with_used_upload(self, _mock_consume_direct_upload):
+        attrs = {"upload": "media/key.mp4", "attachment": None}
+
+        with pytest.raises(serializers.ValidationError) as error:
+            self.Serializer().validate(attrs)
+
+        assert error.value.detail == {"upload": "This upload was already used."}
+
+    def test_with_upload_and_file(self):
+        attrs = {"upload": "media/key.mp4", "attachment": "file"}
+
+        with pytest.raises(serializers.ValidationError) as error:
+            self.Serializer().validate(attrs)
+
+        assert error.value.detail == {"upload": "Send either the file or the upload."}
@@ -27,6 +27,47 @@ class AttachmentModel:
                 null=True,
                 blank=True,
             )
+            attachment_type = models.CharField(
+                verbose_name=_("Attachment Type"),
+                max_length=5,
+                choices=GetAttachmentTypeMixin.ATTACHMENT_TYPE_CHOICES,
+                null=True,
+                blank=True,
+                editable=False,
+            )
+            attachment_mime_type = models.CharField(
+                verbose_name=_("Attachment MIME Type"),
+                max_length=255,
+                blank=True,
+                default="",
+                editable=False,
+            )
+            attachment_size = models.PositiveBigIntegerField(
+                verbose_name=_("Attachment Size"),
+                null=True,
+                blank=True,
+                editable=False,
+                help_text=_("In bytes."),
+            )
+            attachment_width = models.PositiveIntegerField(
+                verbose_name=_("Attachment Width"),
+                null=True,
+                blank=True,
+                editable=False,
+            )
+            attachment_height = models.PositiveIntegerField(
+                verbose_name=_("Attachment Height"),
+                null=True,
+                blank=True,
+                editable=False,
+            )
+            attachment_duration = models.FloatField(
+                verbose_name=_("Attachment Duration"),
+                null=True,
+                blank=True,
+                editable=False,
+                help_text=_("In seconds."),
+            )
 
             class Meta:
                 abstract = True
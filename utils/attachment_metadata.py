@@ -0,0 +1,125 @@
+import mimetypes
+import os
+import struct
+import wave
+
+from django.core.files.images import get_image_dimensions
+
+MP4_EXTENSIONS = {"mp4", "m4a", "m4v", "mov"}
+MP4_CONTAINER_BOXES = {b"moov", b"trak"}
+
+
+def get_extension(name: str):
+    return os.path.splitext(name)[1][1:].lower()
+
+
+def iter_mp4_boxes(file, end: int):
+    """
+    Yields the kind, body start and end of each MP4/MOV box up to `end`.
+    """
+    while file.tell() + 8 <= end:
+        start = file.tell()
+        size, kind = struct.unpack(">I4s", file.read(8))
+
+        if size == 1:
+            (size,) = struct.unpack(">Q", file.read(8))
+        elif size == 0:
+            size = end - start
+
+        if size < 8:
+            return
+
+        yield kind, file.tell(), start + size
+        file.seek(start + size)
+
+
+def read_mp4_metadata(file, end: int, metadata: dict):
+    for kind, body_start, body_end in iter_mp4_boxes(file, end):
+        if kind in MP4_CONTAINER_BOXES:
+            read_mp4_metadata(file, body_end, metadata)
+        elif kind == b"mvhd":
+            body = file.read(32)
+            offset, duration_format = (20, ">Q") if body[0] == 1 else (12, ">I")
+            (timescale,) = struct.unpack_from(">I", body, offset)
+            (duration,) = struct.unpack_from(duration_format, body, offset + 4)
+
+            if timescale:
+                metadata["duration"] = round(duration / timescale, 3)
+        elif kind == b"tkhd" and not metadata.get("width"):
+            body = file.read(96)
+            offset = 88 if body[0] == 1 else 76
+            width, height = struct.unpack_from(">II", body, offset)
+
+            if width and height:
+                metadata["width"] = width >> 16
+                metadata["height"] = height >> 16
+
+
+def get_mp4_metadata(file):
+    """
+    Reads the duration and the first track dimensions from the box headers.
+    """
+    metadata = {}
+    file.seek(0, 2)
+    end = file.tell()
+    file.seek(0)
+
+    try:
+        read_mp4_metadata(file, end, metadata)
+    except struct.error:
+        pass
+
+    return metadata
+
+
+def get_wav_metadata(file):
+    try:
+        with wave.open(file) as audio:
+            return {"duration": round(audio.getnframes() / audio.getframerate(), 3)}
+    except (wave.Error, EOFError, ZeroDivisionError):
+        return {}
+
+
+def get_media_metadata(file, attachment_type: str, extension: str):
+    if attachment_type == "image":
+        width, height = get_image_dimensions(file)
+
+        return {"width": width, "height": height} if width else {}
+
+    if extension in MP4_EXTENSIONS:
+        return get_mp4_metadata(file)
+
+    if extension == "wav":
+        return get_wav_metadata(file)
+
+    return {}
+
+
+def get_stored_attachment_metadata(file):
+    """
+    MIME type (from the name) and size of a file, without opening it.
+    """
+    name = file.name or ""
+
+    return {
+        "mime_type": mimetypes.guess_type(name)[0] or "application/octet-stream",
+        "size": file.size,
+    }
+
+
+def get_attachment_metadata(file, attachment_type: str):
+    """
+    MIME type, size and, when the format is known, dimensions and duration.
+    """
+    name = file.name or ""
+    extension = get_extension(name)
+    metadata = get_stored_attachment_metadata(file)
+
+    file.seek(0)
+
+    try:
+        metadata.update(get_media_metadata(file, attachment_type, extension))
+    finally:
+        file.seek(0)
+
+    return metadata
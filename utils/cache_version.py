@@ -0,0 +1,27 @@
+import time
+
+from django.core.cache import cache
+
+
+def get_version(key: str):
+    """
+    Current version stored in `key`, started from the clock when missing.
+    """
+    version = cache.get(key)
+
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+
+    return version
+
+
+def bump_version(key: str):
+    """
+    Changes the version stored in `key`. An evicted version is restarted from
+    the clock, so it never goes back to a value already handed out.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
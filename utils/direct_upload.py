@@ -0,0 +1,393 @@
+import base64
+import binascii
+import math
+from datetime import timedelta
+from uuid import uuid4
+
+from botocore.exceptions import ClientError
+from django.core import signing
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
+
+DIRECT_UPLOAD_SALT = "utils.direct_upload"
+DIRECT_UPLOAD_EXPIRES_IN = 60 * 60
+DIRECT_UPLOAD_TOKEN_MAX_AGE = 60 * 60 * 24
+DIRECT_UPLOAD_MAX_SIZE = 1024**3
+MULTIPART_UPLOAD_PART_SIZE = 8 * 1024**2
+DIRECT_UPLOAD_TARGETS = {
+    "post_comment": "media/posts",
+    "mission_interaction": "media/mission_interaction",
+    "profile_image": "media/profile_image",
+}
+
+
+def get_direct_upload_key(target: str, user_id: int, file_name: str):
+    file_name = get_valid_filename(file_name)
+
+    return f"{DIRECT_UPLOAD_TARGETS[target]}/{user_id}/{uuid4().hex}/{file_name}"
+
+
+def get_direct_upload_storage():
+    if not isinstance(default_storage, S3Boto3Storage):
+        raise serializers.ValidationError(
+            _("Direct uploads are not available for this storage.")
+        )
+
+    return default_storage
+
+
+def sign_direct_upload(upload: dict):
+    return signing.dumps(upload, salt=DIRECT_UPLOAD_SALT)
+
+
+def consume_direct_upload(key: str):
+    """
+    Marks the uploaded file as used. Returns False when it already was, so
+    a token is attached to a single record.
+    """
+    return cache.add(
+        f"direct_upload:used:{key}", True, timeout=DIRECT_UPLOAD_TOKEN_MAX_AGE
+    )
+
+
+def create_direct_upload(
+    user, target: str, file_name: str, content_type: str, size: int
+):
+    """
+    Presigned POST for sending the file straight to S3, and the token that
+    identifies the upload when saving the record that uses it.
+    """
+    storage = get_direct_upload_storage()
+    key = get_direct_upload_key(target, user.pk, file_name)
+    presigned_post = storage.connection.meta.client.generate_presigned_post(
+        Bucket=storage.bucket_name,
+        Key=storage._normalize_name(clean_name(key)),
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", size, size],
+        ],
+        ExpiresIn=DIRECT_UPLOAD_EXPIRES_IN,
+    )
+    token = sign_direct_upload(
+        {"key": key, "user": user.pk, "target": target, "size": size}
+    )
+
+    return {
+        "key": key,
+        "token": token,
+        "url": presigned_post["url"],
+        "fields": presigned_post["fields"],
+        "expires_in": DIRECT_UPLOAD_EXPIRES_IN,
+    }
+
+
+def get_parts_count(size: int):
+    return max(math.ceil(size / MULTIPART_UPLOAD_PART_SIZE), 1)
+
+
+def get_part_size(size: int, part_number: int):
+    parts_count = get_parts_count(size)
+
+    if part_number < parts_count:
+        return MULTIPART_UPLOAD_PART_SIZE
+
+    return size - MULTIPART_UPLOAD_PART_SIZE * (parts_count - 1)
+
+
+def get_etag_checksum(etag: str):
+    return base64.b64encode(bytes.fromhex(etag.strip('"'))).decode()
+
+
+def validate_checksum(value: str):
+    try:
+        digest = base64.b64decode(value, validate=True)
+    except binascii.Error:
+        digest = b""
+
+    if len(digest) != 16:
+        raise serializers.ValidationError(_("Enter the base64 MD5 of the part."))
+
+
+def create_multipart_upload(
+    user, target: str, file_name: str, content_type: str, size: int, **extra
+):
+    """
+    Starts a resumable S3 multipart upload. `extra` is signed in the token.
+    """
+    storage = get_direct_upload_storage()
+    key = get_direct_upload_key(target, user.pk, file_name)
+    multipart_upload = storage.connection.meta.client.create_multipart_upload(
+        Bucket=storage.bucket_name,
+        Key=storage._normalize_name(clean_name(key)),
+        ContentType=content_type,
+    )
+    token = sign_direct_upload(
+        {
+            "key": key,
+            "user": user.pk,
+            "target": target,
+            "size": size,
+            "upload_id": multipart_upload["UploadId"],
+            **extra,
+        }
+    )
+
+    return {
+        "key": key,
+        "token": token,
+        "part_size": MULTIPART_UPLOAD_PART_SIZE,
+        "parts_count": get_parts_count(size),
+    }
+
+
+def get_multipart_upload_params(upload: dict):
+    storage = get_direct_upload_storage()
+
+    return storage.connection.meta.client, {
+        "Bucket": storage.bucket_name,
+        "Key": storage._normalize_name(clean_name(upload["key"])),
+        "UploadId": upload["upload_id"],
+    }
+
+
+def abort_multipart_upload(upload: dict):
+    """
+    Aborts the upload and drops its parts. Finished uploads are ignored.
+    """
+    client, params = get_multipart_upload_params(upload)
+
+    try:
+        client.abort_multipart_upload(**params)
+    except ClientError:
+        pass
+
+
+def abort_stale_multipart_uploads():
+    """
+    Aborts the multipart uploads older than the token, which can no longer
+    be completed, and returns how many were aborted.
+    """
+    storage = get_direct_upload_storage()
+    client = storage.connection.meta.client
+    expired_at = timezone.now() - timedelta(seconds=DIRECT_UPLOAD_TOKEN_MAX_AGE)
+    aborted = 0
+
+    for prefix in DIRECT_UPLOAD_TARGETS.values():
+        pages = client.get_paginator("list_multipart_uploads").paginate(
+            Bucket=storage.bucket_name,
+            Prefix=f"{storage._normalize_name(clean_name(prefix))}/",
+        )
+
+        for page in pages:
+            for upload in page.get("Uploads", []):
+                if upload["Initiated"] >= expired_at:
+                    continue
+
+                client.abort_multipart_upload(
+                    Bucket=storage.bucket_name,
+                    Key=upload["Key"],
+                    UploadId=upload["UploadId"],
+                )
+                aborted += 1
+
+    return aborted
+
+
+def get_multipart_part_url(upload: dict, part_number: int, checksum: str):
+    """
+    Presigned URL of a part, signed with its base64 MD5 so S3 checks it.
+    """
+    client, params = get_multipart_upload_params(upload)
+    url = client.generate_presigned_url(
+        "upload_part",
+        Params={**params, "PartNumber": part_number, "ContentMD5": checksum},
+        ExpiresIn=DIRECT_UPLOAD_EXPIRES_IN,
+    )
+
+    return {
+        "url": url,
+        "headers": {"Content-MD5": checksum},
+        "expires_in": DIRECT_UPLOAD_EXPIRES_IN,
+    }
+
+
+def get_multipart_parts(upload: dict):
+    client, params = get_multipart_upload_params(upload)
+    parts = []
+
+    try:
+        for page in client.get_paginator("list_parts").paginate(**params):
+            parts += page.get("Parts", [])
+    except ClientError:
+        raise serializers.ValidationError(_("Invalid or expired upload."))
+
+    return parts
+
+
+def list_multipart_parts(upload: dict):
+    """
+    Parts already in the bucket and the `offset` the client can resume from.
+    """
+    parts = [
+        {
+            "part_number": part["PartNumber"],
+            "size": part["Size"],
+            "checksum": get_etag_checksum(part["ETag"]),
+        }
+        for part in get_multipart_parts(upload)
+    ]
+    offset = 0
+
+    for part_number, part in enumerate(parts, start=1):
+        if part["part_number"] != part_number:
+            break
+
+        offset += part["size"]
+
+    return {"offset": offset, "parts": parts}
+
+
+def complete_multipart_upload(upload: dict, checksums: dict):
+    """
+    Checks the size and MD5 of every part, completes the upload in S3 and
+    returns the file key.
+    """
+    parts = {part["PartNumber"]: part for part in get_multipart_parts(upload)}
+    part_numbers = range(1, get_parts_count(upload["size"]) + 1)
+    invalid_parts = [
+        part_number
+        for part_number in part_numbers
+        if part_number not in parts
+        or parts[part_number]["Size"] != get_part_size(upload["size"], part_number)
+        or get_etag_checksum(parts[part_number]["ETag"]) != checksums.get(part_number)
+    ]
+
+    if invalid_parts:
+        raise serializers.ValidationError(
+            {
+                "parts": _("Missing or corrupted parts: %(parts)s.")
+                % {"parts": ", ".join(map(str, invalid_parts))}
+            }
+        )
+
+    client, params = get_multipart_upload_params(upload)
+    client.complete_multipart_upload(
+        **params,
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": part_number, "ETag": parts[part_number]["ETag"]}
+                for part_number in part_numbers
+            ]
+        },
+    )
+
+    return upload["key"]
+
+
+class DirectUploadField(serializers.CharField):
+    """
+    Turns the token of a direct upload made by the request user into the
+    file key, once the file is in the bucket with the declared size.
+    """
+
+    default_error_messages = {
+        "invalid_upload": _("Invalid or expired upload."),
+        "missing_file": _("The uploaded file was not found."),
+        "wrong_size": _("The uploaded file does not have the declared size."),
+    }
+
+    def __init__(self, target: str, **kwargs):
+        self.target = target
+        kwargs.setdefault("write_only", True)
+        super().__init__(**kwargs)
+
+    @staticmethod
+    def abort_expired_upload(token: str):
+        upload = signing.loads(token, salt=DIRECT_UPLOAD_SALT)
+
+        if "upload_id" in upload:
+            abort_multipart_upload(upload)
+
+    def load_upload(self, data):
+        token = super().to_internal_value(data)
+        user = self.context["request"].user
+
+        try:
+            upload = signing.loads(
+                token, salt=DIRECT_UPLOAD_SALT, max_age=DIRECT_UPLOAD_TOKEN_MAX_AGE
+            )
+        except signing.SignatureExpired:
+            self.abort_expired_upload(token)
+            self.fail("invalid_upload")
+        except signing.BadSignature:
+            self.fail("invalid_upload")
+
+        if upload["user"] != user.pk or upload["target"] != self.target:
+            self.fail("invalid_upload")
+
+        return upload
+
+    def to_internal_value(self, data):
+        upload = self.load_upload(data)
+
+        if "upload_id" in upload:
+            self.fail("invalid_upload")
+
+        if not default_storage.exists(upload["key"]):
+            self.fail("missing_file")
+
+        if default_storage.size(upload["key"]) != upload["size"]:
+            self.fail("wrong_size")
+
+        return upload["key"]
+
+
+class MultipartUploadField(DirectUploadField):
+    """
+    Turns the token of a multipart upload into the upload data.
+    """
+
+    def to_internal_value(self, data):
+        upload = self.load_upload(data)
+
+        if "upload_id" not in upload:
+            self.fail("invalid_upload")
+
+        return upload
+
+
+class DirectUploadSerializerMixin:
+    """
+    Accepts a direct upload token in place of the file in `file_field`.
+    """
+
+    file_field = "attachment"
+    upload_field = "upload"
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        key = attrs.pop(self.upload_field, None)
+
+        if key is None:
+            return attrs
+
+        if attrs.get(self.file_field):
+            raise serializers.ValidationError(
+                {self.upload_field: _("Send either the file or the upload.")}
+            )
+
+        if not consume_direct_upload(key):
+            raise serializers.ValidationError(
+                {self.upload_field: _("This upload was already used.")}
+            )
+
+        attrs[self.file_field] = key
+
+        return attrs
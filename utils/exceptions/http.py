@@ -5,3 +5,8 @@ from rest_framework.exceptions import APIException
 class HttpPaymentRequired(APIException):
     status_code = 402
     default_detail = _("Payment is required to access this resource.")
+
+
+class HttpNotModified(APIException):
+    status_code = 304
+    default_detail = _("The resource was not modified.")
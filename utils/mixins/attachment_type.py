@@ -1,5 +1,14 @@
+from botocore.exceptions import ClientError
+from django.db.models import DEFERRED
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
+from utils.attachment_metadata import (
+    get_attachment_metadata,
+    get_extension,
+    get_stored_attachment_metadata,
+)
+
 
 class GetAttachmentTypeMixin:
     VIDEO_EXTENSIONS = [
@@ -31,26 +40,113 @@ class GetAttachmentTypeMixin:
         "dsd",
     ]
 
-    @property
-    def attachment_type(self):
-        attachment = self.attachment
+    ATTACHMENT_TYPE_CHOICES = (
+        ("image", _("Image")),
+        ("video", _("Video")),
+        ("audio", _("Audio")),
+        ("file", _("File")),
+    )
 
-        if attachment.name == "":
-            return
+    ATTACHMENT_METADATA_FIELDS = [
+        "attachment_type",
+        "attachment_mime_type",
+        "attachment_size",
+        "attachment_width",
+        "attachment_height",
+        "attachment_duration",
+    ]
 
-        extension = attachment.name.split(".")[-1].lower()
+    @classmethod
+    def get_attachment_type(cls, name: str):
+        """
+        Type by extension. Video wins over audio for ambiguous ones ("ogg").
+        """
+        if not name:
+            return None
 
-        if extension in self.VIDEO_EXTENSIONS:
+        extension = get_extension(name)
+
+        if extension in cls.VIDEO_EXTENSIONS:
             return "video"
 
-        if extension in self.IMAGE_EXTENSIONS:
+        if extension in cls.IMAGE_EXTENSIONS:
             return "image"
 
-        if extension in self.AUDIO_EXTENSIONS:
+        if extension in cls.AUDIO_EXTENSIONS:
             return "audio"
 
         return "file"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._saved_attachment_name = instance.__dict__.get("attachment", DEFERRED)
+
+        return instance
+
+    def is_attachment_replaced(self):
+        """
+        Whether the attachment name changed since the instance was loaded.
+        """
+        saved_name = getattr(self, "_saved_attachment_name", None)
+
+        if saved_name is DEFERRED:
+            return False
+
+        return (self.attachment.name or None) != (saved_name or None)
+
+    def set_attachment_metadata(self, read_file: bool = True, read_size: bool = False):
+        """
+        Fills the attachment metadata columns. Without `read_file` only the
+        type is set, plus the MIME type and size when `read_size` is given.
+        """
+        attachment = self.attachment
+        attachment_type = self.get_attachment_type(attachment.name or "")
+        metadata = {}
+
+        if attachment and read_file:
+            metadata = get_attachment_metadata(attachment, attachment_type)
+        elif attachment and read_size:
+            try:
+                metadata = get_stored_attachment_metadata(attachment)
+            except (OSError, ClientError):
+                pass
+
+        self.attachment_type = attachment_type
+        self.attachment_mime_type = metadata.get("mime_type", "")
+        self.attachment_size = metadata.get("size")
+        self.attachment_width = metadata.get("width")
+        self.attachment_height = metadata.get("height")
+        self.attachment_duration = metadata.get("duration")
+
+    def save(self, *args, **kwargs):
+        """
+        Reads the metadata once, when the attachment is uploaded or replaced.
+        """
+        attachment = self.attachment
+        update_fields = kwargs.get("update_fields")
+        metadata_changed = True
+
+        if attachment and not attachment._committed:
+            self.set_attachment_metadata()
+        elif attachment and self.is_attachment_replaced():
+            self.set_attachment_metadata(read_file=False, read_size=True)
+        elif bool(attachment) != bool(self.attachment_type):
+            self.set_attachment_metadata(read_file=False)
+        else:
+            metadata_changed = False
+
+        if metadata_changed and update_fields is not None:
+            kwargs["update_fields"] = {
+                *update_fields,
+                *self.ATTACHMENT_METADATA_FIELDS,
+            }
+
+        result = super().save(*args, **kwargs)
+        self._saved_attachment_name = self.attachment.name
+
+        return result
+
 
 class GetAttachmentTypeSerializerMixin:
     attachment_type = serializers.SerializerMethodField()
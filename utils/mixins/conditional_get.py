@@ -0,0 +1,170 @@
+import hashlib
+from functools import partial
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.utils.http import parse_etags
+from rest_framework.response import Response
+
+from utils.cache_version import bump_version, get_version
+from utils.exceptions.http import HttpNotModified
+from utils.mixins.counter import counter_updated
+
+
+class ModelVersion:
+    """
+    Cached version of a model, bumped when its instances, relations or
+    counters change. Models with `version_scope_fields` keep one version per
+    scope, and a change also bumps the wider scopes that contain it.
+    """
+
+    @staticmethod
+    def get_scope_fields(model):
+        return getattr(model, "version_scope_fields", ())
+
+    @classmethod
+    def get_key(cls, model, scope=()):
+        scope = scope[: len(cls.get_scope_fields(model))]
+
+        return ":".join(["model", "version", model._meta.label_lower, *map(str, scope)])
+
+    @classmethod
+    def get(cls, model, scope=()):
+        return get_version(cls.get_key(model, scope))
+
+    @classmethod
+    def bump(cls, model, scope=()):
+        bump_version(cls.get_key(model, scope))
+
+    @classmethod
+    def get_scopes(cls, model, **filters):
+        """
+        Scopes of the filtered instances and the wider scopes containing them.
+        """
+        fields = cls.get_scope_fields(model)
+
+        if not fields:
+            return {()}
+
+        rows = model._base_manager.filter(**filters).values_list(*fields)
+        scopes = set()
+
+        for row in rows.distinct():
+            for size in range(1, len(row) + 1):
+                scopes.add(row[:size] + (None,) * (len(row) - size))
+
+        return scopes
+
+    @classmethod
+    def bump_scopes(cls, model, scopes):
+        for scope in scopes:
+            cls.bump(model, scope)
+
+    @classmethod
+    def track(cls, model):
+        scopes_attr = f"_{model._meta.model_name}_version_scopes"
+
+        def bump_instance(instance, **_kwargs):
+            cls.bump_scopes(model, cls.get_scopes(model, pk=instance.pk))
+
+        def keep_deleted_scopes(instance, **_kwargs):
+            setattr(instance, scopes_attr, cls.get_scopes(model, pk=instance.pk))
+
+        def bump_deleted(instance, **_kwargs):
+            cls.bump_scopes(model, getattr(instance, scopes_attr, set()))
+
+        def bump_counter(filters, **_kwargs):
+            cls.bump_scopes(model, cls.get_scopes(model, **filters))
+
+        def bump_related(field, instance, action, pk_set, **_kwargs):
+            if isinstance(instance, model):
+                filters = {"pk": instance.pk}
+            elif action.endswith("_clear"):
+                filters = {field.name: instance}
+            else:
+                filters = {"pk__in": pk_set}
+
+            if action == "pre_clear":
+                setattr(instance, scopes_attr, cls.get_scopes(model, **filters))
+            elif action == "post_clear":
+                bump_deleted(instance)
+            elif action.startswith("post_"):
+                cls.bump_scopes(model, cls.get_scopes(model, **filters))
+
+        dispatch_uid = cls.get_key(model)
+        receivers = [
+            (post_save, bump_instance),
+            (pre_delete, keep_deleted_scopes),
+            (post_delete, bump_deleted),
+            (counter_updated, bump_counter),
+        ]
+
+        for signal, receiver in receivers:
+            signal.connect(
+                receiver, sender=model, weak=False, dispatch_uid=dispatch_uid
+            )
+
+        for field in model._meta.many_to_many:
+            m2m_changed.connect(
+                partial(bump_related, field),
+                sender=field.remote_field.through,
+                weak=False,
+                dispatch_uid=dispatch_uid,
+            )
+
+
+class ConditionalGetMixin:
+    """
+    Adds an ETag, built from the URL, the user and the versions of
+    `etag_models`, to the read actions, and answers `304 Not Modified`
+    before querying anything when it matches `If-None-Match`.
+    """
+
+    etag_models = []
+    etag_actions = ["list", "retrieve"]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for model in cls.etag_models:
+            ModelVersion.track(model)
+
+    def get_etag_scope(self, request):
+        return ()
+
+    def get_etag(self, request):
+        scope = self.get_etag_scope(request)
+        versions = [ModelVersion.get(model, scope) for model in self.etag_models]
+        identity = f"{request.get_full_path()}:{request.user.pk}:{versions}"
+
+        return f'"{hashlib.md5(identity.encode()).hexdigest()}"'
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.etag = None
+
+        if request.method != "GET" or self.action not in self.etag_actions:
+            return
+
+        self.etag = self.get_etag(request)
+        client_etags = [
+            etag[2:] if etag.startswith("W/") else etag
+            for etag in parse_etags(request.headers.get("If-None-Match", ""))
+        ]
+
+        if self.etag in client_etags:
+            raise HttpNotModified
+
+    def handle_exception(self, exc):
+        if isinstance(exc, HttpNotModified):
+            return Response(status=exc.status_code)
+
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        etag = getattr(self, "etag", None)
+
+        if etag and response.status_code in [200, 304]:
+            response["ETag"] = etag
+
+        return response
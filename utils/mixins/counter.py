@@ -0,0 +1,73 @@
+from django.db.models import F, Func, JSONField, Value
+from django.db.models.functions import Greatest
+from django.dispatch import Signal
+
+counter_updated = Signal()
+
+
+class JSONCounterIncrement(Func):
+    """
+    Adds `amount` to `key` of a jsonb counters column, dropping zeroed keys.
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, field: str, key: str, amount: int):
+        super().__init__(F(field), Value(key), Value(amount))
+
+    def as_sql(self, compiler, connection, **extra_context):
+        field_sql, field_params = compiler.compile(self.source_expressions[0])
+        key_sql, key_params = compiler.compile(self.source_expressions[1])
+        amount_sql, amount_params = compiler.compile(self.source_expressions[2])
+        current_sql = f"COALESCE(({field_sql} ->> {key_sql})::int, 0)"
+        sql = (
+            f"jsonb_strip_nulls({field_sql} || jsonb_build_object({key_sql}::text, "
+            f"NULLIF(GREATEST({current_sql} + {amount_sql}, 0), 0)))"
+        )
+        params = [
+            *field_params,
+            *key_params,
+            *field_params,
+            *key_params,
+            *amount_params,
+        ]
+
+        return sql, params
+
+
+class CounterMixin:
+    """
+    Updates denormalized counter columns in the database and sends
+    `counter_updated` with the filters used.
+    """
+
+    @classmethod
+    def update_counters(cls, values: dict, **filters):
+        updated = cls._default_manager.filter(**filters).update(**values)
+        counter_updated.send(sender=cls, fields=tuple(values), filters=filters)
+
+        return updated
+
+    @classmethod
+    def _update_counter(cls, field: str, value, **filters):
+        return cls.update_counters({field: value}, **filters)
+
+    @staticmethod
+    def get_counter_increment(field: str, amount: int = 1):
+        return Greatest(F(field) + amount, 0)
+
+    @classmethod
+    def update_counter(cls, field: str, amount: int = 1, **filters):
+        return cls._update_counter(
+            field, cls.get_counter_increment(field, amount), **filters
+        )
+
+    @classmethod
+    def update_json_counter(cls, field: str, key: str, amount: int = 1, **filters):
+        return cls._update_counter(
+            field, JSONCounterIncrement(field, key, amount), **filters
+        )
+
+    def increment_counter(self, field: str, amount: int = 1):
+        self.update_counter(field, amount, pk=self.pk)
+        setattr(self, field, max(getattr(self, field) + amount, 0))